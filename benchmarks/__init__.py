@@ -0,0 +1,37 @@
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+"""Reproducible stage-by-stage benchmarks for the backup and recovery pipeline."""
+
+from .cli import main
+from .pipeline import STAGES, ScenarioRun, StageTimer, run_scenario
+from .report import Comparison, Regression, compare_results, scenario_result
+from .scenarios import Scenario, default_scenarios, full_scenarios, scenario_inputs
+
+__all__ = [
+    "Comparison",
+    "Regression",
+    "STAGES",
+    "Scenario",
+    "ScenarioRun",
+    "StageTimer",
+    "compare_results",
+    "default_scenarios",
+    "full_scenarios",
+    "main",
+    "run_scenario",
+    "scenario_inputs",
+    "scenario_result",
+]
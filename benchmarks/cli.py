@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+"""Command-line entry point: `python -m benchmarks`."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from ethernity.config import load_app_config
+from ethernity.config.paths import DEFAULT_CONFIG_PATH
+
+from .pipeline import probe_chromium, run_scenario
+from .report import (
+    DEFAULT_MIN_DELTA_SECONDS,
+    DEFAULT_THRESHOLD,
+    compare_results,
+    format_comparison,
+    format_summary,
+    load_results,
+    results_document,
+    scenario_error,
+    scenario_result,
+    write_results,
+)
+from .scenarios import DEFAULT_SEED, Scenario, default_scenarios, full_scenarios
+
+DEFAULT_BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Time each stage of the backup and recovery pipeline.",
+    )
+    parser.add_argument(
+        "--matrix",
+        choices=("default", "full"),
+        default="default",
+        help="default varies one axis at a time; full runs the cross product",
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        default=[],
+        metavar="TEXT",
+        help="only run scenarios whose name contains TEXT (repeatable)",
+    )
+    parser.add_argument("--list", action="store_true", help="list scenarios and exit")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per scenario (median kept)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="input data seed")
+    parser.add_argument("--config", type=Path, default=None, help="config file to benchmark")
+    parser.add_argument(
+        "--skip-pdf",
+        action="store_true",
+        help="skip Chromium PDF rendering and scan the rasterized QR images instead",
+    )
+    parser.add_argument("--output", type=Path, default=None, help="write JSON results here")
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=DEFAULT_BASELINE_PATH,
+        help="baseline results to compare against",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="store these results as the new baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="slowdown ratio that counts as a regression (0.15 = 15%%)",
+    )
+    parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=DEFAULT_MIN_DELTA_SECONDS,
+        help="ignore slowdowns smaller than this many seconds",
+    )
+    return parser
+
+
+def select_scenarios(matrix: str, filters: Sequence[str]) -> list[Scenario]:
+    scenarios = full_scenarios() if matrix == "full" else default_scenarios()
+    if not filters:
+        return scenarios
+    return [item for item in scenarios if any(text in item.name for text in filters)]
+
+
+def run_benchmarks(
+    scenarios: Sequence[Scenario],
+    *,
+    repeat: int,
+    seed: int,
+    config_path: Path | None,
+    skip_pdf: bool,
+    work_root: Path,
+) -> dict[str, Any]:
+    config = load_app_config(config_path or DEFAULT_CONFIG_PATH)
+    skipped: dict[str, str] = {}
+    if skip_pdf:
+        skipped["pdf"] = "disabled with --skip-pdf"
+    else:
+        reason = probe_chromium(work_root)
+        if reason is not None:
+            skipped["pdf"] = reason
+    render_pdf = "pdf" not in skipped
+
+    entries: dict[str, dict[str, Any]] = {}
+    for index, scenario in enumerate(scenarios):
+        print(f"[{index + 1}/{len(scenarios)}] {scenario.name}", file=sys.stderr)
+        try:
+            runs = [
+                run_scenario(
+                    scenario,
+                    config=config,
+                    work_dir=work_root / f"scenario-{index}" / f"run-{attempt}",
+                    render_pdf=render_pdf,
+                    seed=seed,
+                )
+                for attempt in range(repeat)
+            ]
+        except Exception as exc:  # noqa: BLE001 - record and keep benchmarking the rest
+            entries[scenario.name] = scenario_error(scenario, exc)
+            continue
+        entries[scenario.name] = scenario_result(scenario, runs, skipped=skipped)
+    return results_document(entries, repeat=repeat)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.repeat < 1:
+        print("--repeat must be at least 1", file=sys.stderr)
+        return 2
+    scenarios = select_scenarios(args.matrix, args.scenario)
+    if args.list:
+        for scenario in scenarios:
+            print(scenario.name)
+        return 0
+    if not scenarios:
+        print("no scenarios match the given filters", file=sys.stderr)
+        return 2
+
+    with tempfile.TemporaryDirectory(prefix="ethernity-bench-") as work_root:
+        document = run_benchmarks(
+            scenarios,
+            repeat=args.repeat,
+            seed=args.seed,
+            config_path=args.config,
+            skip_pdf=args.skip_pdf,
+            work_root=Path(work_root),
+        )
+    print(format_summary(document))
+    if args.output is not None:
+        write_results(args.output, document)
+
+    if args.update_baseline:
+        write_results(args.baseline, document)
+        print(f"baseline updated: {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}; run with --update-baseline to create one")
+        return 0
+    comparison = compare_results(
+        document,
+        load_results(args.baseline),
+        threshold=args.threshold,
+        min_delta_seconds=args.min_delta,
+    )
+    print(format_comparison(comparison))
+    return 1 if comparison.regressions else 0
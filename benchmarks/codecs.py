@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+"""Micro-benchmarks for the fallback text codecs: `python -m benchmarks.codecs`."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections.abc import Callable, Sequence
+
+from ethernity.encoding.zbase32 import decode_fallback_lines, encode_zbase32
+from ethernity.render.fallback_text import format_zbase32_lines
+
+from .scenarios import DEFAULT_SEED, PAYLOAD_SIZES
+
+# Matches the recovery document's grouping so decode sees text shaped like a pasted fallback.
+FALLBACK_GROUP_SIZE = 4
+FALLBACK_LINE_LENGTH = 80
+
+
+def _best_of(func: Callable[[], object], *, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def time_zbase32(
+    sizes: Sequence[str] = tuple(PAYLOAD_SIZES),
+    *,
+    repeat: int = 5,
+    seed: int = DEFAULT_SEED,
+) -> dict[str, dict[str, float]]:
+    """Return the best encode/decode seconds per payload size tier.
+
+    Decoding runs over grouped fallback lines, so separator stripping is included.
+    """
+
+    results: dict[str, dict[str, float]] = {}
+    for size in sizes:
+        data = random.Random(f"{seed}:{size}").randbytes(PAYLOAD_SIZES[size])
+        encoded = encode_zbase32(data)
+        lines = format_zbase32_lines(
+            encoded,
+            group_size=FALLBACK_GROUP_SIZE,
+            line_length=FALLBACK_LINE_LENGTH,
+            line_count=None,
+        )
+        if decode_fallback_lines(lines) != data:
+            raise RuntimeError(f"z-base-32 round trip mismatch for size {size}")
+        results[size] = {
+            "bytes": float(len(data)),
+            "encode_seconds": _best_of(lambda: encode_zbase32(data), repeat=repeat),
+            "decode_seconds": _best_of(lambda: decode_fallback_lines(lines), repeat=repeat),
+        }
+    return results
+
+
+def format_codec_results(results: dict[str, dict[str, float]]) -> str:
+    rows = [f"{'size':>6}  {'encode ms':>10}  {'decode ms':>10}  {'decode MiB/s':>12}"]
+    for size, entry in results.items():
+        decode_seconds = entry["decode_seconds"]
+        throughput = entry["bytes"] / (1 << 20) / decode_seconds if decode_seconds else 0.0
+        rows.append(
+            f"{size:>6}  {entry['encode_seconds'] * 1000:>10.2f}  "
+            f"{decode_seconds * 1000:>10.2f}  {throughput:>12.1f}"
+        )
+    return "\n".join(rows)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.codecs",
+        description="Time z-base-32 encoding and fallback-text decoding.",
+    )
+    parser.add_argument(
+        "--size",
+        action="append",
+        choices=tuple(PAYLOAD_SIZES),
+        default=[],
+        help="payload size tier to time (repeatable; default all)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="runs per size (best kept)")
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    print(format_codec_results(time_zbase32(args.size or tuple(PAYLOAD_SIZES), repeat=args.repeat)))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+"""Run one scenario end to end and attribute wall time to individual pipeline stages."""
+
+from __future__ import annotations
+
+import functools
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any
+
+from ethernity.cli.features.backup import execution as backup_execution
+from ethernity.cli.shared.io.frames import _frame_from_scanned_payload
+from ethernity.config import AppConfig, apply_template_design
+from ethernity.core.models import DocumentPlan, ShardingConfig
+from ethernity.crypto import decrypt_bytes, sharding as sharding_module
+from ethernity.encoding.chunking import reassemble_payload
+from ethernity.encoding.framing import FrameType
+from ethernity.formats import envelope_codec, payload_codec
+from ethernity.qr import scan as scan_module
+from ethernity.render import html_to_pdf, pdf_render
+from ethernity.render.service import RenderService
+
+from .scenarios import DEFAULT_SEED, Scenario, scenario_inputs
+
+STAGES = (
+    "envelope",
+    "compression",
+    "encryption",
+    "sharding",
+    "chunk_size",
+    "framing",
+    "qr_rasterization",
+    "layout",
+    "templating",
+    "pdf",
+    "scan",
+    "decode",
+)
+BENCHMARK_PASSPHRASE = "benchmark fixed passphrase do not reuse"
+
+SCAN_SOURCE_PDF = "pdf"
+SCAN_SOURCE_QR_IMAGES = "qr_images"
+
+
+class StageTimer:
+    """Accumulate exclusive wall time per stage.
+
+    Nested measurements subtract their time from the enclosing stage so every second is
+    attributed once. Instrumented calls all happen on the calling thread.
+    """
+
+    def __init__(self) -> None:
+        self.totals: dict[str, float] = dict.fromkeys(STAGES, 0.0)
+        self._child_time: list[float] = []
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        self._child_time.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self._child_time.pop()
+            self.totals[stage] += elapsed - nested
+            if self._child_time:
+                self._child_time[-1] += elapsed
+
+    def wrap(self, func: Callable[..., Any], stage: str) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with self.measure(stage):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+
+@dataclass
+class ScenarioRun:
+    """Per-stage seconds for one run plus the facts needed to compare runs."""
+
+    stages: dict[str, float]
+    wall_seconds: float
+    meta: dict[str, object] = field(default_factory=dict)
+
+    @property
+    def unattributed_seconds(self) -> float:
+        return max(0.0, self.wall_seconds - sum(self.stages.values()))
+
+
+def _instrumentation_targets() -> list[tuple[object, str, str]]:
+    """(owner, attribute, stage) triples wrapped while a scenario runs."""
+
+    return [
+        (envelope_codec, "build_manifest_and_payload_parts", "envelope"),
+        (envelope_codec, "encode_envelope", "envelope"),
+        (payload_codec, "encode_payload_parts_for_manifest", "compression"),
+        (backup_execution, "encrypt_bytes_with_passphrase", "encryption"),
+        (sharding_module, "split_passphrase", "sharding"),
+        (sharding_module, "split_signing_seed", "sharding"),
+        (backup_execution, "choose_frame_chunk_size", "chunk_size"),
+        (backup_execution, "chunk_payload", "framing"),
+        (RenderService, "build_qr_payloads", "framing"),
+        (pdf_render, "_build_qr_resources", "qr_rasterization"),
+        (pdf_render, "compute_layout", "layout"),
+        (pdf_render, "build_pages", "layout"),
+        (pdf_render, "build_fallback_sections_data", "layout"),
+        (pdf_render, "render_template", "templating"),
+        (pdf_render, "render_html_to_pdf", "pdf"),
+    ]
+
+
+@contextmanager
+def _patched(replacements: Sequence[tuple[object, str, Any]]) -> Iterator[None]:
+    originals = [(owner, name, getattr(owner, name)) for owner, name, _ in replacements]
+    try:
+        for owner, name, value in replacements:
+            setattr(owner, name, value)
+        yield
+    finally:
+        for owner, name, value in reversed(originals):
+            setattr(owner, name, value)
+
+
+def _write_placeholder_pdf(
+    html: str,
+    output_path: str | Path,
+    *,
+    resources: object = None,
+) -> None:
+    del html, resources
+    Path(output_path).write_bytes(b"")
+
+
+def _capture_first(
+    func: Callable[..., dict[str, tuple[str, bytes]]],
+    sink: list[dict[str, tuple[str, bytes]]],
+) -> Callable[..., dict[str, tuple[str, bytes]]]:
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> dict[str, tuple[str, bytes]]:
+        resources = func(*args, **kwargs)
+        if not sink:
+            sink.append(resources)
+        return resources
+
+    return wrapper
+
+
+def probe_chromium(work_dir: Path) -> str | None:
+    """Return None when Chromium can print a PDF here, otherwise a one-line reason."""
+
+    try:
+        html_to_pdf.render_html_to_pdf("<html><body></body></html>", work_dir / "probe.pdf")
+    except Exception as exc:  # noqa: BLE001 - any failure means the stage cannot run
+        detail = str(exc).strip().splitlines()
+        return f"{type(exc).__name__}: {detail[0] if detail else 'Chromium unavailable'}"
+    return None
+
+
+def scenario_config(config: AppConfig, scenario: Scenario) -> AppConfig:
+    """Apply a scenario's design and payload codec to a base config."""
+
+    config = apply_template_design(config, scenario.design)
+    defaults = config.cli_defaults
+    backup_defaults = replace(defaults.backup, payload_codec=scenario.payload_codec)
+    return replace(config, cli_defaults=replace(defaults, backup=backup_defaults))
+
+
+def scenario_plan(scenario: Scenario) -> DocumentPlan:
+    threshold = scenario.shard_threshold
+    sharding = ShardingConfig(threshold=threshold[0], shares=threshold[1]) if threshold else None
+    return DocumentPlan(version=1, sealed=False, sharding=sharding)
+
+
+def _scan_qr_images(resources: dict[str, tuple[str, bytes]]) -> list[bytes]:
+    decoder = scan_module._load_decoder()
+    payloads: list[bytes] = []
+    for _content_type, image in resources.values():
+        payloads.extend(decoder.decode_image_bytes(image))
+    return payloads
+
+
+def _decode_payloads(
+    payloads: Sequence[bytes],
+    *,
+    doc_id: bytes,
+) -> tuple[bytes, list[tuple[str, bytes]]]:
+    frames = [_frame_from_scanned_payload(payload) for payload in payloads]
+    main_frames = [frame for frame in frames if frame.frame_type == FrameType.MAIN_DOCUMENT]
+    ciphertext = reassemble_payload(
+        main_frames,
+        expected_doc_id=doc_id,
+        expected_frame_type=FrameType.MAIN_DOCUMENT,
+    )
+    plaintext = decrypt_bytes(ciphertext, passphrase=BENCHMARK_PASSPHRASE)
+    manifest, payload = envelope_codec.decode_envelope(plaintext)
+    extracted = envelope_codec.extract_payloads(manifest, payload)
+    return ciphertext, [(entry.path, data) for entry, data in extracted]
+
+
+def run_scenario(
+    scenario: Scenario,
+    *,
+    config: AppConfig,
+    work_dir: Path,
+    render_pdf: bool = True,
+    seed: int = DEFAULT_SEED,
+) -> ScenarioRun:
+    """Back up and recover one scenario, returning exclusive seconds per stage.
+
+    `work_dir` must be empty or missing; output documents are written beneath it. When
+    `render_pdf` is false the Chromium stage is replaced by an empty file and the scan stage
+    decodes the rasterized QR images instead of the PDF.
+    """
+
+    input_files = scenario_inputs(scenario, seed=seed)
+    run_config = scenario_config(config, scenario)
+    plan = scenario_plan(scenario)
+    timer = StageTimer()
+    qr_resources: list[dict[str, tuple[str, bytes]]] = []
+
+    replacements: list[tuple[object, str, Any]] = []
+    for owner, name, stage in _instrumentation_targets():
+        func = getattr(owner, name)
+        if owner is pdf_render and name == "render_html_to_pdf" and not render_pdf:
+            replacements.append((owner, name, _write_placeholder_pdf))
+            continue
+        if owner is pdf_render and name == "_build_qr_resources":
+            func = _capture_first(func, qr_resources)
+        replacements.append((owner, name, timer.wrap(func, stage)))
+
+    work_dir.mkdir(parents=True, exist_ok=True)
+    wall_start = time.perf_counter()
+    with _patched(replacements):
+        result = backup_execution.run_backup(
+            input_files=input_files,
+            base_dir=None,
+            output_dir=str(work_dir / "backup"),
+            plan=plan,
+            passphrase=BENCHMARK_PASSPHRASE,
+            config=run_config,
+            quiet=True,
+        )
+    with timer.measure("scan"):
+        if render_pdf:
+            payloads = scan_module.scan_qr_payloads([result.qr_path])
+        else:
+            payloads = _scan_qr_images(qr_resources[0])
+    with timer.measure("decode"):
+        ciphertext, recovered = _decode_payloads(payloads, doc_id=result.doc_id)
+    wall_seconds = time.perf_counter() - wall_start
+
+    expected = [(item.relative_path, item.data) for item in input_files]
+    if recovered != expected:
+        raise RuntimeError(f"round trip mismatch for scenario {scenario.name}")
+
+    return ScenarioRun(
+        stages=timer.totals,
+        wall_seconds=wall_seconds,
+        meta={
+            "ciphertext_bytes": len(ciphertext),
+            "frame_count": len(payloads),
+            "shard_documents": len(result.shard_paths),
+            "scan_source": SCAN_SOURCE_PDF if render_pdf else SCAN_SOURCE_QR_IMAGES,
+        },
+    )
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+"""Benchmark result documents and baseline comparison."""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import statistics
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from ethernity.version import get_ethernity_version
+
+from .pipeline import STAGES, ScenarioRun
+from .scenarios import Scenario
+
+RESULTS_FORMAT = 1
+DEFAULT_THRESHOLD = 0.15
+DEFAULT_MIN_DELTA_SECONDS = 0.005
+TOTAL_KEY = "total"
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A stage whose median slowed down beyond both the ratio and the noise floor."""
+
+    scenario: str
+    stage: str
+    baseline_seconds: float
+    current_seconds: float
+
+    @property
+    def ratio(self) -> float:
+        if self.baseline_seconds <= 0:
+            return float("inf")
+        return self.current_seconds / self.baseline_seconds
+
+
+@dataclass(frozen=True)
+class Comparison:
+    regressions: list[Regression]
+    improvements: list[Regression]
+    missing: list[str]
+    incomparable: dict[str, str]
+
+
+def environment_info() -> dict[str, Any]:
+    return {
+        "ethernity_version": get_ethernity_version(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def _stage_summary(samples: list[float]) -> dict[str, Any]:
+    return {
+        "median_s": statistics.median(samples),
+        "min_s": min(samples),
+        "runs_s": samples,
+    }
+
+
+def scenario_result(
+    scenario: Scenario,
+    runs: list[ScenarioRun],
+    *,
+    skipped: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """Summarize repeated runs of one scenario into its JSON entry."""
+
+    skipped = dict(skipped or {})
+    stages: dict[str, Any] = {}
+    for stage in STAGES:
+        if stage in skipped:
+            continue
+        stages[stage] = _stage_summary([run.stages[stage] for run in runs])
+    stages["unattributed"] = _stage_summary([run.unattributed_seconds for run in runs])
+    stages[TOTAL_KEY] = _stage_summary([run.wall_seconds for run in runs])
+    return {
+        "params": scenario.to_dict(),
+        "meta": dict(runs[0].meta) if runs else {},
+        "skipped": skipped,
+        "stages": stages,
+    }
+
+
+def scenario_error(scenario: Scenario, exc: BaseException) -> dict[str, Any]:
+    return {
+        "params": scenario.to_dict(),
+        "error": f"{type(exc).__name__}: {exc}",
+    }
+
+
+def results_document(scenarios: dict[str, dict[str, Any]], *, repeat: int) -> dict[str, Any]:
+    return {
+        "format": RESULTS_FORMAT,
+        "created_utc": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "repeat": repeat,
+        "environment": environment_info(),
+        "scenarios": scenarios,
+    }
+
+
+def load_results(path: Path) -> dict[str, Any]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(data, dict) or data.get("format") != RESULTS_FORMAT:
+        raise ValueError(f"unsupported benchmark results format in {path}")
+    return data
+
+
+def write_results(path: Path, document: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def compare_results(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    min_delta_seconds: float = DEFAULT_MIN_DELTA_SECONDS,
+) -> Comparison:
+    """Compare stage medians scenario by scenario.
+
+    A stage regresses when its median exceeds the baseline by more than `threshold` (a
+    ratio) *and* by more than `min_delta_seconds`, so sub-millisecond stages cannot flap.
+    Scenarios whose scan source or frame count changed are reported as incomparable. The
+    ciphertext size is not compared: the manifest timestamp makes it drift by a few bytes
+    between otherwise identical runs.
+    """
+
+    regressions: list[Regression] = []
+    improvements: list[Regression] = []
+    missing: list[str] = []
+    incomparable: dict[str, str] = {}
+    baseline_scenarios = baseline.get("scenarios", {})
+    for name, entry in current.get("scenarios", {}).items():
+        base_entry = baseline_scenarios.get(name)
+        if base_entry is None:
+            missing.append(name)
+            continue
+        if "error" in entry or "error" in base_entry:
+            incomparable[name] = "scenario failed in current or baseline run"
+            continue
+        reason = _incomparable_reason(entry.get("meta", {}), base_entry.get("meta", {}))
+        if reason is not None:
+            incomparable[name] = reason
+            continue
+        for stage, summary in entry.get("stages", {}).items():
+            base_summary = base_entry.get("stages", {}).get(stage)
+            if base_summary is None:
+                continue
+            finding = Regression(
+                scenario=name,
+                stage=stage,
+                baseline_seconds=float(base_summary["median_s"]),
+                current_seconds=float(summary["median_s"]),
+            )
+            delta = finding.current_seconds - finding.baseline_seconds
+            limit = finding.baseline_seconds * threshold
+            if delta > limit and delta > min_delta_seconds:
+                regressions.append(finding)
+            elif -delta > limit and -delta > min_delta_seconds:
+                improvements.append(finding)
+    return Comparison(
+        regressions=regressions,
+        improvements=improvements,
+        missing=missing,
+        incomparable=incomparable,
+    )
+
+
+def _incomparable_reason(meta: dict[str, Any], base_meta: dict[str, Any]) -> str | None:
+    for key in ("scan_source", "frame_count"):
+        if key in meta and key in base_meta and meta[key] != base_meta[key]:
+            return f"{key} changed: {base_meta[key]} -> {meta[key]}"
+    return None
+
+
+def format_summary(current: dict[str, Any]) -> str:
+    lines: list[str] = []
+    for name, entry in current.get("scenarios", {}).items():
+        lines.append(name)
+        if "error" in entry:
+            lines.append(f"  error: {entry['error']}")
+            continue
+        for stage, summary in entry["stages"].items():
+            lines.append(f"  {stage:<18} {summary['median_s'] * 1000:10.2f} ms")
+        for stage, reason in entry.get("skipped", {}).items():
+            lines.append(f"  {stage:<18} skipped ({reason})")
+    return "\n".join(lines)
+
+
+def format_comparison(comparison: Comparison) -> str:
+    lines: list[str] = []
+    for label, findings in (
+        ("REGRESSION", comparison.regressions),
+        ("improved", comparison.improvements),
+    ):
+        for finding in findings:
+            lines.append(
+                f"{label}: {finding.scenario} [{finding.stage}] "
+                f"{finding.baseline_seconds * 1000:.2f} ms -> "
+                f"{finding.current_seconds * 1000:.2f} ms (x{finding.ratio:.2f})"
+            )
+    for name in comparison.missing:
+        lines.append(f"not in baseline: {name}")
+    for name, reason in comparison.incomparable.items():
+        lines.append(f"not compared: {name} ({reason})")
+    if not lines:
+        lines.append("no significant changes against baseline")
+    return "\n".join(lines)
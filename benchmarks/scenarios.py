@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+"""Fixed, reproducible benchmark scenarios for the backup/recovery pipeline."""
+
+from __future__ import annotations
+
+import itertools
+import random
+from dataclasses import asdict, dataclass
+
+from ethernity.cli.shared.types import InputFile
+from ethernity.config.paths import SUPPORTED_TEMPLATE_DESIGNS
+from ethernity.core.bounds import MAX_CIPHERTEXT_BYTES
+
+# Input sizes are chosen so the raw-codec ciphertext lands near the named tier. The largest
+# tier is further capped per file count (see `Scenario.payload_bytes`) so it still fits under
+# MAX_CIPHERTEXT_BYTES once manifest and age overhead are added.
+PAYLOAD_SIZES: dict[str, int] = {
+    "1k": 1_024,
+    "100k": 102_400,
+    "1m": 960_000,
+}
+# Envelope bytes available to the payload and manifest, leaving room for the age header and
+# per-chunk tags. Each manifest file entry costs about 58 bytes for the paths used here.
+_ENVELOPE_BUDGET_BYTES = MAX_CIPHERTEXT_BYTES - 4_096
+_MANIFEST_ENTRY_BYTES = 64
+FILE_COUNTS = (1, 2048)
+PAYLOAD_CODECS = ("gzip", "raw")
+SHARDINGS: dict[str, tuple[int, int] | None] = {
+    "none": None,
+    "3of5": (3, 5),
+    "10of20": (10, 20),
+}
+DEFAULT_DESIGN = "sentinel"
+DEFAULT_SEED = 20260101
+FIXED_MTIME = 1_700_000_000
+
+# Inputs draw from a 17-symbol alphabet so gzip has something to do without the payload
+# collapsing to nothing; raw keeps the full size.
+_ALPHABET = b"abcdefghijklmnop "
+_TRANSLATE = bytes(_ALPHABET[index % len(_ALPHABET)] for index in range(256))
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One benchmark configuration; `name` is stable across runs and used as the baseline key."""
+
+    size: str
+    file_count: int
+    payload_codec: str
+    sharding: str
+    design: str
+
+    @property
+    def name(self) -> str:
+        return (
+            f"size={self.size},files={self.file_count},codec={self.payload_codec},"
+            f"shards={self.sharding},design={self.design}"
+        )
+
+    @property
+    def payload_bytes(self) -> int:
+        manifest_bytes = self.file_count * _MANIFEST_ENTRY_BYTES
+        return min(PAYLOAD_SIZES[self.size], _ENVELOPE_BUDGET_BYTES - manifest_bytes)
+
+    @property
+    def shard_threshold(self) -> tuple[int, int] | None:
+        return SHARDINGS[self.sharding]
+
+    def to_dict(self) -> dict[str, object]:
+        data: dict[str, object] = asdict(self)
+        data["payload_bytes"] = self.payload_bytes
+        return data
+
+
+BASE_SCENARIO = Scenario(
+    size="100k",
+    file_count=1,
+    payload_codec="raw",
+    sharding="none",
+    design=DEFAULT_DESIGN,
+)
+
+
+def default_scenarios() -> list[Scenario]:
+    """Vary one axis at a time around `BASE_SCENARIO` (the CI-sized matrix)."""
+
+    variants: list[Scenario] = [BASE_SCENARIO]
+    axes: tuple[tuple[str, tuple[object, ...]], ...] = (
+        ("size", tuple(PAYLOAD_SIZES)),
+        ("file_count", FILE_COUNTS),
+        ("payload_codec", PAYLOAD_CODECS),
+        ("sharding", tuple(SHARDINGS)),
+        ("design", SUPPORTED_TEMPLATE_DESIGNS),
+    )
+    for field_name, values in axes:
+        for value in values:
+            scenario = Scenario(**{**asdict(BASE_SCENARIO), field_name: value})
+            if scenario not in variants:
+                variants.append(scenario)
+    return variants
+
+
+def full_scenarios() -> list[Scenario]:
+    """Return the full cross product of every axis."""
+
+    return [
+        Scenario(
+            size=size,
+            file_count=file_count,
+            payload_codec=codec,
+            sharding=sharding,
+            design=design,
+        )
+        for size, file_count, codec, sharding, design in itertools.product(
+            PAYLOAD_SIZES,
+            FILE_COUNTS,
+            PAYLOAD_CODECS,
+            SHARDINGS,
+            SUPPORTED_TEMPLATE_DESIGNS,
+        )
+    ]
+
+
+def scenario_inputs(scenario: Scenario, *, seed: int = DEFAULT_SEED) -> list[InputFile]:
+    """Build deterministic input files for a scenario.
+
+    The payload is split as evenly as possible across `file_count` files, so the same
+    scenario and seed always produce byte-identical inputs.
+    """
+
+    rng = random.Random(f"{seed}:{scenario.size}:{scenario.file_count}")
+    data = rng.randbytes(scenario.payload_bytes).translate(_TRANSLATE)
+    base, extra = divmod(len(data), scenario.file_count)
+    width = len(str(scenario.file_count - 1))
+    files: list[InputFile] = []
+    offset = 0
+    for index in range(scenario.file_count):
+        size = base + (1 if index < extra else 0)
+        relative_path = f"data/file-{index:0{width}d}.txt"
+        files.append(
+            InputFile(
+                source_path=None,
+                relative_path=relative_path,
+                data=data[offset : offset + size],
+                mtime=FIXED_MTIME,
+            )
+        )
+        offset += size
+    return files
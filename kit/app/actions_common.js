@@ -29,6 +29,7 @@ export function dispatchState(dispatch, state) {
         next[key] = state[key];
       }
       next.mainFrames = new Map(state.mainFrames);
+      next.parityFrames = new Map(state.parityFrames);
       next.shardFrames = new Map(state.shardFrames);
       next.extractedFiles = state.extractedFiles.slice();
       next.frameStatus = { ...state.frameStatus };
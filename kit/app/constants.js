@@ -18,10 +18,12 @@
 export const FRAME_MAGIC = [0x41, 0x50]; // "AP"
 export const ENVELOPE_MAGIC = [0x41, 0x59]; // "AY"
 export const FRAME_VERSION = 1;
+export const FRAME_VERSION_PARITY = 2;
 export const ENVELOPE_VERSION = 1;
 export const FRAME_TYPE_MAIN = 0x44; // "D"
 export const FRAME_TYPE_KEY = 0x4b; // "K"
 export const FRAME_TYPE_AUTH = 0x41; // "A"
+export const FRAME_TYPE_PARITY = 0x50; // "P"
 export const DOC_ID_LEN = 8;
 export const MANIFEST_VERSION = 1;
 export const SHARD_VERSION = 1;
@@ -37,6 +39,8 @@ export const PATH_ENCODING_PREFIX_TABLE = "prefix_table";
 export const MAX_CIPHERTEXT_BYTES = 1_048_576;
 export const MAX_MAIN_FRAME_DATA_BYTES = 1_048_576;
 export const MAX_MAIN_FRAME_TOTAL = 4_096;
+export const MAX_PARITY_FRAME_TOTAL = 255;
+export const MAX_PARITY_FRAME_DATA_BYTES = MAX_MAIN_FRAME_DATA_BYTES + 32;
 export const MAX_QR_PAYLOAD_CHARS = 3_072;
 export const MAX_AUTH_CBOR_BYTES = 512;
 export const MAX_SHARD_CBOR_BYTES = 2_048;
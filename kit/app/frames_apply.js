@@ -15,15 +15,31 @@
  * If not, see <https://www.gnu.org/licenses/>.
  */
 
-import { bytesEqual, bytesToHex } from "../lib/encoding.js";
-import { FRAME_TYPE_AUTH, FRAME_TYPE_KEY, FRAME_TYPE_MAIN } from "./constants.js";
-import { decodeAuthPayload, decodeShardPayload } from "./frames_protocol.js";
+import { bytesEqual, bytesToHex, hexToBytes } from "../lib/encoding.js";
+import { recoverChunks } from "../lib/erasure.js";
+import {
+  FRAME_TYPE_AUTH,
+  FRAME_TYPE_KEY,
+  FRAME_TYPE_MAIN,
+  FRAME_TYPE_PARITY,
+  FRAME_VERSION,
+} from "./constants.js";
+import {
+  decodeAuthPayload,
+  decodeParityData,
+  decodeShardPayload,
+  parityChunkLayout,
+} from "./frames_protocol.js";
 
 export function addFrame(state, frame) {
   if (frame.frameType === FRAME_TYPE_AUTH) {
     addAuthFrame(state, frame);
     return;
   }
+  if (frame.frameType === FRAME_TYPE_PARITY) {
+    addParityFrame(state, frame);
+    return;
+  }
   if (frame.frameType !== FRAME_TYPE_MAIN) {
     state.ignored += 1;
     return;
@@ -53,6 +69,101 @@ export function addFrame(state, frame) {
   state.mainFrames.set(frame.index, frame);
   state.ciphertext = null;
   state.cipherDocHashHex = null;
+  recoverFromParity(state);
+}
+
+export function addParityFrame(state, frame) {
+  const docIdHex = bytesToHex(frame.docId);
+  if (state.docIdHex && state.docIdHex !== docIdHex) {
+    state.ignored += 1;
+    return;
+  }
+  let parity;
+  try {
+    parity = decodeParityData(frame.data);
+  } catch {
+    state.errors += 1;
+    return;
+  }
+  const layout = {
+    dataTotal: parity.dataTotal,
+    payloadLen: parity.payloadLen,
+    parityTotal: frame.total,
+  };
+  if (state.total !== null && state.total !== layout.dataTotal) {
+    state.conflicts += 1;
+    return;
+  }
+  const known = state.parityLayout;
+  if (
+    known &&
+    (known.dataTotal !== layout.dataTotal ||
+      known.payloadLen !== layout.payloadLen ||
+      known.parityTotal !== layout.parityTotal)
+  ) {
+    state.conflicts += 1;
+    return;
+  }
+  const existing = state.parityFrames.get(frame.index);
+  if (existing) {
+    if (!bytesEqual(existing, parity.parity)) {
+      state.conflicts += 1;
+    } else {
+      state.duplicates += 1;
+    }
+    return;
+  }
+  state.docIdHex = docIdHex;
+  state.total = layout.dataTotal;
+  state.parityLayout = layout;
+  state.parityFrames.set(frame.index, parity.parity);
+  recoverFromParity(state);
+}
+
+function recoverFromParity(state) {
+  const layout = state.parityLayout;
+  if (!layout || state.total !== layout.dataTotal) return;
+  const missing = state.total - state.mainFrames.size;
+  if (missing <= 0 || missing > state.parityFrames.size) return;
+  const { chunkLen, sizeOf } = parityChunkLayout(layout.dataTotal, layout.payloadLen);
+  const chunks = new Map();
+  for (const [index, frame] of state.mainFrames) {
+    if (frame.data.length !== sizeOf(index)) {
+      state.conflicts += 1;
+      return;
+    }
+    const padded = new Uint8Array(chunkLen);
+    padded.set(frame.data);
+    chunks.set(index, padded);
+  }
+  let recovered;
+  try {
+    recovered = recoverChunks({
+      chunks,
+      parity: state.parityFrames,
+      dataTotal: layout.dataTotal,
+      parityTotal: layout.parityTotal,
+      chunkLen,
+    });
+  } catch {
+    state.errors += 1;
+    return;
+  }
+  const docId = hexToBytes(state.docIdHex);
+  for (const [index, chunk] of recovered) {
+    state.mainFrames.set(index, {
+      version: FRAME_VERSION,
+      frameType: FRAME_TYPE_MAIN,
+      docId,
+      index,
+      total: layout.dataTotal,
+      data: chunk.slice(0, sizeOf(index)),
+      recovered: true,
+    });
+  }
+  state.recoveredFrames += recovered.size;
+  state.ciphertext = null;
+  state.cipherDocHashHex = null;
 }
 
 export function addAuthFrame(state, frame) {
@@ -15,7 +15,12 @@
  * If not, see <https://www.gnu.org/licenses/>.
  */
 
-import { decodePayloadString, decodeZBase32, filterZBase32Lines } from "../lib/encoding.js";
+import {
+  decodeBase45,
+  decodePayloadString,
+  decodeZBase32,
+  filterZBase32Lines,
+} from "../lib/encoding.js";
 import {
   FRAME_TYPE_KEY,
   MAX_FALLBACK_LINES,
@@ -78,6 +83,33 @@ function getScannedBytes(input) {
   }
 }
 
+function asciiText(bytes) {
+  let text = "";
+  for (const value of bytes) {
+    if (value > 0x7f) return null;
+    text += String.fromCharCode(value);
+  }
+  return text;
+}
+
+// base45 uses spaces and overlaps the base64 alphabet, so it is tried last on the untrimmed
+// scan text; the frame magic and CRC reject text that only happens to parse as base45.
+function decodeScannedBase45Frame(scanned) {
+  const candidates = [getScannedText(scanned)];
+  const bytes = getScannedBytes(scanned);
+  if (bytes?.length) candidates.push(asciiText(bytes));
+  for (const candidate of candidates) {
+    const decoded = candidate ? decodeBase45(candidate) : null;
+    if (!decoded) continue;
+    try {
+      return decodeFrame(decoded);
+    } catch {
+      // try the next candidate
+    }
+  }
+  return null;
+}
+
 function nonEmptyLines(text) {
   return text
     .split(/\r?\n/)
@@ -310,6 +342,11 @@ export function parseScannedPayload(state, scanned) {
     try {
       return parseAutoPayload(state, text);
     } catch {
+      const frame = decodeScannedBase45Frame(scanned);
+      if (frame) {
+        addFrame(state, frame);
+        return 1;
+      }
       bumpError(state, "errors");
       return 0;
     }
@@ -344,6 +381,11 @@ export function parseScannedShard(state, scanned) {
     try {
       return parseAutoShard(state, text);
     } catch {
+      const frame = decodeScannedBase45Frame(scanned);
+      if (frame?.frameType === FRAME_TYPE_KEY) {
+        addShardFrame(state, frame);
+        return 1;
+      }
       bumpError(state, "shardErrors");
       return 0;
     }
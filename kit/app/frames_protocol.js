@@ -21,9 +21,11 @@ import { decodeCanonicalCbor } from "../lib/cbor.js";
 import {
   FRAME_MAGIC,
   FRAME_VERSION,
+  FRAME_VERSION_PARITY,
   FRAME_TYPE_MAIN,
   FRAME_TYPE_AUTH,
   FRAME_TYPE_KEY,
+  FRAME_TYPE_PARITY,
   DOC_ID_LEN,
   AUTH_VERSION,
   SHARD_VERSION,
@@ -32,8 +34,11 @@ import {
   SIGNING_SEED_LEN,
   MAX_SHARD_SHARES,
   MAX_AUTH_CBOR_BYTES,
+  MAX_CIPHERTEXT_BYTES,
   MAX_MAIN_FRAME_DATA_BYTES,
   MAX_MAIN_FRAME_TOTAL,
+  MAX_PARITY_FRAME_DATA_BYTES,
+  MAX_PARITY_FRAME_TOTAL,
   MAX_SHARD_CBOR_BYTES,
 } from "./constants.js";
 
@@ -48,7 +53,7 @@ export function decodeFrame(payload) {
   const versionRes = readUvarint(payload, idx);
   const version = versionRes.value;
   idx = versionRes.offset;
-  if (version !== FRAME_VERSION) {
+  if (version !== FRAME_VERSION && version !== FRAME_VERSION_PARITY) {
     throw new Error(`unsupported frame version: ${version}`);
   }
   if (idx >= payload.length) throw new Error("missing frame type");
@@ -56,10 +61,15 @@ export function decodeFrame(payload) {
   if (
     frameType !== FRAME_TYPE_MAIN &&
     frameType !== FRAME_TYPE_AUTH &&
-    frameType !== FRAME_TYPE_KEY
+    frameType !== FRAME_TYPE_KEY &&
+    frameType !== FRAME_TYPE_PARITY
   ) {
     throw new Error(`unsupported frame type: ${frameType}`);
   }
+  const expectedVersion = frameType === FRAME_TYPE_PARITY ? FRAME_VERSION_PARITY : FRAME_VERSION;
+  if (version !== expectedVersion) {
+    throw new Error(`unsupported frame version for frame type ${frameType}: ${version}`);
+  }
   const docId = payload.slice(idx, idx + DOC_ID_LEN);
   if (docId.length !== DOC_ID_LEN) throw new Error("missing doc_id");
   idx += DOC_ID_LEN;
@@ -99,6 +109,18 @@ export function decodeFrame(payload) {
           `MAX_MAIN_FRAME_DATA_BYTES (${MAX_MAIN_FRAME_DATA_BYTES}): ${dataLen} bytes`,
       );
     }
+  } else if (frameType === FRAME_TYPE_PARITY) {
+    if (total > MAX_PARITY_FRAME_TOTAL) {
+      throw new Error(
+        `PARITY total exceeds MAX_PARITY_FRAME_TOTAL (${MAX_PARITY_FRAME_TOTAL}): ${total}`,
+      );
+    }
+    if (dataLen > MAX_PARITY_FRAME_DATA_BYTES) {
+      throw new Error(
+        "PARITY data exceeds " +
+          `MAX_PARITY_FRAME_DATA_BYTES (${MAX_PARITY_FRAME_DATA_BYTES}): ${dataLen} bytes`,
+      );
+    }
   } else if (frameType === FRAME_TYPE_AUTH) {
     if (total !== 1 || index !== 0) {
       throw new Error("AUTH payload must be a single-frame payload (index=0,total=1)");
@@ -133,6 +155,33 @@ export function decodeFrame(payload) {
   return { version, frameType, docId, index, total, data, raw: payload };
 }
 
+export function parityChunkLayout(dataTotal, payloadLen) {
+  const base = Math.floor(payloadLen / dataTotal);
+  const remainder = payloadLen % dataTotal;
+  return {
+    chunkLen: base + (remainder ? 1 : 0),
+    sizeOf: (index) => base + (index < remainder ? 1 : 0),
+  };
+}
+
+export function decodeParityData(bytes) {
+  const totalRes = readUvarint(bytes, 0);
+  const dataTotal = totalRes.value;
+  const lenRes = readUvarint(bytes, totalRes.offset);
+  const payloadLen = lenRes.value;
+  if (dataTotal <= 0 || dataTotal > MAX_MAIN_FRAME_TOTAL) {
+    throw new Error(`PARITY data_total out of range: ${dataTotal}`);
+  }
+  if (payloadLen < dataTotal || payloadLen > MAX_CIPHERTEXT_BYTES) {
+    throw new Error(`PARITY payload_len out of range: ${payloadLen}`);
+  }
+  const parity = bytes.slice(lenRes.offset);
+  if (parity.length !== parityChunkLayout(dataTotal, payloadLen).chunkLen) {
+    throw new Error("PARITY row length does not match the MAIN frame layout");
+  }
+  return { dataTotal, payloadLen, parity };
+}
+
 export function decodeShardPayload(bytes) {
   const decoded = decodeCanonicalCbor(bytes, "shard payload");
   if (decoded === null || typeof decoded !== "object" || Array.isArray(decoded)) {
@@ -19,6 +19,9 @@ export function createBaseState() {
   return {
     revision: 0,
     mainFrames: new Map(),
+    parityFrames: new Map(),
+    parityLayout: null,
+    recoveredFrames: 0,
     docIdHex: null,
     total: null,
     duplicates: 0,
@@ -94,6 +97,7 @@ export function cloneState(state) {
   return {
     ...state,
     mainFrames: new Map(state.mainFrames),
+    parityFrames: new Map(state.parityFrames),
     shardFrames: new Map(state.shardFrames),
     extractedFiles: state.extractedFiles.slice(),
     frameStatus: { ...state.frameStatus },
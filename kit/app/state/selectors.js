@@ -44,7 +44,9 @@ function describeMissingFrames(state) {
   if (missingCount === 0) {
     return {
       value: "Complete",
-      detail: "All frames collected.",
+      detail: state.recoveredFrames
+        ? `All frames collected (${state.recoveredFrames} rebuilt from parity).`
+        : "All frames collected.",
       tone: TONE_OK,
     };
   }
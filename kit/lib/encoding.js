@@ -19,6 +19,8 @@ import { MAX_QR_PAYLOAD_CHARS } from "../app/constants.js";
 
 const ZBASE32_ALPHABET = "ybndrfg8ejkmcpqxot1uwisza345h769";
 const BASE64_ALPHABET = /^[A-Za-z0-9+/]+$/;
+// RFC 9285 alphabet; identical to the QR alphanumeric-mode character set.
+const BASE45_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ $%*+-./:";
 const MAX_UVARINT = (1n << 64n) - 1n;
 const BASE64_BINARY_CHUNK = 0x8000;
 
@@ -66,6 +68,32 @@ export function decodePayloadString(text) {
   return null;
 }
 
+export function decodeBase45(text) {
+  if (!text || text.length > MAX_QR_PAYLOAD_CHARS || text.length % 3 === 1) return null;
+  const digits = new Array(text.length);
+  for (let i = 0; i < text.length; i += 1) {
+    const value = BASE45_ALPHABET.indexOf(text[i]);
+    if (value === -1) return null;
+    digits[i] = value;
+  }
+  const out = new Uint8Array(Math.floor(text.length / 3) * 2 + (text.length % 3 ? 1 : 0));
+  let pos = 0;
+  let offset = 0;
+  for (; offset + 3 <= digits.length; offset += 3) {
+    const value = digits[offset] + digits[offset + 1] * 45 + digits[offset + 2] * 45 * 45;
+    if (value > 0xffff) return null;
+    out[pos] = value >> 8;
+    out[pos + 1] = value & 0xff;
+    pos += 2;
+  }
+  if (offset < digits.length) {
+    const value = digits[offset] + digits[offset + 1] * 45;
+    if (value > 0xff) return null;
+    out[pos] = value;
+  }
+  return out;
+}
+
 function encodeZBase32(bytes) {
   if (!(bytes instanceof Uint8Array)) {
     throw new Error("encodeZBase32 expects Uint8Array");
@@ -0,0 +1,141 @@
+/*
+ * Copyright (C) 2026 Alex Stoyanov
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation; either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License along with this program.
+ * If not, see <https://www.gnu.org/licenses/>.
+ */
+
+// Systematic Reed-Solomon erasure decoding over GF(256), matching
+// src/ethernity/encoding/erasure.py: parity row j weights data chunk i by the Cauchy
+// coefficient 1 / ((dataTotal + j) ^ i).
+
+export const MAX_ERASURE_SHARDS = 256;
+
+const GF_POLY = 0x11d;
+const GF_EXP = new Uint8Array(512);
+const GF_LOG = new Uint8Array(256);
+
+(() => {
+  let value = 1;
+  for (let power = 0; power < 255; power += 1) {
+    GF_EXP[power] = value;
+    GF_LOG[value] = power;
+    value <<= 1;
+    if (value & 0x100) value ^= GF_POLY;
+  }
+  for (let power = 255; power < 512; power += 1) {
+    GF_EXP[power] = GF_EXP[power - 255];
+  }
+})();
+
+function gfMul(left, right) {
+  if (left === 0 || right === 0) return 0;
+  return GF_EXP[GF_LOG[left] + GF_LOG[right]];
+}
+
+function gfInv(value) {
+  if (value === 0) throw new Error("zero has no inverse in GF(256)");
+  return GF_EXP[255 - GF_LOG[value]];
+}
+
+export function parityCoefficient(row, index, dataTotal) {
+  return gfInv((dataTotal + row) ^ index);
+}
+
+function addScaled(target, chunk, coefficient) {
+  if (coefficient === 0) return;
+  if (coefficient === 1) {
+    for (let i = 0; i < target.length; i += 1) target[i] ^= chunk[i];
+    return;
+  }
+  const logCoefficient = GF_LOG[coefficient];
+  for (let i = 0; i < target.length; i += 1) {
+    const value = chunk[i];
+    if (value !== 0) target[i] ^= GF_EXP[logCoefficient + GF_LOG[value]];
+  }
+}
+
+function invertMatrix(matrix) {
+  const size = matrix.length;
+  const work = matrix.map((row, idx) => {
+    const extended = row.slice();
+    for (let col = 0; col < size; col += 1) extended.push(col === idx ? 1 : 0);
+    return extended;
+  });
+  for (let col = 0; col < size; col += 1) {
+    let pivot = col;
+    while (pivot < size && work[pivot][col] === 0) pivot += 1;
+    if (pivot === size) throw new Error("erasure decoding matrix is singular");
+    [work[col], work[pivot]] = [work[pivot], work[col]];
+    const scale = gfInv(work[col][col]);
+    work[col] = work[col].map((value) => gfMul(scale, value));
+    for (let idx = 0; idx < size; idx += 1) {
+      const factor = work[idx][col];
+      if (idx !== col && factor !== 0) {
+        work[idx] = work[idx].map((value, pos) => value ^ gfMul(factor, work[col][pos]));
+      }
+    }
+  }
+  return work.map((row) => row.slice(size));
+}
+
+export function recoverChunks({ chunks, parity, dataTotal, parityTotal, chunkLen }) {
+  if (dataTotal <= 0 || parityTotal < 0 || dataTotal + parityTotal > MAX_ERASURE_SHARDS) {
+    throw new Error(
+      `erasure coding supports at most ${MAX_ERASURE_SHARDS} data and parity chunks combined`,
+    );
+  }
+  for (const [mapping, bound] of [
+    [chunks, dataTotal],
+    [parity, parityTotal],
+  ]) {
+    for (const [index, chunk] of mapping) {
+      if (index < 0 || index >= bound) throw new Error(`chunk index out of range: ${index}`);
+      if (chunk.length !== chunkLen) {
+        throw new Error("erasure-coded chunks must all have the same length");
+      }
+    }
+  }
+  const missing = [];
+  for (let index = 0; index < dataTotal; index += 1) {
+    if (!chunks.has(index)) missing.push(index);
+  }
+  const recovered = new Map();
+  if (!missing.length) return recovered;
+  if (missing.length > parity.size) {
+    throw new Error(
+      `cannot rebuild ${missing.length} missing chunk(s) from ${parity.size} parity chunk(s)`,
+    );
+  }
+  const rows = Array.from(parity.keys())
+    .sort((a, b) => a - b)
+    .slice(0, missing.length);
+  const syndromes = rows.map((row) => {
+    const syndrome = parity.get(row).slice();
+    for (const [index, chunk] of chunks) {
+      addScaled(syndrome, chunk, parityCoefficient(row, index, dataTotal));
+    }
+    return syndrome;
+  });
+  const inverse = invertMatrix(
+    rows.map((row) => missing.map((index) => parityCoefficient(row, index, dataTotal))),
+  );
+  missing.forEach((index, position) => {
+    const chunk = new Uint8Array(chunkLen);
+    inverse[position].forEach((coefficient, rowPos) => {
+      addScaled(chunk, syndromes[rowPos], coefficient);
+    });
+    recovered.set(index, chunk);
+  });
+  return recovered;
+}
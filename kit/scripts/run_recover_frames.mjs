@@ -0,0 +1,34 @@
+import fs from "node:fs";
+import path from "node:path";
+import process from "node:process";
+
+import { reassembleCiphertext } from "../app/frames_cipher.js";
+import { parseAutoPayload } from "../app/frames_parse.js";
+import { createInitialState } from "../app/state/initial.js";
+
+function fail(message) {
+  process.stderr.write(`${message}\n`);
+  process.exit(1);
+}
+
+async function main() {
+  const input = process.argv[2];
+  if (!input) {
+    fail("usage: node kit/scripts/run_recover_frames.mjs <qr-payload-lines-file>");
+  }
+  const payloadPath = path.resolve(input);
+  const text = fs.readFileSync(payloadPath, "utf8");
+  const state = createInitialState();
+  const added = parseAutoPayload(state, text);
+  const ciphertext = reassembleCiphertext(state);
+  process.stdout.write(
+    `${JSON.stringify({
+      added,
+      parity_frames: state.parityFrames.size,
+      recovered_frames: state.recoveredFrames,
+      ciphertext_base64: Buffer.from(ciphertext).toString("base64"),
+    })}\n`,
+  );
+}
+
+await main();
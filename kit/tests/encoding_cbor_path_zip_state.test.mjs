@@ -15,6 +15,7 @@ import {
   bytesEqual,
   bytesToUnpaddedBase64,
   concatBytes,
+  decodeBase45,
   decodePayloadString,
   decodeZBase32,
   filterZBase32Lines,
@@ -27,6 +28,19 @@ import { ensureAtob } from "./test_helpers.mjs";
 
 ensureAtob();
 
+test("decodeBase45 matches RFC 9285 vectors and rejects malformed text", () => {
+  const utf8 = new TextDecoder();
+  assert.equal(utf8.decode(decodeBase45("BB8")), "AB");
+  assert.equal(utf8.decode(decodeBase45("%69 VD92EX0")), "Hello!!");
+  assert.equal(utf8.decode(decodeBase45("UJCLQE7W581")), "base-45");
+  assert.equal(utf8.decode(decodeBase45("QED8WEX0")), "ietf!");
+  assert.deepEqual(decodeBase45("FGW"), Uint8Array.of(0xff, 0xff));
+  for (const invalid of ["", "A", "GGW", "V5", "bb8", "BB8="]) {
+    assert.equal(decodeBase45(invalid), null, invalid);
+  }
+  assert.equal(decodeBase45("0".repeat(MAX_QR_PAYLOAD_CHARS + 3)), null);
+});
+
 test("encoding primitives enforce strict payload and varint rules", () => {
   assert.equal(decodePayloadString(""), null);
   assert.equal(decodePayloadString("A".repeat(MAX_QR_PAYLOAD_CHARS + 1)), null);
@@ -0,0 +1,91 @@
+import assert from "node:assert/strict";
+import test from "node:test";
+
+import { FRAME_TYPE_MAIN, FRAME_TYPE_PARITY, FRAME_VERSION_PARITY } from "../app/constants.js";
+import { reassembleCiphertext } from "../app/frames_cipher.js";
+import { parseScannedPayload } from "../app/frames_parse.js";
+import { decodeFrame } from "../app/frames_protocol.js";
+import { createInitialState } from "../app/state/initial.js";
+import { hexToBytes } from "../lib/encoding.js";
+import { buildFrame, concatBytes, encodeUvarint } from "./test_helpers.mjs";
+
+// Generated by ethernity.encoding.chunking.chunk_payload(parity_percent=40) for a 203-byte
+// payload split into five MAIN frames of 41/41/41/40/40 bytes.
+const PARITY_PAYLOAD = Uint8Array.from({ length: 203 }, (_, idx) => (idx * 37 + 11) % 256);
+const MAIN_FRAMES = [
+  "4150014401020304050607080005290b30557a9fc4e90e33587da2c7ec11365b80a5caef14395e83a8cdf2173c6186abd0f51a3f6489aed326bdca45",
+  "415001440102030405060708010529f81d42678cb1d6fb20456a8fb4d9fe23486d92b7dc01264b7095badf04294e7398bde2072c51769bc0eae43b40",
+  "415001440102030405060708020529e50a2f54799ec3e80d32577ca1c6eb10355a7fa4c9ee13385d82a7ccf1163b6085aacff4193e6388ad4c070eb5",
+  "415001440102030405060708030528d2f71c41668bb0d5fa1f44698eb3d8fd22476c91b6db00254a6f94b9de03284d7297bce1062b50754db35298",
+  "4150014401020304050607080405289abfe4092e53789dc2e70c31567ba0c5ea0f34597ea3c8ed12375c81a6cbf0153a5f84a9cef3183d823201df",
+].map(hexToBytes);
+const PARITY_FRAMES = [
+  "41500250010203040506070800022c05cb016e87fc1fd7d5490b3f57504ee4677a359ba40565e768fefe748e2ac787d0f6a0b94c84fd50dcb0dcfd8ab8d481",
+  "41500250010203040506070801022c05cb018689ba14d0533b414ff8fab7fe315f8c4c94363b901a498bbc4cd57cbf437e77a1602323e21b2066cf43e05220",
+].map(hexToBytes);
+
+function scanAll(state, frames) {
+  for (const bytes of frames) {
+    assert.equal(parseScannedPayload(state, { bytes }), 1);
+  }
+}
+
+test("decodeFrame accepts PARITY frames only at the parity frame version", () => {
+  const parity = decodeFrame(PARITY_FRAMES[0]);
+  assert.equal(parity.frameType, FRAME_TYPE_PARITY);
+  assert.equal(parity.version, FRAME_VERSION_PARITY);
+  assert.equal(parity.total, 2);
+
+  assert.throws(
+    () => decodeFrame(buildFrame({ frameType: FRAME_TYPE_PARITY, data: Uint8Array.of(1) })),
+    /unsupported frame version for frame type 80: 1/,
+  );
+  assert.throws(
+    () =>
+      decodeFrame(
+        buildFrame({
+          frameType: FRAME_TYPE_MAIN,
+          data: Uint8Array.of(1),
+          version: FRAME_VERSION_PARITY,
+        }),
+      ),
+    /unsupported frame version for frame type 68: 2/,
+  );
+});
+
+test("PARITY frames rebuild missing MAIN frames from a Python backup", () => {
+  const state = createInitialState();
+  scanAll(state, [MAIN_FRAMES[0], MAIN_FRAMES[2], MAIN_FRAMES[4], ...PARITY_FRAMES]);
+
+  assert.equal(state.mainFrames.size, 5);
+  assert.equal(state.recoveredFrames, 2);
+  assert.equal(state.mainFrames.get(1).recovered, true);
+  assert.equal(state.mainFrames.get(3).data.length, 40);
+  assert.deepEqual(Array.from(reassembleCiphertext(state)), Array.from(PARITY_PAYLOAD));
+});
+
+test("PARITY frames seen first still set the frame total and wait for enough frames", () => {
+  const state = createInitialState();
+  scanAll(state, [PARITY_FRAMES[1], MAIN_FRAMES[1], MAIN_FRAMES[2]]);
+  assert.equal(state.total, 5);
+  assert.equal(state.mainFrames.size, 2);
+  assert.equal(state.recoveredFrames, 0);
+
+  scanAll(state, [MAIN_FRAMES[3], MAIN_FRAMES[4]]);
+  assert.equal(state.mainFrames.size, 5);
+  assert.equal(state.recoveredFrames, 1);
+  assert.deepEqual(Array.from(reassembleCiphertext(state)), Array.from(PARITY_PAYLOAD));
+});
+
+test("PARITY frames for a different MAIN layout are counted as conflicts", () => {
+  const state = createInitialState();
+  scanAll(state, [MAIN_FRAMES[0]]);
+  const foreign = buildFrame({
+    frameType: FRAME_TYPE_PARITY,
+    version: FRAME_VERSION_PARITY,
+    data: concatBytes([encodeUvarint(3), encodeUvarint(30), new Uint8Array(10)]),
+  });
+  assert.equal(parseScannedPayload(state, { bytes: foreign }), 1);
+  assert.equal(state.conflicts, 1);
+  assert.equal(state.parityFrames.size, 0);
+});
@@ -33,6 +33,7 @@ import {
   encodeZBase32,
   ensureAtob,
   mutateFrameCrc,
+  toBase45,
   toUnpaddedBase64,
 } from "./test_helpers.mjs";
 
@@ -196,6 +197,35 @@ test("parseScannedPayload and parseScannedShard fall back to text when bytes are
   assert.equal(shardState.shardErrors, 0);
 });
 
+test("parseScannedPayload and parseScannedShard decode base45 alphanumeric payloads", () => {
+  const mainFrame = buildFrame({
+    frameType: FRAME_TYPE_MAIN,
+    data: Uint8Array.from({ length: 40 }, (_, idx) => (idx * 13) & 0xff),
+    docId: Uint8Array.of(5, 5, 5, 5, 5, 5, 5, 5),
+  });
+  const mainText = toBase45(mainFrame);
+  assert.ok(mainText.includes(" "));
+  const mainAsciiBytes = Uint8Array.from(mainText, (char) => char.charCodeAt(0));
+  const mainState = createInitialState();
+  assert.equal(parseScannedPayload(mainState, { bytes: mainAsciiBytes, text: mainText }), 1);
+  assert.equal(parseScannedPayload(mainState, mainText), 1);
+  assert.equal(mainState.mainFrames.size, 1);
+  assert.equal(mainState.errors, 0);
+
+  const shardText = toBase45(
+    buildFrame({
+      frameType: FRAME_TYPE_KEY,
+      data: encodeCbor(shardPayload({ shareIndex: 1, shareHex: FIXTURE_SHARES.share1 })),
+      docId: Uint8Array.of(7, 7, 7, 7, 7, 7, 7, 7),
+    }),
+  );
+  const shardState = createInitialState();
+  assert.equal(parseScannedShard(shardState, shardText), 1);
+  assert.equal(shardState.shardFrames.size, 1);
+  assert.equal(parseScannedShard(shardState, mainText), 0);
+  assert.equal(shardState.shardErrors, 1);
+});
+
 test("parseAutoPayload supports fallback sections and handles invalid auth fallback", () => {
   const state = createInitialState();
   const main = buildFrame({ frameType: FRAME_TYPE_MAIN, data: Uint8Array.of(7), total: 1 });
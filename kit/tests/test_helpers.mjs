@@ -2,6 +2,7 @@ import { DOC_ID_LEN, FRAME_MAGIC, FRAME_VERSION } from "../app/constants.js";
 import { crc32 } from "../lib/crc32.js";
 
 const ZBASE32_ALPHABET = "ybndrfg8ejkmcpqxot1uwisza345h769";
+const BASE45_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ $%*+-./:";
 
 export function ensureAtob() {
   if (typeof globalThis.atob !== "function") {
@@ -40,6 +41,22 @@ export function toUnpaddedBase64(bytes) {
   return Buffer.from(bytes).toString("base64").replace(/=+$/u, "");
 }
 
+export function toBase45(bytes) {
+  let out = "";
+  let offset = 0;
+  for (; offset + 2 <= bytes.length; offset += 2) {
+    let value = bytes[offset] * 256 + bytes[offset + 1];
+    for (let i = 0; i < 3; i += 1) {
+      out += BASE45_ALPHABET[value % 45];
+      value = Math.floor(value / 45);
+    }
+  }
+  if (offset < bytes.length) {
+    out += BASE45_ALPHABET[bytes[offset] % 45] + BASE45_ALPHABET[Math.floor(bytes[offset] / 45)];
+  }
+  return out;
+}
+
 export function encodeZBase32(bytes) {
   let bits = 0;
   let bitCount = 0;
@@ -67,10 +84,11 @@ export function buildFrame({
   index = 0,
   total = 1,
   docId = Uint8Array.from(Array.from({ length: DOC_ID_LEN }, (_, idx) => idx + 1)),
+  version = FRAME_VERSION,
 }) {
   const body = concatBytes([
     Uint8Array.from(FRAME_MAGIC),
-    encodeUvarint(FRAME_VERSION),
+    encodeUvarint(version),
     Uint8Array.of(frameType),
     docId,
     encodeUvarint(index),
@@ -0,0 +1,35 @@
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+"""Asyncio entry points for embedding backup, render and recovery in an event loop."""
+
+from ethernity.aio._executor import run_blocking
+from ethernity.aio.backup import run_backup_async
+from ethernity.aio.recover import (
+    decrypt_manifest_and_extract_async,
+    prepare_recover_plan_async,
+    recover_async,
+)
+from ethernity.aio.render import AsyncPdfRenderer, render_frames_to_pdf_async
+
+__all__ = [
+    "AsyncPdfRenderer",
+    "decrypt_manifest_and_extract_async",
+    "prepare_recover_plan_async",
+    "recover_async",
+    "render_frames_to_pdf_async",
+    "run_backup_async",
+    "run_blocking",
+]
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+"""Asyncio backup flow: CPU-bound stages in an executor, PDFs via async Chromium."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor
+from pathlib import Path
+
+from ethernity.aio._executor import run_blocking
+from ethernity.aio.render import AsyncPdfRenderer, render_frames_to_pdf_async
+from ethernity.cli.features.backup.execution import (
+    DocumentRenderJob,
+    backup_document_render_jobs,
+    backup_result,
+    prepare_backup_documents,
+)
+from ethernity.cli.shared.events import emit_phase, emit_progress
+from ethernity.cli.shared.io.outputs import (
+    _commit_prepared_output_dir,
+    _discard_prepared_output_dir,
+)
+from ethernity.cli.shared.types import BackupResult, InputFile
+from ethernity.config import AppConfig
+from ethernity.core.models import DocumentPlan
+from ethernity.core.timing import span
+
+
+async def _render_jobs(
+    jobs: list[DocumentRenderJob],
+    *,
+    renderer: AsyncPdfRenderer,
+    executor: Executor | None,
+) -> None:
+    """Render all jobs concurrently, emitting one progress event per finished document."""
+
+    rendered = 0
+
+    async def _render(job: DocumentRenderJob) -> None:
+        nonlocal rendered
+        await render_frames_to_pdf_async(job.inputs, renderer=renderer, executor=executor)
+        rendered += 1
+        emit_progress(
+            phase="render",
+            current=rendered,
+            total=len(jobs),
+            unit="documents",
+            label=job.label,
+            details={"kind": job.kind, "path": str(job.inputs.output_path)},
+        )
+
+    async with asyncio.TaskGroup() as group:
+        for job in jobs:
+            group.create_task(_render(job))
+
+
+async def run_backup_async(
+    *,
+    input_files: list[InputFile],
+    output_dir: str | None,
+    plan: DocumentPlan,
+    passphrase: str | None,
+    config: AppConfig,
+    output_dir_existing_parent: bool = False,
+    layout_debug_dir: str | None = None,
+    input_origin: str = "file",
+    input_roots: list[str] | None = None,
+    passphrase_words: int | None = None,
+    renderer: AsyncPdfRenderer | None = None,
+    executor: Executor | None = None,
+) -> BackupResult:
+    """Run a backup without blocking the event loop.
+
+    Envelope building, compression, encryption and framing run in `executor`; documents
+    are then rendered concurrently on `renderer` (a private renderer is started and closed
+    for this call when none is given). Terminal UI output is always suppressed; progress is
+    reported through the active event sink.
+    """
+
+    with span("backup", input_files=len(input_files)) as backup_span:
+        documents = await run_blocking(
+            executor,
+            prepare_backup_documents,
+            input_files=input_files,
+            base_dir=None,
+            output_dir=output_dir,
+            output_dir_existing_parent=output_dir_existing_parent,
+            layout_debug_dir=layout_debug_dir,
+            input_origin=input_origin,
+            input_roots=input_roots,
+            plan=plan,
+            passphrase=passphrase,
+            passphrase_words=passphrase_words,
+            config=config,
+            quiet=True,
+        )
+        try:
+            emit_phase(phase="render", label="Rendering backup documents")
+            jobs = await run_blocking(
+                executor, backup_document_render_jobs, documents, config=config
+            )
+            with span("backup.render"):
+                if renderer is None:
+                    async with AsyncPdfRenderer() as owned_renderer:
+                        await _render_jobs(jobs, renderer=owned_renderer, executor=executor)
+                else:
+                    await _render_jobs(jobs, renderer=renderer, executor=executor)
+            await run_blocking(
+                executor,
+                _commit_prepared_output_dir,
+                documents.staging_output_dir,
+                documents.output_dir,
+            )
+        except BaseException:
+            _discard_prepared_output_dir(documents.staging_output_dir)
+            raise
+
+        shard_paths = [
+            str(Path(job.inputs.output_path)) for job in jobs if job.kind == "shard_document"
+        ]
+        signing_key_shard_paths = [
+            str(Path(job.inputs.output_path))
+            for job in jobs
+            if job.kind == "signing_key_shard_document"
+        ]
+        backup_span.count("main_frames", len(documents.qr_inputs.frames))
+        backup_span.count("shard_documents", len(shard_paths) + len(signing_key_shard_paths))
+    return backup_result(
+        documents,
+        shard_paths=shard_paths,
+        signing_key_shard_paths=signing_key_shard_paths,
+    )
+
+
+__all__ = ["run_backup_async"]
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+"""Asyncio recovery flow: scanning, scrypt decryption and file writes off the event loop."""
+
+from __future__ import annotations
+
+from concurrent.futures import Executor
+from dataclasses import replace
+
+from ethernity.aio._executor import run_blocking
+from ethernity.cli.features.recover.execution import decrypt_manifest_and_extract
+from ethernity.cli.features.recover.planning import RecoveryPlan
+from ethernity.cli.features.recover.service import (
+    RecoverExecutionResult,
+    execute_recover_plan,
+    prepare_recover_plan,
+)
+from ethernity.cli.shared.types import RecoverArgs
+from ethernity.formats.envelope_types import EnvelopeManifest, ManifestFile
+
+
+async def prepare_recover_plan_async(
+    args: RecoverArgs,
+    *,
+    executor: Executor | None = None,
+) -> RecoveryPlan:
+    """Scan/parse recovery inputs and resolve keys in `executor`."""
+
+    return await run_blocking(executor, prepare_recover_plan, replace(args, quiet=True))
+
+
+async def decrypt_manifest_and_extract_async(
+    plan: RecoveryPlan,
+    *,
+    executor: Executor | None = None,
+    debug: bool = False,
+) -> tuple[EnvelopeManifest, list[tuple[ManifestFile, bytes]]]:
+    """Decrypt and unpack a recovery plan in `executor` without writing any files."""
+
+    return await run_blocking(
+        executor,
+        decrypt_manifest_and_extract,
+        plan,
+        quiet=True,
+        debug=debug,
+    )
+
+
+async def recover_async(
+    args: RecoverArgs,
+    *,
+    executor: Executor | None = None,
+    emit_file_artifacts: bool = True,
+) -> RecoverExecutionResult:
+    """Plan, decrypt and write a recovery end to end without blocking the event loop."""
+
+    plan = await prepare_recover_plan_async(args, executor=executor)
+    return await run_blocking(
+        executor,
+        execute_recover_plan,
+        plan,
+        quiet=True,
+        emit_file_artifacts=emit_file_artifacts,
+    )
+
+
+__all__ = [
+    "decrypt_manifest_and_extract_async",
+    "prepare_recover_plan_async",
+    "recover_async",
+]
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+"""Render documents to PDF through a shared async Playwright Chromium session."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor
+from pathlib import Path
+from types import TracebackType
+from typing import Mapping
+
+from playwright.async_api import Browser, Playwright, async_playwright
+
+from ethernity.aio._executor import run_blocking
+from ethernity.core.timing import span
+from ethernity.render.html_to_pdf import PDF_OPTIONS, RESOURCE_ROUTE_PATTERN, resource_response
+from ethernity.render.pdf_render import render_frames_to_html
+from ethernity.render.types import RenderInputs
+
+DEFAULT_MAX_PAGES = 4
+
+
+class AsyncPdfRenderer:
+    """Async Chromium session that renders HTML to PDF on a bounded number of pages.
+
+    One renderer can be shared by many concurrent backup jobs on the same event loop;
+    each render opens its own page and at most `max_pages` pages are open at once.
+    """
+
+    def __init__(self, *, max_pages: int = DEFAULT_MAX_PAGES) -> None:
+        if max_pages <= 0:
+            raise ValueError("max_pages must be positive")
+        self._max_pages = max_pages
+        self._semaphore: asyncio.Semaphore | None = None
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._start_lock: asyncio.Lock | None = None
+
+    async def start(self) -> None:
+        """Launch Chromium if it is not already running."""
+
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self._browser is not None:
+                return
+            playwright = await async_playwright().start()
+            try:
+                self._browser = await playwright.chromium.launch()
+            except BaseException:
+                await playwright.stop()
+                raise
+            self._playwright = playwright
+            self._semaphore = asyncio.Semaphore(self._max_pages)
+
+    async def close(self) -> None:
+        """Close the browser and stop Playwright."""
+
+        browser = self._browser
+        playwright = self._playwright
+        self._browser = None
+        self._playwright = None
+        self._semaphore = None
+        if browser is not None:
+            await browser.close()
+        if playwright is not None:
+            await playwright.stop()
+
+    async def __aenter__(self) -> AsyncPdfRenderer:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def render_html_to_pdf(
+        self,
+        html: str,
+        output_path: str | Path,
+        *,
+        resources: Mapping[str, tuple[str, bytes]] | None = None,
+    ) -> None:
+        """Render HTML to PDF, serving in-memory resources via route hooks."""
+
+        await self.start()
+        browser = self._browser
+        semaphore = self._semaphore
+        if browser is None or semaphore is None:
+            raise RuntimeError("renderer is closed")
+        async with semaphore:
+            page = await browser.new_page()
+            try:
+                if resources:
+                    served = resources
+
+                    async def _route_resource(route, request) -> None:
+                        await route.fulfill(**resource_response(request.url, served))
+
+                    await page.route(RESOURCE_ROUTE_PATTERN, _route_resource)
+                await page.set_content(html, wait_until="networkidle")
+                await page.emulate_media(media="print")
+                await page.pdf(path=str(output_path), **PDF_OPTIONS)
+            finally:
+                await page.close()
+
+
+async def render_frames_to_pdf_async(
+    inputs: RenderInputs,
+    *,
+    renderer: AsyncPdfRenderer,
+    executor: Executor | None = None,
+) -> None:
+    """Render one document: layout and QR rasterization in `executor`, PDF in Chromium."""
+
+    with span("render", frames=len(inputs.frames)) as render_span:
+        html, resources = await run_blocking(executor, render_frames_to_html, inputs)
+        render_span.count("resources", len(resources))
+        with span("render.chromium"):
+            await renderer.render_html_to_pdf(html, inputs.output_path, resources=resources)
+
+
+__all__ = ["AsyncPdfRenderer", "DEFAULT_MAX_PAGES", "render_frames_to_pdf_async"]
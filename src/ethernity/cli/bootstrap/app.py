@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import sys
 from collections.abc import Sequence
+from pathlib import Path
 from typing import Annotated
 
 import click
@@ -32,6 +33,8 @@ from ethernity.cli.features.kit.command import _run_kit_render
 from ethernity.cli.features.mint.workflow import run_mint_wizard
 from ethernity.cli.features.recover.orchestrator import run_recover_wizard
 from ethernity.cli.shared import common as cli_common, ndjson as cli_ndjson, ui_api as ui
+from ethernity.cli.shared.paths import expanduser_cli_path
+from ethernity.cli.shared.profiling import ProfileSession
 from ethernity.cli.shared.types import BackupArgs, CliContextState
 from ethernity.config import CliDefaults, load_cli_defaults
 from ethernity.config.install import DEFAULT_CONFIG_PATH, resolve_api_defaults_config_path
@@ -72,7 +75,10 @@ prompt_home_action = ui.prompt_home_action
 ui_screen_mode = ui.ui_screen_mode
 
 _DEFAULTS_BOOTSTRAP_SUBCOMMANDS = frozenset({"api", "backup", "recover", "kit", "mint", "render"})
-_GLOBAL_OPTIONS_WITH_VALUES = frozenset({"--config", "--paper", "--design", "--debug-max-bytes"})
+_GLOBAL_OPTIONS_WITH_VALUES = frozenset(
+    {"--config", "--paper", "--design", "--debug-max-bytes", "--profile"}
+)
+_API_GROUP_FLAGS = frozenset({"--timings"})
 
 
 def _subcommand_config_override(argv: Sequence[str]) -> str | None:
@@ -156,6 +162,9 @@ def _api_argv_path(argv: Sequence[str]) -> tuple[str, ...]:
     path: list[str] = []
     while idx < len(args):
         arg = args[idx]
+        if not path and arg in _API_GROUP_FLAGS:
+            idx += 1
+            continue
         if arg == "--" or arg.startswith("-"):
             break
         path.append(arg)
@@ -454,6 +463,31 @@ def _run_home_screen(
     )
 
 
+def _start_profile(ctx: typer.Context, output_dir: str, *, quiet: bool) -> None:
+    """Profile everything dispatched after the global callback, reporting on context close."""
+
+    command = ctx.invoked_subcommand
+    if _is_api_invocation(command):
+        command = "-".join(("api", *_api_argv_path(sys.argv)))
+    session = ProfileSession(
+        Path(expanduser_cli_path(output_dir, preserve_stdin=False) or output_dir),
+        command=command,
+        argv=sys.argv,
+    )
+    try:
+        session.start()
+    except OSError as exc:
+        console_err.print(f"[red]Error:[/red] cannot write profile to {output_dir}: {exc}")
+        raise typer.Exit(code=2) from exc
+
+    def _finish() -> None:
+        artifacts = session.stop()
+        if not quiet:
+            console_err.print(f"Profile written to {artifacts.summary_path.parent}")
+
+    ctx.call_on_close(_finish)
+
+
 @app.callback(invoke_without_command=True)
 def cli(
     ctx: typer.Context,
@@ -511,6 +545,17 @@ def cli(
             rich_help_panel="Debug",
         ),
     ] = False,
+    profile: Annotated[
+        str | None,
+        typer.Option(
+            "--profile",
+            help=(
+                "Profile the command with cProfile and tracemalloc and write .pstats, "
+                "collapsed-stack and allocation reports to this directory."
+            ),
+            rich_help_panel="Debug",
+        ),
+    ] = None,
     quiet: Annotated[
         bool,
         typer.Option(
@@ -607,6 +652,8 @@ def cli(
         no_animations=effective_no_animations,
         cli_defaults=cli_defaults,
     )
+    if profile is not None and not help_invocation:
+        _start_profile(ctx, profile, quiet=effective_quiet)
     if ctx.invoked_subcommand is None:
         _run_home_screen(
             ctx=ctx,
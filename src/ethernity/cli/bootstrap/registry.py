@@ -24,6 +24,7 @@ from ethernity.cli.features.config import command as config_command
 from ethernity.cli.features.kit import command as kit_command
 from ethernity.cli.features.mint import command as mint_command
 from ethernity.cli.features.recover import command as recover_command
+from ethernity.cli.features.registry import command as registry_command
 from ethernity.cli.features.render import command as render_command
 
 
@@ -35,3 +36,4 @@ def register(app: typer.Typer) -> None:
     mint_command.register(app)
     render_command.register(app)
     recover_command.register(app)
+    registry_command.register(app)
@@ -24,6 +24,7 @@ import click
 import typer
 
 from ethernity.cli.features.backup.api_handlers import run_backup_api_command
+from ethernity.cli.features.backup.memory import parse_memory_size
 from ethernity.cli.features.config.api_handlers import (
     run_config_get_api_command,
     run_config_set_api_command,
@@ -39,6 +40,7 @@ from ethernity.cli.features.recover.api_handlers import (
 from ethernity.cli.features.recover.service import RecoverShardDirError, expand_recover_shard_dir
 from ethernity.cli.shared import api_codes
 from ethernity.cli.shared.common import _ctx_state, _paper_callback, _resolve_config_and_paper
+from ethernity.cli.shared.events import timing_events
 from ethernity.cli.shared.ndjson import (
     ApiCommandError,
     emit_error,
@@ -87,10 +89,32 @@ _INSPECT_HELP = (
 )
 
 SigningKeyMode = Literal["embedded", "sharded"]
+KeyModeName = Literal["passphrase", "x25519"]
+
+
+_TIMINGS_META_KEY = "ethernity.api.timings"
+
+
+def _api_callback(
+    ctx: typer.Context,
+    timings: Annotated[
+        bool,
+        typer.Option(
+            "--timings",
+            help="Emit `timing` events with wall time, CPU time and peak RSS per pipeline span.",
+        ),
+    ] = False,
+) -> None:
+    ctx.meta[_TIMINGS_META_KEY] = timings
+
+
+def _timings_requested(ctx: typer.Context | None) -> bool:
+    return bool(ctx is not None and ctx.meta.get(_TIMINGS_META_KEY, False))
 
 
 def register(app: typer.Typer) -> None:
     api_app = typer.Typer(help=_API_HELP, add_completion=False)
+    api_app.callback()(_api_callback)
     config_app = typer.Typer(help=_CONFIG_HELP, add_completion=False)
     inspect_app = typer.Typer(help=_INSPECT_HELP, add_completion=False)
     api_app.command(name="backup", help=_BACKUP_HELP)(backup)
@@ -108,8 +132,12 @@ def register(app: typer.Typer) -> None:
     app.add_typer(api_app, name="api")
 
 
-def _run_ndjson_command(func: Callable[[], int | None]) -> None:
-    with ndjson_session():
+def _run_ndjson_command(
+    func: Callable[[], int | None],
+    *,
+    ctx: typer.Context | None = None,
+) -> None:
+    with ndjson_session(), timing_events(_timings_requested(ctx)):
         try:
             result = func()
         except typer.Exit:
@@ -217,6 +245,30 @@ def _parse_api_int_option(name: str, value: str | None) -> int | None:
         ) from exc
 
 
+def _parse_api_positive_int_option(name: str, value: str | None) -> int | None:
+    parsed = _parse_api_int_option(name, value)
+    if parsed is not None and parsed <= 0:
+        raise ApiCommandError(
+            code=api_codes.INVALID_INPUT,
+            message=f"{name} must be a positive integer",
+            details={"option": name, "value": value},
+        )
+    return parsed
+
+
+def _parse_api_memory_option(name: str, value: str | None) -> int | None:
+    if value is None:
+        return None
+    try:
+        return parse_memory_size(value)
+    except ValueError as exc:
+        raise ApiCommandError(
+            code=api_codes.INVALID_INPUT,
+            message=f"{name} {exc}",
+            details={"option": name, "value": value},
+        ) from exc
+
+
 def _parse_signing_key_mode(value: str | None) -> str | None:
     if value is None:
         return None
@@ -230,6 +282,19 @@ def _parse_signing_key_mode(value: str | None) -> str | None:
     return normalized
 
 
+def _parse_key_mode(value: str | None) -> str | None:
+    if value is None:
+        return None
+    normalized = value.strip().lower()
+    if normalized not in {"passphrase", "x25519"}:
+        raise ApiCommandError(
+            code=api_codes.INVALID_INPUT,
+            message="--key-mode must be 'passphrase' or 'x25519'",
+            details={"option": "--key-mode", "value": value},
+        )
+    return normalized
+
+
 def _state_debug_enabled(state: object | None) -> bool:
     return bool(getattr(state, "debug", False)) if state is not None else False
 
@@ -270,6 +335,9 @@ def _build_recover_api_args(
     auth_payloads_file: str | None,
     output: str | None,
     allow_unsigned: bool,
+    scan_jobs: int | None = None,
+    scan_cache: bool = True,
+    session: str | None = None,
 ) -> RecoverArgs:
     shard_files = list(shard_fallback_file or [])
     shard_files.extend(_expand_shard_dir(shard_dir))
@@ -292,6 +360,9 @@ def _build_recover_api_args(
         output=output,
         allow_unsigned=allow_unsigned,
         assume_yes=True,
+        scan_jobs=scan_jobs,
+        scan_cache=scan_cache,
+        session=session,
         debug_max_bytes=debug_max_bytes,
         debug_reveal_secrets=debug_reveal_secrets,
         quiet=True,
@@ -317,6 +388,9 @@ def _run_recover_operation(
     output: str | None,
     allow_unsigned: bool,
     handler: Callable[..., int],
+    scan_jobs: int | None = None,
+    scan_cache: bool = True,
+    session: str | None = None,
 ) -> int:
     config_value, paper_value = _resolve_api_config_and_paper(ctx, config, paper)
     args = _build_recover_api_args(
@@ -335,6 +409,9 @@ def _run_recover_operation(
         auth_payloads_file=auth_payloads_file,
         output=output,
         allow_unsigned=allow_unsigned,
+        scan_jobs=scan_jobs,
+        scan_cache=scan_cache,
+        session=session,
     )
     return handler(args, debug=_state_debug_enabled(state))
 
@@ -521,13 +598,17 @@ def _build_backup_api_args(
     signing_key_shard_threshold: str | None,
     signing_key_shard_count: str | None,
     layout_debug_dir: str | None,
+    max_memory: str | None = None,
+    key_mode: str | None = None,
 ) -> BackupArgs:
     defaults = _state_backup_defaults(state)
     qr_chunk_size_value = _parse_api_int_option("--qr-chunk-size", qr_chunk_size)
+    max_memory_value = _parse_api_memory_option("--max-memory", max_memory)
     passphrase_words_value = _parse_api_int_option("--passphrase-words", passphrase_words)
     shard_threshold_cli = _parse_api_int_option("--shard-threshold", shard_threshold)
     shard_count_cli = _parse_api_int_option("--shard-count", shard_count)
     signing_key_mode_cli = _parse_signing_key_mode(signing_key_mode)
+    key_mode_cli = _parse_key_mode(key_mode)
     signing_key_shard_threshold_cli = _parse_api_int_option(
         "--signing-key-shard-threshold",
         signing_key_shard_threshold,
@@ -551,6 +632,7 @@ def _build_backup_api_args(
         passphrase=passphrase,
         passphrase_generate=passphrase_generate,
         passphrase_words=passphrase_words_value,
+        key_mode=cast(KeyModeName | None, key_mode_cli),
         sealed=sealed,
         shard_threshold=(
             shard_threshold_cli if shard_threshold_cli is not None else defaults.shard_threshold
@@ -575,6 +657,7 @@ def _build_backup_api_args(
         debug_reveal_secrets=_state_debug_reveal_secrets(state),
         assume_yes=True,
         quiet=True,
+        max_memory=max_memory_value,
     )
 
 
@@ -589,7 +672,7 @@ def config_get(
         args = ConfigGetArgs(config=_explicit_api_config_value(ctx, config))
         return run_config_get_api_command(args)
 
-    _run_ndjson_command(_run)
+    _run_ndjson_command(_run, ctx=ctx)
 
 
 def config_set(
@@ -613,7 +696,7 @@ def config_set(
         )
         return run_config_set_api_command(args)
 
-    _run_ndjson_command(_run)
+    _run_ndjson_command(_run, ctx=ctx)
 
 
 def recover(
@@ -650,6 +733,14 @@ def recover(
         list[str] | None,
         typer.Option("--shard-scan", help="Shard scan path (image/PDF/dir, repeatable)."),
     ] = None,
+    scan_jobs: Annotated[
+        str | None,
+        typer.Option("--scan-jobs", help="Parallel QR decode workers (default: CPU count)."),
+    ] = None,
+    no_scan_cache: Annotated[
+        bool,
+        typer.Option("--no-scan-cache", help="Decode every scan input; skip the scan cache."),
+    ] = False,
     auth_fallback_file: Annotated[
         str | None,
         typer.Option("--auth-fallback-file", help="Auth recovery text (fallback, z-base-32)."),
@@ -700,9 +791,11 @@ def recover(
             output=output,
             allow_unsigned=allow_unsigned,
             handler=run_recover_api_command,
+            scan_jobs=_parse_api_positive_int_option("--scan-jobs", scan_jobs),
+            scan_cache=not no_scan_cache,
         )
 
-    _run_ndjson_command(_run)
+    _run_ndjson_command(_run, ctx=ctx)
 
 
 def inspect_recover(
@@ -747,6 +840,13 @@ def inspect_recover(
         str | None,
         typer.Option("--auth-payloads-file", help="Auth QR payloads (one per line)."),
     ] = None,
+    session: Annotated[
+        str | None,
+        typer.Option(
+            "--session",
+            help="Recovery session checkpoint to report progress against (read-only).",
+        ),
+    ] = None,
     allow_unsigned: Annotated[
         bool,
         typer.Option(
@@ -784,10 +884,11 @@ def inspect_recover(
             auth_payloads_file=auth_payloads_file,
             output=None,
             allow_unsigned=allow_unsigned,
+            session=session,
             handler=run_recover_inspect_api_command,
         )
 
-    _run_ndjson_command(_run)
+    _run_ndjson_command(_run, ctx=ctx)
 
 
 def backup(
@@ -833,6 +934,10 @@ def backup(
         str | None,
         typer.Option("--passphrase-words", help="Mnemonic word count for generated passphrases."),
     ] = None,
+    key_mode: Annotated[
+        str | None,
+        typer.Option("--key-mode", help="Encryption key type: passphrase or x25519."),
+    ] = None,
     sealed: Annotated[
         bool,
         typer.Option("--sealed", help="Seal backup (no new shards later)."),
@@ -863,6 +968,13 @@ def backup(
             "--layout-debug-dir", help="Write per-document layout diagnostics JSON files."
         ),
     ] = None,
+    max_memory: Annotated[
+        str | None,
+        typer.Option(
+            "--max-memory",
+            help="Refuse to start when the estimated peak memory exceeds this size (e.g. 512M).",
+        ),
+    ] = None,
     config: Annotated[
         str | None,
         typer.Option("--config", help="Use this config file."),
@@ -900,10 +1012,12 @@ def backup(
             signing_key_shard_threshold=signing_key_shard_threshold,
             signing_key_shard_count=signing_key_shard_count,
             layout_debug_dir=layout_debug_dir,
+            max_memory=max_memory,
+            key_mode=key_mode,
         )
         return run_backup_api_command(args)
 
-    _run_ndjson_command(_run)
+    _run_ndjson_command(_run, ctx=ctx)
 
 
 def mint(
@@ -1089,7 +1203,7 @@ def mint(
             handler=run_mint_api_command,
         )
 
-    _run_ndjson_command(_run)
+    _run_ndjson_command(_run, ctx=ctx)
 
 
 def inspect_mint(
@@ -1267,7 +1381,7 @@ def inspect_mint(
             handler=run_mint_inspect_api_command,
         )
 
-    _run_ndjson_command(_run)
+    _run_ndjson_command(_run, ctx=ctx)
 
 
 __all__ = ["register"]
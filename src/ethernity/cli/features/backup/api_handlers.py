@@ -113,10 +113,12 @@ def run_backup_api_command(args: BackupArgs) -> int:
             "output_dir": args.output_dir,
             "layout_debug_dir": args.layout_debug_dir,
             "qr_chunk_size": args.qr_chunk_size,
+            "max_memory": args.max_memory,
             "has_passphrase": args.passphrase is not None,
             "passphrase_generate": args.passphrase is None,
             "passphrase_generate_requested": args.passphrase_generate,
             "passphrase_words": args.passphrase_words,
+            "key_mode": args.key_mode,
             "sealed": args.sealed,
             "shard_threshold": args.shard_threshold,
             "shard_count": args.shard_count,
@@ -166,6 +168,7 @@ def run_backup_api_command(args: BackupArgs) -> int:
             "signing_key_shard_documents": list(result.signing_key_shard_paths),
         },
         plan={
+            "key_mode": prepared.plan.key_mode.value,
             "sealed": prepared.plan.sealed,
             "shard_threshold": (
                 prepared.plan.sharding.threshold if prepared.plan.sharding is not None else None
@@ -22,6 +22,7 @@ from typing import Annotated, Literal
 
 import typer
 
+from ethernity.cli.features.backup.memory import parse_memory_size
 from ethernity.cli.features.backup.orchestrator import (
     _should_use_wizard_for_backup,
     run_backup_command,
@@ -42,6 +43,8 @@ _BACKUP_HELP = (
     "Examples:\n"
     "  ethernity backup -i secrets.txt\n"
     "  ethernity backup --input-dir docs --output-dir backups\n"
+    "  ethernity backup -i secrets.txt --verify-render\n"
+    "  ethernity backup -i secrets.txt --qr-parity 10\n"
 )
 
 
@@ -49,6 +52,15 @@ def register(app: typer.Typer) -> None:
     app.command(help=_BACKUP_HELP)(backup)
 
 
+def _parse_max_memory(value: str | None) -> int | None:
+    if value is None:
+        return None
+    try:
+        return parse_memory_size(value)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--max-memory") from exc
+
+
 def backup(
     ctx: typer.Context,
     input: Annotated[
@@ -107,6 +119,19 @@ def backup(
             rich_help_panel="Config",
         ),
     ] = None,
+    qr_parity: Annotated[
+        int | None,
+        typer.Option(
+            "--qr-parity",
+            help=(
+                "Add PARITY QR codes worth this percentage of the MAIN codes (0-100); "
+                "recovery can rebuild that many missing or unreadable MAIN codes."
+            ),
+            min=0,
+            max=100,
+            rich_help_panel="Config",
+        ),
+    ] = None,
     passphrase: Annotated[
         str | None,
         typer.Option(
@@ -132,6 +157,17 @@ def backup(
             rich_help_panel="Encryption",
         ),
     ] = None,
+    key_mode: Annotated[
+        Literal["passphrase", "x25519"] | None,
+        typer.Option(
+            "--key-mode",
+            help=(
+                "Encryption key type: passphrase (scrypt) or x25519 (generated age identity, "
+                "printed or sharded like a passphrase; no scrypt work factor)."
+            ),
+            rich_help_panel="Encryption",
+        ),
+    ] = None,
     sealed: Annotated[
         bool,
         typer.Option(
@@ -183,6 +219,39 @@ def backup(
             rich_help_panel="Sharding",
         ),
     ] = None,
+    max_memory: Annotated[
+        str | None,
+        typer.Option(
+            "--max-memory",
+            help=(
+                "Refuse to start when the estimated peak memory exceeds this size "
+                "(bytes, or with K/M/G suffix, e.g. 512M)."
+            ),
+            rich_help_panel="Advanced",
+        ),
+    ] = None,
+    verify_render: Annotated[
+        bool,
+        typer.Option(
+            "--verify-render",
+            help=(
+                "Scan the written PDFs back and fail unless every QR code decodes to the "
+                "rendered bytes."
+            ),
+            rich_help_panel="Outputs",
+        ),
+    ] = False,
+    registry: Annotated[
+        bool,
+        typer.Option(
+            "--registry",
+            help=(
+                "Record the backup's non-secret metadata in the local registry "
+                "(see `ethernity registry`)."
+            ),
+            rich_help_panel="Outputs",
+        ),
+    ] = False,
     config: Annotated[
         str | None,
         typer.Option(
@@ -256,6 +325,7 @@ def backup(
         else debug_max_bytes
     )
     debug_reveal_value = state.debug_reveal_secrets if state is not None else False
+    max_memory_value = _parse_max_memory(max_memory)
     quiet_value = quiet or (state.quiet if state is not None else False)
     base_dir_value = base_dir if base_dir is not None else defaults.base_dir
     output_dir_value = output_dir if output_dir is not None else defaults.output_dir
@@ -288,9 +358,11 @@ def backup(
         output_dir_existing_parent=True,
         layout_debug_dir=layout_debug_dir,
         qr_chunk_size=qr_chunk_size,
+        qr_parity=qr_parity,
         passphrase=passphrase,
         passphrase_generate=passphrase_generate,
         passphrase_words=passphrase_words,
+        key_mode=key_mode,
         sealed=sealed,
         shard_threshold=shard_threshold_value,
         shard_count=shard_count_value,
@@ -302,6 +374,9 @@ def backup(
         debug_reveal_secrets=debug_reveal_value,
         assume_yes=assume_yes,
         quiet=quiet_value,
+        max_memory=max_memory_value,
+        verify_render=verify_render,
+        registry=registry,
     )
     if _should_use_wizard_for_backup(args):
         _run_cli(
@@ -18,12 +18,14 @@
 
 from __future__ import annotations
 
-from dataclasses import replace
+import sqlite3
+from dataclasses import dataclass, replace
 from pathlib import Path
 
 from rich.progress import Progress
 
 from ethernity import render as render_module
+from ethernity.cli.features.backup.verify import verify_rendered_documents, verify_targets
 from ethernity.cli.shared import api_codes
 from ethernity.cli.shared.constants import AUTH_FALLBACK_LABEL, MAIN_FALLBACK_LABEL
 from ethernity.cli.shared.crypto import _doc_id_and_hash_from_ciphertext
@@ -43,22 +45,30 @@ from ethernity.cli.shared.ui.debug import (
 from ethernity.cli.shared.ui_api import progress, status
 from ethernity.config import AppConfig
 from ethernity.config.paths import TEMPLATES_RESOURCE_ROOT
+from ethernity.core.backup_registry import (
+    RegistryEntry,
+    RegistryOutput,
+    open_backup_registry,
+    registry_files,
+)
 from ethernity.core.bounds import MAX_CIPHERTEXT_BYTES
-from ethernity.core.models import DocumentPlan, SigningSeedMode
+from ethernity.core.models import DocumentPlan, KeyMode, SigningSeedMode
+from ethernity.core.timing import span
 from ethernity.crypto import (
+    encrypt_bytes_with_identity,
     encrypt_bytes_with_passphrase,
     sharding as sharding_module,
     signing as signing_module,
 )
 from ethernity.crypto.sharding import ShardPayload
-from ethernity.encoding.chunking import chunk_payload
+from ethernity.encoding.chunking import PARITY_FRAME_OVERHEAD_BYTES, chunk_payload
 from ethernity.encoding.framing import VERSION, Frame, FrameType
 from ethernity.encoding.qr_payloads import QR_PAYLOAD_CODEC_RAW, QrPayloadCodec
 from ethernity.formats import (
     envelope_codec as envelope_codec_module,
     payload_codec as payload_codec_module,
 )
-from ethernity.formats.envelope_types import PayloadPart
+from ethernity.formats.envelope_types import EnvelopeManifest, PayloadPart
 from ethernity.qr.capacity import choose_frame_chunk_size
 from ethernity.render.doc_types import DOC_TYPE_KIT_INDEX, DOC_TYPE_SIGNING_KEY_SHARD
 from ethernity.render.recovery_meta import build_recovery_meta
@@ -167,6 +177,34 @@ def _render_shard(
     qr_payload_codec: QrPayloadCodec = QR_PAYLOAD_CODEC_RAW,
 ) -> str:
     """Render a single shard document to PDF and return the output path."""
+    shard_inputs = _shard_render_inputs(
+        shard,
+        doc_id=doc_id,
+        output_dir=output_dir,
+        render_service=render_service,
+        filename_prefix=filename_prefix,
+        template_path=template_path,
+        doc_type=doc_type,
+        layout_debug_json_path=layout_debug_json_path,
+        qr_payload_codec=qr_payload_codec,
+    )
+    render_module.render_frames_to_pdf(shard_inputs)
+    return str(shard_inputs.output_path)
+
+
+def _shard_render_inputs(
+    shard: ShardPayload,
+    *,
+    doc_id: bytes,
+    output_dir: str,
+    render_service: RenderService,
+    filename_prefix: str,
+    template_path: str | Path,
+    doc_type: str | None = None,
+    layout_debug_json_path: str | None = None,
+    qr_payload_codec: QrPayloadCodec = QR_PAYLOAD_CODEC_RAW,
+) -> RenderInputs:
+    """Build render inputs for a single shard document."""
     shard_frame = Frame(
         version=VERSION,
         frame_type=FrameType.KEY_DOCUMENT,
@@ -179,7 +217,7 @@ def _render_shard(
         Path(output_dir)
         / f"{filename_prefix}-{doc_id.hex()}-{shard.share_index}-of-{shard.share_count}.pdf"
     )
-    shard_inputs = render_service.shard_inputs(
+    return render_service.shard_inputs(
         shard_frame,
         shard_path,
         shard_index=shard.share_index,
@@ -190,8 +228,6 @@ def _render_shard(
         doc_type=doc_type,
         layout_debug_json_path=layout_debug_json_path,
     )
-    render_module.render_frames_to_pdf(shard_inputs)
-    return shard_path
 
 
 def _prepare_envelope(
@@ -203,13 +239,20 @@ def _prepare_envelope(
     payload_codec_mode: payload_codec_module.PayloadEncodingMode = (
         payload_codec_module.PAYLOAD_ENCODING_AUTO
     ),
-) -> tuple[bytes, bytes]:
-    """Prepare the envelope from input files. Returns (envelope, payload)."""
+    *,
+    max_envelope_bytes: int | None = None,
+) -> tuple[bytes, EnvelopeManifest]:
+    """Prepare the envelope from input files. Returns (envelope, manifest).
+
+    Input data is fed to the payload codec part by part, so the concatenated raw payload is
+    never materialized unless the raw codec wins. With `max_envelope_bytes`, payloads that
+    cannot fit are rejected before the envelope is assembled.
+    """
     parts = [
         PayloadPart(path=item.relative_path, data=item.data, mtime=item.mtime)
         for item in input_files
     ]
-    manifest, payload = envelope_codec_module.build_manifest_and_payload(
+    manifest, payload_parts = envelope_codec_module.build_manifest_and_payload_parts(
         parts,
         sealed=plan.sealed,
         signing_seed=sign_priv if not plan.sealed else None,
@@ -217,18 +260,30 @@ def _prepare_envelope(
         input_roots=input_roots,
     )
     encoded_payload, payload_codec, payload_raw_len = (
-        payload_codec_module.encode_payload_for_manifest(
-            payload,
+        payload_codec_module.encode_payload_parts_for_manifest(
+            payload_parts,
             mode=payload_codec_mode,
+            max_encoded_bytes=max_envelope_bytes,
         )
     )
     manifest = replace(
         manifest,
         payload_codec=payload_codec,
         payload_raw_len=payload_raw_len,
+        key_mode=plan.key_mode.value,
     )
     envelope = envelope_codec_module.encode_envelope(encoded_payload, manifest)
-    return envelope, payload
+    if max_envelope_bytes is not None and len(envelope) > max_envelope_bytes:
+        raise payload_codec_module.PayloadTooLargeError(
+            f"envelope exceeds {max_envelope_bytes} bytes before encryption: {len(envelope)} bytes"
+        )
+    return envelope, manifest
+
+
+def _debug_payload(envelope: bytes, manifest: EnvelopeManifest) -> bytes:
+    """Recover the raw payload from the envelope; only debug output needs it."""
+    _manifest, encoded_payload = envelope_codec_module.decode_envelope(envelope)
+    return payload_codec_module.decode_payload_from_manifest(manifest, encoded_payload)
 
 
 def _create_auth_frame(
@@ -595,7 +650,36 @@ def _render_without_progress(
     return shard_paths, signing_key_shard_paths
 
 
-def run_backup(
+@dataclass(frozen=True)
+class BackupDocuments:
+    """Prepared render inputs and staging state for one backup run."""
+
+    doc_id: bytes
+    doc_hash: bytes
+    manifest: EnvelopeManifest
+    output_dir: str
+    staging_output_dir: str
+    passphrase_used: str | None
+    qr_inputs: RenderInputs
+    recovery_inputs: RenderInputs
+    kit_index_inputs: RenderInputs | None
+    shard_payloads: list[ShardPayload]
+    signing_key_shard_payloads: list[ShardPayload]
+    layout_debug_dir: str | None
+    render_service: RenderService
+    qr_payload_codec: QrPayloadCodec
+
+
+@dataclass(frozen=True)
+class DocumentRenderJob:
+    """One PDF to render for a prepared backup, with its progress metadata."""
+
+    kind: str
+    label: str
+    inputs: RenderInputs
+
+
+def prepare_backup_documents(
     *,
     input_files: list[InputFile],
     base_dir: Path | None,
@@ -612,8 +696,12 @@ def run_backup(
     debug_max_bytes: int | None = None,
     debug_reveal_secrets: bool = False,
     quiet: bool = False,
-) -> BackupResult:
-    """Run the backup process and generate PDF documents."""
+) -> BackupDocuments:
+    """Encrypt inputs and build render inputs for every backup document.
+
+    The returned staging directory is created but empty; callers must either render and
+    commit it or discard it.
+    """
     status_quiet = quiet or debug
     if not input_files:
         raise ValueError("at least one input file is required")
@@ -635,15 +723,20 @@ def run_backup(
         emit_phase(phase="prepare", label="Preparing payload")
         payload_codec_mode = config.cli_defaults.backup.payload_codec
         qr_payload_codec_mode = config.cli_defaults.backup.qr_payload_codec
-        envelope, payload = _prepare_envelope(
-            input_files,
-            plan,
-            sign_priv,
-            input_origin,
-            input_roots or [],
-            payload_codec_mode=payload_codec_mode,
-        )
-        manifest = envelope_codec_module.decode_envelope(envelope)[0]
+        try:
+            envelope, manifest = _prepare_envelope(
+                input_files,
+                plan,
+                sign_priv,
+                input_origin,
+                input_roots or [],
+                payload_codec_mode=payload_codec_mode,
+                max_envelope_bytes=MAX_CIPHERTEXT_BYTES,
+            )
+        except payload_codec_module.PayloadTooLargeError as exc:
+            raise ValueError(
+                f"ciphertext would exceed MAX_CIPHERTEXT_BYTES ({MAX_CIPHERTEXT_BYTES}): {exc}"
+            ) from exc
         emit_progress(
             phase="prepare",
             current=1,
@@ -652,13 +745,13 @@ def run_backup(
             details={
                 "input_count": len(input_files),
                 "manifest_file_count": len(manifest.files),
-                "payload_bytes": len(payload),
+                "payload_bytes": sum(entry.size for entry in manifest.files),
             },
         )
 
     if debug:
         print_backup_debug(
-            payload=payload,
+            payload=_debug_payload(envelope, manifest),
             input_files=input_files,
             base_dir=base_dir,
             manifest=manifest,
@@ -674,11 +767,21 @@ def run_backup(
         )
 
     # Encrypt payload
+    use_identity = plan.key_mode == KeyMode.X25519
+    passphrase_used: str | None
     with status("Encrypting payload...", quiet=status_quiet):
         emit_phase(phase="encrypt", label="Encrypting payload")
-        ciphertext, passphrase_used = encrypt_bytes_with_passphrase(
-            envelope, passphrase=passphrase, passphrase_words=passphrase_words
-        )
+        with span("backup.encrypt", envelope_bytes=len(envelope)):
+            if use_identity:
+                ciphertext, passphrase_used = encrypt_bytes_with_identity(
+                    envelope, identity=passphrase
+                )
+            else:
+                ciphertext, passphrase_used = encrypt_bytes_with_passphrase(
+                    envelope, passphrase=passphrase, passphrase_words=passphrase_words
+                )
+    # Rendering only needs the ciphertext; release the plaintext envelope before it starts.
+    del envelope
     emit_progress(
         phase="encrypt",
         current=1,
@@ -693,19 +796,22 @@ def run_backup(
         )
     if passphrase_used is None:
         raise ValueError("passphrase generation failed")
-    passphrase_final = passphrase if passphrase is not None else passphrase_used
+    # The identity comes back normalized, so prefer it over the caller's transcription.
+    passphrase_final = passphrase_used if use_identity or passphrase is None else passphrase
 
     # Build key lines for recovery document
     plan_sharding = plan.sharding
+    key_label = "Age identity" if use_identity else "Passphrase"
     if plan_sharding is not None:
         key_lines = [
-            "Passphrase is sharded.",
+            f"{key_label} is sharded.",
             f"Recover with {plan_sharding.threshold} of {plan_sharding.shares} shard documents.",
         ]
     else:
-        key_lines = ["Passphrase:", passphrase_final]
+        key_lines = [f"{key_label}:", passphrase_final]
     recovery_meta = build_recovery_meta(
-        passphrase=None if plan_sharding is not None else passphrase_final,
+        passphrase=None if plan_sharding is not None or use_identity else passphrase_final,
+        age_identity=passphrase_final if plan_sharding is None and use_identity else None,
         quorum_threshold=plan_sharding.threshold if plan_sharding is not None else None,
         quorum_shares=plan_sharding.shares if plan_sharding is not None else None,
         signing_pub=sign_pub,
@@ -749,6 +855,7 @@ def run_backup(
         frame_type=FrameType.MAIN_DOCUMENT,
         qr_config=config.qr_config,
         payload_codec=qr_payload_codec_mode,
+        data_overhead=PARITY_FRAME_OVERHEAD_BYTES if config.qr_parity_percent else 0,
     )
     if main_chunk_size < config.qr_chunk_size:
         _warn(
@@ -768,8 +875,10 @@ def run_backup(
         doc_id=doc_id,
         frame_type=FrameType.MAIN_DOCUMENT,
         chunk_size=main_chunk_size,
+        parity_percent=config.qr_parity_percent,
     )
     qr_frames = [*frames, auth_frame]
+    frames = [frame for frame in frames if frame.frame_type == FrameType.MAIN_DOCUMENT]
     output_dir, staging_output_dir = _prepare_output_dir(
         output_dir,
         doc_id.hex(),
@@ -836,44 +945,263 @@ def run_backup(
         layout_debug_json_path=_layout_debug_json_path(layout_debug_dir, "recovery_document"),
     )
 
-    try:
-        emit_phase(phase="render", label="Rendering backup documents")
-        shard_paths, signing_key_shard_paths = _render_all_documents(
-            qr_inputs=qr_inputs,
-            recovery_inputs=recovery_inputs,
-            kit_index_inputs=kit_index_inputs,
-            shard_payloads=shard_payloads,
-            signing_key_shard_payloads=signing_key_shard_payloads,
-            doc_id=doc_id,
-            output_dir=staging_output_dir,
-            render_service=render_service,
-            config=config,
-            status_quiet=status_quiet,
-            layout_debug_dir=layout_debug_dir,
-            qr_payload_codec=qr_payload_codec_mode,
+    return BackupDocuments(
+        doc_id=doc_id,
+        doc_hash=doc_hash,
+        manifest=manifest,
+        output_dir=output_dir,
+        staging_output_dir=staging_output_dir,
+        passphrase_used=passphrase_used,
+        qr_inputs=qr_inputs,
+        recovery_inputs=recovery_inputs,
+        kit_index_inputs=kit_index_inputs,
+        shard_payloads=shard_payloads,
+        signing_key_shard_payloads=signing_key_shard_payloads,
+        layout_debug_dir=layout_debug_dir,
+        render_service=render_service,
+        qr_payload_codec=qr_payload_codec_mode,
+    )
+
+
+def backup_document_render_jobs(
+    documents: BackupDocuments,
+    *,
+    config: AppConfig,
+) -> list[DocumentRenderJob]:
+    """List every PDF of a prepared backup in the order the sequential flow renders them."""
+
+    jobs = [
+        DocumentRenderJob(
+            kind="qr_document",
+            label="Rendered QR document",
+            inputs=documents.qr_inputs,
+        ),
+        DocumentRenderJob(
+            kind="recovery_document",
+            label="Rendered recovery document",
+            inputs=documents.recovery_inputs,
+        ),
+    ]
+    if documents.kit_index_inputs is not None:
+        jobs.append(
+            DocumentRenderJob(
+                kind="recovery_kit_index",
+                label="Rendered recovery kit index",
+                inputs=documents.kit_index_inputs,
+            )
+        )
+    for shard in sorted(documents.shard_payloads, key=lambda item: item.share_index):
+        jobs.append(
+            DocumentRenderJob(
+                kind="shard_document",
+                label=f"Rendered shard document {shard.share_index} of {shard.share_count}",
+                inputs=_shard_render_inputs(
+                    shard,
+                    doc_id=documents.doc_id,
+                    output_dir=documents.staging_output_dir,
+                    render_service=documents.render_service,
+                    filename_prefix="shard",
+                    template_path=config.shard_template_path,
+                    layout_debug_json_path=_layout_debug_json_path(
+                        documents.layout_debug_dir,
+                        f"shard-{shard.share_index:02d}-of-{shard.share_count:02d}",
+                    ),
+                    qr_payload_codec=documents.qr_payload_codec,
+                ),
+            )
         )
-        _commit_prepared_output_dir(staging_output_dir, output_dir)
-    except Exception:
-        _discard_prepared_output_dir(staging_output_dir)
-        raise
+    for shard in sorted(documents.signing_key_shard_payloads, key=lambda item: item.share_index):
+        jobs.append(
+            DocumentRenderJob(
+                kind="signing_key_shard_document",
+                label=f"Rendered signing-key shard {shard.share_index} of {shard.share_count}",
+                inputs=_shard_render_inputs(
+                    shard,
+                    doc_id=documents.doc_id,
+                    output_dir=documents.staging_output_dir,
+                    render_service=documents.render_service,
+                    filename_prefix="signing-key-shard",
+                    template_path=config.signing_key_shard_template_path,
+                    doc_type=DOC_TYPE_SIGNING_KEY_SHARD,
+                    layout_debug_json_path=_layout_debug_json_path(
+                        documents.layout_debug_dir,
+                        f"signing-key-shard-{shard.share_index:02d}-of-{shard.share_count:02d}",
+                    ),
+                    qr_payload_codec=documents.qr_payload_codec,
+                ),
+            )
+        )
+    return jobs
+
 
-    final_output_dir = Path(output_dir)
-    final_qr_path = str(final_output_dir / Path(qr_path).name)
-    final_recovery_path = str(final_output_dir / Path(recovery_path).name)
-    final_kit_index_path = (
-        None if kit_index_path is None else str(final_output_dir / Path(kit_index_path).name)
+def backup_result(
+    documents: BackupDocuments,
+    *,
+    shard_paths: list[str],
+    signing_key_shard_paths: list[str],
+) -> BackupResult:
+    """Map staged document paths onto the committed output directory."""
+
+    final_output_dir = Path(documents.output_dir)
+    kit_index_path = (
+        None
+        if documents.kit_index_inputs is None
+        else str(final_output_dir / Path(documents.kit_index_inputs.output_path).name)
     )
-    final_shard_paths = tuple(str(final_output_dir / Path(path).name) for path in shard_paths)
-    final_signing_key_shard_paths = tuple(
-        str(final_output_dir / Path(path).name) for path in signing_key_shard_paths
+    return BackupResult(
+        doc_id=documents.doc_id,
+        qr_path=str(final_output_dir / Path(documents.qr_inputs.output_path).name),
+        recovery_path=str(final_output_dir / Path(documents.recovery_inputs.output_path).name),
+        kit_index_path=kit_index_path,
+        shard_paths=tuple(str(final_output_dir / Path(path).name) for path in shard_paths),
+        signing_key_shard_paths=tuple(
+            str(final_output_dir / Path(path).name) for path in signing_key_shard_paths
+        ),
+        passphrase_used=documents.passphrase_used,
     )
 
-    return BackupResult(
-        doc_id=doc_id,
-        qr_path=final_qr_path,
-        recovery_path=final_recovery_path,
-        kit_index_path=final_kit_index_path,
-        shard_paths=final_shard_paths,
-        signing_key_shard_paths=final_signing_key_shard_paths,
-        passphrase_used=passphrase_used,
+
+def backup_registry_entry(
+    documents: BackupDocuments,
+    result: BackupResult,
+    *,
+    plan: DocumentPlan,
+) -> RegistryEntry:
+    """Collect the non-secret metadata of a committed backup for the local registry."""
+
+    manifest = documents.manifest
+    outputs = [
+        RegistryOutput(kind="qr_document", path=result.qr_path),
+        RegistryOutput(kind="recovery_document", path=result.recovery_path),
+    ]
+    if result.kit_index_path is not None:
+        outputs.append(RegistryOutput(kind="kit_index", path=result.kit_index_path))
+    outputs.extend(RegistryOutput(kind="shard_document", path=path) for path in result.shard_paths)
+    outputs.extend(
+        RegistryOutput(kind="signing_key_shard_document", path=path)
+        for path in result.signing_key_shard_paths
     )
+    sharding = plan.sharding
+    signing_sharding = plan.signing_seed_sharding if result.signing_key_shard_paths else None
+    return RegistryEntry(
+        doc_id=documents.doc_id.hex(),
+        doc_hash=documents.doc_hash.hex(),
+        created_at=manifest.created_at,
+        sealed=manifest.sealed,
+        key_mode=manifest.key_mode,
+        input_origin=manifest.input_origin,
+        output_dir=str(Path(documents.output_dir).resolve()),
+        files=registry_files([(entry.path, entry.size, entry.sha256) for entry in manifest.files]),
+        outputs=tuple(
+            RegistryOutput(kind=item.kind, path=str(Path(item.path).resolve())) for item in outputs
+        ),
+        shard_threshold=sharding.threshold if sharding is not None else None,
+        shard_count=sharding.shares if sharding is not None else None,
+        signing_key_shard_threshold=(
+            signing_sharding.threshold if signing_sharding is not None else None
+        ),
+        signing_key_shard_count=signing_sharding.shares if signing_sharding is not None else None,
+    )
+
+
+def _record_in_registry(registry_path: Path, entry: RegistryEntry, *, output_dir: str) -> None:
+    try:
+        with open_backup_registry(registry_path) as registry:
+            registry.record(entry)
+    except (OSError, sqlite3.Error) as exc:
+        raise OSError(
+            f"backup was written to {output_dir} but the registry {registry_path} "
+            f"could not be updated: {exc}"
+        ) from exc
+
+
+def run_backup(
+    *,
+    input_files: list[InputFile],
+    base_dir: Path | None,
+    output_dir: str | None,
+    output_dir_existing_parent: bool = False,
+    layout_debug_dir: str | None = None,
+    input_origin: str = "file",
+    input_roots: list[str] | None = None,
+    plan: DocumentPlan,
+    passphrase: str | None,
+    passphrase_words: int | None = None,
+    config: AppConfig,
+    debug: bool = False,
+    debug_max_bytes: int | None = None,
+    debug_reveal_secrets: bool = False,
+    quiet: bool = False,
+    verify_render: bool = False,
+    registry_path: Path | None = None,
+) -> BackupResult:
+    """Run the backup process and generate PDF documents.
+
+    With `verify_render`, the committed PDFs are scanned back and the result carries the
+    round-trip report. With `registry_path`, the backup's non-secret metadata is appended to
+    that local registry once the documents are committed.
+    """
+    with span("backup", input_files=len(input_files)) as backup_span:
+        documents = prepare_backup_documents(
+            input_files=input_files,
+            base_dir=base_dir,
+            output_dir=output_dir,
+            output_dir_existing_parent=output_dir_existing_parent,
+            layout_debug_dir=layout_debug_dir,
+            input_origin=input_origin,
+            input_roots=input_roots,
+            plan=plan,
+            passphrase=passphrase,
+            passphrase_words=passphrase_words,
+            config=config,
+            debug=debug,
+            debug_max_bytes=debug_max_bytes,
+            debug_reveal_secrets=debug_reveal_secrets,
+            quiet=quiet,
+        )
+
+        try:
+            emit_phase(phase="render", label="Rendering backup documents")
+            with span("backup.render"):
+                shard_paths, signing_key_shard_paths = _render_all_documents(
+                    qr_inputs=documents.qr_inputs,
+                    recovery_inputs=documents.recovery_inputs,
+                    kit_index_inputs=documents.kit_index_inputs,
+                    shard_payloads=documents.shard_payloads,
+                    signing_key_shard_payloads=documents.signing_key_shard_payloads,
+                    doc_id=documents.doc_id,
+                    output_dir=documents.staging_output_dir,
+                    render_service=documents.render_service,
+                    config=config,
+                    status_quiet=quiet or debug,
+                    layout_debug_dir=documents.layout_debug_dir,
+                    qr_payload_codec=documents.qr_payload_codec,
+                )
+            _commit_prepared_output_dir(documents.staging_output_dir, documents.output_dir)
+        except Exception:
+            _discard_prepared_output_dir(documents.staging_output_dir)
+            raise
+
+        result = backup_result(
+            documents,
+            shard_paths=shard_paths,
+            signing_key_shard_paths=signing_key_shard_paths,
+        )
+        if registry_path is not None:
+            _record_in_registry(
+                registry_path,
+                backup_registry_entry(documents, result, plan=plan),
+                output_dir=documents.output_dir,
+            )
+        if verify_render:
+            targets = verify_targets(
+                [
+                    (job.kind, job.inputs)
+                    for job in backup_document_render_jobs(documents, config=config)
+                ],
+                output_dir=documents.output_dir,
+            )
+            result = replace(result, render_verification=verify_rendered_documents(targets))
+        backup_span.count("main_frames", len(documents.qr_inputs.frames))
+        backup_span.count("shard_documents", len(shard_paths) + len(signing_key_shard_paths))
+    return result
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+"""Peak-memory estimate and `--max-memory` admission for the backup pipeline.
+
+The backup keeps every input in memory until it finishes (`InputFile.data`), so the inputs
+are a floor under every stage. On top of that:
+
+- `prepare` streams the inputs through the payload codec. The encoded payload and the
+  envelope exist together for a moment, and both are capped at `MAX_CIPHERTEXT_BYTES`
+  because the codec gives up as soon as its output would not fit.
+- `encrypt` holds the envelope, the ciphertext, and age's working copy.
+- `render` holds frames, QR payload text, rasterized QR images, and template HTML. All of
+  them scale with the ciphertext, not with the inputs.
+
+Chromium prints PDFs in a separate process, so its memory is not counted here.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from ethernity.core.bounds import MAX_CIPHERTEXT_BYTES
+from ethernity.formats.envelope_types import PAYLOAD_CODEC_RAW
+
+# InputFile, PayloadPart and ManifestFile objects plus path strings, per input file.
+PER_FILE_OVERHEAD_BYTES = 1024
+# zlib deflate state at level 9 (window, hash chains, pending buffer), rounded up.
+GZIP_STATE_BYTES = 512 * 1024
+# Render working set per ciphertext byte: frames, QR text, QR rasters, HTML.
+RENDER_BYTES_PER_CIPHERTEXT_BYTE = 24
+
+_SIZE_PATTERN = re.compile(r"^\s*(\d+)\s*([kmgt]?)(i?b)?\s*$", re.IGNORECASE)
+_SIZE_UNITS = {"": 1, "k": 1024, "m": 1024**2, "g": 1024**3, "t": 1024**4}
+
+
+@dataclass(frozen=True)
+class BackupMemoryEstimate:
+    """Estimated resident bytes per backup stage; `peak_bytes` is the largest."""
+
+    input_bytes: int
+    file_count: int
+    stages: tuple[tuple[str, int], ...]
+
+    @property
+    def peak_bytes(self) -> int:
+        return max(size for _stage, size in self.stages)
+
+    @property
+    def peak_stage(self) -> str:
+        return max(self.stages, key=lambda item: item[1])[0]
+
+
+def estimate_backup_memory(
+    input_sizes: Sequence[int],
+    *,
+    payload_codec: str,
+) -> BackupMemoryEstimate:
+    """Estimate backup memory from input file sizes before any input is read."""
+
+    input_bytes = sum(input_sizes)
+    resident = input_bytes + PER_FILE_OVERHEAD_BYTES * len(input_sizes)
+    # Anything larger than the ciphertext bound is rejected by the codec before it is kept.
+    bounded = min(input_bytes, MAX_CIPHERTEXT_BYTES)
+    codec_state = 0 if payload_codec == PAYLOAD_CODEC_RAW else GZIP_STATE_BYTES
+    stages = (
+        ("input", resident),
+        ("prepare", resident + 2 * bounded + codec_state),
+        ("encrypt", resident + 3 * bounded),
+        ("render", resident + RENDER_BYTES_PER_CIPHERTEXT_BYTE * bounded),
+    )
+    return BackupMemoryEstimate(
+        input_bytes=input_bytes,
+        file_count=len(input_sizes),
+        stages=stages,
+    )
+
+
+def check_memory_limit(estimate: BackupMemoryEstimate, max_memory: int | None) -> None:
+    """Raise `ValueError` when the estimated peak exceeds `max_memory` bytes."""
+
+    if max_memory is None or estimate.peak_bytes <= max_memory:
+        return
+    raise ValueError(
+        f"estimated peak memory {format_memory_size(estimate.peak_bytes)} "
+        f"(stage '{estimate.peak_stage}', {estimate.file_count} input file(s), "
+        f"{format_memory_size(estimate.input_bytes)} of input) exceeds --max-memory "
+        f"{format_memory_size(max_memory)}"
+    )
+
+
+def parse_memory_size(value: str) -> int:
+    """Parse a byte count such as `1048576`, `512M`, `512MiB`, or `2G` (binary units)."""
+
+    match = _SIZE_PATTERN.match(value)
+    if match is None:
+        raise ValueError(f"invalid memory size: {value!r} (use e.g. 512M or 2G)")
+    amount = int(match.group(1)) * _SIZE_UNITS[match.group(2).lower()]
+    if amount <= 0:
+        raise ValueError("memory size must be positive")
+    return amount
+
+
+def format_memory_size(size: int) -> str:
+    for unit, factor in (("GiB", 1024**3), ("MiB", 1024**2), ("KiB", 1024)):
+        if size >= factor:
+            return f"{size / factor:.1f} {unit}"
+    return f"{size} B"
+
+
+__all__ = [
+    "BackupMemoryEstimate",
+    "check_memory_limit",
+    "estimate_backup_memory",
+    "format_memory_size",
+    "parse_memory_size",
+]
@@ -26,6 +26,7 @@ from ethernity.cli.features.backup.execution import run_backup as _run_backup
 from ethernity.cli.features.backup.planning import build_document_plan
 from ethernity.cli.features.backup.service import (
     apply_qr_chunk_size_override as _apply_qr_chunk_size_override_service,
+    apply_qr_parity_override,
     execute_prepared_backup,
     prepare_backup_run,
 )
@@ -38,7 +39,7 @@ from ethernity.cli.features.backup.wizard import (
 from ethernity.cli.shared.io.inputs import _load_input_files
 from ethernity.cli.shared.plan import _validate_backup_args, _validate_passphrase_words
 from ethernity.cli.shared.types import BackupArgs, BackupResult, InputFile
-from ethernity.cli.shared.ui.summary import print_backup_summary
+from ethernity.cli.shared.ui.summary import print_backup_summary, print_render_verification
 from ethernity.cli.shared.ui_api import (
     DEBUG_MAX_BYTES_DEFAULT,
     build_review_table,
@@ -71,7 +72,8 @@ from ethernity.config import (
     load_app_config,
 )
 from ethernity.config.paths import TEMPLATES_RESOURCE_ROOT
-from ethernity.core.models import DocumentPlan, ShardingConfig, SigningSeedMode
+from ethernity.core.app_paths import backup_registry_path
+from ethernity.core.models import DocumentPlan, KeyMode, ShardingConfig, SigningSeedMode
 from ethernity.formats import (
     envelope_codec as envelope_codec_module,
     payload_codec as payload_codec_module,
@@ -105,6 +107,9 @@ def _prompt_encryption(
     passphrase = args.passphrase if args is not None else None
     passphrase_generate = args.passphrase_generate if args is not None else False
     passphrase_words = args.passphrase_words if args is not None else None
+    if args is not None and args.key_mode == KeyMode.X25519.value:
+        # The age identity is generated during backup; there is no passphrase to prompt for.
+        return passphrase, None
 
     if passphrase is not None:
         entered = prompt_optional_secret(
@@ -381,7 +386,9 @@ def _build_review_rows(
         config=config,
     )
     review_rows.append(("Keys", None))
-    if passphrase:
+    if plan.key_mode == KeyMode.X25519:
+        review_rows.append(("Age identity", "provided" if passphrase else "auto-generated"))
+    elif passphrase:
         review_rows.append(("Passphrase", "provided"))
     else:
         review_rows.append(("Passphrase", "auto-generated"))
@@ -428,6 +435,8 @@ def _build_review_rows(
         review_rows.append(("Config", "default"))
     review_rows.append(("Paper size", paper or str(config.paper_size)))
     review_rows.append(("QR chunk size (preferred)", f"{config.qr_chunk_size} bytes"))
+    if config.qr_parity_percent:
+        review_rows.append(("QR parity", f"{config.qr_parity_percent}%"))
     if design:
         review_rows.append(("Template design", design))
     review_rows.append(("Output", None))
@@ -601,6 +610,7 @@ def run_wizard(
             signing_seed_mode = SigningSeedMode.EMBEDDED
             sharding = None
             signing_seed_sharding = None
+            key_mode = KeyMode(working_args.key_mode or KeyMode.PASSPHRASE.value)
             paper = paper_size
             design = args.design if args is not None else None
             input_files: list[InputFile] = []
@@ -613,10 +623,12 @@ def run_wizard(
                 signing_seed_mode=signing_seed_mode,
                 sharding=sharding,
                 signing_seed_sharding=signing_seed_sharding,
+                key_mode=key_mode,
             )
             config = load_app_config(config_path, paper_size=paper)
             config = apply_template_design(config, design)
             config = _apply_qr_chunk_size_override(config, working_args.qr_chunk_size)
+            config = apply_qr_parity_override(config, working_args.qr_parity)
             stage_index = 0
 
             while stage_index < 5:
@@ -715,10 +727,12 @@ def run_wizard(
                     signing_seed_mode=signing_seed_mode,
                     sharding=sharding,
                     signing_seed_sharding=signing_seed_sharding,
+                    key_mode=key_mode,
                 )
                 config = load_app_config(config_path, paper_size=paper)
                 config = apply_template_design(config, design)
                 config = _apply_qr_chunk_size_override(config, working_args.qr_chunk_size)
+                config = apply_qr_parity_override(config, working_args.qr_parity)
                 review_rows = _build_review_rows(
                     passphrase,
                     passphrase_words,
@@ -780,10 +794,14 @@ def run_wizard(
                 debug_max_bytes=debug_max_bytes,
                 debug_reveal_secrets=debug_reveal_secrets,
                 quiet=quiet,
+                verify_render=args.verify_render if args is not None else False,
+                registry_path=(
+                    backup_registry_path() if args is not None and args.registry else None
+                ),
             )
             print_backup_summary(result, plan, passphrase, quiet=quiet)
             _print_completion_actions(result, quiet)
-    return 0
+    return _render_verification_exit_code(result, quiet=quiet)
 
 
 def _should_use_wizard_for_backup(args: BackupArgs) -> bool:
@@ -810,7 +828,17 @@ def run_backup_command(args: BackupArgs) -> int:
     result = execute_prepared_backup(prepared)
     print_backup_summary(result, prepared.plan, prepared.args.passphrase, quiet=quiet)
     _print_completion_actions(result, quiet)
-    return 0
+    return _render_verification_exit_code(result, quiet=quiet)
+
+
+def _render_verification_exit_code(result: BackupResult, *, quiet: bool) -> int:
+    """Report `--verify-render` results; a frame that did not round-trip fails the command."""
+
+    verification = result.render_verification
+    if verification is None:
+        return 0
+    print_render_verification(verification, quiet=quiet)
+    return 0 if verification.ok else 1
 
 
 def run_backup(
@@ -830,6 +858,8 @@ def run_backup(
     debug_max_bytes: int | None = None,
     debug_reveal_secrets: bool = False,
     quiet: bool = False,
+    verify_render: bool = False,
+    registry_path: Path | None = None,
 ) -> BackupResult:
     """Run the backup flow with preloaded inputs and resolved config."""
 
@@ -849,4 +879,6 @@ def run_backup(
         debug_max_bytes=debug_max_bytes,
         debug_reveal_secrets=debug_reveal_secrets,
         quiet=quiet,
+        verify_render=verify_render,
+        registry_path=registry_path,
     )
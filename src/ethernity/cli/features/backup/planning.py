@@ -17,7 +17,7 @@
 from __future__ import annotations
 
 from ethernity.cli.shared.types import BackupArgs
-from ethernity.core.models import DocumentPlan, ShardingConfig, SigningSeedMode
+from ethernity.core.models import DocumentPlan, KeyMode, ShardingConfig, SigningSeedMode
 
 
 def build_document_plan(
@@ -26,6 +26,7 @@ def build_document_plan(
     sharding: ShardingConfig | None,
     signing_seed_mode: SigningSeedMode,
     signing_seed_sharding: ShardingConfig | None,
+    key_mode: KeyMode = KeyMode.PASSPHRASE,
 ) -> DocumentPlan:
     return DocumentPlan(
         version=1,
@@ -33,6 +34,7 @@ def build_document_plan(
         signing_seed_mode=signing_seed_mode,
         sharding=sharding,
         signing_seed_sharding=signing_seed_sharding,
+        key_mode=key_mode,
     )
 
 
@@ -49,6 +51,7 @@ def plan_from_args(args: BackupArgs) -> DocumentPlan:
         sharding=sharding,
         signing_seed_mode=signing_seed_mode,
         signing_seed_sharding=signing_seed_sharding,
+        key_mode=KeyMode(args.key_mode) if args.key_mode else KeyMode.PASSPHRASE,
     )
 
 
@@ -23,6 +23,7 @@ from typing import Literal
 from rich.progress import Progress
 
 from ethernity.cli.features.backup.execution import run_backup as _run_backup
+from ethernity.cli.features.backup.memory import check_memory_limit, estimate_backup_memory
 from ethernity.cli.features.backup.planning import plan_from_args
 from ethernity.cli.shared import api_codes
 from ethernity.cli.shared.events import EventSink, emit_phase, emit_progress, event_session
@@ -31,6 +32,7 @@ from ethernity.cli.shared.log import _warn
 from ethernity.cli.shared.plan import _validate_backup_args
 from ethernity.cli.shared.types import BackupArgs, BackupResult, InputFile
 from ethernity.config import AppConfig, apply_template_design, load_app_config
+from ethernity.core.app_paths import backup_registry_path
 from ethernity.core.models import DocumentPlan, SigningSeedMode
 
 
@@ -53,6 +55,14 @@ def apply_qr_chunk_size_override(config: AppConfig, qr_chunk_size: int | None) -
     return replace(config, qr_chunk_size=qr_chunk_size)
 
 
+def apply_qr_parity_override(config: AppConfig, qr_parity: int | None) -> AppConfig:
+    """Override the configured PARITY QR percentage when requested."""
+
+    if qr_parity is None:
+        return config
+    return replace(config, qr_parity_percent=qr_parity)
+
+
 def prepare_backup_run(
     args: BackupArgs,
     *,
@@ -64,6 +74,7 @@ def prepare_backup_run(
         config = load_app_config(args.config, paper_size=args.paper)
         config = apply_template_design(config, args.design)
         config = apply_qr_chunk_size_override(config, args.qr_chunk_size)
+        config = apply_qr_parity_override(config, args.qr_parity)
         _validate_backup_args(args)
         plan = plan_from_args(args)
         if plan.sealed and plan.signing_seed_mode == SigningSeedMode.SHARDED:
@@ -74,19 +85,35 @@ def prepare_backup_run(
             )
 
         emit_phase(phase="input", label="Loading backup inputs")
+        payload_codec = config.cli_defaults.backup.payload_codec
+
+        def _admit(input_sizes: list[int]) -> None:
+            estimate = estimate_backup_memory(input_sizes, payload_codec=payload_codec)
+            check_memory_limit(estimate, args.max_memory)
+
         input_files, resolved_base, input_origin, input_roots = _load_input_files(
             list(args.input or []),
             list(args.input_dir or []),
             args.base_dir,
             allow_stdin=True,
             progress=input_progress,
+            before_read=_admit if args.max_memory is not None else None,
+        )
+        # Re-check with the bytes actually read: stdin has no size up front.
+        estimate = estimate_backup_memory(
+            [len(item.data) for item in input_files], payload_codec=payload_codec
         )
+        check_memory_limit(estimate, args.max_memory)
         emit_progress(
             phase="input",
             current=len(input_files),
             total=len(input_files),
             unit="files",
-            details={"input_origin": input_origin, "input_roots": input_roots},
+            details={
+                "input_origin": input_origin,
+                "input_roots": input_roots,
+                "estimated_peak_bytes": estimate.peak_bytes,
+            },
         )
         return PreparedBackupRun(
             args=args,
@@ -122,12 +149,15 @@ def execute_prepared_backup(
             debug_max_bytes=prepared.args.debug_max_bytes,
             debug_reveal_secrets=prepared.args.debug_reveal_secrets,
             quiet=prepared.args.quiet,
+            verify_render=prepared.args.verify_render,
+            registry_path=backup_registry_path() if prepared.args.registry else None,
         )
 
 
 __all__ = [
     "PreparedBackupRun",
     "apply_qr_chunk_size_override",
+    "apply_qr_parity_override",
     "execute_prepared_backup",
     "prepare_backup_run",
 ]
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+"""Scan freshly written backup PDFs back and check every QR frame round-trips."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from ethernity.cli.shared.events import emit_phase, emit_progress
+from ethernity.core.timing import span
+from ethernity.qr.scan import (
+    PdfRasterizerUnavailableError,
+    QrScanError,
+    ScanProgress,
+    ScanRetryLog,
+    iter_qr_payloads,
+    scan_session,
+)
+from ethernity.render.types import RenderInputs
+
+# Render verification gives up after this many seconds per expected frame, plus a fixed
+# allowance for opening and rasterizing the PDFs.
+VERIFY_SECONDS_PER_FRAME = 1.0
+VERIFY_BASE_SECONDS = 5.0
+
+# Documents whose QR codes carry recovery frames; the kit index only lists them.
+VERIFIED_DOCUMENT_KINDS = ("qr_document", "shard_document", "signing_key_shard_document")
+
+
+@dataclass(frozen=True)
+class VerifyTarget:
+    """One written PDF and the QR payloads it is expected to contain, in frame order."""
+
+    kind: str
+    path: str
+    payloads: tuple[bytes, ...]
+
+
+@dataclass(frozen=True)
+class DocumentVerification:
+    """Round-trip result for one PDF; frame numbers are 0-based positions in the document."""
+
+    kind: str
+    path: str
+    expected: int
+    missing: tuple[int, ...]
+    retried: tuple[tuple[int, str], ...]
+    unexpected: int
+
+    @property
+    def ok(self) -> bool:
+        return not self.missing and not self.unexpected
+
+
+@dataclass(frozen=True)
+class RenderVerification:
+    """Result of scanning every verified backup PDF within a frame-proportional time budget."""
+
+    documents: tuple[DocumentVerification, ...]
+    budget_seconds: float
+    elapsed_seconds: float
+    timed_out: bool
+
+    @property
+    def ok(self) -> bool:
+        return not self.timed_out and all(document.ok for document in self.documents)
+
+    @property
+    def frames(self) -> int:
+        return sum(document.expected for document in self.documents)
+
+
+class _BudgetExceeded(Exception):
+    pass
+
+
+def verify_targets(
+    inputs: Sequence[tuple[str, RenderInputs]],
+    *,
+    output_dir: str | Path,
+) -> list[VerifyTarget]:
+    """Map staged render inputs onto their committed PDFs in `output_dir`.
+
+    Only inputs of `VERIFIED_DOCUMENT_KINDS` that render QR codes are kept.
+    """
+
+    targets: list[VerifyTarget] = []
+    for kind, render_inputs in inputs:
+        if kind not in VERIFIED_DOCUMENT_KINDS or not render_inputs.render_qr:
+            continue
+        if not render_inputs.qr_payloads:
+            continue
+        targets.append(
+            VerifyTarget(
+                kind=kind,
+                path=str(Path(output_dir) / Path(render_inputs.output_path).name),
+                payloads=tuple(
+                    payload.encode("ascii") if isinstance(payload, str) else bytes(payload)
+                    for payload in render_inputs.qr_payloads
+                ),
+            )
+        )
+    return targets
+
+
+def verify_rendered_documents(
+    targets: Sequence[VerifyTarget],
+    *,
+    jobs: int | None = None,
+    seconds_per_frame: float = VERIFY_SECONDS_PER_FRAME,
+    clock: Callable[[], float] = time.monotonic,
+) -> RenderVerification:
+    """Scan `targets` concurrently and compare each decoded QR with the bytes rendered.
+
+    Every target is decoded on the thread pool of `iter_qr_payloads`, with the scan cache off
+    so nothing stale can vouch for a fresh PDF. Scanning stops once the budget of
+    `seconds_per_frame` per expected frame (plus `VERIFY_BASE_SECONDS`) runs out; frames not
+    seen by then are reported missing.
+    """
+
+    expected_frames = sum(len(target.payloads) for target in targets)
+    budget = VERIFY_BASE_SECONDS + seconds_per_frame * expected_frames
+    by_path = {Path(target.path): target for target in targets}
+    decoded: dict[Path, set[bytes]] = {path: set() for path in by_path}
+    retries = ScanRetryLog()
+    started = clock()
+    timed_out = False
+
+    def _check_budget(progress: ScanProgress) -> None:
+        emit_progress(
+            phase="verify",
+            current=progress.payloads,
+            total=expected_frames,
+            unit="frames",
+        )
+        if clock() - started > budget:
+            raise _BudgetExceeded
+
+    emit_phase(phase="verify", label="Verifying rendered QR codes")
+    with span("backup.verify", frames=expected_frames):
+        with scan_session(jobs=jobs, cache=False, retries=retries):
+            try:
+                for scanned in iter_qr_payloads(
+                    list(by_path), executor="thread", progress=_check_budget
+                ):
+                    decoded.setdefault(scanned.source_path, set()).add(scanned.payload)
+            except _BudgetExceeded:
+                timed_out = True
+            except PdfRasterizerUnavailableError:
+                # Reporting every frame as missing would blame the render, not the scanner.
+                raise
+            except QrScanError:
+                # No QR code in any document; every frame is reported missing below.
+                pass
+    elapsed = clock() - started
+
+    retried = retries.retried()
+    documents = tuple(
+        _document_verification(target, decoded.get(path, set()), retried)
+        for path, target in by_path.items()
+    )
+    return RenderVerification(
+        documents=documents,
+        budget_seconds=budget,
+        elapsed_seconds=elapsed,
+        timed_out=timed_out,
+    )
+
+
+def _document_verification(
+    target: VerifyTarget,
+    decoded: set[bytes],
+    retried: dict[bytes, str],
+) -> DocumentVerification:
+    expected = set(target.payloads)
+    return DocumentVerification(
+        kind=target.kind,
+        path=target.path,
+        expected=len(target.payloads),
+        missing=tuple(
+            index for index, payload in enumerate(target.payloads) if payload not in decoded
+        ),
+        retried=tuple(
+            (index, retried[payload])
+            for index, payload in enumerate(target.payloads)
+            if payload in decoded and payload in retried
+        ),
+        unexpected=len(decoded - expected),
+    )
+
+
+__all__ = [
+    "DocumentVerification",
+    "RenderVerification",
+    "VERIFIED_DOCUMENT_KINDS",
+    "VERIFY_BASE_SECONDS",
+    "VERIFY_SECONDS_PER_FRAME",
+    "VerifyTarget",
+    "verify_rendered_documents",
+    "verify_targets",
+]
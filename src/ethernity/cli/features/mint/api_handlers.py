@@ -32,6 +32,7 @@ from ethernity.cli.shared.events import (
 )
 from ethernity.cli.shared.ndjson import SCHEMA_VERSION, emit_started
 from ethernity.cli.shared.types import MintArgs, MintResult
+from ethernity.crypto import envelope_cache_session
 
 _SHARD_LAYOUT_PATTERN = re.compile(
     r"^(?P<prefix>shard|signing-key-shard)-[0-9a-f]+-(?P<index>\d+)-of-(?P<count>\d+)\.pdf$"
@@ -162,7 +163,7 @@ def run_mint_inspect_api_command(args: MintArgs, *, debug: bool = False) -> int:
     )
 
     sink = _ForwardingWarningCollector(active_event_sink())
-    with event_session(sink):
+    with event_session(sink), envelope_cache_session():
         emit_phase(phase="plan", label="Resolving mint inputs")
         inspection = inspect_mint_inputs(args, debug=debug)
         emit_progress(
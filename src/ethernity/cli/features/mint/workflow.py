@@ -68,7 +68,7 @@ from ethernity.cli.shared.ui_api import (
 )
 from ethernity.config import apply_template_design, load_app_config
 from ethernity.core.models import ShardingConfig
-from ethernity.crypto import decrypt_bytes
+from ethernity.crypto import decrypt_bytes, envelope_cache_session
 from ethernity.crypto.sharding import (
     KEY_TYPE_PASSPHRASE,
     KEY_TYPE_SIGNING_SEED,
@@ -155,7 +155,7 @@ def execute_mint(
 ) -> MintResult:
     """Mint fresh shard documents from an existing backup and return the result."""
 
-    with event_session(event_sink):
+    with event_session(event_sink), envelope_cache_session():
         emit_phase(phase="plan", label="Resolving mint inputs")
         state = _load_mint_input_state(args)
         shard_frames = list(state.shard_frames)
@@ -315,9 +315,15 @@ def _should_use_wizard_for_mint(args: MintArgs) -> bool:
 
 
 def run_mint_wizard(args: MintArgs, *, debug: bool = False, show_header: bool = True) -> int:
-    quiet = args.quiet
     if not (sys.stdin.isatty() and sys.stdout.isatty()):
         return run_mint_command(args, debug=debug)
+    # Going back through wizard stages re-plans recovery; decrypt each backup only once.
+    with envelope_cache_session():
+        return _run_mint_wizard(args, debug=debug, show_header=show_header)
+
+
+def _run_mint_wizard(args: MintArgs, *, debug: bool, show_header: bool) -> int:
+    quiet = args.quiet
 
     config = load_app_config(args.config, paper_size=args.paper)
     config = apply_template_design(config, args.design)
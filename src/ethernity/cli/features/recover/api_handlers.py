@@ -35,6 +35,7 @@ from ethernity.cli.shared.types import RecoverArgs
 from ethernity.crypto import decrypt_bytes
 from ethernity.formats.envelope_codec import decode_envelope
 from ethernity.formats.envelope_types import EnvelopeManifest
+from ethernity.qr.scan import scan_session
 
 
 class _ForwardingWarningCollector:
@@ -63,6 +64,7 @@ def _manifest_summary_payload(manifest: EnvelopeManifest) -> dict[str, object]:
         "sealed": manifest.sealed,
         "payload_codec": manifest.payload_codec,
         "payload_raw_len": manifest.payload_raw_len,
+        "key_mode": manifest.key_mode,
         "file_count": len(manifest.files),
     }
 
@@ -91,8 +93,11 @@ def _recover_started_args(
     }
     if operation is not None:
         payload["operation"] = operation
+        payload["session"] = args.session
     else:
         payload["output"] = args.output
+        payload["scan_jobs"] = args.scan_jobs
+        payload["scan_cache"] = args.scan_cache
     return payload
 
 
@@ -119,7 +124,8 @@ def run_recover_api_command(args: RecoverArgs, *, debug: bool = False) -> int:
     )
 
     sink = active_event_sink()
-    plan = prepare_recover_plan(args, event_sink=sink)
+    with scan_session(jobs=args.scan_jobs, cache=args.scan_cache):
+        plan = prepare_recover_plan(args, event_sink=sink)
     execution = execute_recover_plan(
         plan,
         quiet=True,
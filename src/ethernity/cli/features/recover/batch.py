@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+"""Recover every backup found in an archive scan into per-document output directories."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import json
+import os
+import string
+from collections.abc import Mapping, Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Literal
+
+from ethernity.cli.features.recover.execution import decrypt_manifest_and_extract
+from ethernity.cli.features.recover.planning import (
+    RecoveryPlan,
+    _shard_frames_from_args,
+    build_recovery_plan,
+)
+from ethernity.cli.shared.crypto import _doc_id_and_hash_from_ciphertext
+from ethernity.cli.shared.events import emit_phase, emit_progress
+from ethernity.cli.shared.io.frames import (
+    RECOVERY_FRAME_TYPES,
+    _dedupe_frames,
+    _frames_from_scan,
+    _recovery_scan_cache,
+    format_recovery_input_error,
+)
+from ethernity.cli.shared.io.outputs import _write_recovered_outputs
+from ethernity.cli.shared.paths import expanduser_cli_path, expanduser_cli_paths
+from ethernity.cli.shared.types import RecoverArgs
+from ethernity.cli.shared.ui.summary import print_batch_recover_summary
+from ethernity.core.concurrency import jobs_from_env, resolve_worker_count
+from ethernity.core.timing import span
+from ethernity.crypto.sharding import KEY_TYPE_PASSPHRASE, decode_shard_payload
+from ethernity.encoding.chunking import reassemble_payload
+from ethernity.encoding.framing import DOC_ID_LEN, Frame, FrameType
+
+BATCH_REPORT_NAME = "recovery-report.json"
+
+_RECOVER_JOBS_ENV = "ETHERNITY_RECOVER_JOBS"
+_DEFAULT_RECOVER_WORKERS_CAP = 4
+
+PassphraseSource = Literal["shards", "file", "env", "passphrase"]
+
+
+@dataclass(frozen=True)
+class BatchDocumentResult:
+    """Outcome of one document in a batch recovery, as written to the report."""
+
+    doc_id: str
+    status: Literal["recovered", "failed"]
+    main_frames: int
+    auth_status: str | None = None
+    passphrase_source: PassphraseSource | None = None
+    output_dir: str | None = None
+    files: tuple[str, ...] = ()
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class BatchPassphrases:
+    """Per-document passphrase sources, consulted after matching shard sets.
+
+    `by_doc_id` maps lowercase doc_id hex to a passphrase (from `--passphrase-file`);
+    `env_prefix` names environment variables `<prefix><DOC_ID_HEX>`; `default` is the
+    shared `--passphrase`.
+    """
+
+    by_doc_id: Mapping[str, str]
+    env_prefix: str | None = None
+    default: str | None = None
+
+    def resolve(self, doc_id: bytes) -> tuple[str, PassphraseSource] | None:
+        key = doc_id.hex()
+        if key in self.by_doc_id:
+            return self.by_doc_id[key], "file"
+        if self.env_prefix:
+            value = os.environ.get(f"{self.env_prefix}{key.upper()}")
+            if value:
+                return value, "env"
+        if self.default:
+            return self.default, "passphrase"
+        return None
+
+
+def load_passphrase_file(path: str) -> dict[str, str]:
+    """Read `<doc_id hex> <passphrase>` lines; blank lines and `#` comments are skipped."""
+
+    passphrases: dict[str, str] = {}
+    text = Path(path).read_text(encoding="utf-8")
+    for line_number, raw_line in enumerate(text.splitlines(), start=1):
+        line = raw_line.strip()
+        if not line or line.startswith("#"):
+            continue
+        doc_id, _sep, passphrase = line.partition(" ")
+        doc_id = doc_id.lower()
+        passphrase = passphrase.strip()
+        if len(doc_id) != DOC_ID_LEN * 2 or not set(doc_id) <= set(string.hexdigits.lower()):
+            raise ValueError(f"{path}:{line_number}: expected a {DOC_ID_LEN * 2}-digit hex doc_id")
+        if not passphrase:
+            raise ValueError(f"{path}:{line_number}: missing passphrase for {doc_id}")
+        if doc_id in passphrases and passphrases[doc_id] != passphrase:
+            raise ValueError(f"{path}:{line_number}: conflicting passphrases for {doc_id}")
+        passphrases[doc_id] = passphrase
+    return passphrases
+
+
+def partition_frames_by_doc_id(frames: Sequence[Frame]) -> dict[bytes, list[Frame]]:
+    """Group MAIN/PARITY/AUTH frames by doc_id, in order of first appearance."""
+
+    groups: dict[bytes, list[Frame]] = {}
+    for frame in frames:
+        if frame.frame_type in RECOVERY_FRAME_TYPES:
+            groups.setdefault(frame.doc_id, []).append(frame)
+    return groups
+
+
+def partition_shard_frames_by_doc_hash(frames: Sequence[Frame]) -> dict[bytes, list[Frame]]:
+    """Group passphrase shard frames by the doc_hash they were issued for.
+
+    Signing-key shards and undecodable shard frames are left out; they cannot unlock a
+    document.
+    """
+
+    groups: dict[bytes, list[Frame]] = {}
+    for frame in frames:
+        if frame.frame_type != FrameType.KEY_DOCUMENT:
+            continue
+        try:
+            payload = decode_shard_payload(frame.data)
+        except ValueError:
+            continue
+        if payload.key_type != KEY_TYPE_PASSPHRASE:
+            continue
+        groups.setdefault(payload.doc_hash, []).append(frame)
+    return groups
+
+
+def run_batch_recovery(args: RecoverArgs) -> int:
+    """Scan `args.scan` once and recover every complete backup found into `args.output`.
+
+    Each document is written to `<output>/<doc_id hex>/` and the outcome of every document
+    is saved as `<output>/recovery-report.json`. Returns 1 when any document failed.
+    """
+
+    quiet = args.quiet
+    output_root = expanduser_cli_path(args.output, preserve_stdin=False)
+    if not output_root:
+        raise ValueError("--batch requires --output DIR")
+    passphrases = BatchPassphrases(
+        by_doc_id=(
+            load_passphrase_file(expanduser_cli_path(args.passphrase_file) or "")
+            if args.passphrase_file
+            else {}
+        ),
+        env_prefix=args.passphrase_env,
+        default=args.passphrase,
+    )
+
+    scan = expanduser_cli_paths(list(args.scan or []))
+    try:
+        frames = _frames_from_scan(scan, cache=_recovery_scan_cache())
+    except ValueError as exc:
+        raise ValueError(format_recovery_input_error(exc)) from exc
+    extra_shard_frames, _fallback_files, _payload_files, _shard_scan = _shard_frames_from_args(
+        args, quiet=quiet
+    )
+    documents = partition_frames_by_doc_id(frames)
+    if not documents:
+        raise ValueError("scan input did not contain recovery QR payloads")
+    shard_sets = partition_shard_frames_by_doc_hash([*frames, *extra_shard_frames])
+
+    emit_phase(phase="plan", label="Resolving recovery inputs")
+    results: dict[bytes, BatchDocumentResult] = {}
+    plans: list[tuple[RecoveryPlan, PassphraseSource]] = []
+    for doc_id, doc_frames in documents.items():
+        main_count = len(
+            {frame.index for frame in doc_frames if frame.frame_type == FrameType.MAIN_DOCUMENT}
+        )
+        try:
+            plan, source = _plan_document(
+                doc_id,
+                doc_frames,
+                shard_sets=shard_sets,
+                passphrases=passphrases,
+                output_dir=str(Path(output_root) / doc_id.hex()),
+                scan=scan,
+                allow_unsigned=args.allow_unsigned,
+                quiet=quiet,
+            )
+        except ValueError as exc:
+            results[doc_id] = BatchDocumentResult(
+                doc_id=doc_id.hex(), status="failed", main_frames=main_count, error=str(exc)
+            )
+            continue
+        plans.append((plan, source))
+
+    emit_phase(phase="decrypt", label="Decrypting and extracting payloads")
+    for doc_id, result in _recover_plans(plans, workers=_resolve_recover_workers(len(plans))):
+        results[doc_id] = result
+
+    ordered = [results[doc_id] for doc_id in documents]
+    report_path = write_batch_report(output_root, ordered)
+    print_batch_recover_summary(ordered, report_path=report_path, quiet=quiet)
+    return 0 if all(result.status == "recovered" for result in ordered) else 1
+
+
+def write_batch_report(output_root: str, results: Sequence[BatchDocumentResult]) -> str:
+    """Write the batch outcome as JSON next to the per-document directories."""
+
+    root = Path(output_root)
+    root.mkdir(parents=True, exist_ok=True)
+    report_path = root / BATCH_REPORT_NAME
+    report = {
+        "documents": [asdict(result) for result in results],
+        "recovered": sum(1 for result in results if result.status == "recovered"),
+        "failed": sum(1 for result in results if result.status == "failed"),
+    }
+    report_path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    return str(report_path)
+
+
+def _plan_document(
+    doc_id: bytes,
+    frames: list[Frame],
+    *,
+    shard_sets: Mapping[bytes, list[Frame]],
+    passphrases: BatchPassphrases,
+    output_dir: str,
+    scan: list[str],
+    allow_unsigned: bool,
+    quiet: bool,
+) -> tuple[RecoveryPlan, PassphraseSource]:
+    """Build one document's recovery plan, preferring a matching shard set for the key."""
+
+    main_frames = [
+        frame
+        for frame in _dedupe_frames(frames)
+        if frame.frame_type in (FrameType.MAIN_DOCUMENT, FrameType.PARITY)
+    ]
+    if not main_frames:
+        raise ValueError("no main document payloads found (only the AUTH frame was scanned)")
+    _doc_id, doc_hash = _doc_id_and_hash_from_ciphertext(
+        reassemble_payload(main_frames, expected_frame_type=FrameType.MAIN_DOCUMENT)
+    )
+    shard_frames = shard_sets.get(doc_hash, [])
+    passphrase: str | None = None
+    source: PassphraseSource = "shards"
+    if not shard_frames:
+        resolved = passphrases.resolve(doc_id)
+        if resolved is None:
+            raise ValueError("no passphrase source for this document")
+        passphrase, source = resolved
+    plan = build_recovery_plan(
+        frames=frames,
+        extra_auth_frames=[],
+        shard_frames=shard_frames,
+        passphrase=passphrase,
+        allow_unsigned=allow_unsigned,
+        input_label="Scan",
+        input_detail=", ".join(scan),
+        shard_fallback_files=[],
+        shard_payloads_file=[],
+        shard_scan=[],
+        output_path=output_dir,
+        args=None,
+        quiet=quiet,
+    )
+    return plan, source
+
+
+def _recover_plans(
+    plans: Sequence[tuple[RecoveryPlan, PassphraseSource]],
+    *,
+    workers: int,
+) -> list[tuple[bytes, BatchDocumentResult]]:
+    """Decrypt and write every planned document on a thread pool."""
+
+    outcomes: list[tuple[bytes, BatchDocumentResult]] = []
+    with (
+        span("recover.batch", documents=len(plans)) as batch_span,
+        concurrent.futures.ThreadPoolExecutor(max_workers=max(1, workers)) as pool,
+    ):
+        batch_span.count("workers", workers)
+        futures = {
+            pool.submit(_recover_document, plan, source): plan.doc_id for plan, source in plans
+        }
+        for done, future in enumerate(concurrent.futures.as_completed(futures), start=1):
+            outcomes.append((futures[future], future.result()))
+            emit_progress(phase="decrypt", current=done, total=len(plans), unit="documents")
+    return outcomes
+
+
+def _recover_document(plan: RecoveryPlan, source: PassphraseSource) -> BatchDocumentResult:
+    try:
+        _manifest, extracted = decrypt_manifest_and_extract(plan, quiet=True)
+        written = _write_recovered_outputs(
+            plan.output_path, extracted, single_entry_output_is_directory=True
+        )
+    except (OSError, ValueError) as exc:
+        return BatchDocumentResult(
+            doc_id=plan.doc_id.hex(),
+            status="failed",
+            main_frames=len(plan.main_frames),
+            auth_status=plan.auth_status,
+            passphrase_source=source,
+            error=str(exc),
+        )
+    return BatchDocumentResult(
+        doc_id=plan.doc_id.hex(),
+        status="recovered",
+        main_frames=len(plan.main_frames),
+        auth_status=plan.auth_status,
+        passphrase_source=source,
+        output_dir=plan.output_path,
+        files=tuple(written),
+    )
+
+
+def _resolve_recover_workers(document_count: int) -> int:
+    return resolve_worker_count(
+        document_count,
+        requested=jobs_from_env(_RECOVER_JOBS_ENV),
+        cap=_DEFAULT_RECOVER_WORKERS_CAP,
+        min_tasks_per_worker=1,
+    )
+
+
+__all__ = [
+    "BATCH_REPORT_NAME",
+    "BatchDocumentResult",
+    "BatchPassphrases",
+    "load_passphrase_file",
+    "partition_frames_by_doc_id",
+    "partition_shard_frames_by_doc_hash",
+    "run_batch_recovery",
+    "write_batch_report",
+]
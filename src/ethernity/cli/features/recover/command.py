@@ -24,6 +24,7 @@ import typer
 
 from ethernity.cli.features.recover.orchestrator import (
     _should_use_wizard_for_recover,
+    run_recover_batch_command,
     run_recover_command,
     run_recover_wizard,
 )
@@ -39,7 +40,9 @@ from ethernity.cli.shared.common import (
     _run_cli,
 )
 from ethernity.cli.shared.types import RecoverArgs
+from ethernity.cli.shared.ui_api import printed_progress
 from ethernity.config import RecoverDefaults
+from ethernity.qr.scan import scan_session
 
 
 def _expand_shard_dir(shard_dir: str | None) -> list[str]:
@@ -59,6 +62,11 @@ def register(app: typer.Typer) -> None:
             "--shard-scan shard-02.pdf --output recovered.bin\n"
             "  ethernity recover --fallback-file recovery.txt --output recovered.bin\n"
             "  ethernity recover --payloads-file qr_payloads.txt\n"
+            "  ethernity recover --scan-watch ~/Pictures/phone-sync --output recovered.bin\n"
+            "  ethernity recover --session recovery.session --scan ./pages-1-20.pdf "
+            "--output recovered.bin\n"
+            "  ethernity recover --batch --scan ./archive --shard-dir ./shards "
+            "--passphrase-file passphrases.txt --output ./recovered\n"
         )
     )(recover)
 
@@ -90,6 +98,45 @@ def recover(
             rich_help_panel="Inputs",
         ),
     ] = None,
+    scan_watch: Annotated[
+        str | None,
+        typer.Option(
+            "--scan-watch",
+            help="Decode scans as they arrive in this directory until the document is complete.",
+            rich_help_panel="Inputs",
+        ),
+    ] = None,
+    scan_watch_idle: Annotated[
+        float | None,
+        typer.Option(
+            "--scan-watch-idle",
+            min=1,
+            help="Stop --scan-watch after this many seconds without a new scan (default: 600).",
+            rich_help_panel="Inputs",
+        ),
+    ] = None,
+    session: Annotated[
+        str | None,
+        typer.Option(
+            "--session",
+            help=(
+                "Checkpoint file that keeps the frames read so far; later runs only need "
+                "the missing pages."
+            ),
+            rich_help_panel="Inputs",
+        ),
+    ] = None,
+    batch: Annotated[
+        bool,
+        typer.Option(
+            "--batch",
+            help=(
+                "Recover every backup found in --scan inputs, each into its own "
+                "<doc_id> subdirectory of --output."
+            ),
+            rich_help_panel="Inputs",
+        ),
+    ] = False,
     passphrase: Annotated[
         str | None,
         typer.Option(
@@ -98,6 +145,22 @@ def recover(
             rich_help_panel="Keys",
         ),
     ] = None,
+    passphrase_file: Annotated[
+        str | None,
+        typer.Option(
+            "--passphrase-file",
+            help="With --batch: file of '<doc_id hex> <passphrase>' lines.",
+            rich_help_panel="Keys",
+        ),
+    ] = None,
+    passphrase_env: Annotated[
+        str | None,
+        typer.Option(
+            "--passphrase-env",
+            help="With --batch: read passphrases from env vars named <PREFIX><DOC_ID_HEX>.",
+            rich_help_panel="Keys",
+        ),
+    ] = None,
     shard_fallback_file: Annotated[
         list[str] | None,
         typer.Option(
@@ -130,6 +193,23 @@ def recover(
             rich_help_panel="Inputs",
         ),
     ] = None,
+    scan_jobs: Annotated[
+        int | None,
+        typer.Option(
+            "--scan-jobs",
+            min=1,
+            help="Parallel QR decode workers for --scan/--shard-scan (default: CPU count).",
+            rich_help_panel="Inputs",
+        ),
+    ] = None,
+    no_scan_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-scan-cache",
+            help="Decode every --scan input again instead of reusing cached results.",
+            rich_help_panel="Inputs",
+        ),
+    ] = False,
     auth_fallback_file: Annotated[
         str | None,
         typer.Option(
@@ -221,6 +301,8 @@ def recover(
         payloads_file,
         list(scan or []),
         stdin_is_tty=sys.stdin.isatty(),
+        scan_watch=scan_watch,
+        session=session,
     )
 
     # Expand shard_dir to individual files and combine with explicit files
@@ -242,11 +324,28 @@ def recover(
         output=output_value,
         allow_unsigned=allow_unsigned,
         assume_yes=assume_yes,
+        scan_jobs=scan_jobs,
+        scan_cache=not no_scan_cache,
+        scan_watch=scan_watch,
+        scan_watch_idle=scan_watch_idle,
+        batch=batch,
+        passphrase_file=passphrase_file,
+        passphrase_env=passphrase_env,
+        session=session,
         debug_max_bytes=debug_max_value,
         debug_reveal_secrets=debug_reveal_value,
         quiet=quiet_value,
     )
-    if _should_use_wizard_for_recover(args):
-        _run_cli(functools.partial(run_recover_wizard, args, debug=debug_value), debug=debug_value)
-        return
-    _run_cli(functools.partial(run_recover_command, args, debug=debug_value), debug=debug_value)
+    with scan_session(jobs=scan_jobs, cache=not no_scan_cache):
+        if batch:
+            _run_cli(functools.partial(run_recover_batch_command, args), debug=debug_value)
+            return
+        if _should_use_wizard_for_recover(args):
+            _run_cli(
+                functools.partial(run_recover_wizard, args, debug=debug_value), debug=debug_value
+            )
+            return
+        with printed_progress(phase="scan", quiet=quiet_value or not scan_watch):
+            _run_cli(
+                functools.partial(run_recover_command, args, debug=debug_value), debug=debug_value
+            )
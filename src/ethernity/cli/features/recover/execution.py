@@ -23,11 +23,13 @@ from collections.abc import Callable
 from ethernity.cli.features.recover.planning import RecoveryPlan
 from ethernity.cli.shared.io.outputs import (
     _single_entry_uses_directory_output,
+    _stream_recovered_directory_outputs,
     _write_recovered_outputs,
 )
 from ethernity.cli.shared.ui.debug import print_recover_debug
 from ethernity.cli.shared.ui.summary import format_auth_status, print_recover_summary
 from ethernity.cli.shared.ui_api import print_completion_panel, status
+from ethernity.core.timing import span
 from ethernity.crypto import decrypt_bytes
 from ethernity.formats.envelope_codec import decode_envelope, extract_payloads
 from ethernity.formats.envelope_types import EnvelopeManifest, ManifestFile
@@ -41,10 +43,42 @@ def decrypt_manifest_and_extract(
 ) -> tuple[EnvelopeManifest, list[tuple[ManifestFile, bytes]]]:
     """Decrypt a recovery plan ciphertext and extract manifest payload entries."""
 
-    with status("Decrypting and unpacking payload...", quiet=quiet):
+    with (
+        status("Decrypting and unpacking payload...", quiet=quiet),
+        span("recover.decrypt", ciphertext_bytes=len(plan.ciphertext)) as decrypt_span,
+    ):
         plaintext = decrypt_bytes(plan.ciphertext, passphrase=plan.passphrase, debug=debug)
         manifest, payload = decode_envelope(plaintext)
         extracted = extract_payloads(manifest, payload)
+        decrypt_span.count("files", len(extracted))
+    return manifest, extracted
+
+
+def decrypt_manifest_and_stream(
+    plan: RecoveryPlan,
+    *,
+    quiet: bool,
+) -> tuple[EnvelopeManifest, list[tuple[ManifestFile, bytes]] | None]:
+    """Decrypt a recovery plan and stream directory outputs straight to disk.
+
+    When the recovered entries go into a directory, they are written while the payload is
+    decompressed and `(manifest, None)` is returned. Otherwise the entries are extracted in
+    memory and returned as by `decrypt_manifest_and_extract`.
+    """
+
+    with (
+        status("Decrypting and unpacking payload...", quiet=quiet),
+        span("recover.decrypt", ciphertext_bytes=len(plan.ciphertext)) as decrypt_span,
+    ):
+        plaintext = decrypt_bytes(plan.ciphertext, passphrase=plan.passphrase)
+        manifest, payload = decode_envelope(plaintext)
+        del plaintext
+        if plan.output_path is not None and _uses_directory_output(plan, manifest):
+            written_paths = _stream_recovered_directory_outputs(plan.output_path, manifest, payload)
+            decrypt_span.count("files", len(written_paths))
+            return manifest, None
+        extracted = extract_payloads(manifest, payload)
+        decrypt_span.count("files", len(extracted))
     return manifest, extracted
 
 
@@ -78,6 +112,28 @@ def write_recovered_outputs(
         single_entry_output_is_directory=single_entry_output_is_directory,
         on_entry_written=on_file_written,
     )
+    print_recovered_outputs_summary(
+        extracted,
+        output_path=output_path,
+        auth_status=auth_status,
+        allow_unsigned=allow_unsigned,
+        quiet=quiet,
+        single_entry_output_is_directory=single_entry_output_is_directory,
+    )
+    return written_paths
+
+
+def print_recovered_outputs_summary(
+    extracted: list[tuple[ManifestFile, bytes]],
+    *,
+    output_path: str | None,
+    auth_status: str,
+    allow_unsigned: bool,
+    quiet: bool,
+    single_entry_output_is_directory: bool = False,
+) -> None:
+    """Print the post-recovery summary and completion panel."""
+
     auth_label = format_auth_status(auth_status, allow_unsigned=allow_unsigned)
     print_recover_summary(
         extracted,
@@ -94,7 +150,6 @@ def write_recovered_outputs(
         else:
             actions.append("Save stdout output if you need to keep the recovered data.")
         print_completion_panel("Recovery complete", actions, quiet=quiet, use_err=True)
-    return written_paths
 
 
 def run_recover_plan(
@@ -106,8 +161,8 @@ def run_recover_plan(
     debug_reveal_secrets: bool = False,
 ) -> int:
     """Execute a prepared recovery plan end to end."""
-    manifest, extracted = decrypt_manifest_and_extract(plan, quiet=quiet, debug=debug)
     if debug:
+        manifest, extracted = decrypt_manifest_and_extract(plan, quiet=quiet, debug=debug)
         print_recover_debug(
             manifest=manifest,
             extracted=extracted,
@@ -119,21 +174,39 @@ def run_recover_plan(
             debug_max_bytes=debug_max_bytes,
             reveal_secrets=debug_reveal_secrets,
         )
-    single_entry_output_is_directory = (
-        plan.output_path is not None
-        and len(extracted) == 1
-        and manifest.input_origin in {"directory", "mixed"}
-    )
-    single_entry_output_is_directory = _single_entry_uses_directory_output(
-        plan.output_path,
-        single_entry_output_is_directory=single_entry_output_is_directory,
-    )
+    else:
+        manifest, streamed = decrypt_manifest_and_stream(plan, quiet=quiet)
+        if streamed is None:
+            print_recovered_outputs_summary(
+                [(entry, b"") for entry in manifest.files],
+                output_path=plan.output_path,
+                auth_status=plan.auth_status,
+                allow_unsigned=plan.allow_unsigned,
+                quiet=quiet,
+                single_entry_output_is_directory=True,
+            )
+            return 0
+        extracted = streamed
     write_recovered_outputs(
         extracted,
         output_path=plan.output_path,
         auth_status=plan.auth_status,
         allow_unsigned=plan.allow_unsigned,
         quiet=quiet,
-        single_entry_output_is_directory=single_entry_output_is_directory,
+        single_entry_output_is_directory=_uses_directory_output(plan, manifest),
     )
     return 0
+
+
+def _uses_directory_output(plan: RecoveryPlan, manifest: EnvelopeManifest) -> bool:
+    if plan.output_path is not None and len(manifest.files) > 1:
+        return True
+    single_entry_output_is_directory = (
+        plan.output_path is not None
+        and len(manifest.files) == 1
+        and manifest.input_origin in {"directory", "mixed"}
+    )
+    return _single_entry_uses_directory_output(
+        plan.output_path,
+        single_entry_output_is_directory=single_entry_output_is_directory,
+    )
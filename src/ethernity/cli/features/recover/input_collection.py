@@ -18,6 +18,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 
 from ethernity.cli.shared.io.fallback_parser import format_fallback_error
@@ -26,13 +27,15 @@ from ethernity.cli.shared.io.frames import (
     _frame_from_payload_text,
     _frames_from_fallback_lines,
     _frames_from_payload_lines,
-    _read_text_lines,
+    _iter_text_lines,
+    _peek_recovery_input_mode,
     _recovery_frames_from_scan,
     format_recovery_input_error,
 )
 from ethernity.cli.shared.ui_api import (
     console,
     console_err,
+    live_progress,
     prompt_choice,
     prompt_multiline,
     prompt_path_with_picker,
@@ -75,7 +78,7 @@ def prompt_recovery_input_interactive(
                     )
                 else:
                     with status("Reading recovery input...", quiet=quiet):
-                        lines = _read_text_lines(path)
+                        lines = _iter_text_lines(path)
                         frames, input_label = parse_recovery_lines(
                             lines,
                             allow_unsigned=allow_unsigned,
@@ -91,7 +94,11 @@ def prompt_recovery_input_interactive(
                 )
                 input_label = "Scan"
                 input_detail = path
-                with status("Scanning QR images...", quiet=quiet):
+                message = "Scanning QR images..."
+                with (
+                    status(message, quiet=quiet) as live,
+                    live_progress(live, message, phase="scan"),
+                ):
                     frames = _recovery_frames_from_scan([path], quiet=quiet)
             return frames, input_label, input_detail
         except (OSError, ValueError) as exc:
@@ -100,7 +107,7 @@ def prompt_recovery_input_interactive(
 
 
 def parse_recovery_lines(
-    lines: list[str],
+    lines: Iterable[str],
     *,
     allow_unsigned: bool,
     quiet: bool,
@@ -109,7 +116,7 @@ def parse_recovery_lines(
     """Parse pasted/file recovery lines as fallback text or QR payload lines."""
 
     try:
-        mode = _detect_recovery_input_mode(lines)
+        mode, lines = _peek_recovery_input_mode(lines)
     except ValueError as exc:
         raise ValueError(f"unable to parse recovery text from {source}: {exc}") from exc
 
@@ -125,11 +132,13 @@ def parse_recovery_lines(
             raise ValueError(f"invalid recovery text in {source}: {message}") from exc
         return frames, "Recovery text"
 
+    # The mode comes from the first line only, so a later line in another format
+    # surfaces here as a payload that does not decode.
     try:
         frames = _frames_from_payload_lines(lines, label="QR payloads", source=source)
         return frames, "QR payloads"
     except ValueError as exc:
-        raise ValueError(f"invalid QR payloads in {source}: {exc}") from exc
+        raise ValueError(f"unable to parse recovery text from {source}: {exc}") from exc
 
 
 def prompt_text_or_payloads_stdin(
@@ -240,6 +249,7 @@ class _PayloadCollectionState:
     frames: list[Frame] = field(default_factory=list)
     seen: dict[tuple[int, int, bytes], Frame] = field(default_factory=dict)
     main_indices: set[int] = field(default_factory=set)
+    parity_indices: set[int] = field(default_factory=set)
     main_total: int | None = None
     auth_present: bool = False
     expected_doc_id: bytes | None = None
@@ -249,7 +259,7 @@ class _PayloadCollectionState:
 
         if self.main_total is None:
             return "QR payload"
-        remaining_main = max(self.main_total - len(self.main_indices), 0)
+        remaining_main = self._remaining_main()
         remaining_auth = 0 if self.allow_unsigned or self.auth_present else 1
         remaining_total = remaining_main + remaining_auth
         if remaining_main == 0 and remaining_auth == 1:
@@ -259,9 +269,9 @@ class _PayloadCollectionState:
     def ingest(self, frame: Frame) -> bool:
         """Validate and store a QR frame, returning whether collection is complete."""
 
-        if frame.frame_type not in (FrameType.MAIN_DOCUMENT, FrameType.AUTH):
+        if frame.frame_type not in (FrameType.MAIN_DOCUMENT, FrameType.PARITY, FrameType.AUTH):
             console_err.print(
-                "[error]Only MAIN or AUTH QR payloads are accepted here. "
+                "[error]Only MAIN, PARITY, or AUTH QR payloads are accepted here. "
                 "Paste a MAIN/AUTH payload for this document.[/error]"
             )
             return False
@@ -301,6 +311,8 @@ class _PayloadCollectionState:
         self.frames.append(frame)
         if frame.frame_type == FrameType.MAIN_DOCUMENT:
             self.main_indices.add(frame.index)
+        elif frame.frame_type == FrameType.PARITY:
+            self.parity_indices.add(frame.index)
         else:
             self.auth_present = True
 
@@ -312,7 +324,7 @@ class _PayloadCollectionState:
         if self.main_total is None:
             return False
 
-        remaining_main = max(self.main_total - len(self.main_indices), 0)
+        remaining_main = self._remaining_main()
         remaining_auth = 0 if self.allow_unsigned or self.auth_present else 1
         if remaining_main == 0 and remaining_auth == 0:
             if not self.quiet:
@@ -320,6 +332,13 @@ class _PayloadCollectionState:
             return True
         return False
 
+    def _remaining_main(self) -> int:
+        """Return MAIN payloads still needed; each PARITY payload can stand in for one."""
+
+        if self.main_total is None:
+            return 0
+        return max(self.main_total - len(self.main_indices) - len(self.parity_indices), 0)
+
 
 def collect_payload_frames(
     *,
@@ -18,7 +18,9 @@ from __future__ import annotations
 
 import sys
 
+from ethernity.cli.features.recover.batch import run_batch_recovery
 from ethernity.cli.features.recover.execution import run_recover_plan
+from ethernity.cli.features.recover.planning import validate_recover_args
 from ethernity.cli.features.recover.service import prepare_recover_plan
 from ethernity.cli.features.recover.wizard import run_recover_wizard as _run_recover_wizard
 from ethernity.cli.shared.log import _warn
@@ -42,12 +44,19 @@ def run_recover_command(args: RecoverArgs, *, debug: bool = False) -> int:
     )
 
 
+def run_recover_batch_command(args: RecoverArgs) -> int:
+    validate_recover_args(args)
+    if args.allow_unsigned:
+        _warn("Authentication check skipped - ensure you trust the source", quiet=args.quiet)
+    return run_batch_recovery(args)
+
+
 def run_recover_wizard(args: RecoverArgs, *, debug: bool = False) -> int:
     return _run_recover_wizard(args, debug=debug)
 
 
 def _should_use_wizard_for_recover(args: RecoverArgs) -> bool:
-    if args.fallback_file or args.payloads_file or args.scan:
+    if args.fallback_file or args.payloads_file or args.scan or args.scan_watch or args.session:
         return False
     if args.shard_fallback_file or args.shard_payloads_file or args.shard_scan:
         return False
@@ -18,6 +18,7 @@
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, replace
 from typing import Any, Literal
 
@@ -28,10 +29,12 @@ from ethernity.cli.features.recover.key_recovery import (
     _resolve_recovery_keys,
     _validated_shard_payloads_from_frames,
 )
+from ethernity.cli.features.recover.session import frames_with_session
 from ethernity.cli.shared import api_codes
 from ethernity.cli.shared.crypto import _doc_id_and_hash_from_ciphertext
 from ethernity.cli.shared.io.fallback_parser import format_fallback_error
 from ethernity.cli.shared.io.frames import (
+    SCAN_WATCH_IDLE_SECONDS,
     _auth_frames_from_fallback,
     _auth_frames_from_payloads,
     _dedupe_auth_frames,
@@ -40,6 +43,7 @@ from ethernity.cli.shared.io.frames import (
     _frames_from_fallback,
     _frames_from_payloads,
     _recovery_frames_from_scan,
+    _recovery_frames_from_watch,
     _shard_frames_from_scan,
     _split_main_and_auth_frames,
     format_recovery_input_error,
@@ -132,6 +136,25 @@ def validate_recover_args(args: RecoverArgs) -> None:
         raise ValueError("use either --scan or --fallback-file/--payloads-file, not both")
     if args.auth_fallback_file and args.auth_payloads_file:
         raise ValueError("use either --auth-fallback-file or --auth-payloads-file, not both")
+    if args.scan_watch and (args.scan or args.fallback_file or args.payloads_file):
+        raise ValueError(
+            "use either --scan-watch or --scan/--fallback-file/--payloads-file, not both"
+        )
+    if args.scan_watch_idle is not None and not args.scan_watch:
+        raise ValueError("--scan-watch-idle requires --scan-watch")
+    if args.batch:
+        if not args.scan:
+            raise ValueError("--batch requires --scan inputs")
+        if not args.output:
+            raise ValueError("--batch requires --output DIR")
+        if args.fallback_file or args.payloads_file or args.scan_watch:
+            raise ValueError("--batch only reads --scan inputs")
+        if args.auth_fallback_file or args.auth_payloads_file:
+            raise ValueError("--batch reads AUTH frames from the scan; drop --auth-* inputs")
+    elif args.passphrase_file or args.passphrase_env:
+        raise ValueError("--passphrase-file and --passphrase-env require --batch")
+    if args.session and (args.batch or args.scan_watch):
+        raise ValueError("--session cannot be combined with --batch or --scan-watch")
 
 
 def inspect_from_args(args: RecoverArgs) -> RecoveryInspection:
@@ -142,10 +165,11 @@ def inspect_from_args(args: RecoverArgs) -> RecoveryInspection:
     allow_unsigned = args.allow_unsigned
     quiet = args.quiet
 
-    frames, input_label, input_detail = _frames_from_args(
+    frames, input_label, input_detail = _recovery_frames_from_args(
         args,
         allow_unsigned=allow_unsigned,
         quiet=quiet,
+        persist_session=False,
     )
     extra_auth_frames = _extra_auth_frames_from_args(
         args,
@@ -179,10 +203,11 @@ def plan_from_args(args: RecoverArgs) -> RecoveryPlan:
     allow_unsigned = args.allow_unsigned
     quiet = args.quiet
 
-    frames, input_label, input_detail = _frames_from_args(
+    frames, input_label, input_detail = _recovery_frames_from_args(
         args,
         allow_unsigned=allow_unsigned,
         quiet=quiet,
+        persist_session=True,
     )
     extra_auth_frames = _extra_auth_frames_from_args(
         args,
@@ -655,6 +680,23 @@ def _resolve_passphrase(
     raise ValueError("passphrase is required for recovery")
 
 
+def _recovery_frames_from_args(
+    args: RecoverArgs,
+    *,
+    allow_unsigned: bool,
+    quiet: bool,
+    persist_session: bool,
+) -> tuple[list[Frame], str | None, str | None]:
+    """Load primary recovery frames, merged with the `--session` checkpoint when given."""
+
+    load_frames = functools.partial(
+        _frames_from_args, args, allow_unsigned=allow_unsigned, quiet=quiet
+    )
+    if args.session:
+        return frames_with_session(args.session, args, load_frames, persist=persist_session)
+    return load_frames()
+
+
 def _frames_from_args(
     args: RecoverArgs,
     *,
@@ -698,6 +740,15 @@ def _frames_from_args(
             frames = _recovery_frames_from_scan(scan, quiet=quiet)
         except ValueError as exc:
             raise ValueError(format_recovery_input_error(exc)) from exc
+    elif args.scan_watch:
+        input_label = "Scan"
+        input_detail = expanduser_cli_path(args.scan_watch) or args.scan_watch
+        idle_timeout = args.scan_watch_idle
+        frames = _recovery_frames_from_watch(
+            input_detail,
+            allow_unsigned=allow_unsigned,
+            idle_timeout=SCAN_WATCH_IDLE_SECONDS if idle_timeout is None else idle_timeout,
+        )
     else:
         raise ValueError("either --fallback-file, --payloads-file, or --scan is required")
     return frames, input_label, input_detail
@@ -99,8 +99,10 @@ def apply_recover_stdin_default(
     scan: list[str] | None,
     *,
     stdin_is_tty: bool,
+    scan_watch: str | None = None,
+    session: str | None = None,
 ) -> str | None:
-    if fallback_file or payloads_file or (scan or []) or stdin_is_tty:
+    if fallback_file or payloads_file or (scan or []) or scan_watch or session or stdin_is_tty:
         return fallback_file
     return "-"
 
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+"""Resume recoveries from a `--session` checkpoint of previously collected frames."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+
+from ethernity.cli.shared.events import emit_progress
+from ethernity.cli.shared.io.frames import RECOVERY_FRAME_TYPES, _format_index_ranges
+from ethernity.cli.shared.io.outputs import _write_output
+from ethernity.cli.shared.paths import expanduser_cli_path
+from ethernity.cli.shared.types import RecoverArgs
+from ethernity.encoding.framing import Frame
+from ethernity.formats.recovery_session import (
+    RecoverySession,
+    SessionDocument,
+    decode_recovery_session,
+    encode_recovery_session,
+)
+
+FramesLoader = Callable[[], tuple[list[Frame], str | None, str | None]]
+
+
+def load_recovery_session(path: str) -> RecoverySession:
+    """Read a session checkpoint; a missing file is an empty session."""
+
+    try:
+        data = Path(path).read_bytes()
+    except FileNotFoundError:
+        return RecoverySession()
+    try:
+        return decode_recovery_session(data)
+    except ValueError as exc:
+        raise ValueError(f"invalid recovery session file {path}: {exc}") from exc
+
+
+def save_recovery_session(path: str, session: RecoverySession) -> None:
+    """Atomically replace the session checkpoint (owner-only permissions on POSIX)."""
+
+    _write_output(path, encode_recovery_session(session))
+
+
+def has_recovery_inputs(args: RecoverArgs) -> bool:
+    return bool(args.fallback_file or args.payloads_file or args.scan)
+
+
+def frames_with_session(
+    session_path: str,
+    args: RecoverArgs,
+    load_frames: FramesLoader,
+    *,
+    persist: bool,
+) -> tuple[list[Frame], str | None, str | None]:
+    """Merge newly read frames into the session checkpoint and return the full set.
+
+    The checkpoint is saved (when `persist` is set) before completeness is checked, so an
+    incomplete run still keeps what it read. A `progress` event with phase `plan` reports
+    the document's coverage. A MAIN set counts as complete when the stored PARITY frames
+    cover every missing index (the same rule as live scanning); otherwise, or when AUTH is
+    missing without `allow_unsigned`, `ValueError` names the missing frame indices.
+    """
+
+    path = expanduser_cli_path(session_path) or session_path
+    session = load_recovery_session(path)
+    if has_recovery_inputs(args):
+        frames, input_label, input_detail = load_frames()
+    else:
+        frames, input_label, input_detail = [], "Recovery session", path
+    added = session.add_frames(frames)
+    if persist and (added or not Path(path).exists()):
+        save_recovery_session(path, session)
+
+    document = _session_document(session, frames, path=path)
+    missing = document.missing_indices
+    found = len(document.chunks)
+    emit_progress(
+        phase="plan",
+        current=found,
+        total=document.total,
+        unit="frames",
+        label=f"Recovery session: {found}/{document.total or '?'} frames",
+        details={
+            "session": path,
+            "doc_id": document.doc_id.hex(),
+            "added_frames": added,
+            "missing_indices": missing,
+            "parity_frames": len(document.parity),
+            "auth_found": document.auth is not None,
+        },
+    )
+    gaps: list[str] = []
+    if document.total is None:
+        gaps.append("no MAIN frames yet")
+    elif not document.main_recoverable:
+        parity_note = f" and {len(document.parity)} PARITY frame(s)" if document.parity else ""
+        gaps.append(
+            f"{found}/{document.total} MAIN frames{parity_note}, "
+            f"missing {_format_index_ranges(missing)}"
+        )
+    if document.auth is None and not args.allow_unsigned:
+        gaps.append("AUTH frame missing")
+    if gaps:
+        raise ValueError(
+            f"recovery session {path} is incomplete for document {document.doc_id.hex()}: "
+            f"{'; '.join(gaps)}. Add the missing pages and run again with --session {path}"
+        )
+
+    others = [frame for frame in frames if frame.frame_type not in RECOVERY_FRAME_TYPES]
+    return [*document.frames(), *others], input_label, input_detail
+
+
+def _session_document(
+    session: RecoverySession,
+    frames: list[Frame],
+    *,
+    path: str,
+) -> SessionDocument:
+    doc_ids = {frame.doc_id for frame in frames if frame.frame_type in RECOVERY_FRAME_TYPES} or set(
+        session.documents
+    )
+    if not doc_ids:
+        raise ValueError(
+            f"recovery session {path} holds no frames yet; "
+            "add --scan, --fallback-file, or --payloads-file inputs"
+        )
+    if len(doc_ids) > 1:
+        listed = ", ".join(sorted(doc_id.hex() for doc_id in doc_ids))
+        raise ValueError(
+            f"recovery session {path} holds frames from {len(doc_ids)} documents ({listed}); "
+            "add inputs from the document to recover"
+        )
+    (doc_id,) = doc_ids
+    return session.documents[doc_id]
@@ -56,6 +56,7 @@ from ethernity.cli.shared.ui.summary import format_auth_status
 from ethernity.cli.shared.ui_api import (
     build_review_table,
     console,
+    live_progress,
     panel,
     prompt_choice,
     prompt_required_secret,
@@ -116,7 +117,8 @@ def _prompt_recovery_input(
     elif args.scan:
         input_label = "Scan"
         input_detail = ", ".join(args.scan)
-        with status("Scanning QR images...", quiet=quiet):
+        message = "Scanning QR images..."
+        with status(message, quiet=quiet) as live, live_progress(live, message, phase="scan"):
             frames = _recovery_frames_from_scan(args.scan, quiet=quiet)
     else:
         frames, input_label, input_detail = prompt_recovery_input_interactive(
@@ -0,0 +1 @@
+"""Render CLI feature."""
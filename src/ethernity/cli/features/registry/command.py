@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import json
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Annotated
+
+import typer
+from rich import box
+from rich.table import Table
+
+from ethernity.cli.shared.common import _ctx_state, _run_cli
+from ethernity.cli.shared.paths import expanduser_cli_path
+from ethernity.cli.shared.ui_api import console
+from ethernity.core.app_paths import backup_registry_path
+from ethernity.core.backup_registry import RegistryEntry, open_backup_registry
+
+_REGISTRY_HELP = (
+    "Look up backups recorded with `ethernity backup --registry`.\n\n"
+    "Filters combine; without filters every recorded backup is listed, newest first.\n\n"
+    "Examples:\n"
+    "  ethernity registry --path notes/keys.txt\n"
+    "  ethernity registry --sha256 9f86d081\n"
+    "  ethernity registry --doc-id 3fa2 --json\n"
+    "  ethernity registry --since 2026-01-01 --until 2026-03-31\n"
+)
+
+
+def register(app: typer.Typer) -> None:
+    app.command(help=_REGISTRY_HELP)(registry)
+
+
+def registry(
+    ctx: typer.Context,
+    path: Annotated[
+        str | None,
+        typer.Option(
+            "--path",
+            help="Manifest path or written document path recorded for the backup.",
+            rich_help_panel="Filters",
+        ),
+    ] = None,
+    sha256: Annotated[
+        str | None,
+        typer.Option(
+            "--sha256",
+            help="SHA-256 (hex, full or prefix) of a backed-up file.",
+            rich_help_panel="Filters",
+        ),
+    ] = None,
+    doc_id: Annotated[
+        str | None,
+        typer.Option(
+            "--doc-id",
+            help="Document ID hex prefix.",
+            rich_help_panel="Filters",
+        ),
+    ] = None,
+    since: Annotated[
+        str | None,
+        typer.Option(
+            "--since",
+            help="Only backups created at or after this ISO date/time (local time).",
+            rich_help_panel="Filters",
+        ),
+    ] = None,
+    until: Annotated[
+        str | None,
+        typer.Option(
+            "--until",
+            help="Only backups created before this ISO date/time (a date includes that day).",
+            rich_help_panel="Filters",
+        ),
+    ] = None,
+    limit: Annotated[
+        int | None,
+        typer.Option(
+            "--limit",
+            min=1,
+            help="Show at most this many backups.",
+            rich_help_panel="Outputs",
+        ),
+    ] = None,
+    json_output: Annotated[
+        bool,
+        typer.Option(
+            "--json",
+            help="Print matches as a JSON array.",
+            rich_help_panel="Outputs",
+        ),
+    ] = False,
+    db: Annotated[
+        Path | None,
+        typer.Option(
+            "--db",
+            help="Registry database (defaults to the app state directory or $ETHERNITY_REGISTRY).",
+            rich_help_panel="Inputs",
+        ),
+    ] = None,
+) -> None:
+    state = _ctx_state(ctx)
+    debug_value = state.debug if state is not None else False
+
+    def _run() -> None:
+        db_path = (
+            backup_registry_path()
+            if db is None
+            else Path(expanduser_cli_path(db, preserve_stdin=False) or "")
+        )
+        with open_backup_registry(db_path, create=False) as backup_registry:
+            entries = backup_registry.find(
+                path=_normalize_lookup_path(path),
+                sha256=sha256,
+                doc_id_prefix=doc_id,
+                since=_parse_time_bound(since, label="--since", end_of_day=False),
+                until=_parse_time_bound(until, label="--until", end_of_day=True),
+                limit=limit,
+            )
+        if json_output:
+            console.print_json(json.dumps([entry.to_dict() for entry in entries]))
+            return
+        if not entries:
+            console.print("No matching backups.")
+            return
+        console.print(_entries_table(entries))
+
+    _run_cli(_run, debug=debug_value)
+
+
+def _normalize_lookup_path(value: str | None) -> str | None:
+    # Written documents are recorded by absolute path; manifest paths are relative and kept
+    # as given. Existing files on disk are looked up by their resolved location.
+    if value is None:
+        return None
+    candidate = Path(value).expanduser()
+    if candidate.is_absolute() or candidate.exists():
+        return str(candidate.resolve())
+    return value
+
+
+def _parse_time_bound(value: str | None, *, label: str, end_of_day: bool) -> float | None:
+    if value is None:
+        return None
+    try:
+        parsed_date = date.fromisoformat(value)
+    except ValueError:
+        parsed_date = None
+    if parsed_date is not None:
+        moment = datetime.combine(parsed_date, datetime.min.time())
+        if end_of_day:
+            moment += timedelta(days=1)
+        return moment.timestamp()
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError as exc:
+        raise ValueError(f"{label} must be an ISO date or date/time: {value!r}") from exc
+
+
+def _format_quorum(threshold: int | None, count: int | None) -> str:
+    if threshold is None or count is None:
+        return "-"
+    return f"{threshold} of {count}"
+
+
+def _entries_table(entries: list[RegistryEntry]) -> Table:
+    table = Table(box=box.SIMPLE, show_header=True, header_style="accent")
+    table.add_column("Doc ID", no_wrap=True)
+    table.add_column("Created", no_wrap=True)
+    table.add_column("Files", justify="right")
+    table.add_column("Bytes", justify="right")
+    table.add_column("Shards", no_wrap=True)
+    table.add_column("Output")
+    for entry in entries:
+        created = datetime.fromtimestamp(entry.created_at).isoformat(timespec="seconds")
+        table.add_row(
+            entry.doc_id,
+            created,
+            str(len(entry.files)),
+            str(sum(item.size for item in entry.files)),
+            _format_quorum(entry.shard_threshold, entry.shard_count),
+            entry.output_dir,
+        )
+    return table
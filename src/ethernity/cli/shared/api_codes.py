@@ -45,6 +45,7 @@ AUTH_SIGNATURE_INVALID = "AUTH_SIGNATURE_INVALID"
 AUTH_FALLBACK_INVALID = "AUTH_FALLBACK_INVALID"
 FALLBACK_SECTION_INVALID = "FALLBACK_SECTION_INVALID"
 RECOVERY_SHARD_PAYLOADS_IGNORED = "RECOVERY_SHARD_PAYLOADS_IGNORED"
+RECOVERY_SCAN_INPUTS_SKIPPED = "RECOVERY_SCAN_INPUTS_SKIPPED"
 BACKUP_SIGNING_KEY_SHARDING_DISABLED = "BACKUP_SIGNING_KEY_SHARDING_DISABLED"
 BACKUP_QR_CHUNK_SIZE_REDUCED = "BACKUP_QR_CHUNK_SIZE_REDUCED"
 
@@ -81,6 +82,7 @@ STABLE_WARNING_CODES = (
     AUTH_FALLBACK_INVALID,
     FALLBACK_SECTION_INVALID,
     RECOVERY_SHARD_PAYLOADS_IGNORED,
+    RECOVERY_SCAN_INPUTS_SKIPPED,
     BACKUP_SIGNING_KEY_SHARDING_DISABLED,
     BACKUP_QR_CHUNK_SIZE_REDUCED,
 )
@@ -127,6 +129,7 @@ __all__ = [
     "NOT_FOUND",
     "OUTPUT_REQUIRED",
     "PERMISSION_DENIED",
+    "RECOVERY_SCAN_INPUTS_SKIPPED",
     "RECOVERY_SHARD_PAYLOADS_IGNORED",
     "RUNTIME_ERROR",
     "SIGNING_KEY_SHARD_DIR_EMPTY",
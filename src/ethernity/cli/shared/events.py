@@ -23,6 +23,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Protocol
 
+from ethernity.core.timing import SpanRecord, timing_listener
+
 
 @dataclass(frozen=True)
 class CommandError(ValueError):
@@ -116,6 +118,27 @@ def emit_artifact(*, kind: str, path: str, details: dict[str, Any] | None = None
     emit_event("artifact", kind=kind, path=path, details=details or {})
 
 
+def emit_timing(record: SpanRecord) -> None:
+    emit_event(
+        "timing",
+        span=record.name,
+        parent=record.parent,
+        ok=record.ok,
+        wall_s=round(record.wall_seconds, 6),
+        cpu_s=round(record.cpu_seconds, 6),
+        peak_rss_bytes=record.peak_rss_bytes,
+        counts=record.counts,
+    )
+
+
+@contextmanager
+def timing_events(enabled: bool) -> Generator[None, None, None]:
+    """Emit a `timing` event for every span finished while `enabled` is true."""
+
+    with timing_listener(emit_timing if enabled else None):
+        yield
+
+
 def emit_result(**payload: Any) -> None:
     emit_event("result", ok=True, **payload)
 
@@ -135,6 +158,8 @@ __all__ = [
     "emit_progress",
     "emit_result",
     "emit_started",
+    "emit_timing",
     "emit_warning",
     "event_session",
+    "timing_events",
 ]
@@ -17,75 +17,144 @@
 from __future__ import annotations
 
 import re
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
 
 from ethernity.core.bounds import MAX_FALLBACK_LINES, MAX_FALLBACK_NORMALIZED_CHARS
-from ethernity.encoding.chunking import fallback_lines_to_frame
-from ethernity.encoding.framing import Frame
-from ethernity.encoding.zbase32 import ZBASE32_ALPHABET
+from ethernity.encoding.framing import Frame, decode_frame
+from ethernity.encoding.zbase32 import ZBase32Decoder, count_zbase32_symbols
 
 _FALLBACK_SECTION_PATTERNS = {
     "auth": re.compile(r"^[=\-:\s]*auth frame[=\-:\s]*$", re.IGNORECASE),
     "key": re.compile(r"^[=\-:\s]*(?:key|shard) frame[=\-:\s]*$", re.IGNORECASE),
     "main": re.compile(r"^[=\-:\s]*main frame[=\-:\s]*$", re.IGNORECASE),
 }
+_FALLBACK_SECTION_NAMES = ("auth", "key", "main")
+_INVALID_LINE_MESSAGE = (
+    "fallback text contains non-empty lines with characters outside the z-base-32 alphabet"
+)
 
 
 def _is_valid_zbase32_line(line: str) -> bool:
     """Check if line contains only allowed z-base-32 characters."""
-    stripped = line.strip()
-    if not stripped:
-        return False
-    has_payload_char = False
-    for ch in stripped:
-        if ch.isspace() or ch == "-":
-            continue
-        if ch.lower() not in ZBASE32_ALPHABET:
-            return False
-        has_payload_char = True
-    return has_payload_char
+    return bool(count_zbase32_symbols(line))
 
 
 def filter_fallback_lines(lines: Sequence[str]) -> list[str]:
     """Filter lines to valid z-base-32 fallback content."""
     filtered: list[str] = []
 
-    for line in lines:
+    for line_number, line in enumerate(lines, start=1):
         stripped = line.strip()
         if not stripped:
             continue
 
         if not _is_valid_zbase32_line(stripped):
-            raise ValueError(
-                "fallback text contains non-empty lines with characters "
-                "outside the z-base-32 alphabet"
-            )
+            raise ValueError(f"{_INVALID_LINE_MESSAGE} (first at line {line_number})")
 
         filtered.append(stripped)
 
     return filtered
 
 
-def _normalized_zbase_chars(lines: Sequence[str]) -> int:
-    return sum(1 for line in lines for ch in line if not ch.isspace() and ch != "-")
+class FallbackSection:
+    """Validate, bound and decode one fallback section as its lines arrive.
 
+    Each line is checked, counted against `MAX_FALLBACK_LINES` and
+    `MAX_FALLBACK_NORMALIZED_CHARS`, and fed to an incremental z-base-32 decoder, so the
+    section is never joined into one string. The first problem is kept and raised by
+    `frame()`, which lets callers tolerate a bad section while still using the others.
+    """
 
-def parse_fallback_frame(lines: Sequence[str], *, label: str) -> Frame:
-    filtered = filter_fallback_lines(lines)
-    if not filtered:
-        raise ValueError(f"no recovery lines found ({label}); check the z-base-32 recovery text")
-    if len(filtered) > MAX_FALLBACK_LINES:
-        raise ValueError(
-            f"{label} fallback exceeds MAX_FALLBACK_LINES ({MAX_FALLBACK_LINES}): "
-            f"{len(filtered)} lines"
-        )
-    normalized_chars = _normalized_zbase_chars(filtered)
-    if normalized_chars > MAX_FALLBACK_NORMALIZED_CHARS:
-        raise ValueError(
-            f"{label} fallback exceeds MAX_FALLBACK_NORMALIZED_CHARS "
-            f"({MAX_FALLBACK_NORMALIZED_CHARS}): {normalized_chars} chars"
-        )
-    return fallback_lines_to_frame(filtered)
+    def __init__(self, label: str) -> None:
+        self.label = label
+        self.populated = False
+        self.has_content = False
+        self._decoder = ZBase32Decoder()
+        self._line_count = 0
+        self._error: ValueError | None = None
+
+    def add_line(self, line: str, *, line_number: int) -> None:
+        self.populated = True
+        stripped = line.strip()
+        if not stripped:
+            return
+        self.has_content = True
+        if self._error is not None:
+            return
+        try:
+            symbols = self._decoder.feed(stripped)
+        except ValueError:
+            symbols = 0
+        if not symbols:
+            self._error = ValueError(f"{_INVALID_LINE_MESSAGE} (first at line {line_number})")
+            return
+        self._line_count += 1
+        if self._line_count > MAX_FALLBACK_LINES:
+            self._error = ValueError(
+                f"{self.label} fallback exceeds MAX_FALLBACK_LINES ({MAX_FALLBACK_LINES}) "
+                f"at line {line_number}"
+            )
+        elif self._decoder.symbol_count > MAX_FALLBACK_NORMALIZED_CHARS:
+            self._error = ValueError(
+                f"{self.label} fallback exceeds MAX_FALLBACK_NORMALIZED_CHARS "
+                f"({MAX_FALLBACK_NORMALIZED_CHARS}) at line {line_number}: "
+                f"{self._decoder.symbol_count} chars"
+            )
+
+    def frame(self) -> Frame:
+        if self._error is not None:
+            raise self._error
+        if not self._line_count:
+            raise ValueError(
+                f"no recovery lines found ({self.label}); check the z-base-32 recovery text"
+            )
+        return decode_frame(self._decoder.finish())
+
+
+@dataclass(frozen=True)
+class FallbackText:
+    """Fallback text split into sections in one pass.
+
+    Marked text has `auth`, `key` and `main` sections; unmarked text has one section named
+    after the caller's label.
+    """
+
+    marked: bool
+    sections: dict[str, FallbackSection]
+
+
+def parse_fallback_text(lines: Iterable[str], *, label: str) -> FallbackText:
+    """Split, validate and decode fallback text in a single pass over `lines`.
+
+    Section markers switch the target section; text without markers forms one section.
+    """
+
+    unmarked = FallbackSection(label)
+    sections: dict[str, FallbackSection] | None = None
+    current = unmarked
+    for line_number, line in enumerate(lines, start=1):
+        marker = detect_fallback_section(line) if "frame" in line.lower() else None
+        if marker is not None:
+            if sections is None:
+                if unmarked.has_content:
+                    raise ValueError("unexpected content before the first marked fallback section")
+                sections = {name: FallbackSection(name) for name in _FALLBACK_SECTION_NAMES}
+            current = sections[marker]
+            continue
+        current.add_line(line, line_number=line_number)
+    if sections is None:
+        return FallbackText(marked=False, sections={label: unmarked})
+    return FallbackText(marked=True, sections=sections)
+
+
+def parse_fallback_frame(lines: Iterable[str], *, label: str) -> Frame:
+    """Decode all `lines` as one fallback frame; section markers are not interpreted."""
+
+    section = FallbackSection(label)
+    for line_number, line in enumerate(lines, start=1):
+        section.add_line(line, line_number=line_number)
+    return section.frame()
 
 
 def format_fallback_error(exc: Exception, *, context: str) -> str:
@@ -106,10 +175,6 @@ def detect_fallback_section(line: str) -> str | None:
     return None
 
 
-def contains_fallback_markers(lines: Sequence[str]) -> bool:
-    return any(detect_fallback_section(line) for line in lines)
-
-
 def split_fallback_sections(lines: Sequence[str]) -> dict[str, list[str]]:
     sections: dict[str, list[str]] = {"auth": [], "key": [], "main": []}
     current: str | None = None
@@ -18,24 +18,47 @@
 
 from __future__ import annotations
 
+import codecs
 import errno
+import itertools
 import sys
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from pathlib import Path
 
 from ethernity.cli.shared import api_codes
+from ethernity.cli.shared.events import emit_progress
 from ethernity.cli.shared.io.fallback_parser import (
-    contains_fallback_markers as _contains_fallback_markers,
-    filter_fallback_lines as _filter_fallback_lines,
+    detect_fallback_section as _detect_fallback_section,
     parse_fallback_frame as _parse_fallback_frame,
-    split_fallback_sections as _split_fallback_sections,
+    parse_fallback_text as _parse_fallback_text,
 )
 from ethernity.cli.shared.log import _warn
 from ethernity.cli.shared.paths import expanduser_cli_path, expanduser_cli_paths
 from ethernity.cli.shared.text import format_qr_input_error
+from ethernity.core.app_paths import scan_cache_dir_path
 from ethernity.core.bounds import MAX_QR_PAYLOAD_CHARS, MAX_RECOVERY_TEXT_BYTES
 from ethernity.encoding.framing import Frame, FrameType, decode_frame
-from ethernity.encoding.qr_payloads import decode_qr_payload
-from ethernity.qr.scan import QrScanError, scan_qr_payloads
+from ethernity.encoding.qr_payloads import QR_PAYLOAD_CODEC_BASE45, decode_qr_payload
+from ethernity.encoding.zbase32 import count_zbase32_symbols
+from ethernity.qr.scan import (
+    QrScanError,
+    ScanProgress,
+    ScanStopPredicate,
+    decoder_fingerprint,
+    expand_scan_paths,
+    iter_qr_payloads,
+    scan_cache_enabled,
+    scan_qr_payloads,
+)
+from ethernity.qr.scan_cache import ScanCache
+from ethernity.qr.scan_watch import ScanWatcher
+
+SCAN_WATCH_POLL_SECONDS = 1.0
+SCAN_WATCH_IDLE_SECONDS = 600.0
+_TEXT_READ_CHUNK_BYTES = 64 * 1024
+# Frame types that belong to a recovery document; PARITY frames stand in for lost MAIN frames.
+RECOVERY_FRAME_TYPES = (FrameType.MAIN_DOCUMENT, FrameType.PARITY, FrameType.AUTH)
 
 
 def format_recovery_input_error(exc: Exception) -> str:
@@ -78,105 +101,112 @@ def format_shard_input_error(exc: Exception) -> str:
 def _read_text_lines(path: str) -> list[str]:
     """Read recovery text input from a file or stdin with size limits."""
 
+    return list(_iter_text_lines(path))
+
+
+def _iter_text_lines(path: str) -> Iterator[str]:
+    """Yield recovery text lines from a file or stdin as they are read.
+
+    The input is decoded in chunks and stops with a ValueError as soon as it passes
+    `MAX_RECOVERY_TEXT_BYTES`, so callers that parse line by line never hold the whole text.
+    """
+
     normalized_path = expanduser_cli_path(path) or path
     if normalized_path == "-":
-        text = _read_stdin_text_with_limit()
-    else:
-        file_path = Path(normalized_path)
+        yield from _iter_limited_lines(
+            _iter_stdin_chunks(),
+            not_utf8="stdin is not UTF-8 text. If this is a PDF or image, "
+            "scan it for QR payloads instead.",
+        )
+        return
+    file_path = Path(normalized_path)
+    try:
+        file_bytes = file_path.stat().st_size
+    except OSError:
+        file_bytes = None
+    if file_bytes is not None and file_bytes > MAX_RECOVERY_TEXT_BYTES:
+        raise ValueError(
+            "recovery input exceeds "
+            f"MAX_RECOVERY_TEXT_BYTES ({MAX_RECOVERY_TEXT_BYTES}): {file_bytes} bytes"
+        )
+    try:
+        handle = file_path.open("rb")
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(errno.ENOENT, "file not found", str(file_path)) from exc
+    except PermissionError as exc:
+        raise PermissionError(f"unable to read file: {file_path}") from exc
+    except OSError as exc:
+        raise OSError(f"unable to read file: {file_path}") from exc
+    with handle:
+        chunks = iter(lambda: handle.read(_TEXT_READ_CHUNK_BYTES), b"")
         try:
-            file_bytes = file_path.stat().st_size
-        except OSError:
-            file_bytes = None
-        if file_bytes is not None and file_bytes > MAX_RECOVERY_TEXT_BYTES:
-            raise ValueError(
-                "recovery input exceeds "
-                f"MAX_RECOVERY_TEXT_BYTES ({MAX_RECOVERY_TEXT_BYTES}): {file_bytes} bytes"
+            yield from _iter_limited_lines(
+                chunks,
+                not_utf8=f"file is not UTF-8 text: {file_path}. "
+                "If this is a PDF or image, scan it for QR payloads instead.",
             )
-        try:
-            with file_path.open("r", encoding="utf-8") as handle:
-                text = handle.read()
-        except UnicodeDecodeError as exc:
-            raise ValueError(
-                f"file is not UTF-8 text: {file_path}. "
-                "If this is a PDF or image, scan it for QR payloads instead."
-            ) from exc
-        except FileNotFoundError as exc:
-            raise FileNotFoundError(errno.ENOENT, "file not found", str(file_path)) from exc
-        except PermissionError as exc:
-            raise PermissionError(f"unable to read file: {file_path}") from exc
         except OSError as exc:
             raise OSError(f"unable to read file: {file_path}") from exc
-        text_bytes = len(text.encode("utf-8"))
-        if text_bytes > MAX_RECOVERY_TEXT_BYTES:
-            raise ValueError(
-                "recovery input exceeds "
-                f"MAX_RECOVERY_TEXT_BYTES ({MAX_RECOVERY_TEXT_BYTES}): {text_bytes} bytes"
-            )
-    return text.splitlines()
 
 
-def _read_stdin_text_with_limit() -> str:
-    """Read UTF-8 stdin incrementally and stop once the recovery size limit is exceeded."""
-
+def _iter_stdin_chunks() -> Iterator[bytes]:
     stream_buffer = getattr(sys.stdin, "buffer", None)
-    if stream_buffer is not None:
-        chunks: list[bytes] = []
-        total_bytes = 0
-        while True:
-            chunk = stream_buffer.read(64 * 1024)
-            if not chunk:
-                break
-            total_bytes += len(chunk)
-            if total_bytes > MAX_RECOVERY_TEXT_BYTES:
-                raise ValueError(
-                    "recovery input exceeds "
-                    f"MAX_RECOVERY_TEXT_BYTES ({MAX_RECOVERY_TEXT_BYTES}): {total_bytes} bytes"
-                )
-            chunks.append(chunk)
-        try:
-            return b"".join(chunks).decode("utf-8")
-        except UnicodeDecodeError as exc:
-            raise ValueError(
-                "stdin is not UTF-8 text. If this is a PDF or image, "
-                "scan it for QR payloads instead."
-            ) from exc
-
-    chunks_text: list[str] = []
-    total_bytes = 0
     while True:
-        chunk = sys.stdin.read(64 * 1024)
+        if stream_buffer is not None:
+            chunk = stream_buffer.read(_TEXT_READ_CHUNK_BYTES)
+        else:
+            chunk = sys.stdin.read(_TEXT_READ_CHUNK_BYTES).encode("utf-8")
         if not chunk:
-            break
-        total_bytes += len(chunk.encode("utf-8"))
+            return
+        yield chunk
+
+
+def _iter_limited_lines(chunks: Iterable[bytes], *, not_utf8: str) -> Iterator[str]:
+    """Decode UTF-8 `chunks` into lines, enforcing `MAX_RECOVERY_TEXT_BYTES` as they arrive."""
+
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    total_bytes = 0
+    pending = ""
+    for chunk in chunks:
+        total_bytes += len(chunk)
         if total_bytes > MAX_RECOVERY_TEXT_BYTES:
             raise ValueError(
                 "recovery input exceeds "
                 f"MAX_RECOVERY_TEXT_BYTES ({MAX_RECOVERY_TEXT_BYTES}): {total_bytes} bytes"
             )
-        chunks_text.append(chunk)
-    return "".join(chunks_text)
+        try:
+            pending += decoder.decode(chunk)
+        except UnicodeDecodeError as exc:
+            raise ValueError(not_utf8) from exc
+        lines = pending.splitlines(keepends=True)
+        # Hold back an unterminated last line, and a trailing "\r" that may start "\r\n".
+        if lines and (lines[-1].endswith("\r") or lines[-1].splitlines() == [lines[-1]]):
+            pending = lines.pop()
+        else:
+            pending = ""
+        for line in lines:
+            yield line.splitlines()[0]
+    try:
+        pending += decoder.decode(b"", final=True)
+    except UnicodeDecodeError as exc:
+        raise ValueError(not_utf8) from exc
+    yield from pending.splitlines()
 
 
 def _frame_from_fallback(path: str, *, quiet: bool = False) -> Frame:
     """Decode a single fallback file into one frame."""
 
-    lines = _read_text_lines(path)
-    if _contains_fallback_markers(lines):
-        sections = _split_fallback_sections(lines)
-        populated_sections = [
-            (section_name, section_lines)
-            for section_name, section_lines in sections.items()
-            if section_lines
-        ]
-        if len(populated_sections) != 1:
-            raise ValueError("expected exactly one marked fallback section in shard recovery text")
-        section_name, section_lines = populated_sections[0]
-        return _frame_from_fallback_lines(section_lines, label=section_name, quiet=quiet)
-    return _frame_from_fallback_lines(lines, label="fallback", quiet=quiet)
+    parsed = _parse_fallback_text(_iter_text_lines(path), label="fallback")
+    populated_sections = [section for section in parsed.sections.values() if section.populated]
+    if parsed.marked and len(populated_sections) != 1:
+        raise ValueError("expected exactly one marked fallback section in shard recovery text")
+    if not parsed.marked:
+        return parsed.sections["fallback"].frame()
+    return populated_sections[0].frame()
 
 
 def _parse_fallback_section(
-    lines: list[str],
+    lines: Iterable[str],
     section_key: str,
     *,
     allow_invalid: bool,
@@ -184,17 +214,16 @@ def _parse_fallback_section(
     missing_error: str,
 ) -> Frame | None:
     """Parse a specific section from fallback lines, returning None if invalid and allowed."""
-    if not _contains_fallback_markers(lines):
-        return _frame_from_fallback_lines(lines, label=section_key, quiet=quiet)
-
-    sections = _split_fallback_sections(lines)
-    section_lines = sections.get(section_key)
+    parsed = _parse_fallback_text(lines, label=section_key)
+    if not parsed.marked:
+        return parsed.sections[section_key].frame()
 
-    if not section_lines:
+    section = parsed.sections.get(section_key)
+    if section is None or not section.populated:
         raise ValueError(missing_error)
 
     try:
-        return _frame_from_fallback_lines(section_lines, label=section_key, quiet=quiet)
+        return section.frame()
     except ValueError as exc:
         if allow_invalid:
             _warn(
@@ -208,24 +237,25 @@ def _parse_fallback_section(
 
 
 def _frames_from_fallback_lines(
-    lines: list[str],
+    lines: Iterable[str],
     *,
     allow_invalid_auth: bool,
     quiet: bool,
 ) -> list[Frame]:
     """Decode fallback lines into MAIN and optional AUTH frames."""
 
-    if not _contains_fallback_markers(lines):
-        return [_frame_from_fallback_lines(lines, label="fallback", quiet=quiet)]
+    parsed = _parse_fallback_text(lines, label="fallback")
+    if not parsed.marked:
+        return [parsed.sections["fallback"].frame()]
 
-    sections = _split_fallback_sections(lines)
-    if not sections["main"]:
+    sections = parsed.sections
+    if not sections["main"].populated:
         raise ValueError("missing MAIN fallback section; include the MAIN section from recovery")
 
-    frames: list[Frame] = [_frame_from_fallback_lines(sections["main"], label="main", quiet=quiet)]
-    if sections["auth"]:
+    frames: list[Frame] = [sections["main"].frame()]
+    if sections["auth"].populated:
         try:
-            frames.append(_frame_from_fallback_lines(sections["auth"], label="auth", quiet=quiet))
+            frames.append(sections["auth"].frame())
         except ValueError as exc:
             if allow_invalid_auth:
                 _warn(
@@ -242,51 +272,50 @@ def _frames_from_fallback_lines(
 def _frames_from_fallback(path: str, *, allow_invalid_auth: bool, quiet: bool) -> list[Frame]:
     """Read fallback text from a path and decode frames."""
 
-    lines = _read_text_lines(path)
+    lines = _iter_text_lines(path)
     return _frames_from_fallback_lines(lines, allow_invalid_auth=allow_invalid_auth, quiet=quiet)
 
 
-def _non_empty_lines(lines: list[str]) -> list[str]:
-    """Return stripped non-empty lines."""
+def _detect_recovery_input_mode(lines: Iterable[str]) -> str:
+    """Classify recovery input lines as payload list or fallback text."""
 
-    return [line.strip() for line in lines if line.strip()]
+    mode, _lines = _peek_recovery_input_mode(lines)
+    return mode
 
 
-def _all_payload_lines_decode(lines: list[str]) -> bool:
-    """Return whether every non-empty line decodes as a QR payload frame."""
+def _peek_recovery_input_mode(lines: Iterable[str]) -> tuple[str, Iterator[str]]:
+    """Classify recovery input by its first non-empty line.
 
-    non_empty = _non_empty_lines(lines)
-    if not non_empty:
-        return False
-    for line in non_empty:
-        try:
-            _frame_from_payload_text(line)
-        except ValueError:
-            return False
-    return True
+    Returns the mode and an iterator over all of `lines`, including the ones read to decide,
+    so the input can be parsed in the same pass. A section marker means marked fallback text;
+    otherwise a line that decodes as a QR payload means a payload list, and a z-base-32 line
+    means unmarked fallback text. Later lines are checked by the parser that reads them.
+    """
 
+    iterator = iter(lines)
+    consumed: list[str] = []
+    for line in iterator:
+        consumed.append(line)
+        stripped = line.strip()
+        if not stripped:
+            continue
+        return _recovery_line_mode(stripped), itertools.chain(consumed, iterator)
+    raise ValueError(
+        "input is neither a valid QR payload list nor valid fallback text; "
+        "provide one format per input"
+    )
 
-def _all_lines_match_fallback_text(lines: list[str]) -> bool:
-    """Return whether all non-empty lines look like fallback text content."""
 
-    non_empty = _non_empty_lines(lines)
-    if not non_empty:
-        return False
+def _recovery_line_mode(line: str) -> str:
+    if _detect_fallback_section(line) is not None:
+        return "fallback_marked"
     try:
-        filtered = _filter_fallback_lines(non_empty)
+        _frame_from_payload_text(line)
     except ValueError:
-        return False
-    return len(filtered) == len(non_empty)
-
-
-def _detect_recovery_input_mode(lines: list[str]) -> str:
-    """Classify recovery input lines as payload list or fallback text."""
-
-    if _contains_fallback_markers(lines):
-        return "fallback_marked"
-    if _all_payload_lines_decode(lines):
+        pass
+    else:
         return "payload"
-    if _all_lines_match_fallback_text(lines):
+    if count_zbase32_symbols(line):
         return "fallback"
     raise ValueError(
         "input is neither a valid QR payload list nor valid fallback text; "
@@ -295,7 +324,7 @@ def _detect_recovery_input_mode(lines: list[str]) -> str:
 
 
 def _auth_frames_from_fallback_lines(
-    lines: list[str],
+    lines: Iterable[str],
     *,
     allow_invalid_auth: bool,
     quiet: bool,
@@ -318,7 +347,7 @@ def _auth_frames_from_fallback_lines(
 def _auth_frames_from_fallback(path: str, *, allow_invalid_auth: bool, quiet: bool) -> list[Frame]:
     """Read and decode AUTH fallback frames from a file."""
 
-    lines = _read_text_lines(path)
+    lines = _iter_text_lines(path)
     return _auth_frames_from_fallback_lines(
         lines,
         allow_invalid_auth=allow_invalid_auth,
@@ -326,14 +355,14 @@ def _auth_frames_from_fallback(path: str, *, allow_invalid_auth: bool, quiet: bo
     )
 
 
-def _frame_from_fallback_lines(lines: list[str], *, label: str, quiet: bool = False) -> Frame:
+def _frame_from_fallback_lines(lines: Iterable[str], *, label: str, quiet: bool = False) -> Frame:
     """Decode one fallback frame from lines."""
 
     return _parse_fallback_frame(lines, label=label)
 
 
 def _frames_from_payload_lines(
-    lines: list[str],
+    lines: Iterable[str],
     *,
     label: str = "QR payloads",
     source: str = "input",
@@ -357,7 +386,7 @@ def _frames_from_payload_lines(
 def _frames_from_payloads(path: str, *, label: str = "QR payloads") -> list[Frame]:
     """Read and decode QR payload lines from a text file."""
 
-    lines = _read_text_lines(path)
+    lines = _iter_text_lines(path)
     return _frames_from_payload_lines(lines, label=label, source=path)
 
 
@@ -387,23 +416,54 @@ def _frames_from_shard_inputs(
     return frames
 
 
-def _frames_from_scan(paths: list[str]) -> list[Frame]:
-    """Scan PDFs/images for QR payloads and decode valid frames."""
+def _frames_from_scan(
+    paths: list[str],
+    *,
+    stop_when: ScanStopPredicate | None = None,
+    cache: ScanCache | None = None,
+) -> list[Frame]:
+    """Scan PDFs/images for QR payloads and decode frames as each page is read.
+
+    Emits `progress` events with phase `scan` after every page and file.
+    """
+
+    frames: list[Frame] = []
+    errors: list[str] = []
+
+    def _report(progress: ScanProgress) -> None:
+        emit_progress(
+            phase="scan",
+            current=progress.files,
+            total=progress.total_files,
+            unit="files",
+            label=(
+                f"{progress.pages} page(s), {len(frames)} QR code(s) from "
+                f"{progress.files}/{progress.total_files} file(s)"
+            ),
+            details={
+                "pages": progress.pages,
+                "payloads": progress.payloads,
+                "decoded": len(frames),
+                "rejected": len(errors),
+            },
+        )
 
+    idx = 0
     try:
-        payloads = scan_qr_payloads(expanduser_cli_paths(paths))
+        for idx, scanned in enumerate(
+            iter_qr_payloads(
+                expanduser_cli_paths(paths), stop_when=stop_when, cache=cache, progress=_report
+            ),
+            start=1,
+        ):
+            try:
+                frames.append(_frame_from_scanned_payload(scanned.payload))
+            except ValueError as exc:
+                errors.append(f"#{idx}: {exc}")
     except QrScanError as exc:
         raise ValueError(f"scan failed: {exc}") from exc
-    if not payloads:
+    if not idx:
         raise ValueError("no QR payloads found; check the scan path and image quality")
-    frames: list[Frame] = []
-    errors: list[str] = []
-    for idx, payload in enumerate(payloads, start=1):
-        try:
-            frames.append(_frame_from_scanned_payload(payload))
-        except ValueError as exc:
-            errors.append(f"#{idx}: {exc}")
-            continue
     if not frames:
         if errors:
             detail = "; ".join(errors[:3])
@@ -412,13 +472,69 @@ def _frames_from_scan(paths: list[str]) -> list[Frame]:
     return frames
 
 
+class _RecoveryScanTracker:
+    """Track MAIN/AUTH coverage file by file so scanning can stop once recovery is possible.
+
+    The set is complete when exactly one document has every MAIN index from 0 to `total - 1`
+    (or enough PARITY frames to rebuild the missing ones) and its AUTH frame. Inputs without
+    an AUTH frame never complete and are read in full, unless `require_auth` is False.
+    """
+
+    def __init__(self, *, require_auth: bool = True) -> None:
+        self.require_auth = require_auth
+        self.scanned: list[Path] = []
+        self._main_totals: dict[bytes, int] = {}
+        self._main_indices: dict[bytes, set[int]] = {}
+        self._parity_indices: dict[bytes, set[int]] = {}
+        self._auth_doc_ids: set[bytes] = set()
+
+    def __call__(self, path: Path, payloads: Sequence[bytes]) -> bool:
+        self.scanned.append(path)
+        for payload in payloads:
+            try:
+                frame = _frame_from_scanned_payload(payload)
+            except ValueError:
+                continue
+            if frame.frame_type == FrameType.MAIN_DOCUMENT:
+                self._main_totals.setdefault(frame.doc_id, frame.total)
+                self._main_indices.setdefault(frame.doc_id, set()).add(frame.index)
+            elif frame.frame_type == FrameType.PARITY:
+                self._parity_indices.setdefault(frame.doc_id, set()).add(frame.index)
+            elif frame.frame_type == FrameType.AUTH:
+                self._auth_doc_ids.add(frame.doc_id)
+        return self.complete
+
+    @property
+    def complete(self) -> bool:
+        if len(self._main_totals) != 1:
+            return False
+        ((doc_id, total),) = self._main_totals.items()
+        if self.require_auth and doc_id not in self._auth_doc_ids:
+            return False
+        missing = total - len(self._main_indices[doc_id])
+        return missing <= len(self._parity_indices.get(doc_id, ()))
+
+    def coverage(self) -> tuple[int, int | None, list[int], bool]:
+        """Return `(found, total, missing_indices, has_auth)` for the document seen so far."""
+
+        if len(self._main_totals) != 1:
+            return sum(len(found) for found in self._main_indices.values()), None, [], False
+        ((doc_id, total),) = self._main_totals.items()
+        found = self._main_indices[doc_id]
+        missing = [index for index in range(total) if index not in found]
+        return len(found), total, missing, doc_id in self._auth_doc_ids
+
+
 def _recovery_frames_from_scan(paths: list[str], *, quiet: bool = False) -> list[Frame]:
-    """Scan recovery input and keep only MAIN/AUTH frames."""
+    """Scan recovery input and keep only MAIN/PARITY/AUTH frames.
 
-    frames = _frames_from_scan(paths)
-    recovery_frames = [
-        frame for frame in frames if frame.frame_type in (FrameType.MAIN_DOCUMENT, FrameType.AUTH)
-    ]
+    Scanning stops at the first file that completes the MAIN set and its AUTH frame; any
+    remaining inputs are reported as skipped.
+    """
+
+    tracker = _RecoveryScanTracker()
+    frames = _frames_from_scan(paths, stop_when=tracker, cache=_recovery_scan_cache())
+    recovery_frames = [frame for frame in frames if frame.frame_type in RECOVERY_FRAME_TYPES]
     ignored_shards = len(frames) - len(recovery_frames)
     if not recovery_frames:
         raise ValueError(
@@ -433,9 +549,167 @@ def _recovery_frames_from_scan(paths: list[str], *, quiet: bool = False) -> list
             code=api_codes.RECOVERY_SHARD_PAYLOADS_IGNORED,
             details={"ignored_frames": ignored_shards},
         )
+    if tracker.complete:
+        _warn_skipped_scan_inputs(paths, tracker.scanned, quiet=quiet)
     return recovery_frames
 
 
+def _recovery_frames_from_watch(
+    directory: str,
+    *,
+    allow_unsigned: bool = False,
+    idle_timeout: float = SCAN_WATCH_IDLE_SECONDS,
+    poll_interval: float = SCAN_WATCH_POLL_SECONDS,
+    sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
+) -> list[Frame]:
+    """Decode scans as they arrive in `directory` until the MAIN/AUTH set is complete.
+
+    Only new or replaced files are decoded. Frames are kept in memory between polls, and a
+    `progress` event with phase `scan` reports the frame indices still missing after each
+    file. The AUTH frame is not waited for when `allow_unsigned` is set. Watching stops with
+    a ValueError listing what is still missing after `idle_timeout` seconds without a new
+    scan, or on Ctrl-C.
+    """
+
+    watch_dir = expanduser_cli_path(directory) or directory
+    try:
+        watcher = ScanWatcher(Path(watch_dir))
+    except QrScanError as exc:
+        raise ValueError(f"scan failed: {exc}") from exc
+    tracker = _RecoveryScanTracker(require_auth=not allow_unsigned)
+    cache = _recovery_scan_cache()
+    frames: list[Frame] = []
+    emit_progress(
+        phase="scan",
+        current=0,
+        unit="frames",
+        label=f"Watching {watch_dir} for new scans",
+        details={"files": 0},
+    )
+    last_scan = clock()
+    try:
+        while True:
+            for path in watcher.poll():
+                last_scan = clock()
+                try:
+                    payloads = scan_qr_payloads([path], cache=cache)
+                except QrScanError:
+                    payloads = []
+                tracker(path, payloads)
+                for payload in payloads:
+                    try:
+                        frame = _frame_from_scanned_payload(payload)
+                    except ValueError:
+                        continue
+                    if frame.frame_type in RECOVERY_FRAME_TYPES:
+                        frames.append(frame)
+                _report_watch_progress(tracker, path, found_codes=bool(payloads))
+                if tracker.complete:
+                    return frames
+            if clock() - last_scan >= idle_timeout:
+                raise ValueError(
+                    f"no new scans in {watch_dir} for {idle_timeout:g}s; {_watch_status(tracker)}"
+                )
+            sleep(poll_interval)
+    except KeyboardInterrupt:
+        raise ValueError(f"scan watch interrupted; {_watch_status(tracker)}") from None
+
+
+def _watch_status(tracker: _RecoveryScanTracker) -> str:
+    found, total, missing, has_auth = tracker.coverage()
+    if total is None:
+        status = f"{found} frame(s) found"
+    elif missing:
+        status = f"{found}/{total} frames found, missing {_format_index_ranges(missing)}"
+    else:
+        status = f"all {total} frames found"
+    if tracker.require_auth and total is not None and not has_auth:
+        status += ", waiting for the AUTH frame"
+    return status
+
+
+def _report_watch_progress(tracker: _RecoveryScanTracker, path: Path, *, found_codes: bool) -> None:
+    found, total, missing, has_auth = tracker.coverage()
+    status = _watch_status(tracker)
+    prefix = f"{path.name}: " if found_codes else f"{path.name}: no QR codes; "
+    emit_progress(
+        phase="scan",
+        current=found,
+        total=total,
+        unit="frames",
+        label=prefix + status,
+        details={
+            "files": len(tracker.scanned),
+            "missing_indices": missing,
+            "auth_found": has_auth,
+        },
+    )
+
+
+def _format_index_ranges(indices: Sequence[int]) -> str:
+    """Format sorted frame indices compactly, e.g. `3, 7-9`."""
+
+    parts: list[str] = []
+    start = previous = indices[0]
+    for index in [*indices[1:], None]:
+        if index is not None and index == previous + 1:
+            previous = index
+            continue
+        parts.append(str(start) if start == previous else f"{start}-{previous}")
+        if index is not None:
+            start = previous = index
+    return ", ".join(parts)
+
+
+def _recovery_scan_cache() -> ScanCache | None:
+    """Return the on-disk cache for recovery scans, or None when the session disables it."""
+
+    if not scan_cache_enabled():
+        return None
+    return ScanCache(
+        scan_cache_dir_path(),
+        fingerprint=decoder_fingerprint(),
+        accept=_is_recovery_payload_set,
+    )
+
+
+def _is_recovery_payload_set(payloads: Sequence[bytes]) -> bool:
+    """Accept only files whose payloads all decode to MAIN/PARITY/AUTH frames.
+
+    Those frames carry ciphertext, its parity, and signatures only; shard frames hold key
+    material and must never reach the on-disk cache.
+    """
+
+    for payload in payloads:
+        try:
+            frame = _frame_from_scanned_payload(payload)
+        except ValueError:
+            return False
+        if frame.frame_type not in RECOVERY_FRAME_TYPES:
+            return False
+    return True
+
+
+def _warn_skipped_scan_inputs(paths: list[str], scanned: list[Path], *, quiet: bool) -> None:
+    scanned_set = set(scanned)
+    skipped = [
+        path for path in expand_scan_paths(expanduser_cli_paths(paths)) if path not in scanned_set
+    ]
+    if not skipped:
+        return
+    _warn(
+        f"recovery set complete after {len(scanned)} scan input(s); "
+        f"skipped {len(skipped)} remaining input(s)",
+        quiet=quiet,
+        code=api_codes.RECOVERY_SCAN_INPUTS_SKIPPED,
+        details={
+            "scanned_inputs": len(scanned),
+            "skipped_inputs": [str(path) for path in skipped],
+        },
+    )
+
+
 def _shard_frames_from_scan(paths: list[str], *, quiet: bool = False) -> list[Frame]:
     """Scan shard input and keep only KEY_DOCUMENT frames."""
 
@@ -486,12 +760,12 @@ def _dedupe_auth_frames(frames: list[Frame]) -> list[Frame]:
 
 
 def _split_main_and_auth_frames(frames: list[Frame]) -> tuple[list[Frame], list[Frame]]:
-    """Split decoded frames into MAIN and AUTH lists."""
+    """Split decoded frames into MAIN (with any PARITY frames) and AUTH lists."""
 
     main_frames: list[Frame] = []
     auth_frames: list[Frame] = []
     for frame in frames:
-        if frame.frame_type == FrameType.MAIN_DOCUMENT:
+        if frame.frame_type in (FrameType.MAIN_DOCUMENT, FrameType.PARITY):
             main_frames.append(frame)
         elif frame.frame_type == FrameType.AUTH:
             auth_frames.append(frame)
@@ -531,11 +805,22 @@ def _frame_from_payload_text(payload_text: bytes | str) -> Frame:
 
 
 def _frame_from_scanned_payload(payload: bytes | str) -> Frame:
-    """Decode one scanned QR payload (raw frame bytes first, then base64 text)."""
+    """Decode one scanned QR payload (raw frame bytes, then base64 text, then base45 text)."""
 
     if isinstance(payload, bytes):
         try:
             return decode_frame(payload)
         except ValueError:
             pass
-    return _frame_from_payload_text(payload)
+    try:
+        return _frame_from_payload_text(payload)
+    except ValueError as exc:
+        text_error = exc
+    # base45 shares characters with base64 and uses spaces, so it is tried last and unstripped;
+    # the frame magic and CRC reject payloads that only happen to parse as base45.
+    if len(payload) <= MAX_QR_PAYLOAD_CHARS:
+        try:
+            return decode_frame(decode_qr_payload(payload, codec=QR_PAYLOAD_CODEC_BASE45))
+        except ValueError:
+            pass
+    raise text_error
@@ -65,7 +65,13 @@ def _load_input_files(
     *,
     allow_stdin: bool,
     progress: Progress | None = None,
+    before_read: Callable[[list[int]], None] | None = None,
 ) -> tuple[list[InputFile], Path | None, Literal["file", "directory", "mixed"], list[str]]:
+    """Collect and read input files.
+
+    `before_read` receives the on-disk size of every scanned file (stdin excluded) before any
+    file is read, so callers can refuse oversized inputs without loading them.
+    """
     paths: list[Path] = []
     stdin_requested = False
     has_directory_source = False
@@ -122,6 +128,9 @@ def _load_input_files(
         )
         progress.refresh()
 
+    if before_read is not None:
+        before_read([_stat_size(path) for path in paths])
+
     base = _resolve_base_dir(paths, base_dir)
     entries: list[InputFile] = []
     seen: dict[str, Path] = {}
@@ -189,6 +198,14 @@ def _load_input_files(
     return entries, base, input_origin, input_roots
 
 
+def _stat_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        # Missing or unreadable paths are reported by the read loop with a precise error.
+        return 0
+
+
 def _walk_directory(path: Path, *, on_file: Callable[[], None] | None = None) -> list[Path]:
     if not path.exists():
         raise _missing_path_error(path, "input dir not found")
@@ -25,10 +25,16 @@ import tempfile
 import unicodedata
 import uuid
 from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import BinaryIO
 
 from ethernity.cli.shared.paths import expanduser_cli_path
 from ethernity.core.validation import normalize_path
+from ethernity.formats.envelope_codec import stream_extract_payloads
+from ethernity.formats.envelope_types import EnvelopeManifest
+
+_RECOVERED_WRITE_WORKERS = 8
 
 
 def _is_posix() -> bool:
@@ -137,13 +143,17 @@ def _discard_prepared_output_dir(staging_dir: str | Path | None) -> None:
 def _safe_join(base: Path, relative: str) -> Path:
     """Join a manifest path under a base directory after path normalization checks."""
 
+    path = _safe_relative_path(base, relative)
+    _ensure_directory(path.parent, exist_ok=True)
+    return path
+
+
+def _safe_relative_path(base: Path, relative: str) -> Path:
     relative = normalize_path(relative, label="output path")
     rel = Path(relative)
     if rel.is_absolute() or ".." in rel.parts:
         raise ValueError(f"unsafe output path: {relative}")
-    path = base / rel
-    _ensure_directory(path.parent, exist_ok=True)
-    return path
+    return base / rel
 
 
 def _write_output(path: str | None, data: bytes) -> str | None:
@@ -237,7 +247,94 @@ def _write_recovered_directory_outputs(
     *,
     on_entry_written: Callable[[object, bytes, str, int, int], None] | None,
 ) -> list[str]:
-    """Write recovered directory-style outputs via staging with rollback."""
+    """Write recovered directory-style outputs via staging with rollback.
+
+    Files are created directly inside the private staging directory, concurrently, with no
+    per-file temp-and-rename: the staging directory itself is what gets renamed into place.
+    """
+
+    relative_paths = [getattr(entry, "path", "payload.bin") for entry, _data in entries]
+    staging_dir, destination_exists = _prepare_recovered_staging_dir(base_dir, relative_paths)
+    total = len(entries)
+    try:
+        staged_paths = _staged_output_paths(staging_dir, relative_paths)
+        writes = [(path, data) for path, (_entry, data) in zip(staged_paths, entries, strict=True)]
+        if len(writes) == 1:
+            _write_staged_file(*writes[0])
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(_RECOVERED_WRITE_WORKERS, len(writes)),
+                thread_name_prefix="ethernity-write",
+            ) as executor:
+                for future in [executor.submit(_write_staged_file, *item) for item in writes]:
+                    future.result()
+        _publish_recovered_directory(base_dir, staging_dir, destination_exists=destination_exists)
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+    written_paths = [str(base_dir / relative_path) for relative_path in relative_paths]
+    if on_entry_written is not None:
+        for index, ((entry, data), path) in enumerate(zip(entries, written_paths), start=1):
+            on_entry_written(entry, data, path, index, total)
+    return written_paths
+
+
+def _stream_recovered_directory_outputs(
+    output_path: str,
+    manifest: EnvelopeManifest,
+    payload: bytes,
+) -> list[str]:
+    """Decode a manifest payload straight into a staged output directory.
+
+    Files are written while the payload is decompressed, so the decoded payload is never
+    held in memory as a whole. The staging directory is published only after every entry
+    hash has been verified; any failure leaves the destination untouched.
+    """
+
+    base_dir = Path(expanduser_cli_path(output_path, preserve_stdin=False) or "")
+    relative_paths = [entry.path for entry in manifest.files]
+    if not relative_paths:
+        raise ValueError("no payloads to write")
+    staging_dir, destination_exists = _prepare_recovered_staging_dir(base_dir, relative_paths)
+    try:
+        staged_paths = dict(
+            zip(relative_paths, _staged_output_paths(staging_dir, relative_paths), strict=True)
+        )
+        stream_extract_payloads(
+            manifest, payload, lambda entry: _open_staged_file(staged_paths[entry.path])
+        )
+        _publish_recovered_directory(base_dir, staging_dir, destination_exists=destination_exists)
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+    return [str(base_dir / relative_path) for relative_path in relative_paths]
+
+
+def _staged_output_paths(staging_dir: Path, relative_paths: Sequence[str]) -> list[Path]:
+    """Resolve staged file paths and create each distinct parent directory once."""
+
+    paths = [_safe_relative_path(staging_dir, relative) for relative in relative_paths]
+    for parent in sorted({path.parent for path in paths} - {staging_dir}):
+        _ensure_directory(parent, exist_ok=True)
+    return paths
+
+
+def _open_staged_file(path: Path) -> BinaryIO:
+    # The staging directory is private and renamed as a whole, so files are created in
+    # place with final permissions instead of going through mkstemp + rename.
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    return os.fdopen(os.open(path, flags, 0o600), "wb")
+
+
+def _write_staged_file(path: Path, data: bytes) -> None:
+    with _open_staged_file(path) as handle:
+        handle.write(data)
+
+
+def _prepare_recovered_staging_dir(
+    base_dir: Path,
+    relative_paths: Sequence[str],
+) -> tuple[Path, bool]:
+    """Create a sibling staging directory and reject duplicate or colliding output paths."""
 
     destination_exists = base_dir.exists()
     if destination_exists and not base_dir.is_dir():
@@ -247,63 +344,44 @@ def _write_recovered_directory_outputs(
         tempfile.mkdtemp(prefix=f".{base_dir.name or 'recover'}.tmp-", dir=str(base_dir.parent))
     )
     _harden_dir_permissions(staging_dir)
-    _validate_recovered_output_paths(
-        entries, case_sensitive=_is_directory_case_sensitive(staging_dir)
-    )
-    staged_records: list[tuple[object, bytes, str, Path]] = []
-    total = len(entries)
     try:
-        for entry, data in entries:
-            relative_path = getattr(entry, "path", "payload.bin")
-            staged_path = _safe_join(staging_dir, relative_path)
-            _write_atomic_file(staged_path, data)
-            staged_records.append((entry, data, relative_path, staged_path))
-        if not destination_exists:
-            staging_dir.replace(base_dir)
-            written_paths = [
-                str(base_dir / relative_path)
-                for _entry, _data, relative_path, _path in staged_records
-            ]
-            if on_entry_written is not None:
-                for index, (entry, data, _relative_path, _path) in enumerate(
-                    staged_records, start=1
-                ):
-                    on_entry_written(entry, data, written_paths[index - 1], index, total)
-            return written_paths
-        return _commit_recovered_directory_outputs(
-            base_dir=base_dir,
-            staging_dir=staging_dir,
-            staged_records=staged_records,
-            total=total,
-            on_entry_written=on_entry_written,
-        )
-    finally:
+        _validate_recovered_output_paths(relative_paths, staging_dir=staging_dir)
+    except Exception:
         shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+    return staging_dir, destination_exists
 
 
 def _validate_recovered_output_paths(
-    entries: Sequence[tuple[object, bytes]],
+    relative_paths: Sequence[str],
     *,
-    case_sensitive: bool,
+    staging_dir: Path,
 ) -> None:
-    """Reject output paths that would collide on the target filesystem."""
-
-    if case_sensitive:
-        return
-    seen_paths: dict[tuple[str, ...], str] = {}
-    for entry, _data in entries:
-        relative_path = normalize_path(getattr(entry, "path", "payload.bin"), label="output path")
+    """Reject output paths that would collide on the target filesystem.
+
+    The case-sensitivity probe touches the filesystem, so it only runs when two paths
+    actually differ by case or Unicode normalization alone.
+    """
+
+    seen_paths: set[str] = set()
+    folded_paths: dict[tuple[str, ...], str] = {}
+    collision: tuple[str, str] | None = None
+    for path in relative_paths:
+        relative_path = normalize_path(path, label="output path")
+        if relative_path in seen_paths:
+            raise ValueError(f"duplicate output path: {relative_path!r}")
+        seen_paths.add(relative_path)
         key = tuple(
             unicodedata.normalize("NFC", part).casefold() for part in relative_path.split("/")
         )
-        previous = seen_paths.get(key)
-        if previous is None:
-            seen_paths[key] = relative_path
-            continue
-        if previous != relative_path:
-            raise ValueError(
-                f"output paths collide on this filesystem: {previous!r} vs {relative_path!r}"
-            )
+        previous = folded_paths.setdefault(key, relative_path)
+        if collision is None and previous != relative_path:
+            collision = (previous, relative_path)
+    if collision is not None and not _is_directory_case_sensitive(staging_dir):
+        previous, relative_path = collision
+        raise ValueError(
+            f"output paths collide on this filesystem: {previous!r} vs {relative_path!r}"
+        )
 
 
 def _is_directory_case_sensitive(directory: Path) -> bool:
@@ -321,23 +399,22 @@ def _is_directory_case_sensitive(directory: Path) -> bool:
         probe_path.unlink(missing_ok=True)
 
 
-def _commit_recovered_directory_outputs(
+def _publish_recovered_directory(
     base_dir: Path,
     staging_dir: Path,
-    staged_records: Sequence[tuple[object, bytes, str, Path]],
     *,
-    total: int,
-    on_entry_written: Callable[[object, bytes, str, int, int], None] | None,
-) -> list[str]:
+    destination_exists: bool,
+) -> None:
     """Publish the staged recovered tree as the authoritative destination."""
 
+    if not destination_exists:
+        staging_dir.replace(base_dir)
+        _fsync_directory(base_dir.parent)
+        return
     fd, backup_name = tempfile.mkstemp(prefix=f".{base_dir.name}.bak-", dir=str(base_dir.parent))
     os.close(fd)
     backup_dir = Path(backup_name)
     backup_dir.unlink(missing_ok=True)
-    written_paths = [
-        str(base_dir / relative_path) for _entry, _data, relative_path, _path in staged_records
-    ]
     try:
         base_dir.replace(backup_dir)
         staging_dir.replace(base_dir)
@@ -348,8 +425,21 @@ def _commit_recovered_directory_outputs(
     finally:
         if backup_dir.exists():
             shutil.rmtree(backup_dir, ignore_errors=True)
+    _fsync_directory(base_dir.parent)
 
-    if on_entry_written is not None:
-        for index, (entry, data, _relative_path, _path) in enumerate(staged_records, start=1):
-            on_entry_written(entry, data, written_paths[index - 1], index, total)
-    return written_paths
+
+def _fsync_directory(path: Path) -> None:
+    """Flush a directory entry update (the published rename) to disk where supported."""
+
+    if not _is_posix():
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        return
+    finally:
+        os.close(fd)
@@ -17,7 +17,8 @@
 from __future__ import annotations
 
 from ethernity.cli.shared.types import BackupArgs
-from ethernity.crypto import MNEMONIC_WORD_COUNTS
+from ethernity.crypto import AGE_IDENTITY_PREFIX, MNEMONIC_WORD_COUNTS, is_age_identity
+from ethernity.encoding.chunking import MAX_PARITY_PERCENT
 
 MAX_SHARDS = 255
 
@@ -27,8 +28,22 @@ def _validate_backup_args(args: BackupArgs) -> None:
         raise ValueError("passphrase cannot be empty")
     if args.passphrase and args.passphrase_generate:
         raise ValueError("use either --passphrase or --generate-passphrase, not both")
+    if args.key_mode is not None and args.key_mode not in ("passphrase", "x25519"):
+        raise ValueError("key mode must be 'passphrase' or 'x25519'")
+    if args.key_mode == "x25519":
+        if args.passphrase_generate or args.passphrase_words is not None:
+            raise ValueError("--key-mode x25519 generates an age identity, not a passphrase")
+        if args.passphrase is not None and not is_age_identity(args.passphrase):
+            raise ValueError(
+                "with --key-mode x25519, --passphrase must be an age identity "
+                f"({AGE_IDENTITY_PREFIX}...)"
+            )
     if args.qr_chunk_size is not None and args.qr_chunk_size <= 0:
         raise ValueError("qr chunk size must be a positive integer")
+    if args.qr_parity is not None and not 0 <= args.qr_parity <= MAX_PARITY_PERCENT:
+        raise ValueError(f"qr parity must be between 0 and {MAX_PARITY_PERCENT} percent")
+    if args.max_memory is not None and args.max_memory <= 0:
+        raise ValueError("max memory must be a positive number of bytes")
     if args.signing_key_mode is not None and args.signing_key_mode not in ("embedded", "sharded"):
         raise ValueError("signing key mode must be 'embedded' or 'sharded'")
     if args.signing_key_shard_threshold is not None or args.signing_key_shard_count is not None:
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+"""`--profile` support: cProfile, collapsed stacks and tracemalloc reports for one command."""
+
+from __future__ import annotations
+
+import cProfile
+import json
+import os
+import platform
+import pstats
+import time
+import tracemalloc
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from ethernity.cli.shared.ui.debug import _format_masked_text_secret
+from ethernity.version import get_ethernity_version
+
+DEFAULT_TOP_N = 25
+SECRET_VALUE_OPTIONS = frozenset({"--passphrase"})
+
+# (filename, line, function name) as used by cProfile/pstats.
+_FuncKey = tuple[str, int, str]
+
+_ALLOCATION_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+@dataclass(frozen=True)
+class ProfileArtifacts:
+    pstats_path: Path
+    collapsed_path: Path
+    allocations_path: Path
+    summary_path: Path
+
+
+def redact_argv(argv: Sequence[str]) -> list[str]:
+    """Mask secret option values in argv the same way debug output masks passphrases."""
+
+    redacted: list[str] = []
+    mask_next = False
+    for arg in argv:
+        if mask_next:
+            redacted.append(_format_masked_text_secret(arg))
+            mask_next = False
+            continue
+        option, sep, value = arg.partition("=")
+        if option in SECRET_VALUE_OPTIONS:
+            if sep:
+                redacted.append(f"{option}={_format_masked_text_secret(value)}")
+            else:
+                redacted.append(arg)
+                mask_next = True
+            continue
+        redacted.append(arg)
+    return redacted
+
+
+def _frame_label(func: _FuncKey) -> str:
+    filename, line, name = func
+    if filename == "~" and line == 0:
+        label = name
+    else:
+        label = f"{name} ({Path(filename).name}:{line})"
+    return label.replace(";", ",")
+
+
+def collapsed_stacks(stats: dict[_FuncKey, Any]) -> list[str]:
+    """Rebuild `frame;frame;frame microseconds` lines from a pstats call graph.
+
+    cProfile only records caller/callee edges, so a function's own time is split across
+    the paths that reach it in proportion to each incoming edge's cumulative time. Recursive
+    cycles are cut at the first repeat.
+    """
+
+    own_time: dict[_FuncKey, float] = {}
+    total_time: dict[_FuncKey, float] = {}
+    children: dict[_FuncKey, list[tuple[_FuncKey, float]]] = {}
+    roots: list[_FuncKey] = []
+    for func, (_cc, _nc, tottime, cumtime, callers) in stats.items():
+        own_time[func] = tottime
+        total_time[func] = cumtime
+        if not callers.keys() - {func}:
+            roots.append(func)
+        for caller, edge in callers.items():
+            children.setdefault(caller, []).append((func, edge[3]))
+    # Frames already running when profiling started appear only as callers; treat them
+    # as roots so the work they dispatched is not lost.
+    roots.extend(caller for caller in children if caller not in stats)
+
+    samples: dict[str, int] = {}
+    stack: list[tuple[tuple[_FuncKey, ...], float]] = [((root,), 1.0) for root in sorted(roots)]
+    while stack:
+        path, weight = stack.pop()
+        func = path[-1]
+        micros = int(round(own_time.get(func, 0.0) * weight * 1_000_000))
+        if micros > 0:
+            key = ";".join(_frame_label(item) for item in path)
+            samples[key] = samples.get(key, 0) + micros
+        for child, edge_cumtime in children.get(func, []):
+            child_total = total_time.get(child, 0.0)
+            if child in path or child_total <= 0 or edge_cumtime <= 0:
+                continue
+            child_weight = weight * min(1.0, edge_cumtime / child_total)
+            if child_weight * child_total * 1_000_000 < 1:
+                continue
+            stack.append(((*path, child), child_weight))
+    return [f"{key} {value}" for key, value in sorted(samples.items())]
+
+
+def allocation_report(snapshot: tracemalloc.Snapshot, *, top_n: int) -> str:
+    """Format the largest live allocations by source line and by file.
+
+    Only code locations and sizes are reported; allocated contents are never read.
+    """
+
+    snapshot = snapshot.filter_traces(_ALLOCATION_FILTERS)
+    current, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+    lines = [
+        f"traced memory at exit: {current / 1024:.1f} KiB (peak {peak / 1024:.1f} KiB)",
+        "",
+        f"Top {top_n} live allocations by line:",
+    ]
+    for index, stat in enumerate(snapshot.statistics("lineno")[:top_n], start=1):
+        frame = stat.traceback[0]
+        lines.append(
+            f"#{index:<3} {frame.filename}:{frame.lineno}: "
+            f"{stat.size / 1024:.1f} KiB in {stat.count} blocks"
+        )
+    lines.extend(["", f"Top {top_n} live allocations by file:"])
+    for index, stat in enumerate(snapshot.statistics("filename")[:top_n], start=1):
+        lines.append(
+            f"#{index:<3} {stat.traceback[0].filename}: "
+            f"{stat.size / 1024:.1f} KiB in {stat.count} blocks"
+        )
+    return "\n".join(lines) + "\n"
+
+
+class ProfileSession:
+    """Profile one CLI command and write its reports into `output_dir`."""
+
+    def __init__(
+        self,
+        output_dir: Path,
+        *,
+        command: str | None,
+        argv: Sequence[str],
+        top_n: int = DEFAULT_TOP_N,
+    ) -> None:
+        self.output_dir = output_dir
+        self.command = command or "home"
+        self.argv = redact_argv(argv)
+        self.top_n = top_n
+        self._profiler = cProfile.Profile()
+        self._started_tracemalloc = False
+        self._wall_start = 0.0
+        self._cpu_start = 0.0
+        self._started_utc = ""
+
+    def start(self) -> None:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._started_utc = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        self._profiler.enable()
+
+    def stop(self) -> ProfileArtifacts:
+        self._profiler.disable()
+        wall_seconds = time.perf_counter() - self._wall_start
+        cpu_seconds = time.process_time() - self._cpu_start
+        snapshot = tracemalloc.take_snapshot()
+        allocations = allocation_report(snapshot, top_n=self.top_n)
+        _current, traced_peak = tracemalloc.get_traced_memory()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+
+        stem = f"ethernity-{self.command}-{self._started_utc}-{os.getpid()}"
+        artifacts = ProfileArtifacts(
+            pstats_path=self.output_dir / f"{stem}.pstats",
+            collapsed_path=self.output_dir / f"{stem}.collapsed.txt",
+            allocations_path=self.output_dir / f"{stem}.allocations.txt",
+            summary_path=self.output_dir / f"{stem}.json",
+        )
+        self._profiler.dump_stats(str(artifacts.pstats_path))
+        stats = pstats.Stats(str(artifacts.pstats_path)).stats  # type: ignore[attr-defined]
+        artifacts.collapsed_path.write_text(
+            "\n".join(collapsed_stacks(stats)) + "\n", encoding="utf-8"
+        )
+        artifacts.allocations_path.write_text(allocations, encoding="utf-8")
+        summary = {
+            "command": self.command,
+            "argv": self.argv,
+            "ethernity_version": get_ethernity_version(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "started_utc": self._started_utc,
+            "wall_seconds": round(wall_seconds, 6),
+            "cpu_seconds": round(cpu_seconds, 6),
+            "traced_peak_bytes": traced_peak,
+            "files": {
+                "pstats": artifacts.pstats_path.name,
+                "collapsed": artifacts.collapsed_path.name,
+                "allocations": artifacts.allocations_path.name,
+            },
+        }
+        artifacts.summary_path.write_text(
+            json.dumps(summary, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+        return artifacts
+
+
+__all__ = [
+    "DEFAULT_TOP_N",
+    "ProfileArtifacts",
+    "ProfileSession",
+    "allocation_report",
+    "collapsed_stacks",
+    "redact_argv",
+]
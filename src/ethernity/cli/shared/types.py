@@ -18,10 +18,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 from ethernity.config import BackupDefaults, RecoverDefaults
 
+if TYPE_CHECKING:
+    from ethernity.cli.features.backup.verify import RenderVerification
+
 
 @dataclass(frozen=True)
 class InputFile:
@@ -40,6 +43,7 @@ class BackupResult:
     signing_key_shard_paths: tuple[str, ...]
     passphrase_used: str | None
     kit_index_path: str | None = None
+    render_verification: RenderVerification | None = None
 
 
 @dataclass
@@ -56,9 +60,11 @@ class BackupArgs:
     output_dir_existing_parent: bool = False
     layout_debug_dir: str | None = None
     qr_chunk_size: int | None = None
+    qr_parity: int | None = None
     passphrase: str | None = None
     passphrase_generate: bool = False
     passphrase_words: int | None = None
+    key_mode: Literal["passphrase", "x25519"] | None = None
     sealed: bool = False
     shard_threshold: int | None = None
     shard_count: int | None = None
@@ -70,6 +76,9 @@ class BackupArgs:
     debug_reveal_secrets: bool = False
     assume_yes: bool = False
     quiet: bool = False
+    max_memory: int | None = None
+    verify_render: bool = False
+    registry: bool = False
 
 
 @dataclass
@@ -90,6 +99,14 @@ class RecoverArgs:
     output: str | None = None
     allow_unsigned: bool = False
     assume_yes: bool = False
+    scan_jobs: int | None = None
+    scan_cache: bool = True
+    scan_watch: str | None = None
+    scan_watch_idle: float | None = None
+    batch: bool = False
+    passphrase_file: str | None = None
+    passphrase_env: str | None = None
+    session: str | None = None
     debug_max_bytes: int = 0
     debug_reveal_secrets: bool = False
     quiet: bool = False
@@ -19,6 +19,7 @@ from __future__ import annotations
 import sys
 from collections.abc import Generator
 from contextlib import contextmanager
+from typing import Any
 
 from rich.live import Live
 from rich.padding import Padding
@@ -34,6 +35,7 @@ from rich.rule import Rule
 from rich.spinner import Spinner
 from rich.text import Text
 
+from ethernity.cli.shared.events import event_session
 from ethernity.cli.shared.ui.state import UIContext, WizardState, format_hint, get_context, isatty
 
 DEBUG_MAX_BYTES_DEFAULT = 1024
@@ -199,3 +201,69 @@ def status(
                     live.update(Text(f"{message} ✓", style="success"), refresh=True)
                 except (OSError, ValueError):
                     pass
+
+
+class _LiveProgressSink:
+    """Event sink that appends `progress` labels for one phase to a status spinner."""
+
+    def __init__(self, live: Live, message: str, phase: str) -> None:
+        self._live = live
+        self._message = message
+        self._phase = phase
+
+    def emit(self, event_type: str, **payload: Any) -> None:
+        if event_type != "progress" or payload.get("phase") != self._phase:
+            return
+        label = payload.get("label")
+        if not label:
+            return
+        text = Text(f"{self._message} {label}", style="subtitle")
+        try:
+            self._live.update(Spinner("dots", text=text), refresh=True)
+        except (OSError, ValueError):
+            pass
+
+
+@contextmanager
+def live_progress(live: Live | None, message: str, *, phase: str) -> Generator[None, None, None]:
+    """Show `progress` events for `phase` on a `status` spinner while the block runs."""
+
+    if live is None:
+        yield
+        return
+    with event_session(_LiveProgressSink(live, message, phase)):
+        yield
+
+
+class _PrintedProgressSink:
+    """Event sink that prints each new `progress` label for one phase on its own line."""
+
+    def __init__(self, phase: str, context: UIContext) -> None:
+        self._phase = phase
+        self._context = context
+        self._last_label: str | None = None
+
+    def emit(self, event_type: str, **payload: Any) -> None:
+        if event_type != "progress" or payload.get("phase") != self._phase:
+            return
+        label = payload.get("label")
+        if not label or label == self._last_label:
+            return
+        self._last_label = label
+        self._context.console_err.print(Text(str(label), style="subtitle"))
+
+
+@contextmanager
+def printed_progress(
+    *, phase: str, quiet: bool, context: UIContext | None = None
+) -> Generator[None, None, None]:
+    """Print `progress` labels for `phase` to stderr while the block runs.
+
+    Unlike `live_progress`, output is plain lines, so prompts can interleave with it.
+    """
+
+    if quiet:
+        yield
+        return
+    with event_session(_PrintedProgressSink(phase, _resolve_context(context))):
+        yield
@@ -17,6 +17,8 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 from ethernity.cli.shared.types import BackupResult, MintResult
 from ethernity.cli.shared.ui import (
@@ -30,6 +32,10 @@ from ethernity.cli.shared.ui import (
 )
 from ethernity.core.models import DocumentPlan
 
+if TYPE_CHECKING:
+    from ethernity.cli.features.backup.verify import RenderVerification
+    from ethernity.cli.features.recover.batch import BatchDocumentResult
+
 
 def print_backup_summary(
     result: BackupResult,
@@ -56,6 +62,65 @@ def print_backup_summary(
     )
 
 
+def print_render_verification(verification: RenderVerification, *, quiet: bool) -> None:
+    """Print `--verify-render` results; QR codes that did not round-trip are always shown."""
+
+    for document in verification.documents:
+        name = Path(document.path).name
+        if document.missing:
+            console_err.print(
+                f"[red]Error:[/red] {name}: QR {_qr_numbers(document.missing)} did not decode "
+                "to the rendered bytes"
+            )
+        if document.unexpected:
+            console_err.print(
+                f"[red]Error:[/red] {name}: {document.unexpected} decoded QR code(s) match no "
+                "rendered frame"
+            )
+    if verification.timed_out:
+        console_err.print(
+            f"[red]Error:[/red] render verification stopped after its "
+            f"{verification.budget_seconds:.0f}s budget"
+        )
+    if quiet:
+        return
+    for document in verification.documents:
+        for index, retry in document.retried:
+            console_err.print(
+                f"[yellow]Warning:[/yellow] {Path(document.path).name}: QR {index + 1} only "
+                f"decoded after a {retry.replace('_', ' ')} retry"
+            )
+    status = "passed" if verification.ok else "failed"
+    console.print(
+        panel(
+            "Render verification",
+            build_kv_table(
+                [
+                    ("Result", status),
+                    ("QR codes", str(verification.frames)),
+                    ("Documents", str(len(verification.documents))),
+                    ("Elapsed", f"{verification.elapsed_seconds:.1f}s"),
+                ]
+            ),
+        )
+    )
+
+
+def _qr_numbers(indices: Sequence[int]) -> str:
+    """Format 0-based QR positions as compact 1-based ranges, e.g. `3, 7-9`."""
+
+    parts: list[str] = []
+    start = previous = indices[0]
+    for index in [*indices[1:], None]:
+        if index is not None and index == previous + 1:
+            previous = index
+            continue
+        parts.append(str(start + 1) if start == previous else f"{start + 1}-{previous + 1}")
+        if index is not None:
+            start = previous = index
+    return ", ".join(parts)
+
+
 def print_recover_summary(
     entries: Sequence[tuple[object, bytes]],
     output_path: str | None,
@@ -85,6 +150,34 @@ def print_recover_summary(
         console_err.print(panel("Recovered files", tree))
 
 
+def print_batch_recover_summary(
+    results: Sequence[BatchDocumentResult],
+    *,
+    report_path: str,
+    quiet: bool,
+) -> None:
+    """Print one row per document of a batch recovery; failures are always shown."""
+
+    for result in results:
+        if result.status != "recovered":
+            console_err.print(f"[red]Error:[/red] {result.doc_id}: {result.error}")
+    if quiet:
+        return
+    rows = []
+    for result in results:
+        if result.status == "recovered":
+            count = len(result.files)
+            suffix = "file" if count == 1 else "files"
+            value = f"{count} {suffix} via {result.passphrase_source} -> {result.output_dir}"
+        else:
+            value = "failed"
+        rows.append((result.doc_id, value))
+    recovered = sum(1 for result in results if result.status == "recovered")
+    rows.append(("Recovered", f"{recovered} of {len(results)} document(s)"))
+    rows.append(("Report", report_path))
+    console_err.print(panel("Batch recovery summary", build_kv_table(rows)))
+
+
 def print_mint_summary(result: MintResult, *, quiet: bool) -> None:
     if quiet:
         return
@@ -60,6 +60,8 @@ from ethernity.cli.shared.ui.runtime import (
     configure_ui,
     console,
     console_err,
+    live_progress,
+    printed_progress,
     progress,
     status,
     ui_screen_mode,
@@ -85,9 +87,11 @@ __all__ = [
     "empty_mint_args",
     "empty_recover_args",
     "format_hint",
+    "live_progress",
     "panel",
     "print_completion_panel",
     "print_prompt_header",
+    "printed_progress",
     "progress",
     "prompt_choice",
     "prompt_choice_list",
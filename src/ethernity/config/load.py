@@ -41,7 +41,7 @@ from ethernity.config.types import (
     RuntimeDefaults,
     UiDefaults,
 )
-from ethernity.encoding.chunking import DEFAULT_CHUNK_SIZE
+from ethernity.encoding.chunking import DEFAULT_CHUNK_SIZE, MAX_PARITY_PERCENT
 from ethernity.qr.codec import QrConfig
 
 _T = TypeVar("_T")
@@ -96,6 +96,9 @@ def load_app_config(path: str | Path | None = None, *, paper_size: str | None =
     qr_chunk_size = DEFAULT_CHUNK_SIZE if qr_chunk_size_value is None else qr_chunk_size_value
     if qr_chunk_size <= 0:
         raise ValueError("qr.chunk_size must be a positive integer")
+    qr_parity_percent = _parse_optional_int(qr_section.get("parity_percent")) or 0
+    if not 0 <= qr_parity_percent <= MAX_PARITY_PERCENT:
+        raise ValueError(f"qr.parity_percent must be between 0 and {MAX_PARITY_PERCENT}")
     return AppConfig(
         template_path=template_path,
         recovery_template_path=recovery_path,
@@ -105,6 +108,7 @@ def load_app_config(path: str | Path | None = None, *, paper_size: str | None =
         paper_size=resolved_paper_size,
         qr_config=qr_config,
         qr_chunk_size=qr_chunk_size,
+        qr_parity_percent=qr_parity_percent,
         cli_defaults=cli_defaults,
     )
 
@@ -83,4 +83,5 @@ class AppConfig:
     paper_size: str
     qr_config: QrConfig
     qr_chunk_size: int
+    qr_parity_percent: int = 0
     cli_defaults: CliDefaults = field(default_factory=CliDefaults)
@@ -30,6 +30,9 @@ XDG_CONFIG_ENV = "XDG_CONFIG_HOME"
 DEFAULT_CONFIG_FILENAME = "config.toml"
 TEMPLATES_DIRNAME = "templates"
 RUNTIME_DIRNAME = "runtime"
+SCAN_CACHE_DIRNAME = "scan"
+BACKUP_REGISTRY_FILENAME = "registry.sqlite3"
+BACKUP_REGISTRY_ENV = "ETHERNITY_REGISTRY"
 
 
 def user_config_dir_path() -> Path:
@@ -90,3 +93,21 @@ def runtime_scratch_dir_path() -> Path:
     """Return the app-owned runtime scratch directory (under cache)."""
 
     return user_cache_dir_path() / RUNTIME_DIRNAME
+
+
+def scan_cache_dir_path() -> Path:
+    """Return the decoded-QR scan cache directory (under cache)."""
+
+    return user_cache_dir_path() / SCAN_CACHE_DIRNAME
+
+
+def backup_registry_path() -> Path:
+    """Return the local backup registry database path (under state).
+
+    `ETHERNITY_REGISTRY` overrides the location.
+    """
+
+    override = os.environ.get(BACKUP_REGISTRY_ENV)
+    if override:
+        return Path(override).expanduser()
+    return user_state_dir_path() / BACKUP_REGISTRY_FILENAME
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+"""Local SQLite index of non-secret backup metadata.
+
+The registry stores what a backup run produced (document identifiers, manifest paths with
+sizes and SHA-256 digests, shard quorums and output paths) so backups can be located later
+without scanning paper. It never stores passphrases, identities or signing keys.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+REGISTRY_SCHEMA_VERSION = 1
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS backups (
+    doc_id TEXT PRIMARY KEY,
+    doc_hash TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    recorded_at REAL NOT NULL,
+    sealed INTEGER NOT NULL,
+    key_mode TEXT NOT NULL,
+    input_origin TEXT NOT NULL,
+    shard_threshold INTEGER,
+    shard_count INTEGER,
+    signing_key_shard_threshold INTEGER,
+    signing_key_shard_count INTEGER,
+    output_dir TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS backup_files (
+    doc_id TEXT NOT NULL REFERENCES backups(doc_id) ON DELETE CASCADE,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    PRIMARY KEY (doc_id, path)
+);
+CREATE TABLE IF NOT EXISTS backup_outputs (
+    doc_id TEXT NOT NULL REFERENCES backups(doc_id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    path TEXT NOT NULL,
+    PRIMARY KEY (doc_id, path)
+);
+CREATE INDEX IF NOT EXISTS backups_created_at ON backups(created_at);
+CREATE INDEX IF NOT EXISTS backup_files_path ON backup_files(path);
+CREATE INDEX IF NOT EXISTS backup_files_sha256 ON backup_files(sha256);
+CREATE INDEX IF NOT EXISTS backup_outputs_path ON backup_outputs(path);
+"""
+
+
+@dataclass(frozen=True)
+class RegistryFile:
+    """One manifest file recorded for a backup."""
+
+    path: str
+    size: int
+    sha256: str
+
+
+@dataclass(frozen=True)
+class RegistryOutput:
+    """One rendered document written by a backup."""
+
+    kind: str
+    path: str
+
+
+@dataclass(frozen=True)
+class RegistryEntry:
+    """Non-secret metadata recorded for one backup run."""
+
+    doc_id: str
+    doc_hash: str
+    created_at: float
+    sealed: bool
+    key_mode: str
+    input_origin: str
+    output_dir: str
+    files: tuple[RegistryFile, ...]
+    outputs: tuple[RegistryOutput, ...]
+    shard_threshold: int | None = None
+    shard_count: int | None = None
+    signing_key_shard_threshold: int | None = None
+    signing_key_shard_count: int | None = None
+    recorded_at: float | None = None
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "doc_id": self.doc_id,
+            "doc_hash": self.doc_hash,
+            "created_at": self.created_at,
+            "recorded_at": self.recorded_at,
+            "sealed": self.sealed,
+            "key_mode": self.key_mode,
+            "input_origin": self.input_origin,
+            "shard_threshold": self.shard_threshold,
+            "shard_count": self.shard_count,
+            "signing_key_shard_threshold": self.signing_key_shard_threshold,
+            "signing_key_shard_count": self.signing_key_shard_count,
+            "output_dir": self.output_dir,
+            "files": [
+                {"path": entry.path, "size": entry.size, "sha256": entry.sha256}
+                for entry in self.files
+            ],
+            "outputs": [{"kind": entry.kind, "path": entry.path} for entry in self.outputs],
+        }
+
+
+class BackupRegistry:
+    """Append and query backup metadata in a local SQLite database.
+
+    Every lookup is answered from an index: manifest and output paths, SHA-256 digests
+    (full or prefix), doc_id prefixes and creation-time ranges.
+    """
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._connection = connection
+
+    def record(self, entry: RegistryEntry) -> None:
+        """Insert or replace the metadata for one backup."""
+
+        doc_id = _require_hex(entry.doc_id, label="doc_id")
+        recorded_at = time.time() if entry.recorded_at is None else entry.recorded_at
+        with self._connection:
+            self._connection.execute("DELETE FROM backups WHERE doc_id = ?", (doc_id,))
+            self._connection.execute(
+                "INSERT INTO backups (doc_id, doc_hash, created_at, recorded_at, sealed, "
+                "key_mode, input_origin, shard_threshold, shard_count, "
+                "signing_key_shard_threshold, signing_key_shard_count, output_dir) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    doc_id,
+                    _require_hex(entry.doc_hash, label="doc_hash"),
+                    entry.created_at,
+                    recorded_at,
+                    int(entry.sealed),
+                    entry.key_mode,
+                    entry.input_origin,
+                    entry.shard_threshold,
+                    entry.shard_count,
+                    entry.signing_key_shard_threshold,
+                    entry.signing_key_shard_count,
+                    entry.output_dir,
+                ),
+            )
+            self._connection.executemany(
+                "INSERT INTO backup_files (doc_id, path, size, sha256) VALUES (?, ?, ?, ?)",
+                (
+                    (doc_id, item.path, item.size, _require_hex(item.sha256, label="sha256"))
+                    for item in entry.files
+                ),
+            )
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO backup_outputs (doc_id, kind, path) VALUES (?, ?, ?)",
+                ((doc_id, item.kind, item.path) for item in entry.outputs),
+            )
+
+    def find(
+        self,
+        *,
+        path: str | None = None,
+        sha256: str | None = None,
+        doc_id_prefix: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        limit: int | None = None,
+    ) -> list[RegistryEntry]:
+        """Return backups matching every given filter, newest first.
+
+        `path` matches a manifest path or a written document path exactly. `sha256` and
+        `doc_id_prefix` accept hex prefixes. `since` is inclusive and `until` exclusive.
+        """
+
+        clauses: list[str] = []
+        params: list[object] = []
+        if path is not None:
+            clauses.append(
+                "(EXISTS (SELECT 1 FROM backup_files f WHERE f.doc_id = b.doc_id AND f.path = ?)"
+                " OR EXISTS (SELECT 1 FROM backup_outputs o"
+                " WHERE o.doc_id = b.doc_id AND o.path = ?))"
+            )
+            params.extend((path, path))
+        if sha256 is not None:
+            low, high = _hex_prefix_range(sha256, label="sha256")
+            clauses.append(
+                "EXISTS (SELECT 1 FROM backup_files f WHERE f.doc_id = b.doc_id"
+                " AND f.sha256 >= ? AND f.sha256 < ?)"
+            )
+            params.extend((low, high))
+        if doc_id_prefix is not None:
+            low, high = _hex_prefix_range(doc_id_prefix, label="doc_id prefix")
+            clauses.append("b.doc_id >= ? AND b.doc_id < ?")
+            params.extend((low, high))
+        if since is not None:
+            clauses.append("b.created_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("b.created_at < ?")
+            params.append(until)
+        if limit is not None and limit <= 0:
+            raise ValueError("limit must be positive")
+
+        query = "SELECT * FROM backups b"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY b.created_at DESC, b.doc_id"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        rows = self._connection.execute(query, params).fetchall()
+        return [self._entry_from_row(row) for row in rows]
+
+    def __len__(self) -> int:
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM backups").fetchone()
+        return int(count)
+
+    def _entry_from_row(self, row: sqlite3.Row) -> RegistryEntry:
+        doc_id = row["doc_id"]
+        files = tuple(
+            RegistryFile(path=item["path"], size=item["size"], sha256=item["sha256"])
+            for item in self._connection.execute(
+                "SELECT path, size, sha256 FROM backup_files WHERE doc_id = ? ORDER BY path",
+                (doc_id,),
+            )
+        )
+        outputs = tuple(
+            RegistryOutput(kind=item["kind"], path=item["path"])
+            for item in self._connection.execute(
+                "SELECT kind, path FROM backup_outputs WHERE doc_id = ? ORDER BY rowid",
+                (doc_id,),
+            )
+        )
+        return RegistryEntry(
+            doc_id=doc_id,
+            doc_hash=row["doc_hash"],
+            created_at=row["created_at"],
+            recorded_at=row["recorded_at"],
+            sealed=bool(row["sealed"]),
+            key_mode=row["key_mode"],
+            input_origin=row["input_origin"],
+            shard_threshold=row["shard_threshold"],
+            shard_count=row["shard_count"],
+            signing_key_shard_threshold=row["signing_key_shard_threshold"],
+            signing_key_shard_count=row["signing_key_shard_count"],
+            output_dir=row["output_dir"],
+            files=files,
+            outputs=outputs,
+        )
+
+
+@contextmanager
+def open_backup_registry(path: Path, *, create: bool = True) -> Iterator[BackupRegistry]:
+    """Open (and by default create) the registry database at `path`."""
+
+    if not create and not path.exists():
+        raise FileNotFoundError(f"backup registry not found: {path}")
+    if create:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    with closing(sqlite3.connect(path)) as connection:
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA foreign_keys = ON")
+        _ensure_schema(connection, path=path)
+        yield BackupRegistry(connection)
+
+
+def _ensure_schema(connection: sqlite3.Connection, *, path: Path) -> None:
+    (version,) = connection.execute("PRAGMA user_version").fetchone()
+    if version == REGISTRY_SCHEMA_VERSION:
+        return
+    if version != 0:
+        raise ValueError(f"unsupported backup registry schema version {version}: {path}")
+    with connection:
+        connection.executescript(_SCHEMA)
+        connection.execute(f"PRAGMA user_version = {REGISTRY_SCHEMA_VERSION}")
+
+
+def _require_hex(value: str, *, label: str) -> str:
+    normalized = value.strip().lower()
+    if not normalized or not _HEX_DIGITS.issuperset(normalized):
+        raise ValueError(f"{label} must be hex: {value!r}")
+    return normalized
+
+
+def _hex_prefix_range(prefix: str, *, label: str) -> tuple[str, str]:
+    # Lowercase hex sorts below "g", so [prefix, prefix + "g") is exactly the prefix set and
+    # stays an index range scan.
+    low = _require_hex(prefix, label=label)
+    return low, low + "g"
+
+
+def registry_files(entries: Sequence[tuple[str, int, bytes]]) -> tuple[RegistryFile, ...]:
+    """Build registry file rows from `(path, size, sha256_digest)` triples."""
+
+    return tuple(
+        RegistryFile(path=path, size=size, sha256=digest.hex()) for path, size, digest in entries
+    )
+
+
+__all__ = [
+    "REGISTRY_SCHEMA_VERSION",
+    "BackupRegistry",
+    "RegistryEntry",
+    "RegistryFile",
+    "RegistryOutput",
+    "open_backup_registry",
+    "registry_files",
+]
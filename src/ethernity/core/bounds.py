@@ -25,6 +25,12 @@ MAX_MAIN_FRAME_DATA_BYTES = 1_048_576
 # MAIN frame count cap for chunked QR transport.
 MAX_MAIN_FRAME_TOTAL = 4_096
 
+# PARITY frame count cap (data and parity rows share the 256 GF(256) elements).
+MAX_PARITY_FRAME_TOTAL = 255
+
+# PARITY frame data cap (one padded MAIN chunk plus its varint header).
+MAX_PARITY_FRAME_DATA_BYTES = MAX_MAIN_FRAME_DATA_BYTES + 32
+
 # Maximum QR payload characters (whitespace-stripped).
 MAX_QR_PAYLOAD_CHARS = 3_072
 
@@ -66,6 +72,8 @@ __all__ = [
     "MAX_MAIN_FRAME_TOTAL",
     "MAX_MANIFEST_CBOR_BYTES",
     "MAX_MANIFEST_FILES",
+    "MAX_PARITY_FRAME_DATA_BYTES",
+    "MAX_PARITY_FRAME_TOTAL",
     "MAX_PATH_BYTES",
     "MAX_QR_PAYLOAD_CHARS",
     "MAX_RECOVERY_TEXT_BYTES",
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+"""Worker-count resolution shared by the parallel render and scan stages."""
+
+from __future__ import annotations
+
+import os
+from typing import Callable, Sequence, cast
+
+
+def process_cpu_count() -> int:
+    """Best-effort process-scoped CPU count across Python and OS variants."""
+
+    process_cpu_count = cast(
+        Callable[[], int | None] | None, getattr(os, "process_cpu_count", None)
+    )
+    if callable(process_cpu_count):
+        return max(1, process_cpu_count() or 1)
+
+    sched_getaffinity = cast(
+        Callable[[int], Sequence[object]] | None,
+        getattr(os, "sched_getaffinity", None),
+    )
+    if callable(sched_getaffinity):
+        try:
+            return max(1, len(sched_getaffinity(0)))
+        except (OSError, TypeError):
+            pass
+
+    return max(1, os.cpu_count() or 1)
+
+
+def jobs_from_env(env_var: str) -> int | None:
+    """Read a positive worker count from `env_var`; unset or `auto` returns None."""
+
+    raw = os.environ.get(env_var, "").strip().lower()
+    if not raw or raw == "auto":
+        return None
+    try:
+        parsed = int(raw)
+    except ValueError:
+        raise ValueError(f"{env_var} must be a positive integer or 'auto'") from None
+    if parsed <= 0:
+        raise ValueError(f"{env_var} must be a positive integer or 'auto'")
+    return parsed
+
+
+def resolve_worker_count(
+    task_count: int,
+    *,
+    requested: int | None,
+    cap: int,
+    min_tasks_per_worker: int,
+) -> int:
+    """Clamp a requested worker count, or pick one automatically when `requested` is None.
+
+    Explicit requests are only limited by CPU and task count. The automatic choice is also
+    capped at `cap` and keeps at least `min_tasks_per_worker` tasks per worker.
+    """
+
+    cpu = process_cpu_count()
+    explicit = requested is not None
+    if requested is None:
+        requested = min(cpu, cap)
+
+    workers = max(1, min(requested, cpu, task_count))
+    if not explicit:
+        workers = min(workers, max(1, task_count // min_tasks_per_worker))
+
+    return max(1, workers)
+
+
+__all__ = ["jobs_from_env", "process_cpu_count", "resolve_worker_count"]
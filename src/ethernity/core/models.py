@@ -25,6 +25,11 @@ class SigningSeedMode(str, Enum):
     SHARDED = "sharded"
 
 
+class KeyMode(str, Enum):
+    PASSPHRASE = "passphrase"
+    X25519 = "x25519"
+
+
 @dataclass(frozen=True)
 class ShardingConfig:
     threshold: int
@@ -38,3 +43,4 @@ class DocumentPlan:
     signing_seed_mode: SigningSeedMode = SigningSeedMode.EMBEDDED
     sharding: ShardingConfig | None = None
     signing_seed_sharding: ShardingConfig | None = None
+    key_mode: KeyMode = KeyMode.PASSPHRASE
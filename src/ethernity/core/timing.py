@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+"""Opt-in timing spans: wall time, CPU time and peak RSS for named pipeline sections."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import time
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Any
+
+
+def _optional_import(name: str) -> Any | None:
+    try:
+        return importlib.import_module(name)
+    except ModuleNotFoundError:
+        return None
+
+
+resource = _optional_import("resource")
+
+
+@dataclass(frozen=True)
+class SpanRecord:
+    """Measurements for one finished span.
+
+    `cpu_seconds` is process CPU time, so it includes worker threads but not child
+    processes such as Chromium. `peak_rss_bytes` is the process high-water mark at the end
+    of the span, or None where the platform does not report it.
+    """
+
+    name: str
+    parent: str | None
+    wall_seconds: float
+    cpu_seconds: float
+    peak_rss_bytes: int | None
+    counts: dict[str, int] = field(default_factory=dict)
+    ok: bool = True
+
+
+TimingListener = Callable[[SpanRecord], None]
+
+_LISTENER: ContextVar[TimingListener | None] = ContextVar("timing_listener", default=None)
+_CURRENT_SPAN: ContextVar[str | None] = ContextVar("timing_current_span", default=None)
+
+
+def peak_rss_bytes() -> int | None:
+    """Return the process peak resident set size in bytes when available."""
+
+    if resource is None:
+        return None
+    peak = int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+    # Linux reports kilobytes, macOS reports bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class _NullSpan:
+    """Shared no-op span returned while timing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> _NullSpan:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        return None
+
+    def count(self, key: str, value: int) -> None:
+        return None
+
+    def add(self, key: str, amount: int = 1) -> None:
+        return None
+
+
+class _TimingSpan:
+    """Measure one section and report it to the listener active when it was opened."""
+
+    __slots__ = (
+        "_counts",
+        "_cpu_start",
+        "_listener",
+        "_name",
+        "_parent",
+        "_token",
+        "_wall_start",
+    )
+
+    def __init__(self, name: str, listener: TimingListener, counts: dict[str, int]) -> None:
+        self._name = name
+        self._listener = listener
+        self._counts = counts
+        self._parent: str | None = None
+        self._token: Token[str | None] | None = None
+        self._wall_start = 0.0
+        self._cpu_start = 0.0
+
+    def __enter__(self) -> _TimingSpan:
+        self._parent = _CURRENT_SPAN.get()
+        self._token = _CURRENT_SPAN.set(self._name)
+        self._cpu_start = time.process_time()
+        self._wall_start = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        wall_seconds = time.perf_counter() - self._wall_start
+        cpu_seconds = time.process_time() - self._cpu_start
+        if self._token is not None:
+            _CURRENT_SPAN.reset(self._token)
+            self._token = None
+        self._listener(
+            SpanRecord(
+                name=self._name,
+                parent=self._parent,
+                wall_seconds=wall_seconds,
+                cpu_seconds=cpu_seconds,
+                peak_rss_bytes=peak_rss_bytes(),
+                counts=dict(self._counts),
+                ok=exc_type is None,
+            )
+        )
+
+    def count(self, key: str, value: int) -> None:
+        """Set an item count reported with the span."""
+
+        self._counts[key] = value
+
+    def add(self, key: str, amount: int = 1) -> None:
+        """Increase an item count reported with the span."""
+
+        self._counts[key] = self._counts.get(key, 0) + amount
+
+
+_NULL_SPAN = _NullSpan()
+
+Span = _NullSpan | _TimingSpan
+
+
+def span(name: str, **counts: int) -> Span:
+    """Return a context manager that times `name` when a timing listener is active.
+
+    With no listener this returns a shared no-op object, so instrumented code pays one
+    context-variable lookup per span.
+    """
+
+    listener = _LISTENER.get()
+    if listener is None:
+        return _NULL_SPAN
+    return _TimingSpan(name, listener, counts)
+
+
+def timing_enabled() -> bool:
+    return _LISTENER.get() is not None
+
+
+@contextmanager
+def timing_listener(listener: TimingListener | None) -> Generator[None, None, None]:
+    """Route spans finished in this context to `listener`; None leaves timing unchanged."""
+
+    if listener is None:
+        yield
+        return
+    token = _LISTENER.set(listener)
+    try:
+        yield
+    finally:
+        _LISTENER.reset(token)
+
+
+__all__ = [
+    "Span",
+    "SpanRecord",
+    "TimingListener",
+    "peak_rss_bytes",
+    "span",
+    "timing_enabled",
+    "timing_listener",
+]
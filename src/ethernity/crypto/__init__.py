@@ -13,7 +13,21 @@
 # You should have received a copy of the GNU General Public License along with this program.
 # If not, see <https://www.gnu.org/licenses/>.
 
-from ethernity.crypto.age_runtime import AgeError, decrypt_bytes, encrypt_bytes_with_passphrase
+from ethernity.crypto.age_runtime import (
+    AGE_IDENTITY_PREFIX,
+    AgeError,
+    decrypt_bytes,
+    encrypt_bytes_with_identity,
+    encrypt_bytes_with_passphrase,
+    generate_age_identity,
+    is_age_identity,
+    is_x25519_ciphertext,
+)
+from ethernity.crypto.envelope_cache import (
+    DecryptedEnvelopeCache,
+    active_envelope_cache,
+    envelope_cache_session,
+)
 from ethernity.crypto.passphrases import (
     DEFAULT_PASSPHRASE_WORDS,
     MNEMONIC_WORD_COUNTS,
@@ -21,10 +35,18 @@ from ethernity.crypto.passphrases import (
 )
 
 __all__ = [
+    "AGE_IDENTITY_PREFIX",
     "AgeError",
     "DEFAULT_PASSPHRASE_WORDS",
+    "DecryptedEnvelopeCache",
     "MNEMONIC_WORD_COUNTS",
+    "active_envelope_cache",
     "decrypt_bytes",
+    "encrypt_bytes_with_identity",
     "encrypt_bytes_with_passphrase",
+    "envelope_cache_session",
+    "generate_age_identity",
     "generate_passphrase",
+    "is_age_identity",
+    "is_x25519_ciphertext",
 ]
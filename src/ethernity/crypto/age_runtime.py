@@ -21,10 +21,14 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 import pyrage
-from pyrage import passphrase as pyrage_passphrase
+from pyrage import passphrase as pyrage_passphrase, x25519 as pyrage_x25519
 
+from ethernity.crypto.envelope_cache import active_envelope_cache
 from ethernity.crypto.passphrases import DEFAULT_PASSPHRASE_WORDS, generate_passphrase
 
+AGE_IDENTITY_PREFIX = "AGE-SECRET-KEY-1"
+_X25519_STANZA_PREFIX = b"-> X25519 "
+
 
 @dataclass
 class AgeError(RuntimeError):
@@ -65,6 +69,82 @@ def _decrypt_with_pyrage(data: bytes, passphrase: str) -> bytes:
         raise _wrap_pyrage_error(exc) from exc
 
 
+def _x25519_identity(identity: str) -> pyrage_x25519.Identity:
+    try:
+        return pyrage_x25519.Identity.from_str(normalize_age_identity(identity))
+    except pyrage.IdentityError as exc:
+        raise _wrap_pyrage_error(exc) from exc
+
+
+def _encrypt_with_pyrage_x25519(data: bytes, identity: str) -> bytes:
+    """Encrypt bytes to the X25519 recipient of `identity`."""
+
+    recipient = _x25519_identity(identity).to_public()
+    try:
+        return pyrage.encrypt(data, [recipient])
+    except (ValueError, TypeError, RuntimeError, OSError, pyrage.EncryptError) as exc:
+        raise _wrap_pyrage_error(exc) from exc
+
+
+def _decrypt_with_pyrage_x25519(data: bytes, identity: str) -> bytes:
+    """Decrypt bytes with an X25519 identity."""
+
+    parsed = _x25519_identity(identity)
+    try:
+        return pyrage.decrypt(data, [parsed])
+    except (ValueError, TypeError, RuntimeError, OSError, pyrage.DecryptError) as exc:
+        raise _wrap_pyrage_error(exc) from exc
+
+
+def normalize_age_identity(identity: str) -> str:
+    """Return `identity` without whitespace and in the canonical upper-case Bech32 form.
+
+    Printed identities are wrapped across lines, so transcribed copies may contain spaces.
+    """
+
+    return "".join(identity.split()).upper()
+
+
+def is_age_identity(secret: str) -> bool:
+    """Return whether `secret` looks like an age X25519 identity rather than a passphrase."""
+
+    return normalize_age_identity(secret).startswith(AGE_IDENTITY_PREFIX)
+
+
+def generate_age_identity() -> str:
+    """Generate a new age X25519 identity string."""
+
+    return str(pyrage_x25519.Identity.generate())
+
+
+def is_x25519_ciphertext(data: bytes) -> bool:
+    """Return whether age ciphertext `data` was encrypted to an X25519 recipient."""
+
+    lines = data[:256].split(b"\n", 2)
+    return len(lines) > 1 and lines[1].startswith(_X25519_STANZA_PREFIX)
+
+
+def encrypt_bytes_with_identity(
+    data: bytes,
+    *,
+    identity: str | None = None,
+) -> tuple[bytes, str]:
+    """Encrypt bytes to an X25519 identity, generating one when it is not provided.
+
+    Public-key encryption skips the scrypt work factor, so encrypting and decrypting run at
+    I/O speed. The identity is the secret needed for recovery and is returned for printing
+    or sharding like a passphrase.
+    """
+
+    if identity is None:
+        identity = generate_age_identity()
+    elif not is_age_identity(identity):
+        raise ValueError(f"age identity must start with {AGE_IDENTITY_PREFIX}")
+    identity = normalize_age_identity(identity)
+    ciphertext = _encrypt_with_pyrage_x25519(data, identity)
+    return ciphertext, identity
+
+
 def encrypt_bytes_with_passphrase(
     data: bytes,
     *,
@@ -86,11 +166,27 @@ def decrypt_bytes(
     passphrase: str,
     debug: bool = False,
 ) -> bytes:
-    """Decrypt bytes and hide backend details unless debug mode is enabled."""
-
+    """Decrypt bytes and hide backend details unless debug mode is enabled.
+
+    Ciphertext encrypted to an X25519 recipient is decrypted with `passphrase` as the age
+    identity. Inside an `envelope_cache_session`, a document already decrypted with the same
+    passphrase is served from the cache instead of running scrypt again.
+    """
+
+    cache = active_envelope_cache()
+    if cache is not None:
+        cached = cache.get(data, passphrase=passphrase)
+        if cached is not None:
+            return cached
     try:
-        return _decrypt_with_pyrage(data, passphrase)
+        if is_x25519_ciphertext(data):
+            plaintext = _decrypt_with_pyrage_x25519(data, passphrase)
+        else:
+            plaintext = _decrypt_with_pyrage(data, passphrase)
     except AgeError:
         if debug:
             raise
         raise ValueError("decryption failed") from None
+    if cache is not None:
+        cache.put(data, passphrase=passphrase, plaintext=plaintext)
+    return plaintext
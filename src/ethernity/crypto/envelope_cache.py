@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+"""Short-lived in-process cache of decrypted envelopes, keyed by ciphertext hash."""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+DEFAULT_ENVELOPE_CACHE_TTL_SECONDS = 300.0
+DEFAULT_ENVELOPE_CACHE_MAX_ENTRIES = 4
+
+
+@dataclass
+class _CacheEntry:
+    passphrase_tag: bytes
+    plaintext: bytearray
+    expires_at: float
+
+
+def _zeroize(buffer: bytearray) -> None:
+    buffer[:] = bytes(len(buffer))
+
+
+class DecryptedEnvelopeCache:
+    """Decrypted envelope plaintexts keyed by the BLAKE2b-256 hash of their ciphertext.
+
+    Entries also record a keyed digest of the passphrase that unlocked them, so a lookup with
+    a different passphrase misses instead of bypassing authentication. Plaintexts are held in
+    mutable buffers and overwritten with zeros when they expire, are evicted, or the cache is
+    cleared; `get` hands out copies. The passphrase key is random per cache instance and never
+    leaves the process.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = DEFAULT_ENVELOPE_CACHE_TTL_SECONDS,
+        max_entries: int = DEFAULT_ENVELOPE_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl_seconds <= 0:
+            raise ValueError("envelope cache ttl must be positive")
+        if max_entries <= 0:
+            raise ValueError("envelope cache max entries must be positive")
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._tag_key = secrets.token_bytes(32)
+        self._entries: OrderedDict[bytes, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._expire_locked()
+            return len(self._entries)
+
+    def get(self, ciphertext: bytes, *, passphrase: str) -> bytes | None:
+        """Return the cached plaintext for `ciphertext` unlocked with `passphrase`, or None."""
+
+        doc_hash = _doc_hash(ciphertext)
+        tag = self._passphrase_tag(passphrase)
+        with self._lock:
+            self._expire_locked()
+            entry = self._entries.get(doc_hash)
+            if entry is None or not hmac.compare_digest(entry.passphrase_tag, tag):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(doc_hash)
+            self.hits += 1
+            return bytes(entry.plaintext)
+
+    def put(self, ciphertext: bytes, *, passphrase: str, plaintext: bytes) -> None:
+        """Cache `plaintext` for `ciphertext`, replacing and zeroizing any previous entry."""
+
+        doc_hash = _doc_hash(ciphertext)
+        entry = _CacheEntry(
+            passphrase_tag=self._passphrase_tag(passphrase),
+            plaintext=bytearray(plaintext),
+            expires_at=self._clock() + self.ttl_seconds,
+        )
+        with self._lock:
+            self._expire_locked()
+            previous = self._entries.pop(doc_hash, None)
+            if previous is not None:
+                _zeroize(previous.plaintext)
+            self._entries[doc_hash] = entry
+            while len(self._entries) > self.max_entries:
+                _doc, evicted = self._entries.popitem(last=False)
+                _zeroize(evicted.plaintext)
+
+    def clear(self) -> None:
+        """Drop every entry, overwriting cached plaintexts with zeros."""
+
+        with self._lock:
+            for entry in self._entries.values():
+                _zeroize(entry.plaintext)
+            self._entries.clear()
+
+    def _expire_locked(self) -> None:
+        now = self._clock()
+        expired = [doc for doc, entry in self._entries.items() if entry.expires_at <= now]
+        for doc in expired:
+            _zeroize(self._entries.pop(doc).plaintext)
+
+    def _passphrase_tag(self, passphrase: str) -> bytes:
+        return hashlib.blake2b(
+            passphrase.encode("utf-8"), key=self._tag_key, digest_size=32
+        ).digest()
+
+
+def _doc_hash(ciphertext: bytes) -> bytes:
+    return hashlib.blake2b(ciphertext, digest_size=32).digest()
+
+
+_ENVELOPE_CACHE: ContextVar[DecryptedEnvelopeCache | None] = ContextVar(
+    "envelope_cache", default=None
+)
+
+
+@contextmanager
+def envelope_cache_session(
+    *,
+    ttl_seconds: float = DEFAULT_ENVELOPE_CACHE_TTL_SECONDS,
+) -> Generator[DecryptedEnvelopeCache, None, None]:
+    """Cache decrypted envelopes for this context so each document is decrypted once.
+
+    Nested sessions share the outermost cache. When the outermost session ends, every cached
+    plaintext is zeroized.
+    """
+
+    active = _ENVELOPE_CACHE.get()
+    if active is not None:
+        yield active
+        return
+    cache = DecryptedEnvelopeCache(ttl_seconds=ttl_seconds)
+    token = _ENVELOPE_CACHE.set(cache)
+    try:
+        yield cache
+    finally:
+        _ENVELOPE_CACHE.reset(token)
+        cache.clear()
+
+
+def active_envelope_cache() -> DecryptedEnvelopeCache | None:
+    """Return the cache of the active `envelope_cache_session`, if any."""
+
+    return _ENVELOPE_CACHE.get()
+
+
+__all__ = [
+    "DEFAULT_ENVELOPE_CACHE_MAX_ENTRIES",
+    "DEFAULT_ENVELOPE_CACHE_TTL_SECONDS",
+    "DecryptedEnvelopeCache",
+    "active_envelope_cache",
+    "envelope_cache_session",
+]
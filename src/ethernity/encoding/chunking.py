@@ -18,13 +18,82 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Iterable, Sequence
 
-from ethernity.core.bounds import MAX_CIPHERTEXT_BYTES, MAX_MAIN_FRAME_TOTAL
-from ethernity.encoding.framing import DOC_ID_LEN, VERSION, Frame, FrameType, decode_frame
+from ethernity.core.bounds import (
+    MAX_CIPHERTEXT_BYTES,
+    MAX_MAIN_FRAME_TOTAL,
+    MAX_PARITY_FRAME_TOTAL,
+)
+from ethernity.encoding.erasure import MAX_ERASURE_SHARDS, encode_parity, recover_chunks
+from ethernity.encoding.framing import (
+    DOC_ID_LEN,
+    PARITY_VERSION,
+    VERSION,
+    Frame,
+    FrameType,
+    decode_frame,
+)
+from ethernity.encoding.varint import decode_uvarint, encode_uvarint
 from ethernity.encoding.zbase32 import decode_fallback_lines as _decode_fallback_lines
 
 DEFAULT_CHUNK_SIZE = 1024
+MAX_PARITY_PERCENT = 100
+# Upper bound on how much longer an encoded PARITY frame is than the longest MAIN frame it
+# protects: the data_total/payload_len header plus wider index/total varints.
+PARITY_FRAME_OVERHEAD_BYTES = (
+    len(encode_uvarint(MAX_MAIN_FRAME_TOTAL))
+    + len(encode_uvarint(MAX_CIPHERTEXT_BYTES))
+    + 2 * len(encode_uvarint(MAX_PARITY_FRAME_TOTAL))
+)
+
+
+@dataclass(frozen=True)
+class ParityData:
+    """Decoded PARITY frame data: the MAIN layout it protects and one parity row."""
+
+    data_total: int
+    payload_len: int
+    parity: bytes
+
+
+def encode_parity_data(data: ParityData) -> bytes:
+    """Encode PARITY frame data as `uvarint(data_total) uvarint(payload_len) parity`."""
+
+    return encode_uvarint(data.data_total) + encode_uvarint(data.payload_len) + data.parity
+
+
+def decode_parity_data(data: bytes) -> ParityData:
+    """Decode PARITY frame data and check the parity row length against the MAIN layout."""
+
+    data_total, idx = decode_uvarint(data, 0)
+    payload_len, idx = decode_uvarint(data, idx)
+    if data_total <= 0 or data_total > MAX_MAIN_FRAME_TOTAL:
+        raise ValueError(f"PARITY data_total out of range: {data_total}")
+    if payload_len < data_total or payload_len > MAX_CIPHERTEXT_BYTES:
+        raise ValueError(f"PARITY payload_len out of range: {payload_len}")
+    parity = data[idx:]
+    if len(parity) != _chunk_len(payload_len, data_total):
+        raise ValueError("PARITY row length does not match the MAIN frame layout")
+    return ParityData(data_total=data_total, payload_len=payload_len, parity=parity)
+
+
+def parity_frame_total(data_total: int, parity_percent: int) -> int:
+    """Return how many PARITY frames cover `parity_percent`% of `data_total` MAIN frames."""
+
+    if isinstance(parity_percent, bool) or not isinstance(parity_percent, int):
+        raise ValueError("parity percent must be an int")
+    if not 0 <= parity_percent <= MAX_PARITY_PERCENT:
+        raise ValueError(f"parity percent must be between 0 and {MAX_PARITY_PERCENT}")
+    parity_total = -(-data_total * parity_percent // 100)
+    if parity_total and data_total + parity_total > MAX_ERASURE_SHARDS:
+        raise ValueError(
+            f"parity frames support at most {MAX_ERASURE_SHARDS} MAIN and PARITY frames "
+            f"combined ({data_total} MAIN + {parity_total} PARITY); use a larger chunk size "
+            "or a lower parity percent"
+        )
+    return parity_total
 
 
 def chunk_payload(
@@ -34,8 +103,13 @@ def chunk_payload(
     frame_type: int,
     chunk_size: int = DEFAULT_CHUNK_SIZE,
     version: int = VERSION,
+    parity_percent: int = 0,
 ) -> list[Frame]:
-    """Split a payload into frames while enforcing frame-type constraints."""
+    """Split a payload into frames while enforcing frame-type constraints.
+
+    With a non-zero `parity_percent`, MAIN_DOCUMENT payloads are followed by that share
+    (rounded up) of PARITY frames, so recovery tolerates as many missing MAIN frames.
+    """
 
     if not payload:
         raise ValueError("payload cannot be empty")
@@ -60,8 +134,7 @@ def chunk_payload(
     offset = 0
     for idx in range(total):
         size = base_size + (1 if idx < remainder else 0)
-        start = offset
-        end = start + size
+        end = offset + size
         frames.append(
             Frame(
                 version=version,
@@ -69,41 +142,94 @@ def chunk_payload(
                 doc_id=doc_id,
                 index=idx,
                 total=total,
-                data=payload[start:end],
+                data=payload[offset:end],
             )
         )
         offset = end
+    if parity_percent:
+        if int(frame_type) != int(FrameType.MAIN_DOCUMENT):
+            raise ValueError("parity frames are only defined for MAIN_DOCUMENT payloads")
+        frames.extend(
+            parity_frames(frames, parity_total=parity_frame_total(len(frames), parity_percent))
+        )
     return frames
 
 
+def parity_frames(frames: Sequence[Frame], *, parity_total: int) -> list[Frame]:
+    """Build PARITY frames for a complete, ordered MAIN_DOCUMENT frame set."""
+
+    if parity_total <= 0:
+        return []
+    data_total = len(frames)
+    payload_len = sum(len(frame.data) for frame in frames)
+    chunk_len = _chunk_len(payload_len, data_total)
+    rows = encode_parity([frame.data.ljust(chunk_len, b"\0") for frame in frames], parity_total)
+    return [
+        Frame(
+            version=PARITY_VERSION,
+            frame_type=FrameType.PARITY,
+            doc_id=frames[0].doc_id,
+            index=row,
+            total=parity_total,
+            data=encode_parity_data(
+                ParityData(data_total=data_total, payload_len=payload_len, parity=parity)
+            ),
+        )
+        for row, parity in enumerate(rows)
+    ]
+
+
+def _chunk_len(payload_len: int, total: int) -> int:
+    # `chunk_payload` hands the remainder out one byte at a time, so the first chunk is
+    # the longest and the others are zero-padded to it for erasure coding.
+    return -(-payload_len // total)
+
+
 def reassemble_payload(
     frames: Sequence[Frame],
     *,
     expected_doc_id: bytes | None = None,
     expected_frame_type: int | None = None,
 ) -> bytes:
-    """Reassemble MAIN_DOCUMENT frames into a single payload with consistency checks."""
+    """Reassemble MAIN_DOCUMENT frames into a single payload with consistency checks.
+
+    PARITY frames for the same document may be mixed in; they are used to rebuild
+    missing MAIN frames when too few of those are present.
+    """
 
     if not frames:
         raise ValueError("no frames provided")
 
+    parity = [frame for frame in frames if int(frame.frame_type) == int(FrameType.PARITY)]
+    main = [frame for frame in frames if int(frame.frame_type) != int(FrameType.PARITY)]
+    reference = main[0] if main else parity[0]
     if expected_doc_id is not None:
         doc_id = expected_doc_id
     else:
-        doc_id = frames[0].doc_id
-    frame_type = expected_frame_type if expected_frame_type is not None else frames[0].frame_type
+        doc_id = reference.doc_id
+    if expected_frame_type is not None:
+        frame_type = expected_frame_type
+    else:
+        frame_type = main[0].frame_type if main else FrameType.MAIN_DOCUMENT
     if int(frame_type) != int(FrameType.MAIN_DOCUMENT):
         raise ValueError("reassembly is only defined for MAIN_DOCUMENT frames")
-    total = frames[0].total
-    version = frames[0].version
 
     if len(doc_id) != DOC_ID_LEN:
         raise ValueError(f"doc_id must be {DOC_ID_LEN} bytes")
+    parity_set = _collect_parity(parity, doc_id=doc_id)
+    if main:
+        total = main[0].total
+        version = main[0].version
+    elif parity_set is not None:
+        total = parity_set.data_total
+        version = VERSION
+    else:
+        raise ValueError("no frames provided")
     if total <= 0:
         raise ValueError("total must be positive")
 
     seen: dict[int, Frame] = {}
-    for frame in frames:
+    for frame in main:
         if frame.doc_id != doc_id:
             raise ValueError("mismatched doc_id")
         if frame.frame_type != frame_type:
@@ -123,10 +249,13 @@ def reassemble_payload(
             continue
         seen[frame.index] = frame
 
-    if len(seen) != total:
-        raise ValueError("missing frames")
+    chunks = {index: frame.data for index, frame in seen.items()}
+    if len(chunks) != total:
+        if parity_set is None:
+            raise ValueError("missing frames")
+        chunks.update(_recover_missing_chunks(chunks, parity_set, total=total))
 
-    payload = b"".join(seen[idx].data for idx in range(total))
+    payload = b"".join(chunks[idx] for idx in range(total))
     if len(payload) > MAX_CIPHERTEXT_BYTES:
         raise ValueError(
             f"reassembled payload exceeds MAX_CIPHERTEXT_BYTES ({MAX_CIPHERTEXT_BYTES}): "
@@ -135,6 +264,77 @@ def reassemble_payload(
     return payload
 
 
+@dataclass(frozen=True)
+class _ParitySet:
+    data_total: int
+    payload_len: int
+    parity_total: int
+    rows: dict[int, bytes]
+
+
+def _collect_parity(frames: Sequence[Frame], *, doc_id: bytes) -> _ParitySet | None:
+    if not frames:
+        return None
+    first = decode_parity_data(frames[0].data)
+    layout = (first.data_total, first.payload_len, frames[0].total)
+    rows: dict[int, bytes] = {}
+    for frame in frames:
+        if frame.doc_id != doc_id:
+            raise ValueError("mismatched doc_id")
+        if frame.version != PARITY_VERSION:
+            raise ValueError("mismatched version")
+        if not 0 <= frame.index < frame.total:
+            raise ValueError("index must be < total")
+        data = decode_parity_data(frame.data)
+        if (data.data_total, data.payload_len, frame.total) != layout:
+            raise ValueError("mismatched parity frames")
+        existing = rows.get(frame.index)
+        if existing is not None and existing != data.parity:
+            raise ValueError("conflicting duplicate frames detected")
+        rows[frame.index] = data.parity
+    data_total, payload_len, parity_total = layout
+    return _ParitySet(
+        data_total=data_total,
+        payload_len=payload_len,
+        parity_total=parity_total,
+        rows=rows,
+    )
+
+
+def _recover_missing_chunks(
+    chunks: dict[int, bytes],
+    parity: _ParitySet,
+    *,
+    total: int,
+) -> dict[int, bytes]:
+    if parity.data_total != total:
+        raise ValueError("mismatched parity frames")
+    missing = total - len(chunks)
+    if missing > len(parity.rows):
+        raise ValueError(
+            f"missing frames: {missing} MAIN frame(s) missing and only "
+            f"{len(parity.rows)} PARITY frame(s) available"
+        )
+    base_size, remainder = divmod(parity.payload_len, total)
+    chunk_len = _chunk_len(parity.payload_len, total)
+    padded: dict[int, bytes] = {}
+    for index, data in chunks.items():
+        if len(data) != base_size + (1 if index < remainder else 0):
+            raise ValueError("MAIN frame length does not match the PARITY frame layout")
+        padded[index] = data.ljust(chunk_len, b"\0")
+    recovered = recover_chunks(
+        padded,
+        parity.rows,
+        data_total=total,
+        parity_total=parity.parity_total,
+        chunk_len=chunk_len,
+    )
+    return {
+        index: chunk[: base_size + (1 if index < remainder else 0)]
+        for index, chunk in recovered.items()
+    }
+
+
 def fallback_lines_to_frame(lines: Iterable[str]) -> Frame:
     """Decode fallback text lines into a single frame."""
 
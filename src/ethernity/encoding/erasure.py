@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+"""Systematic Reed-Solomon erasure coding over GF(256) for equal-length chunks.
+
+Parity row `j` of a code with `data_total` data chunks is the column-wise sum of
+`coefficient(j, i) * chunk[i]`, where the coefficients form a Cauchy matrix
+`1 / ((data_total + j) ^ i)`. Every square submatrix of a Cauchy matrix is invertible, so
+any `data_total` of the `data_total + parity_total` chunks recover the rest.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+
+# The code is defined over the 256 field elements; data and parity rows share that space.
+MAX_ERASURE_SHARDS = 256
+
+_GF_POLY = 0x11D
+_GF_EXP = [0] * 512
+_GF_LOG = [0] * 256
+
+
+def _init_tables() -> None:
+    value = 1
+    for power in range(255):
+        _GF_EXP[power] = value
+        _GF_LOG[value] = power
+        value <<= 1
+        if value & 0x100:
+            value ^= _GF_POLY
+    for power in range(255, 512):
+        _GF_EXP[power] = _GF_EXP[power - 255]
+
+
+_init_tables()
+
+
+def _gf_mul(left: int, right: int) -> int:
+    if left == 0 or right == 0:
+        return 0
+    return _GF_EXP[_GF_LOG[left] + _GF_LOG[right]]
+
+
+def _gf_inv(value: int) -> int:
+    if value == 0:
+        raise ZeroDivisionError("zero has no inverse in GF(256)")
+    return _GF_EXP[255 - _GF_LOG[value]]
+
+
+@lru_cache(maxsize=256)
+def _mul_table(coefficient: int) -> bytes:
+    # A 256-byte translate table scales a whole chunk by `coefficient` in one C-level pass.
+    return bytes(_gf_mul(coefficient, value) for value in range(256))
+
+
+def parity_coefficient(row: int, index: int, data_total: int) -> int:
+    """Return the Cauchy coefficient applied to data chunk `index` in parity row `row`."""
+
+    return _gf_inv((data_total + row) ^ index)
+
+
+def _validate_shape(data_total: int, parity_total: int) -> None:
+    if data_total <= 0:
+        raise ValueError("data_total must be positive")
+    if parity_total < 0:
+        raise ValueError("parity_total must be non-negative")
+    if data_total + parity_total > MAX_ERASURE_SHARDS:
+        raise ValueError(
+            f"erasure coding supports at most {MAX_ERASURE_SHARDS} data and parity chunks "
+            f"combined: {data_total} + {parity_total}"
+        )
+
+
+def _weighted_sum(terms: Sequence[tuple[int, bytes]], *, initial: int = 0) -> int:
+    # Chunks are summed as big integers so each XOR is a single C-level operation.
+    acc = initial
+    for coefficient, chunk in terms:
+        if coefficient == 0:
+            continue
+        scaled = chunk if coefficient == 1 else chunk.translate(_mul_table(coefficient))
+        acc ^= int.from_bytes(scaled, "big")
+    return acc
+
+
+def encode_parity(chunks: Sequence[bytes], parity_total: int) -> list[bytes]:
+    """Return `parity_total` parity chunks for equal-length data `chunks`."""
+
+    data_total = len(chunks)
+    _validate_shape(data_total, parity_total)
+    chunk_len = len(chunks[0])
+    if any(len(chunk) != chunk_len for chunk in chunks):
+        raise ValueError("erasure-coded chunks must all have the same length")
+    parity: list[bytes] = []
+    for row in range(parity_total):
+        terms = [
+            (parity_coefficient(row, index, data_total), chunk)
+            for index, chunk in enumerate(chunks)
+        ]
+        parity.append(_weighted_sum(terms).to_bytes(chunk_len, "big"))
+    return parity
+
+
+def recover_chunks(
+    chunks: Mapping[int, bytes],
+    parity: Mapping[int, bytes],
+    *,
+    data_total: int,
+    parity_total: int,
+    chunk_len: int,
+) -> dict[int, bytes]:
+    """Rebuild the data chunks missing from `chunks` and return them by index.
+
+    `chunks` and `parity` map indices to equal-length chunks. At least as many parity
+    rows as missing data chunks must be present; extra parity rows are left unused.
+    """
+
+    _validate_shape(data_total, parity_total)
+    for mapping, bound in ((chunks, data_total), (parity, parity_total)):
+        for index, chunk in mapping.items():
+            if not 0 <= index < bound:
+                raise ValueError(f"chunk index out of range: {index}")
+            if len(chunk) != chunk_len:
+                raise ValueError("erasure-coded chunks must all have the same length")
+    missing = [index for index in range(data_total) if index not in chunks]
+    if not missing:
+        return {}
+    if len(missing) > len(parity):
+        raise ValueError(
+            f"cannot rebuild {len(missing)} missing chunk(s) from {len(parity)} parity chunk(s)"
+        )
+
+    rows = sorted(parity)[: len(missing)]
+    # Strip the known data chunks out of each parity row, leaving a square system in the
+    # missing chunks whose matrix is a Cauchy submatrix and therefore invertible.
+    syndromes = [
+        _weighted_sum(
+            [
+                (parity_coefficient(row, index, data_total), chunk)
+                for index, chunk in chunks.items()
+            ],
+            initial=int.from_bytes(parity[row], "big"),
+        ).to_bytes(chunk_len, "big")
+        for row in rows
+    ]
+    inverse = _invert_matrix(
+        [[parity_coefficient(row, index, data_total) for index in missing] for row in rows]
+    )
+    recovered: dict[int, bytes] = {}
+    for position, index in enumerate(missing):
+        terms = list(zip(inverse[position], syndromes))
+        recovered[index] = _weighted_sum(terms).to_bytes(chunk_len, "big")
+    return recovered
+
+
+def _invert_matrix(matrix: list[list[int]]) -> list[list[int]]:
+    size = len(matrix)
+    work = [
+        row[:] + [1 if col == idx else 0 for col in range(size)] for idx, row in enumerate(matrix)
+    ]
+    for col in range(size):
+        pivot = next((idx for idx in range(col, size) if work[idx][col]), None)
+        if pivot is None:
+            raise ValueError("erasure decoding matrix is singular")
+        work[col], work[pivot] = work[pivot], work[col]
+        scale = _gf_inv(work[col][col])
+        work[col] = [_gf_mul(scale, value) for value in work[col]]
+        for idx in range(size):
+            factor = work[idx][col]
+            if idx != col and factor:
+                work[idx] = [
+                    value ^ _gf_mul(factor, pivot_value)
+                    for value, pivot_value in zip(work[idx], work[col])
+                ]
+    return [row[size:] for row in work]
+
+
+__all__ = [
+    "MAX_ERASURE_SHARDS",
+    "encode_parity",
+    "parity_coefficient",
+    "recover_chunks",
+]
@@ -26,6 +26,8 @@ from ethernity.core.bounds import (
     MAX_AUTH_CBOR_BYTES,
     MAX_MAIN_FRAME_DATA_BYTES,
     MAX_MAIN_FRAME_TOTAL,
+    MAX_PARITY_FRAME_DATA_BYTES,
+    MAX_PARITY_FRAME_TOTAL,
     MAX_SHARD_CBOR_BYTES,
 )
 from ethernity.encoding.varint import (
@@ -35,6 +37,9 @@ from ethernity.encoding.varint import (
 
 MAGIC = b"AP"
 VERSION = 1
+# PARITY frames carry their own version so readers that only know VERSION reject them
+# as unsupported and keep going with the frames they do understand.
+PARITY_VERSION = 2
 DOC_ID_LEN = 8
 CRC_LEN = 4
 
@@ -45,6 +50,7 @@ class FrameType(IntEnum):
     MAIN_DOCUMENT = 0x44  # "D"
     KEY_DOCUMENT = 0x4B  # "K"
     AUTH = 0x41  # "A"
+    PARITY = 0x50  # "P"
 
 
 @dataclass(frozen=True)
@@ -91,7 +97,7 @@ def decode_frame(payload: bytes) -> Frame:
     idx += len(MAGIC)
 
     version, idx = _decode_uvarint(payload, idx)
-    if version != VERSION:
+    if version not in (VERSION, PARITY_VERSION):
         raise ValueError(f"unsupported frame version: {version}")
     if idx >= len(payload):
         raise ValueError("missing frame type")
@@ -140,7 +146,7 @@ def _validate_frame(frame: Frame) -> None:
 
     if isinstance(frame.version, bool) or not isinstance(frame.version, int):
         raise ValueError(f"unsupported frame version: {frame.version}")
-    if frame.version != VERSION:
+    if frame.version not in (VERSION, PARITY_VERSION):
         raise ValueError(f"unsupported frame version: {frame.version}")
 
     frame_type = int(frame.frame_type)
@@ -148,6 +154,9 @@ def _validate_frame(frame: Frame) -> None:
         frame_type_enum = FrameType(frame_type)
     except ValueError as exc:
         raise ValueError(f"unsupported frame type: {frame_type}") from exc
+    expected_version = PARITY_VERSION if frame_type_enum == FrameType.PARITY else VERSION
+    if frame.version != expected_version:
+        raise ValueError(f"unsupported frame version for {frame_type_enum.name}: {frame.version}")
 
     if isinstance(frame.total, bool) or not isinstance(frame.total, int) or frame.total <= 0:
         raise ValueError("total must be positive")
@@ -170,6 +179,17 @@ def _validate_frame(frame: Frame) -> None:
                 "MAIN_DOCUMENT data exceeds "
                 f"MAX_MAIN_FRAME_DATA_BYTES ({MAX_MAIN_FRAME_DATA_BYTES}): {data_len} bytes"
             )
+    elif frame_type_enum == FrameType.PARITY:
+        if frame.total > MAX_PARITY_FRAME_TOTAL:
+            raise ValueError(
+                f"PARITY total exceeds MAX_PARITY_FRAME_TOTAL ({MAX_PARITY_FRAME_TOTAL}): "
+                f"{frame.total}"
+            )
+        if data_len > MAX_PARITY_FRAME_DATA_BYTES:
+            raise ValueError(
+                "PARITY data exceeds "
+                f"MAX_PARITY_FRAME_DATA_BYTES ({MAX_PARITY_FRAME_DATA_BYTES}): {data_len} bytes"
+            )
     elif frame_type_enum == FrameType.AUTH:
         if frame.total != 1 or frame.index != 0:
             raise ValueError("AUTH payload must be a single-frame payload (index=0,total=1)")
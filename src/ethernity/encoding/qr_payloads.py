@@ -22,9 +22,19 @@ import base64
 import binascii
 from typing import Final, Literal
 
-QrPayloadCodec = Literal["raw", "base64"]
+QrPayloadCodec = Literal["raw", "base64", "base45"]
 QR_PAYLOAD_CODEC_RAW: Final[QrPayloadCodec] = "raw"
 QR_PAYLOAD_CODEC_BASE64: Final[QrPayloadCodec] = "base64"
+QR_PAYLOAD_CODEC_BASE45: Final[QrPayloadCodec] = "base45"
+QR_PAYLOAD_CODECS: Final[tuple[QrPayloadCodec, ...]] = (
+    QR_PAYLOAD_CODEC_RAW,
+    QR_PAYLOAD_CODEC_BASE64,
+    QR_PAYLOAD_CODEC_BASE45,
+)
+
+# RFC 9285 alphabet; it is exactly the QR alphanumeric-mode character set.
+BASE45_ALPHABET: Final = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ $%*+-./:"
+_BASE45_VALUES: Final = {char: value for value, char in enumerate(BASE45_ALPHABET)}
 
 
 def encode_qr_payload(
@@ -35,6 +45,8 @@ def encode_qr_payload(
     """Encode frame bytes for QR transport."""
     if codec == QR_PAYLOAD_CODEC_RAW:
         return data
+    if codec == QR_PAYLOAD_CODEC_BASE45:
+        return encode_base45(data)
     if codec != QR_PAYLOAD_CODEC_BASE64:
         raise ValueError(f"unsupported QR payload codec: {codec}")
     encoded = base64.b64encode(data).decode("ascii")
@@ -51,6 +63,8 @@ def decode_qr_payload(
         if isinstance(payload, bytes):
             return payload
         raise ValueError("invalid raw QR payload")
+    if codec == QR_PAYLOAD_CODEC_BASE45:
+        return _decode_base45_qr_payload(payload)
     if codec != QR_PAYLOAD_CODEC_BASE64:
         raise ValueError(f"unsupported QR payload codec: {codec}")
     return _decode_base64_qr_payload(payload)
@@ -84,10 +98,71 @@ def _pad_unpadded_base64(text: str) -> str:
     return text + ("=" * padding)
 
 
+def encode_base45(data: bytes) -> str:
+    """Encode bytes as RFC 9285 base45 text (3 chars per 2 bytes, 2 chars for a trailing byte)."""
+    alphabet = BASE45_ALPHABET
+    out: list[str] = []
+    append = out.append
+    even = len(data) - (len(data) % 2)
+    for offset in range(0, even, 2):
+        value = (data[offset] << 8) | data[offset + 1]
+        high, rest = divmod(value, 45 * 45)
+        middle, low = divmod(rest, 45)
+        append(alphabet[low] + alphabet[middle] + alphabet[high])
+    if even != len(data):
+        middle, low = divmod(data[-1], 45)
+        append(alphabet[low] + alphabet[middle])
+    return "".join(out)
+
+
+def decode_base45(text: str) -> bytes:
+    """Decode RFC 9285 base45 text, rejecting characters and groups outside the alphabet."""
+    if len(text) % 3 == 1:
+        raise ValueError("invalid base45 length")
+    values = _BASE45_VALUES
+    try:
+        digits = [values[char] for char in text]
+    except KeyError as exc:
+        raise ValueError("invalid base45 character") from exc
+    out = bytearray()
+    full = len(digits) - (len(digits) % 3)
+    for offset in range(0, full, 3):
+        value = digits[offset] + digits[offset + 1] * 45 + digits[offset + 2] * 45 * 45
+        if value > 0xFFFF:
+            raise ValueError("invalid base45 group")
+        out += value.to_bytes(2, "big")
+    if full != len(digits):
+        value = digits[full] + digits[full + 1] * 45
+        if value > 0xFF:
+            raise ValueError("invalid base45 group")
+        out.append(value)
+    return bytes(out)
+
+
+def _decode_base45_qr_payload(payload: bytes | str) -> bytes:
+    """Decode base45 QR payload text; spaces are alphabet characters, so nothing is stripped."""
+    if isinstance(payload, bytes):
+        try:
+            text = payload.decode("ascii")
+        except UnicodeDecodeError as exc:
+            raise ValueError("invalid base45 QR payload") from exc
+    else:
+        text = payload
+    try:
+        return decode_base45(text)
+    except ValueError as exc:
+        raise ValueError("invalid base45 QR payload") from exc
+
+
 __all__ = [
+    "BASE45_ALPHABET",
+    "QR_PAYLOAD_CODEC_BASE45",
     "QR_PAYLOAD_CODEC_BASE64",
     "QR_PAYLOAD_CODEC_RAW",
+    "QR_PAYLOAD_CODECS",
     "QrPayloadCodec",
+    "decode_base45",
     "decode_qr_payload",
+    "encode_base45",
     "encode_qr_payload",
 ]
@@ -18,11 +18,32 @@
 
 from __future__ import annotations
 
+import base64
 from typing import Iterable
 
 ZBASE32_ALPHABET = "ybndrfg8ejkmcpqxot1uwisza345h769"
 ZBASE32_LOOKUP = {ch: idx for idx, ch in enumerate(ZBASE32_ALPHABET)}
 
+# z-base-32 and RFC 4648 base32 share the bit layout (5 bits per character, MSB first) and
+# differ only in the alphabet, so both directions are a C-level base32 call plus a byte
+# translation instead of a Python loop per bit.
+_RFC4648_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ234567"
+_TO_ZBASE32 = bytes.maketrans(_RFC4648_ALPHABET, ZBASE32_ALPHABET.encode("ascii"))
+_INVALID_MARKER = ord("!")
+_FROM_ZBASE32 = bytes(
+    _RFC4648_ALPHABET[ZBASE32_LOOKUP[chr(byte).lower()]]
+    if chr(byte).lower() in ZBASE32_LOOKUP
+    else _INVALID_MARKER
+    for byte in range(256)
+)
+# ASCII characters for which str.isspace() is true, plus the hyphen used as a separator.
+_IGNORED = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f-"
+# Unused low bits in the final character, keyed by the length of the trailing partial group;
+# lengths 1, 3 and 6 cannot come from whole bytes and are never canonical.
+_TAIL_BITS = {0: 0, 2: 2, 4: 4, 5: 1, 7: 3}
+# Symbols buffered by ZBase32Decoder before whole groups are decoded; a multiple of 8.
+_DECODE_BATCH_SYMBOLS = 64 * 1024
+
 
 def decode_fallback_lines(lines: Iterable[str]) -> bytes:
     """Decode fallback text lines by concatenating and z-base-32 decoding."""
@@ -34,54 +55,87 @@ def decode_fallback_lines(lines: Iterable[str]) -> bytes:
 def encode_zbase32(data: bytes) -> str:
     """Encode bytes using z-base-32 without separators."""
 
-    if not data:
-        return ""
-    bits = 0
-    bit_count = 0
-    out_chars: list[str] = []
+    return base64.b32encode(data).rstrip(b"=").translate(_TO_ZBASE32).decode("ascii")
 
-    for byte in data:
-        bits = (bits << 8) | byte
-        bit_count += 8
-        while bit_count >= 5:
-            shift = bit_count - 5
-            index = (bits >> shift) & 0x1F
-            out_chars.append(ZBASE32_ALPHABET[index])
-            bit_count -= 5
-            bits &= (1 << bit_count) - 1
 
-    if bit_count:
-        index = (bits << (5 - bit_count)) & 0x1F
-        out_chars.append(ZBASE32_ALPHABET[index])
+def decode_zbase32(text: str) -> bytes:
+    """Decode z-base-32 text, ignoring whitespace and hyphens."""
 
-    return "".join(out_chars)
+    decoder = ZBase32Decoder()
+    decoder.feed(text)
+    return decoder.finish()
 
 
-def decode_zbase32(text: str) -> bytes:
-    """Decode z-base-32 text, ignoring whitespace and hyphens."""
+def count_zbase32_symbols(text: str) -> int | None:
+    """Return how many z-base-32 symbols `text` holds, or None if it has foreign characters.
+
+    Whitespace and hyphens are separators and are not counted.
+    """
+
+    try:
+        return len(_map_symbols(text))
+    except ValueError:
+        return None
+
+
+class ZBase32Decoder:
+    """Incremental z-base-32 decoder for text that arrives in pieces (for example, lines).
+
+    Whole 8-symbol groups are decoded in batches as they accumulate, so only a bounded tail
+    of undecoded symbols is buffered. `finish` checks the canonical tail and returns all
+    decoded bytes.
+    """
+
+    def __init__(self) -> None:
+        self._pending = bytearray()
+        self._decoded = bytearray()
+        self.symbol_count = 0
+
+    def feed(self, text: str) -> int:
+        """Add `text` and return the number of symbols it contained.
+
+        Raises ValueError, without consuming anything, if `text` has foreign characters.
+        """
+
+        mapped = _map_symbols(text)
+        self._pending += mapped
+        self.symbol_count += len(mapped)
+        if len(self._pending) >= _DECODE_BATCH_SYMBOLS:
+            whole = len(self._pending) - len(self._pending) % 8
+            self._decoded += base64.b32decode(bytes(self._pending[:whole]))
+            del self._pending[:whole]
+        return len(mapped)
+
+    def finish(self) -> bytes:
+        """Decode the buffered tail and return everything decoded so far."""
+
+        pending = bytes(self._pending)
+        tail_bits = _TAIL_BITS.get(len(pending) % 8)
+        if tail_bits is None:
+            raise ValueError("invalid z-base-32 text: non-canonical tail bits")
+        if tail_bits and _RFC4648_ALPHABET.index(pending[-1]) & ((1 << tail_bits) - 1):
+            raise ValueError("invalid z-base-32 text: non-canonical tail bits")
+        self._decoded += base64.b32decode(pending + b"=" * (-len(pending) % 8))
+        self._pending.clear()
+        return bytes(self._decoded)
+
+
+def _map_symbols(text: str) -> bytes:
+    # Strip separators and map onto the RFC 4648 alphabet in two C-level translate passes.
+    try:
+        raw = text.encode("ascii")
+    except UnicodeEncodeError:
+        raw = _ascii_or_raise("".join(text.split()))
+    compact = raw.translate(None, _IGNORED)
+    mapped = compact.translate(_FROM_ZBASE32)
+    invalid_at = mapped.find(_INVALID_MARKER)
+    if invalid_at >= 0:
+        raise ValueError(f"invalid z-base-32 character: {chr(compact[invalid_at])!r}")
+    return mapped
 
-    bits = 0
-    bit_count = 0
-    out = bytearray()
-    normalized_chars: list[str] = []
 
+def _ascii_or_raise(text: str) -> bytes:
     for char in text:
-        if char.isspace() or char == "-":
-            continue
-        normalized_char = char.lower()
-        value = ZBASE32_LOOKUP.get(normalized_char)
-        if value is None:
+        if not char.isascii():
             raise ValueError(f"invalid z-base-32 character: {char!r}")
-        normalized_chars.append(normalized_char)
-        bits = (bits << 5) | value
-        bit_count += 5
-        if bit_count >= 8:
-            shift = bit_count - 8
-            out.append((bits >> shift) & 0xFF)
-            bit_count -= 8
-            bits &= (1 << bit_count) - 1
-    decoded = bytes(out)
-    normalized = "".join(normalized_chars)
-    if encode_zbase32(decoded) != normalized:
-        raise ValueError("invalid z-base-32 text: non-canonical tail bits")
-    return decoded
+    return text.encode("ascii")
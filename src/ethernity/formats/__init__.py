@@ -17,17 +17,21 @@ from ethernity.formats.envelope_codec import (
     MAGIC as ENVELOPE_MAGIC,
     VERSION as ENVELOPE_VERSION,
     build_manifest_and_payload,
+    build_manifest_and_payload_parts,
     build_single_file_manifest,
     decode_envelope,
     decode_manifest,
     encode_envelope,
     encode_manifest,
     extract_payloads,
+    stream_extract_payloads,
 )
 from ethernity.formats.envelope_types import EnvelopeManifest, ManifestFile, PayloadPart
 from ethernity.formats.payload_codec import (
     decode_payload_from_manifest,
     encode_payload_for_manifest,
+    encode_payload_parts_for_manifest,
+    iter_decoded_payload,
 )
 
 __all__ = [
@@ -37,6 +41,7 @@ __all__ = [
     "ManifestFile",
     "PayloadPart",
     "build_manifest_and_payload",
+    "build_manifest_and_payload_parts",
     "build_single_file_manifest",
     "decode_envelope",
     "decode_manifest",
@@ -44,5 +49,8 @@ __all__ = [
     "encode_envelope",
     "encode_manifest",
     "encode_payload_for_manifest",
+    "encode_payload_parts_for_manifest",
     "extract_payloads",
+    "iter_decoded_payload",
+    "stream_extract_payloads",
 ]
@@ -21,7 +21,9 @@ from __future__ import annotations
 import hashlib
 import os
 import time
+from collections.abc import Callable, Iterator
 from pathlib import Path
+from typing import BinaryIO
 
 from ethernity.core.bounds import MAX_MANIFEST_CBOR_BYTES
 from ethernity.core.validation import normalize_manifest_path, normalize_path
@@ -37,7 +39,11 @@ from ethernity.formats.envelope_types import (
     ManifestFile,
     PayloadPart,
 )
-from ethernity.formats.payload_codec import decode_payload_from_manifest
+from ethernity.formats.payload_codec import (
+    PAYLOAD_STREAM_CHUNK_BYTES,
+    decode_payload_from_manifest,
+    iter_decoded_payload,
+)
 
 MAGIC = b"AY"
 VERSION = 1
@@ -78,6 +84,32 @@ def build_manifest_and_payload(
 ) -> tuple[EnvelopeManifest, bytes]:
     """Build a manifest and concatenated payload bytes from payload parts."""
 
+    manifest, chunks = build_manifest_and_payload_parts(
+        parts,
+        sealed=sealed,
+        created_at=created_at,
+        signing_seed=signing_seed,
+        input_origin=input_origin,
+        input_roots=input_roots,
+    )
+    return manifest, b"".join(chunks)
+
+
+def build_manifest_and_payload_parts(
+    parts: tuple[PayloadPart, ...] | list[PayloadPart],
+    *,
+    sealed: bool = False,
+    created_at: float | None = None,
+    signing_seed: bytes | None = None,
+    input_origin: str = "file",
+    input_roots: tuple[str, ...] | list[str] = (),
+) -> tuple[EnvelopeManifest, tuple[bytes, ...]]:
+    """Build a manifest and return part data in manifest order without concatenating it.
+
+    Joining the returned chunks yields the payload from `build_manifest_and_payload`; callers
+    that stream the payload (for example into a compressor) avoid holding a second copy.
+    """
+
     if not parts:
         raise ValueError("at least one payload part is required")
 
@@ -96,7 +128,7 @@ def build_manifest_and_payload(
 
     created = int(time.time()) if created_at is None else created_at
     files: list[ManifestFile] = []
-    payload = bytearray()
+    chunks: list[bytes] = []
     seen_paths: set[str] = set()
     normalized_parts: list[tuple[str, PayloadPart]] = []
     for part in parts:
@@ -108,7 +140,7 @@ def build_manifest_and_payload(
             raise ValueError(f"duplicate payload path: {path}")
         seen_paths.add(path)
         data = part.data
-        payload.extend(data)
+        chunks.append(data)
         files.append(
             ManifestFile(
                 path=path,
@@ -126,7 +158,7 @@ def build_manifest_and_payload(
         input_roots=tuple(input_roots),
         files=tuple(files),
     )
-    return manifest, bytes(payload)
+    return manifest, tuple(chunks)
 
 
 def encode_manifest(manifest: EnvelopeManifest) -> bytes:
@@ -229,6 +261,57 @@ def extract_payloads(
     return outputs
 
 
+def stream_extract_payloads(
+    manifest: EnvelopeManifest,
+    payload: bytes,
+    open_entry: Callable[[ManifestFile], BinaryIO],
+    *,
+    chunk_size: int = PAYLOAD_STREAM_CHUNK_BYTES,
+) -> None:
+    """Decode payload bytes straight into per-entry writers and verify entry hashes.
+
+    `open_entry` is called once per manifest entry, in order, and the returned handle is
+    closed when the entry is complete. Entry hashes are computed as bytes pass through, so
+    a mismatch raises after that entry was written but before the next one is opened;
+    callers are expected to write into a location they can discard on error.
+    """
+
+    reader = _ChunkReader(iter_decoded_payload(manifest, payload, chunk_size=chunk_size))
+    for entry in manifest.files:
+        digest = hashlib.sha256()
+        remaining = entry.size
+        with open_entry(entry) as handle:
+            while remaining:
+                data = reader.read(min(remaining, chunk_size))
+                if not data:
+                    raise ValueError("manifest file exceeds payload size")
+                digest.update(data)
+                handle.write(data)
+                remaining -= len(data)
+        if digest.digest() != entry.sha256:
+            raise ValueError(f"sha256 mismatch for {entry.path}")
+    if reader.read(1):
+        raise ValueError("payload length does not match manifest sizes")
+
+
+class _ChunkReader:
+    """Re-slice an iterator of byte chunks into reads of caller-chosen size."""
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+        self._buffer = memoryview(b"")
+
+    def read(self, size: int) -> memoryview:
+        while not self._buffer:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return self._buffer
+            self._buffer = memoryview(chunk)
+        data = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return data
+
+
 def _normalize_path(path: str | None) -> str:
     """Normalize a single-file input path for manifest use."""
 
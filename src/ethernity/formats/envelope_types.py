@@ -44,6 +44,8 @@ PATH_ENCODING_DIRECT = "direct"
 PATH_ENCODING_PREFIX_TABLE = "prefix_table"
 PAYLOAD_CODEC_RAW = "raw"
 PAYLOAD_CODEC_GZIP = "gzip"
+KEY_MODE_PASSPHRASE = "passphrase"
+KEY_MODE_X25519 = "x25519"
 
 
 def _require_manifest_created_at(value: object) -> float:
@@ -55,6 +57,13 @@ def _require_manifest_created_at(value: object) -> float:
     return created_at
 
 
+def _require_key_mode(value: object) -> str:
+    key_mode = require_str(value, label="manifest key_mode")
+    if key_mode not in {KEY_MODE_PASSPHRASE, KEY_MODE_X25519}:
+        raise ValueError("manifest key_mode must be one of: passphrase, x25519")
+    return key_mode
+
+
 @dataclass(frozen=True)
 class ManifestFile:
     """One file entry stored in the envelope manifest."""
@@ -95,6 +104,7 @@ class EnvelopeManifest:
     input_roots: tuple[str, ...] = ()
     payload_codec: str = PAYLOAD_CODEC_RAW
     payload_raw_len: int | None = None
+    key_mode: str = KEY_MODE_PASSPHRASE
 
     def to_cbor(self) -> dict[str, object]:
         """Build the canonical manifest CBOR map, selecting the shortest path encoding."""
@@ -154,6 +164,7 @@ class EnvelopeManifest:
                 )
             if raw_len != expected_raw_len:
                 raise ValueError("manifest payload_raw_len must match sum of manifest file sizes")
+        key_mode = _require_key_mode(self.key_mode)
 
         seen_paths: set[str] = set()
         for entry in files:
@@ -172,6 +183,8 @@ class EnvelopeManifest:
         }
         if payload_codec == PAYLOAD_CODEC_GZIP:
             base_manifest["payload_raw_len"] = self.payload_raw_len
+        if key_mode != KEY_MODE_PASSPHRASE:
+            base_manifest["key_mode"] = key_mode
 
         direct_manifest = dict(base_manifest)
         direct_manifest["path_encoding"] = PATH_ENCODING_DIRECT
@@ -201,6 +214,7 @@ class EnvelopeManifest:
             "input_roots": list(self.input_roots),
             "payload_codec": self.payload_codec,
             "payload_raw_len": self.payload_raw_len,
+            "key_mode": self.key_mode,
             "files": [file.to_dict() for file in self.files],
         }
 
@@ -234,6 +248,7 @@ class EnvelopeManifest:
         files_raw = validated["files"]
         payload_codec_raw = validated["payload_codec"]
         payload_raw_len_raw = validated.get("payload_raw_len")
+        key_mode = _require_key_mode(validated.get("key_mode", KEY_MODE_PASSPHRASE))
         format_version = require_int(format_version, label="manifest version")
         if format_version != MANIFEST_VERSION:
             raise ValueError(f"unsupported manifest version: {format_version}")
@@ -314,6 +329,7 @@ class EnvelopeManifest:
             input_roots=tuple(normalized_roots),
             payload_codec=payload_codec,
             payload_raw_len=payload_raw_len,
+            key_mode=key_mode,
             files=tuple(files),
         )
 
@@ -18,8 +18,8 @@
 
 from __future__ import annotations
 
-import gzip
 import zlib
+from collections.abc import Iterator, Sequence
 from typing import Literal
 
 from ethernity.core.bounds import MAX_DECOMPRESSED_PAYLOAD_BYTES
@@ -27,6 +27,11 @@ from ethernity.formats.envelope_types import PAYLOAD_CODEC_GZIP, PAYLOAD_CODEC_R
 
 PAYLOAD_ENCODING_AUTO: Literal["auto"] = "auto"
 PayloadEncodingMode = Literal["auto", "raw", "gzip"]
+PAYLOAD_STREAM_CHUNK_BYTES = 256 * 1024
+
+
+class PayloadTooLargeError(ValueError):
+    """Raised when no payload codec fits within a caller-supplied encoded-size limit."""
 
 
 def encode_payload_for_manifest(
@@ -37,35 +42,140 @@ def encode_payload_for_manifest(
     Compression is deterministic. In `auto` mode, gzip is selected only when it is smaller.
     """
 
-    if len(payload) > MAX_DECOMPRESSED_PAYLOAD_BYTES:
+    return encode_payload_parts_for_manifest((payload,), mode=mode)
+
+
+def encode_payload_parts_for_manifest(
+    parts: Sequence[bytes],
+    *,
+    mode: PayloadEncodingMode = PAYLOAD_ENCODING_AUTO,
+    max_encoded_bytes: int | None = None,
+) -> tuple[bytes, str, int | None]:
+    """Encode a payload given as ordered parts; same result as encoding their concatenation.
+
+    Parts are compressed incrementally, so the raw payload is only joined when the raw codec
+    is selected. When `max_encoded_bytes` is set, compression stops as soon as the output
+    exceeds it and `PayloadTooLargeError` is raised if no codec fits.
+    """
+
+    raw_len = sum(len(part) for part in parts)
+    if raw_len > MAX_DECOMPRESSED_PAYLOAD_BYTES:
         raise ValueError(
             "payload exceeds MAX_DECOMPRESSED_PAYLOAD_BYTES "
-            f"({MAX_DECOMPRESSED_PAYLOAD_BYTES}): {len(payload)} bytes"
+            f"({MAX_DECOMPRESSED_PAYLOAD_BYTES}): {raw_len} bytes"
         )
 
     if mode not in {PAYLOAD_ENCODING_AUTO, PAYLOAD_CODEC_RAW, PAYLOAD_CODEC_GZIP}:
         raise ValueError(f"unsupported payload encoding mode: {mode}")
 
+    raw_fits = max_encoded_bytes is None or raw_len <= max_encoded_bytes
     if mode == PAYLOAD_CODEC_RAW:
-        return payload, PAYLOAD_CODEC_RAW, None
+        if not raw_fits:
+            raise _encoded_too_large(raw_len, max_encoded_bytes)
+        return b"".join(parts), PAYLOAD_CODEC_RAW, None
 
-    compressed = gzip.compress(payload, compresslevel=9, mtime=0)
+    compressed = _gzip_parts(parts, max_encoded_bytes=max_encoded_bytes)
     if mode == PAYLOAD_CODEC_GZIP:
-        return compressed, PAYLOAD_CODEC_GZIP, len(payload)
-
-    if len(compressed) < len(payload):
-        return compressed, PAYLOAD_CODEC_GZIP, len(payload)
-    return payload, PAYLOAD_CODEC_RAW, None
+        if compressed is None:
+            raise _encoded_too_large(None, max_encoded_bytes)
+        return compressed, PAYLOAD_CODEC_GZIP, raw_len
+
+    if compressed is not None and len(compressed) < raw_len:
+        return compressed, PAYLOAD_CODEC_GZIP, raw_len
+    del compressed
+    if not raw_fits:
+        raise _encoded_too_large(raw_len, max_encoded_bytes)
+    return b"".join(parts), PAYLOAD_CODEC_RAW, None
+
+
+def _gzip_parts(parts: Sequence[bytes], *, max_encoded_bytes: int | None) -> bytes | None:
+    # Matches gzip.compress(payload, compresslevel=9, mtime=0) byte for byte.
+    compressor = zlib.compressobj(9, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    chunks: list[bytes] = []
+    encoded_len = 0
+    for part in parts:
+        chunk = compressor.compress(part)
+        if chunk:
+            chunks.append(chunk)
+            encoded_len += len(chunk)
+            if max_encoded_bytes is not None and encoded_len > max_encoded_bytes:
+                return None
+    tail = compressor.flush()
+    encoded_len += len(tail)
+    if max_encoded_bytes is not None and encoded_len > max_encoded_bytes:
+        return None
+    chunks.append(tail)
+    return b"".join(chunks)
+
+
+def _encoded_too_large(size: int | None, max_encoded_bytes: int | None) -> PayloadTooLargeError:
+    observed = "more than that" if size is None else f"{size} bytes"
+    return PayloadTooLargeError(f"encoded payload exceeds {max_encoded_bytes} bytes: {observed}")
 
 
 def decode_payload_from_manifest(manifest: EnvelopeManifest, payload: bytes) -> bytes:
     """Decode payload bytes according to manifest codec metadata."""
 
+    if manifest.payload_codec == PAYLOAD_CODEC_RAW:
+        _validated_raw_len(manifest)
+        return payload
+    return b"".join(iter_decoded_payload(manifest, payload))
+
+
+def iter_decoded_payload(
+    manifest: EnvelopeManifest,
+    payload: bytes,
+    *,
+    chunk_size: int = PAYLOAD_STREAM_CHUNK_BYTES,
+) -> Iterator[bytes]:
+    """Yield decoded payload bytes in chunks of at most `chunk_size` bytes.
+
+    Gzip payloads are inflated incrementally, so at most one chunk of decoded output is
+    held at a time. Validation matches `decode_payload_from_manifest`; errors about the
+    overall stream (truncation, trailing data, length mismatch) surface on the final
+    iteration, after earlier chunks have already been yielded.
+    """
+
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    expected_len = _validated_raw_len(manifest)
+    if expected_len is None:
+        view = memoryview(payload)
+        for offset in range(0, len(view), chunk_size):
+            yield bytes(view[offset : offset + chunk_size])
+        return
+
+    decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    pending = payload
+    decoded_len = 0
+    while not decompressor.eof:
+        try:
+            chunk = decompressor.decompress(pending, chunk_size)
+        except zlib.error as exc:
+            raise ValueError("invalid gzip payload") from exc
+        stalled = not chunk and len(decompressor.unconsumed_tail) == len(pending)
+        pending = decompressor.unconsumed_tail
+        if chunk:
+            decoded_len += len(chunk)
+            if decoded_len > expected_len:
+                raise ValueError("decoded payload exceeds manifest payload_raw_len")
+            yield chunk
+        if stalled or (not chunk and not pending):
+            break
+    if not decompressor.eof:
+        raise ValueError("invalid gzip payload")
+    if decompressor.unused_data or pending:
+        raise ValueError("gzip payload contains trailing data")
+    if decoded_len != expected_len:
+        raise ValueError("decoded payload length does not match manifest payload_raw_len")
+
+
+def _validated_raw_len(manifest: EnvelopeManifest) -> int | None:
     codec = manifest.payload_codec
     if codec == PAYLOAD_CODEC_RAW:
         if manifest.payload_raw_len is not None:
             raise ValueError("manifest payload_raw_len must be null for raw payload codec")
-        return payload
+        return None
     if codec != PAYLOAD_CODEC_GZIP:
         raise ValueError(f"unsupported payload codec: {codec}")
 
@@ -81,37 +191,16 @@ def decode_payload_from_manifest(manifest: EnvelopeManifest, payload: bytes) ->
     expected_from_entries = sum(entry.size for entry in manifest.files)
     if expected_from_entries != expected_len:
         raise ValueError("manifest payload_raw_len must match sum of manifest file sizes")
-
-    decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
-    try:
-        decoded = decompressor.decompress(payload, max_length=expected_len + 1)
-    except zlib.error as exc:
-        raise ValueError("invalid gzip payload") from exc
-    if len(decoded) > expected_len:
-        raise ValueError("decoded payload exceeds manifest payload_raw_len")
-    if decompressor.unconsumed_tail:
-        raise ValueError("decoded payload exceeds manifest payload_raw_len")
-
-    try:
-        flushed = decompressor.flush(expected_len + 1 - len(decoded))
-    except zlib.error as exc:
-        raise ValueError("invalid gzip payload") from exc
-    decoded += flushed
-    if len(decoded) > expected_len:
-        raise ValueError("decoded payload exceeds manifest payload_raw_len")
-    if not decompressor.eof:
-        raise ValueError("invalid gzip payload")
-    if decompressor.unused_data:
-        raise ValueError("gzip payload contains trailing data")
-    if len(decoded) != expected_len:
-        raise ValueError("decoded payload length does not match manifest payload_raw_len")
-
-    return decoded
+    return expected_len
 
 
 __all__ = [
     "decode_payload_from_manifest",
     "encode_payload_for_manifest",
+    "encode_payload_parts_for_manifest",
+    "iter_decoded_payload",
+    "PAYLOAD_STREAM_CHUNK_BYTES",
     "PAYLOAD_ENCODING_AUTO",
     "PayloadEncodingMode",
+    "PayloadTooLargeError",
 ]
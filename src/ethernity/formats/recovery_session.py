@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+"""Compact binary checkpoint of MAIN/PARITY/AUTH frames collected across recovery runs."""
+
+from __future__ import annotations
+
+import zlib
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from ethernity.core.bounds import (
+    MAX_AUTH_CBOR_BYTES,
+    MAX_CIPHERTEXT_BYTES,
+    MAX_MAIN_FRAME_DATA_BYTES,
+    MAX_MAIN_FRAME_TOTAL,
+    MAX_PARITY_FRAME_DATA_BYTES,
+    MAX_PARITY_FRAME_TOTAL,
+)
+from ethernity.encoding.chunking import decode_parity_data
+from ethernity.encoding.framing import (
+    DOC_ID_LEN,
+    PARITY_VERSION,
+    VERSION as FRAME_VERSION,
+    Frame,
+    FrameType,
+)
+from ethernity.encoding.varint import (
+    decode_uvarint as _decode_uvarint,
+    encode_uvarint as _encode_uvarint,
+)
+
+MAGIC = b"ES"
+VERSION = 1
+CRC_LEN = 4
+
+
+@dataclass
+class SessionDocument:
+    """Frames collected so far for one `doc_id`.
+
+    `chunks` maps MAIN frame indices to their ciphertext chunk; `total` stays None until the
+    first MAIN or PARITY frame is seen. `parity` maps PARITY frame indices to their frame
+    data, and `parity_total` is the PARITY frame TOTAL.
+    """
+
+    doc_id: bytes
+    total: int | None = None
+    chunks: dict[int, bytes] = field(default_factory=dict)
+    auth: bytes | None = None
+    parity_total: int | None = None
+    parity: dict[int, bytes] = field(default_factory=dict)
+
+    @property
+    def missing_indices(self) -> list[int]:
+        if self.total is None:
+            return []
+        return [index for index in range(self.total) if index not in self.chunks]
+
+    @property
+    def main_complete(self) -> bool:
+        return self.total is not None and len(self.chunks) == self.total
+
+    @property
+    def main_recoverable(self) -> bool:
+        """Return whether the stored PARITY rows cover every missing MAIN frame."""
+
+        return self.total is not None and len(self.missing_indices) <= len(self.parity)
+
+    def frames(self) -> list[Frame]:
+        """Return the stored frames: MAIN in index order, then PARITY, then AUTH."""
+
+        frames = [
+            Frame(
+                version=FRAME_VERSION,
+                frame_type=FrameType.MAIN_DOCUMENT,
+                doc_id=self.doc_id,
+                index=index,
+                total=self.total or 0,
+                data=self.chunks[index],
+            )
+            for index in sorted(self.chunks)
+        ]
+        frames.extend(
+            Frame(
+                version=PARITY_VERSION,
+                frame_type=FrameType.PARITY,
+                doc_id=self.doc_id,
+                index=index,
+                total=self.parity_total or 0,
+                data=self.parity[index],
+            )
+            for index in sorted(self.parity)
+        )
+        if self.auth is not None:
+            frames.append(
+                Frame(
+                    version=FRAME_VERSION,
+                    frame_type=FrameType.AUTH,
+                    doc_id=self.doc_id,
+                    index=0,
+                    total=1,
+                    data=self.auth,
+                )
+            )
+        return frames
+
+
+@dataclass
+class RecoverySession:
+    """MAIN/PARITY/AUTH frames per `doc_id`, merged across recovery runs.
+
+    Shard frames are never recorded: they carry key material, while MAIN, PARITY and AUTH
+    frames hold only ciphertext, ciphertext parity and public signatures.
+    """
+
+    documents: dict[bytes, SessionDocument] = field(default_factory=dict)
+
+    def add_frames(self, frames: Iterable[Frame]) -> int:
+        """Record MAIN/PARITY/AUTH frames and return how many were new.
+
+        Other frame types are skipped. A frame that disagrees with one already recorded
+        (different data, a different MAIN total, or a different PARITY layout) raises
+        `ValueError`.
+        """
+
+        added = 0
+        for frame in frames:
+            if frame.frame_type == FrameType.MAIN_DOCUMENT:
+                document = self.documents.setdefault(frame.doc_id, SessionDocument(frame.doc_id))
+                _record_total(document, frame.total)
+                existing = document.chunks.get(frame.index)
+                if existing is None:
+                    document.chunks[frame.index] = frame.data
+                    added += 1
+                elif existing != frame.data:
+                    raise ValueError("conflicting duplicate frames detected")
+            elif frame.frame_type == FrameType.PARITY:
+                document = self.documents.setdefault(frame.doc_id, SessionDocument(frame.doc_id))
+                _record_total(document, decode_parity_data(frame.data).data_total)
+                if document.parity_total is None:
+                    document.parity_total = frame.total
+                elif document.parity_total != frame.total:
+                    raise ValueError("mismatched parity frames")
+                existing = document.parity.get(frame.index)
+                if existing is None:
+                    document.parity[frame.index] = frame.data
+                    added += 1
+                elif existing != frame.data:
+                    raise ValueError("conflicting duplicate frames detected")
+            elif frame.frame_type == FrameType.AUTH:
+                document = self.documents.setdefault(frame.doc_id, SessionDocument(frame.doc_id))
+                if document.auth is None:
+                    document.auth = frame.data
+                    added += 1
+                elif document.auth != frame.data:
+                    raise ValueError("conflicting duplicate frames detected")
+        return added
+
+
+def _record_total(document: SessionDocument, total: int) -> None:
+    if document.total is None:
+        document.total = total
+    elif document.total != total:
+        raise ValueError(
+            f"frame total {total} does not match {document.total} recorded "
+            f"for document {document.doc_id.hex()}"
+        )
+
+
+def encode_recovery_session(session: RecoverySession) -> bytes:
+    """Encode a session as `MAGIC | version | documents | CRC32`.
+
+    Each document is `doc_id | total | bitmap | chunks | auth | parity`: `total` is 0 until
+    a MAIN or PARITY frame is known, the bitmap holds one bit per MAIN index (LSB first),
+    and only the chunks whose bit is set follow, each prefixed with its varint length.
+    `auth` is a varint length (0 when absent) followed by the AUTH frame data. `parity`
+    repeats the `total | bitmap | rows` layout for PARITY frames.
+    """
+
+    parts: list[bytes] = [
+        MAGIC,
+        _encode_uvarint(VERSION),
+        _encode_uvarint(len(session.documents)),
+    ]
+    for doc_id in sorted(session.documents):
+        document = session.documents[doc_id]
+        parts.append(doc_id)
+        parts.extend(_encode_indexed(document.total or 0, document.chunks))
+        auth = document.auth or b""
+        parts.extend((_encode_uvarint(len(auth)), auth))
+        parts.extend(_encode_indexed(document.parity_total or 0, document.parity))
+    body = b"".join(parts)
+    return body + (zlib.crc32(body) & 0xFFFFFFFF).to_bytes(CRC_LEN, "big")
+
+
+def decode_recovery_session(data: bytes) -> RecoverySession:
+    """Decode and validate a session checkpoint."""
+
+    if len(data) < len(MAGIC) + CRC_LEN or data[: len(MAGIC)] != MAGIC:
+        raise ValueError("bad magic")
+    body = data[:-CRC_LEN]
+    if int.from_bytes(data[-CRC_LEN:], "big") != zlib.crc32(body) & 0xFFFFFFFF:
+        raise ValueError("crc mismatch")
+    version, idx = _decode_uvarint(body, len(MAGIC))
+    if version != VERSION:
+        raise ValueError(f"unsupported session version: {version}")
+    count, idx = _decode_uvarint(body, idx)
+
+    session = RecoverySession()
+    for _ in range(count):
+        doc_id, idx = _take(body, idx, DOC_ID_LEN)
+        if doc_id in session.documents:
+            raise ValueError(f"duplicate document {doc_id.hex()}")
+        total, idx = _decode_uvarint(body, idx)
+        if total > MAX_MAIN_FRAME_TOTAL:
+            raise ValueError(f"frame total exceeds MAX_MAIN_FRAME_TOTAL ({MAX_MAIN_FRAME_TOTAL})")
+        bitmap, idx = _take(body, idx, (total + 7) // 8)
+        document = SessionDocument(doc_id, total=total or None)
+        idx = _decode_indexed(
+            body,
+            idx,
+            total=total,
+            bitmap=bitmap,
+            into=document.chunks,
+            max_size=MAX_MAIN_FRAME_DATA_BYTES,
+            label="chunk exceeds MAX_MAIN_FRAME_DATA_BYTES",
+        )
+        ciphertext_len = sum(len(chunk) for chunk in document.chunks.values())
+        if ciphertext_len > MAX_CIPHERTEXT_BYTES:
+            raise ValueError("document exceeds MAX_CIPHERTEXT_BYTES")
+        auth_len, idx = _decode_uvarint(body, idx)
+        if auth_len > MAX_AUTH_CBOR_BYTES:
+            raise ValueError("AUTH data exceeds MAX_AUTH_CBOR_BYTES")
+        if auth_len:
+            document.auth, idx = _take(body, idx, auth_len)
+        parity_total, idx = _decode_uvarint(body, idx)
+        if parity_total > MAX_PARITY_FRAME_TOTAL:
+            raise ValueError(
+                f"parity total exceeds MAX_PARITY_FRAME_TOTAL ({MAX_PARITY_FRAME_TOTAL})"
+            )
+        parity_bitmap, idx = _take(body, idx, (parity_total + 7) // 8)
+        document.parity_total = parity_total or None
+        idx = _decode_indexed(
+            body,
+            idx,
+            total=parity_total,
+            bitmap=parity_bitmap,
+            into=document.parity,
+            max_size=MAX_PARITY_FRAME_DATA_BYTES,
+            label="parity row exceeds MAX_PARITY_FRAME_DATA_BYTES",
+        )
+        session.documents[doc_id] = document
+    if idx != len(body):
+        raise ValueError("trailing data")
+    return session
+
+
+def _encode_indexed(total: int, entries: dict[int, bytes]) -> list[bytes]:
+    bitmap = bytearray((total + 7) // 8)
+    for index in entries:
+        bitmap[index // 8] |= 1 << (index % 8)
+    parts = [_encode_uvarint(total), bytes(bitmap)]
+    for index in sorted(entries):
+        parts.extend((_encode_uvarint(len(entries[index])), entries[index]))
+    return parts
+
+
+def _decode_indexed(
+    body: bytes,
+    idx: int,
+    *,
+    total: int,
+    bitmap: bytes,
+    into: dict[int, bytes],
+    max_size: int,
+    label: str,
+) -> int:
+    for index in range(total):
+        if not bitmap[index // 8] & (1 << (index % 8)):
+            continue
+        size, idx = _decode_uvarint(body, idx)
+        if size > max_size:
+            raise ValueError(label)
+        into[index], idx = _take(body, idx, size)
+    return idx
+
+
+def _take(data: bytes, idx: int, size: int) -> tuple[bytes, int]:
+    end = idx + size
+    if end > len(data):
+        raise ValueError("truncated session")
+    return data[idx:end], end
+
+
+__all__ = [
+    "MAGIC",
+    "VERSION",
+    "RecoverySession",
+    "SessionDocument",
+    "decode_recovery_session",
+    "encode_recovery_session",
+]
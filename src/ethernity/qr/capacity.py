@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+from ethernity.core.bounds import MAX_QR_PAYLOAD_CHARS
 from ethernity.encoding.framing import DOC_ID_LEN, VERSION, Frame, encode_frame
 from ethernity.encoding.qr_payloads import (
     QR_PAYLOAD_CODEC_BASE64,
@@ -33,11 +34,14 @@ def choose_frame_chunk_size(
     frame_type: int,
     qr_config: QrConfig,
     payload_codec: QrPayloadCodec = QR_PAYLOAD_CODEC_BASE64,
+    data_overhead: int = 0,
 ) -> int:
     """Choose a chunk_size for chunk_payload() that fits the current QR settings.
 
     The chosen size is <= preferred_chunk_size and is validated by probing QR capacity using the
-    chosen payload transport representation (for example raw bytes or base64 text).
+    chosen payload transport representation (for example raw bytes, base64 or base45 text).
+    Text payloads must also stay within MAX_QR_PAYLOAD_CHARS.
+    `data_overhead` reserves extra frame data bytes per chunk, such as the PARITY header.
     """
     if payload_len <= 0:
         raise ValueError("payload_len must be positive")
@@ -45,6 +49,8 @@ def choose_frame_chunk_size(
         raise ValueError("preferred_chunk_size must be positive")
     if len(doc_id) != DOC_ID_LEN:
         raise ValueError(f"doc_id must be {DOC_ID_LEN} bytes")
+    if data_overhead < 0:
+        raise ValueError("data_overhead must be non-negative")
 
     chunk_size = min(preferred_chunk_size, payload_len)
     while True:
@@ -57,6 +63,7 @@ def choose_frame_chunk_size(
             frame_type=frame_type,
             qr_config=qr_config,
             payload_codec=payload_codec,
+            data_overhead=data_overhead,
         ):
             return chunk_size
         chunk_size = _max_fitting_frame_data_len(
@@ -66,6 +73,7 @@ def choose_frame_chunk_size(
             frame_type=frame_type,
             qr_config=qr_config,
             payload_codec=payload_codec,
+            data_overhead=data_overhead,
         )
         if chunk_size <= 0:
             raise ValueError("unable to select a valid chunk size for current QR settings")
@@ -86,6 +94,7 @@ def _fits_qr_frame(
     frame_type: int,
     qr_config: QrConfig,
     payload_codec: QrPayloadCodec,
+    data_overhead: int = 0,
 ) -> bool:
     if data_len <= 0:
         return False
@@ -96,15 +105,18 @@ def _fits_qr_frame(
 
     # Use a pattern that forces the QR payload into byte mode (base64 strings for random bytes
     # almost always include lowercase anyway, but this makes probing conservative/deterministic).
+    # base45 text is always alphanumeric and its length does not depend on the data bytes.
     frame = Frame(
         version=VERSION,
         frame_type=frame_type,
         doc_id=doc_id,
         index=total - 1,
         total=total,
-        data=b"\xff" * data_len,
+        data=b"\xff" * (data_len + data_overhead),
     )
     qr_payload = encode_qr_payload(encode_frame(frame), codec=payload_codec)
+    if isinstance(qr_payload, str) and len(qr_payload) > MAX_QR_PAYLOAD_CHARS:
+        return False
     return _fits_qr_payload(qr_payload, qr_config)
 
 
@@ -116,6 +128,7 @@ def _max_fitting_frame_data_len(
     frame_type: int,
     qr_config: QrConfig,
     payload_codec: QrPayloadCodec,
+    data_overhead: int = 0,
 ) -> int:
     if upper <= 0:
         raise ValueError("upper must be positive")
@@ -127,6 +140,7 @@ def _max_fitting_frame_data_len(
         frame_type=frame_type,
         qr_config=qr_config,
         payload_codec=payload_codec,
+        data_overhead=data_overhead,
     ):
         raise ValueError(
             "QR settings cannot encode even the smallest frame payload; "
@@ -144,6 +158,7 @@ def _max_fitting_frame_data_len(
             frame_type=frame_type,
             qr_config=qr_config,
             payload_codec=payload_codec,
+            data_overhead=data_overhead,
         ):
             lower = mid
         else:
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+"""Pillow image transforms retried on scans that decode fewer QR codes than expected."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Sequence
+from typing import Any
+
+# Default retry order, cheapest and most often useful first.
+PREPROCESS_TRANSFORMS = ("grayscale", "autocontrast", "otsu", "deskew", "invert")
+
+_DESKEW_ANGLES = (-8.0, 8.0)
+# Share of darkest/brightest pixels ignored when stretching contrast.
+_AUTOCONTRAST_CUTOFF = 0.01
+
+
+class TransformRanking:
+    """Order preprocessing transforms by how often each recovered codes in this session.
+
+    Shared by all decode threads of a scan session; ties keep `PREPROCESS_TRANSFORMS` order.
+    """
+
+    def __init__(self) -> None:
+        self._wins: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def order(self) -> list[str]:
+        with self._lock:
+            wins = dict(self._wins)
+        return sorted(PREPROCESS_TRANSFORMS, key=lambda name: -wins.get(name, 0))
+
+    def record(self, name: str) -> None:
+        with self._lock:
+            self._wins[name] = self._wins.get(name, 0) + 1
+
+    def wins(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._wins)
+
+
+def retry_with_transforms(
+    image: Any,
+    *,
+    decode: Callable[[Any], Sequence[bytes]],
+    found: Sequence[bytes],
+    expected: int,
+    ranking: TransformRanking,
+    on_recover: Callable[[str, Sequence[bytes]], None] | None = None,
+) -> list[bytes]:
+    """Decode transformed copies of `image` until `expected` distinct codes are known.
+
+    Transforms run in `ranking` order; each one that adds new payloads is recorded as a win
+    and reported to `on_recover` with the payloads it added. Returns only payloads not
+    already in `found`.
+    """
+
+    seen = set(found)
+    recovered: list[bytes] = []
+    gray = _grayscale(image)
+    for name in ranking.order():
+        if len(seen) >= expected:
+            break
+        if name == "grayscale" and gray is image:
+            continue
+        added: list[bytes] = []
+        for candidate in _TRANSFORMS[name](gray):
+            for payload in decode(candidate):
+                if payload in seen:
+                    continue
+                seen.add(payload)
+                added.append(payload)
+            if len(seen) >= expected:
+                break
+        if added:
+            recovered.extend(added)
+            ranking.record(name)
+            if on_recover is not None:
+                on_recover(name, added)
+    return recovered
+
+
+def otsu_threshold(histogram: Sequence[int]) -> int:
+    """Return the grey level that best separates a 256-bin histogram into two classes."""
+
+    total = sum(histogram)
+    weighted_total = sum(level * count for level, count in enumerate(histogram))
+    background = 0
+    weighted_background = 0
+    best_level = 0
+    best_variance = -1.0
+    for level, count in enumerate(histogram):
+        background += count
+        if background == 0:
+            continue
+        foreground = total - background
+        if foreground == 0:
+            break
+        weighted_background += level * count
+        mean_background = weighted_background / background
+        mean_foreground = (weighted_total - weighted_background) / foreground
+        variance = background * foreground * (mean_background - mean_foreground) ** 2
+        if variance > best_variance:
+            best_variance = variance
+            best_level = level
+    return best_level
+
+
+def _grayscale(image: Any) -> Any:
+    return image if image.mode == "L" else image.convert("L")
+
+
+def _as_is(gray: Any) -> list[Any]:
+    return [gray]
+
+
+def _autocontrast(gray: Any) -> list[Any]:
+    histogram = gray.histogram()
+    cutoff = sum(histogram) * _AUTOCONTRAST_CUTOFF
+    low = _cutoff_level(histogram, cutoff)
+    high = 255 - _cutoff_level(histogram[::-1], cutoff)
+    if high <= low:
+        return []
+    scale = 255 / (high - low)
+    table = [min(255, max(0, round((level - low) * scale))) for level in range(256)]
+    return [gray.point(table)]
+
+
+def _otsu(gray: Any) -> list[Any]:
+    threshold = otsu_threshold(gray.histogram())
+    return [gray.point([0 if level <= threshold else 255 for level in range(256)])]
+
+
+def _deskew(gray: Any) -> list[Any]:
+    return [gray.rotate(angle, expand=True, fillcolor=255) for angle in _DESKEW_ANGLES]
+
+
+def _invert(gray: Any) -> list[Any]:
+    return [gray.point([255 - level for level in range(256)])]
+
+
+def _cutoff_level(histogram: Sequence[int], cutoff: float) -> int:
+    running = 0
+    for level, count in enumerate(histogram):
+        running += count
+        if running > cutoff:
+            return level
+    return 0
+
+
+_TRANSFORMS: dict[str, Callable[[Any], list[Any]]] = {
+    "grayscale": _as_is,
+    "autocontrast": _autocontrast,
+    "otsu": _otsu,
+    "deskew": _deskew,
+    "invert": _invert,
+}
+
+
+__all__ = [
+    "PREPROCESS_TRANSFORMS",
+    "TransformRanking",
+    "otsu_threshold",
+    "retry_with_transforms",
+]
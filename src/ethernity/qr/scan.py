@@ -18,13 +18,26 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import functools
 import importlib
+import importlib.metadata
 import io
+import os
 import sys
+import threading
+from collections import deque
+from collections.abc import Generator
+from contextlib import closing, contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Iterable, Sequence
+from typing import Any, Callable, Iterable, Iterator, Literal, NamedTuple, Sequence
+
+from ethernity.core.concurrency import jobs_from_env, resolve_worker_count
+from ethernity.core.timing import span
+from ethernity.qr.preprocess import PREPROCESS_TRANSFORMS, TransformRanking, retry_with_transforms
+from ethernity.qr.scan_cache import SCAN_CACHE_FORMAT, ScanCache
 
 
 def _optional_import(name: str) -> Any | None:
@@ -36,6 +49,7 @@ def _optional_import(name: str) -> Any | None:
 
 pil_image = _optional_import("PIL.Image")
 pypdf = _optional_import("pypdf")
+pypdfium2 = _optional_import("pypdfium2")
 zxingcpp = _optional_import("zxingcpp")
 
 
@@ -45,6 +59,12 @@ class QrScanError(RuntimeError):
     pass
 
 
+class PdfRasterizerUnavailableError(QrScanError):
+    """Raised when a PDF has no embedded images and pypdfium2 is not installed to render it."""
+
+    pass
+
+
 @dataclass(frozen=True)
 class QrDecoder:
     """Decoder adapter used to scan QR payloads from paths and image bytes."""
@@ -54,8 +74,149 @@ class QrDecoder:
     decode_image_bytes: Callable[[bytes], list[bytes]]
 
 
+@dataclass(frozen=True)
+class ScanGrid:
+    """Expected QR grid of a rendered page, in millimetres from the page's top-left corner.
+
+    When a page image decodes to fewer than `expected_count` codes, the cells that did not
+    yield a code are cropped from the full-resolution image and decoded again one by one.
+    """
+
+    page_w: float
+    page_h: float
+    x: float
+    y: float
+    qr_size: float
+    gap_x: float
+    gap_y: float
+    cols: int
+    rows: int
+
+    @property
+    def expected_count(self) -> int:
+        return self.cols * self.rows
+
+    def cell_boxes(self) -> list[tuple[float, float, float, float]]:
+        """Return `(left, top, right, bottom)` boxes for each cell in row-major order."""
+
+        boxes: list[tuple[float, float, float, float]] = []
+        for row in range(self.rows):
+            top = self.y + row * (self.qr_size + self.gap_y)
+            for col in range(self.cols):
+                left = self.x + col * (self.qr_size + self.gap_x)
+                boxes.append((left, top, left + self.qr_size, top + self.qr_size))
+        return boxes
+
+
+class ScanRetryLog:
+    """Payloads that only decoded on a retry, each with the retry that first found it.
+
+    Retries are `full_resolution` (the reduced copy of a huge image found nothing), `tile`
+    (grid cells decoded one by one) or the name of a preprocessing transform. Shared by all
+    decode threads of a scan session.
+    """
+
+    def __init__(self) -> None:
+        self._retried: dict[bytes, str] = {}
+        self._lock = threading.Lock()
+
+    def record(self, retry: str, payloads: Iterable[bytes]) -> None:
+        with self._lock:
+            for payload in payloads:
+                self._retried.setdefault(payload, retry)
+
+    def retried(self) -> dict[bytes, str]:
+        with self._lock:
+            return dict(self._retried)
+
+
 _IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tif", ".tiff", ".webp"}
 
+ScanExecutorKind = Literal["auto", "thread", "process"]
+
+_SCAN_JOBS_ENV = "ETHERNITY_SCAN_JOBS"
+_SCAN_EXECUTOR_ENV = "ETHERNITY_SCAN_EXECUTOR"
+_DEFAULT_SCAN_WORKERS_CAP = 8
+_MIN_SCAN_TASKS_PER_WORKER = 2
+_PDF_TASK_ESTIMATE = 4
+
+_SCAN_DPI_ENV = "ETHERNITY_SCAN_DPI"
+_DEFAULT_RASTER_DPI = 200
+_PDF_POINTS_PER_INCH = 72
+# Longest edge decoded as-is; larger images are tried at a reduced size first (3000 px is
+# about 250 dpi on A4, well above what printed QR modules need).
+_MAX_DECODE_EDGE = 3000
+_REDUCIBLE_MODES = {"L", "LA", "RGB", "RGBA"}
+# Images whose aspect ratio is within this fraction of the grid's page are treated as pages.
+_PAGE_ASPECT_TOLERANCE = 0.05
+
+_SCAN_JOBS: ContextVar[int | None] = ContextVar("scan_jobs", default=None)
+_SCAN_GRID: ContextVar[ScanGrid | None] = ContextVar("scan_grid", default=None)
+_SCAN_CACHE_ENABLED: ContextVar[bool] = ContextVar("scan_cache_enabled", default=True)
+_SCAN_RANKING: ContextVar[TransformRanking | None] = ContextVar("scan_ranking", default=None)
+_SCAN_RETRIES: ContextVar[ScanRetryLog | None] = ContextVar("scan_retries", default=None)
+
+
+@contextmanager
+def scan_session(
+    *,
+    jobs: int | None = None,
+    grid: ScanGrid | None = None,
+    cache: bool = True,
+    retries: ScanRetryLog | None = None,
+) -> Generator[None, None, None]:
+    """Set scan defaults for this context: worker count, page grid and cache use.
+
+    Scans in the same session also share what preprocessing transforms worked best. With
+    `retries`, thread-decoded payloads that needed a retry are recorded there.
+    """
+
+    if jobs is not None and jobs <= 0:
+        raise ValueError("scan jobs must be a positive integer")
+    jobs_token = _SCAN_JOBS.set(jobs)
+    grid_token = _SCAN_GRID.set(grid)
+    cache_token = _SCAN_CACHE_ENABLED.set(cache)
+    ranking_token = _SCAN_RANKING.set(TransformRanking())
+    retries_token = _SCAN_RETRIES.set(retries)
+    try:
+        yield
+    finally:
+        _SCAN_RETRIES.reset(retries_token)
+        _SCAN_RANKING.reset(ranking_token)
+        _SCAN_CACHE_ENABLED.reset(cache_token)
+        _SCAN_GRID.reset(grid_token)
+        _SCAN_JOBS.reset(jobs_token)
+
+
+def scan_cache_enabled() -> bool:
+    """Return whether the active `scan_session` allows the on-disk scan cache."""
+
+    return _SCAN_CACHE_ENABLED.get()
+
+
+def decoder_fingerprint(grid: ScanGrid | None = None) -> str:
+    """Describe everything that can change decoded payloads, for scan cache keys."""
+
+    pdfium_available = _module("pypdfium2", pypdfium2) is not None
+    parts = (
+        f"format={SCAN_CACHE_FORMAT}",
+        f"zxingcpp={_distribution_version('zxing-cpp')}",
+        f"pillow={_distribution_version('pillow')}",
+        f"pypdfium2={_distribution_version('pypdfium2') if pdfium_available else None}",
+        f"dpi={_resolve_raster_dpi()}",
+        f"max_edge={_MAX_DECODE_EDGE}",
+        f"preprocess={','.join(PREPROCESS_TRANSFORMS)}",
+        f"grid={grid!r}",
+    )
+    return ";".join(parts)
+
+
+def _distribution_version(name: str) -> str | None:
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
 
 def _module(name: str, default: Any) -> Any:
     """Return an imported module override from `sys.modules` when present."""
@@ -63,55 +224,508 @@ def _module(name: str, default: Any) -> Any:
     return sys.modules.get(name, default)
 
 
-def _decode_image(image, *, zxing_module) -> list[bytes]:
-    """Decode QR codes in an opened image object."""
+# A decoded payload and its centre in full-resolution pixels, when zxing reports a position.
+_QrResult = tuple[bytes, tuple[float, float] | None]
+
+
+def _decode_image(
+    image,
+    *,
+    zxing_module,
+    grid: ScanGrid | None = None,
+    ranking: TransformRanking | None = None,
+    retries: ScanRetryLog | None = None,
+) -> list[bytes]:
+    """Decode QR codes in an opened image object.
+
+    Huge images (e.g. 600 dpi scanner pages) are decoded from a box-reduced copy first and only
+    fall back to full resolution when the reduced copy yields nothing. With a `grid`, page
+    images that still decode short of the expected count retry the unresolved cells as
+    overlapping full-resolution tiles. With a `ranking`, images still short of expectations
+    (the grid count for page images, otherwise one code) are retried through preprocessing
+    transforms; images that decode fully never pay for them. Payloads found by any of these
+    retries are recorded in `retries`.
+    """
+
+    results: list[_QrResult] = []
+    reduced = _reduced_for_decode(image)
+    if reduced is not None:
+        reduced_image, factor = reduced
+        results = [
+            (payload, None if center is None else (center[0] * factor, center[1] * factor))
+            for payload, center in _read_qr_results(reduced_image, zxing_module=zxing_module)
+        ]
+    if not results:
+        results = _read_qr_results(image, zxing_module=zxing_module)
+        if reduced is not None and retries is not None:
+            retries.record("full_resolution", (payload for payload, _center in results))
+    if grid is not None and len(results) < grid.expected_count:
+        tiles = _decode_unresolved_cells(image, grid, results, zxing_module=zxing_module)
+        if retries is not None:
+            retries.record("tile", (payload for payload, _center in tiles))
+        results.extend(tiles)
+    payloads = [payload for payload, _center in results]
+    if ranking is None:
+        return payloads
+    expected = 1
+    if grid is not None and _is_page_image(image, grid):
+        expected = grid.expected_count
+    if len(payloads) >= expected:
+        return payloads
+    retry_image = reduced[0] if reduced is not None else image
+    payloads.extend(
+        retry_with_transforms(
+            retry_image,
+            decode=lambda candidate: [
+                payload
+                for payload, _center in _read_qr_results(candidate, zxing_module=zxing_module)
+            ],
+            found=payloads,
+            expected=expected,
+            ranking=ranking,
+            on_recover=None if retries is None else retries.record,
+        )
+    )
+    return payloads
+
+
+def _reduced_for_decode(image) -> tuple[Any, int] | None:
+    """Return a reduced copy and its factor when the longest edge exceeds `_MAX_DECODE_EDGE`."""
+
+    size = getattr(image, "size", None)
+    if not size or max(size) <= _MAX_DECODE_EDGE:
+        return None
+    factor = -(-max(size) // _MAX_DECODE_EDGE)
+    if image.mode not in _REDUCIBLE_MODES:
+        image = image.convert("L")
+    return image.reduce(factor), factor
+
+
+def _is_page_image(image, grid: ScanGrid) -> bool:
+    """Return whether the image has the aspect ratio of the grid's page."""
+
+    size = getattr(image, "size", None)
+    if not size or not size[1]:
+        return False
+    width, height = size
+    page_aspect = grid.page_w / grid.page_h
+    return abs(width / height - page_aspect) <= _PAGE_ASPECT_TOLERANCE * page_aspect
+
+
+def _decode_unresolved_cells(
+    image,
+    grid: ScanGrid,
+    results: Sequence[_QrResult],
+    *,
+    zxing_module,
+) -> list[_QrResult]:
+    """Decode grid cells with no decoded code as padded crops of the full-resolution image."""
+
+    if not _is_page_image(image, grid):
+        # Not a page image (e.g. a single QR embedded in a PDF), so the grid does not apply.
+        return []
+    width, height = image.size
+    scale_x = width / grid.page_w
+    scale_y = height / grid.page_h
+    centers = [center for _payload, center in results if center is not None]
+    seen = {payload for payload, _center in results}
+    # Pad each cell so neighbouring tiles overlap and small print/scan offsets still fit.
+    pad = max(grid.gap_x, grid.gap_y, grid.qr_size / 4)
+
+    found: list[_QrResult] = []
+    for left, top, right, bottom in grid.cell_boxes():
+        box = (left * scale_x, top * scale_y, right * scale_x, bottom * scale_y)
+        if any(box[0] <= cx <= box[2] and box[1] <= cy <= box[3] for cx, cy in centers):
+            continue
+        crop_left = max(0, int((left - pad) * scale_x))
+        crop_top = max(0, int((top - pad) * scale_y))
+        crop_right = min(width, int((right + pad) * scale_x) + 1)
+        crop_bottom = min(height, int((bottom + pad) * scale_y) + 1)
+        if crop_right <= crop_left or crop_bottom <= crop_top:
+            continue
+        tile = image.crop((crop_left, crop_top, crop_right, crop_bottom))
+        for payload, center in _read_qr_results(tile, zxing_module=zxing_module):
+            if payload in seen:
+                continue
+            seen.add(payload)
+            if center is not None:
+                center = (center[0] + crop_left, center[1] + crop_top)
+                centers.append(center)
+            found.append((payload, center))
+    return found
 
+
+def _read_qr_results(image, *, zxing_module) -> list[_QrResult]:
     results = zxing_module.read_barcodes(image, formats=zxing_module.BarcodeFormat.QRCode)
-    payloads: list[bytes] = []
+    decoded: list[_QrResult] = []
     for result in results:
         data = getattr(result, "bytes", None) or getattr(result, "raw_bytes", None)
         if data:
-            payloads.append(bytes(data))
+            payload = bytes(data)
         elif getattr(result, "text", None):
-            payloads.append(result.text.encode("utf-8"))
-    return payloads
+            payload = result.text.encode("utf-8")
+        else:
+            continue
+        decoded.append((payload, _result_center(result)))
+    return decoded
 
 
-def _decode_image_path(path: Path, *, zxing_module, image_module) -> list[bytes]:
-    """Open and decode a QR image from a filesystem path."""
+def _result_center(result) -> tuple[float, float] | None:
+    position = getattr(result, "position", None)
+    if position is None:
+        return None
+    corners = (position.top_left, position.top_right, position.bottom_right, position.bottom_left)
+    return (
+        sum(corner.x for corner in corners) / 4,
+        sum(corner.y for corner in corners) / 4,
+    )
 
-    with image_module.open(path) as image:
-        return _decode_image(image, zxing_module=zxing_module)
 
+def _decode_image_path(
+    path: Path,
+    *,
+    zxing_module,
+    image_module,
+    grid: ScanGrid | None = None,
+    ranking: TransformRanking | None = None,
+    retries: ScanRetryLog | None = None,
+) -> list[bytes]:
+    """Open and decode a QR image from a filesystem path."""
 
-def _decode_image_bytes(data: bytes, *, zxing_module, image_module) -> list[bytes]:
+    with image_module.open(path) as image:
+        return _decode_image(
+            image, zxing_module=zxing_module, grid=grid, ranking=ranking, retries=retries
+        )
+
+
+def _decode_image_bytes(
+    data: bytes,
+    *,
+    zxing_module,
+    image_module,
+    grid: ScanGrid | None = None,
+    ranking: TransformRanking | None = None,
+    retries: ScanRetryLog | None = None,
+) -> list[bytes]:
     """Open and decode a QR image from in-memory image bytes."""
 
     with image_module.open(io.BytesIO(data)) as image:
-        return _decode_image(image, zxing_module=zxing_module)
+        return _decode_image(
+            image, zxing_module=zxing_module, grid=grid, ranking=ranking, retries=retries
+        )
 
 
-def scan_qr_payloads(paths: Sequence[str | Path]) -> list[bytes]:
-    """Scan one or more paths and return decoded QR payload bytes."""
+ScanStopPredicate = Callable[[Path, Sequence[bytes]], bool]
 
-    decoder = _load_decoder()
-    payloads: list[bytes] = []
-    for path in _expand_paths(paths):
-        suffix = path.suffix.lower()
-        if suffix == ".pdf":
-            payloads.extend(_scan_pdf(path, decoder))
-        elif suffix in _IMAGE_SUFFIXES:
-            payloads.extend(_scan_image(path, decoder))
+
+class ScannedPayload(NamedTuple):
+    """One decoded QR payload and where it was found."""
+
+    source_path: Path
+    page_index: int
+    payload: bytes
+
+
+@dataclass(frozen=True)
+class ScanProgress:
+    """Running scan totals: files finished, pages decoded and payloads found so far."""
+
+    files: int
+    total_files: int
+    pages: int
+    payloads: int
+
+
+ScanProgressCallback = Callable[[ScanProgress], None]
+
+
+def iter_qr_payloads(
+    paths: Sequence[str | Path],
+    *,
+    jobs: int | None = None,
+    executor: ScanExecutorKind | None = None,
+    stop_when: ScanStopPredicate | None = None,
+    grid: ScanGrid | None = None,
+    cache: ScanCache | None = None,
+    progress: ScanProgressCallback | None = None,
+) -> Generator[ScannedPayload, None, None]:
+    """Scan one or more paths, yielding each QR payload as soon as its page is decoded.
+
+    Takes the same options as `scan_qr_payloads` and yields in the same order. `progress` is
+    called after each page's payloads have been yielded and after each file completes.
+    Raises `QrScanError` once the inputs are exhausted if no payload was found.
+    """
+
+    if grid is None:
+        grid = _SCAN_GRID.get()
+    decoder = _load_decoder(grid=grid)
+    files = expand_scan_paths(paths)
+
+    files_done = 0
+    pages = 0
+    payload_count = 0
+    with span("scan") as scan_span:
+        workers = _resolve_scan_workers(files, jobs=jobs)
+        if workers <= 1:
+            steps = _scan_sequential(files, decoder, cache=cache)
         else:
+            kind = _resolve_scan_executor(executor)
+            scan_span.count("workers", workers)
+            steps = _scan_parallel(
+                files, decoder, workers=workers, kind=kind, grid=grid, cache=cache
+            )
+        with closing(steps):
+            file_payloads: list[bytes] = []
+            last_page: int | None = None
+            for path, page_index, step_payloads in steps:
+                if page_index is None:
+                    files_done += 1
+                    scan_span.add("files")
+                    if progress is not None:
+                        progress(ScanProgress(files_done, len(files), pages, payload_count))
+                    if stop_when is not None and stop_when(path, file_payloads):
+                        break
+                    file_payloads = []
+                    last_page = None
+                    continue
+                if page_index != last_page:
+                    pages += 1
+                    last_page = page_index
+                for payload in step_payloads:
+                    payload_count += 1
+                    file_payloads.append(payload)
+                    yield ScannedPayload(path, page_index, payload)
+                if progress is not None:
+                    progress(ScanProgress(files_done, len(files), pages, payload_count))
+        scan_span.count("pages", pages)
+        scan_span.count("payloads", payload_count)
+        if cache is not None:
+            scan_span.count("cache_hits", cache.hits)
+
+    if not payload_count:
+        raise QrScanError("no QR codes found in scan inputs")
+
+
+def scan_qr_payloads(
+    paths: Sequence[str | Path],
+    *,
+    jobs: int | None = None,
+    executor: ScanExecutorKind | None = None,
+    stop_when: ScanStopPredicate | None = None,
+    grid: ScanGrid | None = None,
+    cache: ScanCache | None = None,
+) -> list[bytes]:
+    """Scan one or more paths and return decoded QR payload bytes.
+
+    Images (files and PDF page images) are decoded on a worker pool sized by `jobs`, then
+    the active `scan_session`, then `ETHERNITY_SCAN_JOBS`, then the CPU count. Payloads
+    keep input order whatever the pool size: files in expansion order, PDF images in page order.
+
+    `stop_when` is called with each file and its payloads, in order; returning True stops the
+    scan and leaves the remaining files unread. `grid` (or the active `scan_session` grid)
+    describes the expected page layout and enables tiled retries for short pages. Files found
+    in `cache` are not decoded again, and decoded files are offered back to it.
+    """
+
+    return [
+        item.payload
+        for item in iter_qr_payloads(
+            paths, jobs=jobs, executor=executor, stop_when=stop_when, grid=grid, cache=cache
+        )
+    ]
+
+
+def expand_scan_paths(paths: Sequence[str | Path]) -> list[Path]:
+    """Expand scan inputs into the ordered list of files `scan_qr_payloads` reads."""
+
+    files = list(_expand_paths(paths))
+    for path in files:
+        if _scan_kind(path) is None:
             raise QrScanError(f"unsupported scan file type: {path}")
+    return files
 
-    if not payloads:
-        raise QrScanError("no QR codes found in scan inputs")
-    return payloads
 
+def _scan_kind(path: Path) -> Literal["pdf", "image"] | None:
+    suffix = path.suffix.lower()
+    if suffix == ".pdf":
+        return "pdf"
+    if suffix in _IMAGE_SUFFIXES:
+        return "image"
+    return None
+
+
+def _resolve_scan_workers(files: Sequence[Path], *, jobs: int | None) -> int:
+    """Resolve scan worker count from the caller, context, `ETHERNITY_SCAN_JOBS`, or CPUs."""
+
+    if jobs is not None and jobs <= 0:
+        raise ValueError("scan jobs must be a positive integer")
+    if jobs is None:
+        jobs = _SCAN_JOBS.get()
+    requested = jobs if jobs is not None else jobs_from_env(_SCAN_JOBS_ENV)
+    # A PDF fans out into one task per page image; count it as a page-sized batch up front.
+    task_count = sum(_PDF_TASK_ESTIMATE if _scan_kind(path) == "pdf" else 1 for path in files)
+    return resolve_worker_count(
+        task_count,
+        requested=requested,
+        cap=_DEFAULT_SCAN_WORKERS_CAP,
+        min_tasks_per_worker=_MIN_SCAN_TASKS_PER_WORKER,
+    )
 
-def _load_decoder() -> QrDecoder:
-    """Build the default zxingcpp/Pillow-backed QR decoder adapter."""
+
+def _resolve_scan_executor(kind: ScanExecutorKind | None) -> Literal["thread", "process"]:
+    """Pick the pool type; `auto` uses threads because zxing-cpp and Pillow release the GIL."""
+
+    raw = kind if kind is not None else os.environ.get(_SCAN_EXECUTOR_ENV, "auto")
+    value = raw.strip().lower()
+    if value not in {"auto", "thread", "process"}:
+        raise ValueError(f"{_SCAN_EXECUTOR_ENV} must be 'auto', 'thread', or 'process'")
+    return "process" if value == "process" else "thread"
+
+
+# A scan step is one decoded page (or PDF image) of a file; `None` as the page index marks
+# the end of that file.
+_ScanStep = tuple[Path, int | None, list[bytes]]
+
+
+def _scan_sequential(
+    files: Sequence[Path],
+    decoder: QrDecoder,
+    *,
+    cache: ScanCache | None = None,
+) -> Generator[_ScanStep, None, None]:
+    """Decode scan files one at a time on the calling thread."""
+
+    for path in files:
+        cached = cache.get(path) if cache is not None else None
+        if cached is not None:
+            for page_index, payload in cached:
+                yield path, page_index, [payload]
+            yield path, None, []
+            continue
+        if _scan_kind(path) == "pdf":
+            pages = _iter_pdf_pages(path, decoder)
+        else:
+            pages = iter([(0, _scan_image(path, decoder))])
+        found: list[tuple[int, bytes]] = []
+        for page_index, payloads in pages:
+            found.extend((page_index, payload) for payload in payloads)
+            yield path, page_index, payloads
+        if cache is not None:
+            cache.put(path, found)
+        yield path, None, []
+
+
+def _scan_parallel(
+    files: Sequence[Path],
+    decoder: QrDecoder,
+    *,
+    workers: int,
+    kind: Literal["thread", "process"],
+    grid: ScanGrid | None = None,
+    cache: ScanCache | None = None,
+) -> Generator[_ScanStep, None, None]:
+    """Decode scan tasks on a pool and yield per-page results in submission order.
+
+    PDF page images are extracted lazily on the calling thread and at most `workers * 2`
+    decodes are in flight, so large PDFs are never held in memory all at once. Closing the
+    generator cancels decodes that have not started.
+    """
+
+    pool: concurrent.futures.Executor
+    if kind == "process":
+        pool = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+        submit_path: Callable[[Path], list[bytes]] = functools.partial(
+            _process_decode_image_path, grid=grid
+        )
+        submit_bytes: Callable[[bytes], list[bytes]] = functools.partial(
+            _process_decode_image_bytes, grid=grid
+        )
+    else:
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+        submit_path = decoder.decode_image_path
+        submit_bytes = decoder.decode_image_bytes
+
+    # Each entry is a decode task for one page, or a `None` future marking the end of a file.
+    pending: deque[tuple[concurrent.futures.Future[list[bytes]] | None, Path, int, bool]] = deque()
+    found: list[tuple[int, bytes]] = []
+    max_pending = workers * 2
+
+    def _drain(limit: int) -> Iterator[_ScanStep]:
+        nonlocal found
+        while len(pending) > limit:
+            future, path, page_index, embedded = pending.popleft()
+            if future is None:
+                if cache is not None:
+                    cache.put(path, found)
+                found = []
+                yield path, None, []
+                continue
+            payloads = _collect_scan_result(future, None if embedded else path)
+            found.extend((page_index, payload) for payload in payloads)
+            yield path, page_index, payloads
+
+    with pool:
+        try:
+            for path in files:
+                cached = cache.get(path) if cache is not None else None
+                if cached is not None:
+                    for page_index, payload in cached:
+                        done: concurrent.futures.Future[list[bytes]] = concurrent.futures.Future()
+                        done.set_result([payload])
+                        pending.append((done, path, page_index, False))
+                elif _scan_kind(path) == "pdf":
+                    for page_index, data in _iter_pdf_image_data(path):
+                        pending.append((pool.submit(submit_bytes, data), path, page_index, True))
+                        yield from _drain(max_pending)
+                else:
+                    pending.append((pool.submit(submit_path, path), path, 0, False))
+                pending.append((None, path, 0, False))
+                yield from _drain(max_pending)
+            yield from _drain(0)
+        finally:
+            for future, _path, _page_index, _embedded in pending:
+                if future is not None:
+                    future.cancel()
+
+
+def _collect_scan_result(
+    future: concurrent.futures.Future[list[bytes]],
+    image_path: Path | None,
+) -> list[bytes]:
+    """Resolve one decode task with the same error policy as sequential scanning.
+
+    Unreadable image files are fatal; unreadable images embedded in a PDF are skipped.
+    """
+
+    try:
+        return future.result()
+    except OSError as exc:
+        if image_path is None:
+            return []
+        raise QrScanError(f"failed to read image: {image_path}") from exc
+
+
+@functools.lru_cache(maxsize=4)
+def _process_decoder(grid: ScanGrid | None) -> QrDecoder:
+    """Decoder built once per worker process and grid."""
+
+    return _load_decoder(grid=grid)
+
+
+def _process_decode_image_path(path: Path, *, grid: ScanGrid | None = None) -> list[bytes]:
+    return _process_decoder(grid).decode_image_path(path)
+
+
+def _process_decode_image_bytes(data: bytes, *, grid: ScanGrid | None = None) -> list[bytes]:
+    return _process_decoder(grid).decode_image_bytes(data)
+
+
+def _load_decoder(*, grid: ScanGrid | None = None) -> QrDecoder:
+    """Build the default zxingcpp/Pillow-backed QR decoder adapter.
+
+    The decoder shares the active `scan_session` transform ranking, or starts its own, and
+    records retried payloads in the session's retry log when it has one.
+    """
 
     zxing_module = _module("zxingcpp", zxingcpp)
     image_module = _module("PIL.Image", pil_image)
@@ -120,17 +734,26 @@ def _load_decoder() -> QrDecoder:
     if image_module is None:
         raise QrScanError("Pillow is required to scan QR payloads")
 
+    # Bound here because decode threads do not inherit the caller's context.
+    ranking = _SCAN_RANKING.get() or TransformRanking()
+    retries = _SCAN_RETRIES.get()
     return QrDecoder(
         name="zxingcpp",
         decode_image_path=functools.partial(
             _decode_image_path,
             zxing_module=zxing_module,
             image_module=image_module,
+            grid=grid,
+            ranking=ranking,
+            retries=retries,
         ),
         decode_image_bytes=functools.partial(
             _decode_image_bytes,
             zxing_module=zxing_module,
             image_module=image_module,
+            grid=grid,
+            ranking=ranking,
+            retries=retries,
         ),
     )
 
@@ -147,6 +770,30 @@ def _scan_image(path: Path, decoder: QrDecoder) -> list[bytes]:
 def _scan_pdf(path: Path, decoder: QrDecoder) -> list[bytes]:
     """Decode QR payloads from all embedded page images in a PDF."""
 
+    return [
+        payload for _page_index, payloads in _iter_pdf_pages(path, decoder) for payload in payloads
+    ]
+
+
+def _iter_pdf_pages(path: Path, decoder: QrDecoder) -> Iterator[tuple[int, list[bytes]]]:
+    """Yield `(page_index, payloads)` for each PDF page image; unreadable images yield nothing."""
+
+    for page_index, data in _iter_pdf_image_data(path):
+        try:
+            payloads = decoder.decode_image_bytes(data)
+        except OSError:
+            payloads = []
+        yield page_index, payloads
+
+
+def _iter_pdf_image_data(path: Path) -> Iterator[tuple[int, bytes]]:
+    """Yield `(page_index, image_bytes)` page by page without extracting the whole PDF first.
+
+    Pages without embedded images (vector QR codes, print-driver re-exports) are rasterized
+    at `ETHERNITY_SCAN_DPI` with pypdfium2. Without pypdfium2 such pages are skipped, and a
+    PDF that yields nothing at all raises `PdfRasterizerUnavailableError`.
+    """
+
     pypdf_module = _module("pypdf", pypdf)
     if pypdf_module is None:
         raise QrScanError("pypdf is required to scan PDF inputs")
@@ -154,16 +801,95 @@ def _scan_pdf(path: Path, decoder: QrDecoder) -> list[bytes]:
         reader = pypdf_module.PdfReader(str(path))
     except (OSError, pypdf_module.errors.PdfReadError, ValueError) as exc:
         raise QrScanError(f"failed to read PDF: {path}") from exc
-    payloads: list[bytes] = []
-    for page in reader.pages:
-        if not hasattr(page, "images"):
-            raise QrScanError("pypdf is missing page.images support (upgrade pypdf)")
-        for image in page.images:
-            try:
-                payloads.extend(decoder.decode_image_bytes(image.data))
-            except OSError:
+    rasterizer: _PdfRasterizer | None = None
+    yielded = False
+    try:
+        for page_index, page in enumerate(reader.pages):
+            if not hasattr(page, "images"):
+                raise QrScanError("pypdf is missing page.images support (upgrade pypdf)")
+            images = page.images
+            if len(images) == 0:
+                if rasterizer is None:
+                    rasterizer = _PdfRasterizer(path, dpi=_resolve_raster_dpi())
+                data = rasterizer.render_page(page_index)
+                if data is not None:
+                    yielded = True
+                    yield page_index, data
                 continue
-    return payloads
+            for image in images:
+                yielded = True
+                yield page_index, image.data
+        if not yielded and rasterizer is not None and rasterizer.unavailable:
+            raise PdfRasterizerUnavailableError(
+                f"PDF has no embedded images and pypdfium2 is not installed to render its "
+                f"vector QR codes: {path} (install pypdfium2, or scan an image export instead)"
+            )
+    finally:
+        if rasterizer is not None:
+            rasterizer.close()
+
+
+def _resolve_raster_dpi() -> int:
+    raw = os.environ.get(_SCAN_DPI_ENV, "").strip()
+    if not raw:
+        return _DEFAULT_RASTER_DPI
+    try:
+        dpi = int(raw)
+    except ValueError:
+        raise ValueError(f"{_SCAN_DPI_ENV} must be a positive integer") from None
+    if dpi <= 0:
+        raise ValueError(f"{_SCAN_DPI_ENV} must be a positive integer")
+    return dpi
+
+
+class _PdfRasterizer:
+    """Render PDF pages to grayscale bitmaps with pypdfium2, opening the document lazily."""
+
+    def __init__(self, path: Path, *, dpi: int) -> None:
+        self._path = path
+        self._scale = dpi / _PDF_POINTS_PER_INCH
+        self._document: Any | None = None
+        self._unavailable = False
+
+    def render_page(self, page_index: int) -> bytes | None:
+        """Return the page as PGM image bytes, or None when rasterization is unavailable."""
+
+        document = self._open()
+        if document is None:
+            return None
+        page = document[page_index]
+        try:
+            bitmap = page.render(scale=self._scale, grayscale=True)
+            image = bitmap.to_pil()
+        finally:
+            page.close()
+        buffer = io.BytesIO()
+        image.save(buffer, format="PPM")
+        return buffer.getvalue()
+
+    @property
+    def unavailable(self) -> bool:
+        """Return whether rendering was attempted and pypdfium2 could not be imported."""
+
+        return self._unavailable
+
+    def close(self) -> None:
+        if self._document is not None:
+            self._document.close()
+            self._document = None
+
+    def _open(self) -> Any | None:
+        if self._document is not None or self._unavailable:
+            return self._document
+        pdfium_module = _module("pypdfium2", pypdfium2)
+        if pdfium_module is None:
+            self._unavailable = True
+            return None
+        try:
+            self._document = pdfium_module.PdfDocument(str(self._path))
+        except (OSError, pdfium_module.PdfiumError) as exc:
+            raise QrScanError(f"failed to rasterize PDF: {self._path}") from exc
+        return self._document
 
 
 def _expand_paths(paths: Sequence[str | Path]) -> Iterable[Path]:
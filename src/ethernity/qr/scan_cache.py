@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+"""On-disk cache of decoded QR payloads per scanned file."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+import cbor2
+
+SCAN_CACHE_FORMAT = 2
+DEFAULT_SCAN_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+_ENTRIES_DIRNAME = "entries"
+_STAT_DIRNAME = "stat"
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+PayloadFilter = Callable[[Sequence[bytes]], bool]
+# `(page_index, payload)` pairs in scan order.
+PagePayloads = list[tuple[int, bytes]]
+
+
+class ScanCache:
+    """Decoded payloads keyed by file SHA-256 and decoder fingerprint.
+
+    A `(path, size, mtime_ns, inode)` record maps unchanged files to their content hash so
+    repeat scans skip hashing. Only payload sets accepted by `accept` are stored; callers use
+    it to keep secrets (e.g. shard frames) out of the cache. Cache I/O errors are treated as
+    misses and never fail a scan. The oldest files are evicted once the cache exceeds
+    `max_bytes`.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        fingerprint: str,
+        accept: PayloadFilter,
+        max_bytes: int = DEFAULT_SCAN_CACHE_MAX_BYTES,
+    ) -> None:
+        self.root = root
+        self.fingerprint = fingerprint
+        self.max_bytes = max_bytes
+        self._accept = accept
+        # Entry keys from `get` misses, so `put` does not hash the file again.
+        self._pending: dict[Path, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: Path) -> PagePayloads | None:
+        """Return cached `(page_index, payload)` pairs for `path`, or None on a miss."""
+
+        try:
+            entry_key = self._entry_key(path)
+        except OSError:
+            self.misses += 1
+            return None
+        entry_path = self._entries_dir / entry_key
+        payloads = self._read_entry(entry_path)
+        if payloads is None:
+            self._pending[path] = entry_key
+            self.misses += 1
+            return None
+        self.hits += 1
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        return payloads
+
+    def put(self, path: Path, pages: Sequence[tuple[int, bytes]]) -> None:
+        """Store pages decoded from `path` after a `get` miss, if `accept` allows the payloads."""
+
+        entry_key = self._pending.pop(path, None)
+        if entry_key is None or not pages:
+            return
+        if not self._accept([payload for _page_index, payload in pages]):
+            return
+        data = cbor2.dumps(
+            {
+                "format": SCAN_CACHE_FORMAT,
+                "payloads": [[page_index, bytes(payload)] for page_index, payload in pages],
+            }
+        )
+        try:
+            _write_atomic(self._entries_dir / entry_key, data)
+            self._evict()
+        except OSError:
+            return
+
+    @property
+    def _entries_dir(self) -> Path:
+        return self.root / _ENTRIES_DIRNAME
+
+    @property
+    def _stat_dir(self) -> Path:
+        return self.root / _STAT_DIRNAME
+
+    def _entry_key(self, path: Path) -> str:
+        resolved = path.resolve()
+        stat = resolved.stat()
+        stat_key = hashlib.sha256(
+            f"{resolved}\0{stat.st_size}\0{stat.st_mtime_ns}\0{stat.st_ino}".encode()
+        ).hexdigest()
+        stat_path = self._stat_dir / stat_key
+        content_hash = _read_text(stat_path)
+        if content_hash is None:
+            content_hash = _sha256_file(resolved)
+            try:
+                _write_atomic(stat_path, content_hash.encode("ascii"))
+            except OSError:
+                pass
+        return hashlib.sha256(f"{content_hash}\0{self.fingerprint}".encode()).hexdigest()
+
+    def _read_entry(self, entry_path: Path) -> PagePayloads | None:
+        try:
+            data = entry_path.read_bytes()
+        except OSError:
+            return None
+        try:
+            decoded = cbor2.loads(data)
+        except (cbor2.CBORDecodeError, ValueError):
+            decoded = None
+        payloads = decoded.get("payloads") if isinstance(decoded, dict) else None
+        if (
+            not isinstance(decoded, dict)
+            or decoded.get("format") != SCAN_CACHE_FORMAT
+            or not isinstance(payloads, list)
+            or not all(_is_page_payload(item) for item in payloads)
+        ):
+            _unlink_quietly(entry_path)
+            return None
+        return [(page_index, payload) for page_index, payload in payloads]
+
+    def _evict(self) -> None:
+        files: list[tuple[float, int, Path]] = []
+        total = 0
+        for directory in (self._entries_dir, self._stat_dir):
+            try:
+                entries = list(os.scandir(directory))
+            except FileNotFoundError:
+                continue
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, Path(entry.path)))
+                total += stat.st_size
+        if total <= self.max_bytes:
+            return
+        for _mtime, size, path in sorted(files):
+            _unlink_quietly(path)
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+
+def _is_page_payload(item: object) -> bool:
+    return (
+        isinstance(item, list)
+        and len(item) == 2
+        and isinstance(item[0], int)
+        and isinstance(item[1], bytes)
+    )
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        while chunk := handle.read(_HASH_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_text(path: Path) -> str | None:
+    try:
+        return path.read_text(encoding="ascii").strip() or None
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        _unlink_quietly(Path(tmp_name))
+        raise
+
+
+def _unlink_quietly(path: Path) -> None:
+    try:
+        path.unlink()
+    except OSError:
+        pass
+
+
+__all__ = ["DEFAULT_SCAN_CACHE_MAX_BYTES", "SCAN_CACHE_FORMAT", "ScanCache"]
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+"""Poll a directory for scan files as they arrive."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from ethernity.qr.scan import QrScanError, _iter_scan_files
+
+
+class ScanWatcher:
+    """Report scan files under `directory` once each has finished arriving.
+
+    A file is ready when its size and mtime are unchanged between two polls, so images still
+    being written by a sync client are not decoded half-way. Each version of a file is
+    reported once; a file that is replaced later is reported again.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        if not directory.is_dir():
+            raise QrScanError(f"scan watch directory not found: {directory}")
+        self.directory = directory
+        self._last_seen: dict[Path, tuple[int, int]] = {}
+        self._reported: dict[Path, tuple[int, int]] = {}
+
+    def poll(self) -> list[Path]:
+        """Return files that became ready since the previous poll, in path order."""
+
+        ready: list[Path] = []
+        current: dict[Path, tuple[int, int]] = {}
+        for path in _iter_scan_files(self.directory):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            signature = (stat.st_size, stat.st_mtime_ns)
+            current[path] = signature
+            if stat.st_size == 0 or self._last_seen.get(path) != signature:
+                continue
+            if self._reported.get(path) == signature:
+                continue
+            self._reported[path] = signature
+            ready.append(path)
+        self._last_seen = current
+        return ready
+
+
+__all__ = ["ScanWatcher"]
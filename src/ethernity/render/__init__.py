@@ -13,7 +13,7 @@
 # You should have received a copy of the GNU General Public License along with this program.
 # If not, see <https://www.gnu.org/licenses/>.
 
-from ethernity.render.pdf_render import render_frames_to_pdf
+from ethernity.render.pdf_render import render_frames_to_html, render_frames_to_pdf
 from ethernity.render.service import RenderService
 from ethernity.render.types import FallbackSection, RenderInputs
 
@@ -21,5 +21,6 @@ __all__ = [
     "FallbackSection",
     "RenderInputs",
     "RenderService",
+    "render_frames_to_html",
     "render_frames_to_pdf",
 ]
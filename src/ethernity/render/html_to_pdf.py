@@ -20,10 +20,17 @@ from __future__ import annotations
 
 import atexit
 from pathlib import Path
-from typing import Mapping
+from typing import Any, Mapping
 
 from playwright.sync_api import Browser, Playwright, sync_playwright
 
+RESOURCE_ROUTE_PATTERN = "https://ethernity.local/**"
+PDF_OPTIONS: Mapping[str, Any] = {
+    "print_background": True,
+    "prefer_css_page_size": True,
+    "margin": {"top": "0mm", "right": "0mm", "bottom": "0mm", "left": "0mm"},
+}
+
 _PLAYWRIGHT: Playwright | None = None
 _BROWSER: Browser | None = None
 
@@ -68,17 +75,12 @@ def render_html_to_pdf(
     try:
         if resources:
             page.route(
-                "https://ethernity.local/**",
+                RESOURCE_ROUTE_PATTERN,
                 lambda route, request: _route_resource(route, request, resources),
             )
         page.set_content(html, wait_until="networkidle")
         page.emulate_media(media="print")
-        page.pdf(
-            path=str(output_path),
-            print_background=True,
-            prefer_css_page_size=True,
-            margin={"top": "0mm", "right": "0mm", "bottom": "0mm", "left": "0mm"},
-        )
+        page.pdf(path=str(output_path), **PDF_OPTIONS)
     finally:
         page.close()
 
@@ -86,14 +88,19 @@ def render_html_to_pdf(
 def _route_resource(route, request, resources: Mapping[str, tuple[str, bytes]]) -> None:
     """Serve an in-memory resource for a Playwright request or return 404."""
 
-    entry = resources.get(request.url)
+    route.fulfill(**resource_response(request.url, resources))
+
+
+def resource_response(url: str, resources: Mapping[str, tuple[str, bytes]]) -> dict[str, Any]:
+    """Return `route.fulfill` keyword arguments for an in-memory resource URL."""
+
+    entry = resources.get(url)
     if entry is None:
-        route.fulfill(status=404, body=b"")
-        return
+        return {"status": 404, "body": b""}
     content_type, body = entry
-    route.fulfill(
-        status=200,
-        body=body,
-        content_type=content_type,
-        headers={"Cache-Control": "no-store"},
-    )
+    return {
+        "status": 200,
+        "body": body,
+        "content_type": content_type,
+        "headers": {"Cache-Control": "no-store"},
+    }
@@ -26,6 +26,7 @@ from fpdf import FPDF
 from ethernity.encoding.chunking import reassemble_payload
 from ethernity.encoding.framing import VERSION, Frame, FrameType, encode_frame
 from ethernity.encoding.zbase32 import encode_zbase32
+from ethernity.qr.scan import ScanGrid
 from ethernity.render.doc_types import DOC_TYPE_RECOVERY, DOC_TYPE_SHARD, DOC_TYPE_SIGNING_KEY_SHARD
 from ethernity.render.fallback import fallback_lines_from_sections, label_line_height_fallback
 from ethernity.render.fallback_text import format_zbase32_lines
@@ -57,7 +58,7 @@ from ethernity.render.text import (
 )
 from ethernity.render.types import Layout, RenderInputs
 
-__all__ = ["compute_layout"]
+__all__ = ["compute_layout", "scan_grid_for_layout"]
 
 
 def _calculate_content_positions(
@@ -441,3 +442,19 @@ def compute_layout(
         total_pages=total_pages,
     )
     return layout, fallback_lines
+
+
+def scan_grid_for_layout(layout: Layout) -> ScanGrid:
+    """Describe a layout's QR grid for tiled scanning of pages rendered with it."""
+    gap_y = layout.gap_y_override if layout.gap_y_override is not None else layout.gap
+    return ScanGrid(
+        page_w=layout.page_w,
+        page_h=layout.page_h,
+        x=layout.margin,
+        y=layout.content_start_y,
+        qr_size=layout.qr_size,
+        gap_x=layout.gap,
+        gap_y=gap_y,
+        cols=layout.cols,
+        rows=layout.rows,
+    )
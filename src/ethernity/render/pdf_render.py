@@ -21,7 +21,6 @@ from __future__ import annotations
 import concurrent.futures
 import functools
 import json
-import os
 from dataclasses import asdict, dataclass, replace
 from datetime import date, datetime, timezone
 from pathlib import Path
@@ -30,6 +29,8 @@ from typing import Any, Callable, Literal, Sequence, cast
 from fpdf import FPDF
 
 from ethernity.config.paths import TEMPLATES_RESOURCE_ROOT
+from ethernity.core.concurrency import jobs_from_env, resolve_worker_count
+from ethernity.core.timing import span
 from ethernity.encoding.framing import encode_frame
 from ethernity.qr.codec import QrConfig, qr_bytes
 from ethernity.render.copy_catalog import build_copy_bundle
@@ -298,6 +299,16 @@ def _write_layout_debug_json(
 def render_frames_to_pdf(inputs: RenderInputs) -> None:
     """Render frames to a PDF by building layout, template context, and QR resources."""
 
+    with span("render", frames=len(inputs.frames)) as render_span:
+        html, resources = render_frames_to_html(inputs)
+        render_span.count("resources", len(resources))
+        with span("render.chromium"):
+            render_html_to_pdf(html, inputs.output_path, resources=resources)
+
+
+def render_frames_to_html(inputs: RenderInputs) -> tuple[str, dict[str, tuple[str, bytes]]]:
+    """Build the print HTML and routable resources for a document without launching Chromium."""
+
     if not inputs.frames:
         raise ValueError("frames cannot be empty")
 
@@ -413,14 +424,15 @@ def render_frames_to_pdf(inputs: RenderInputs) -> None:
     qr_kind = _qr_kind(qr_config)
     resources = dict(_build_static_template_resources())
     if inputs.render_qr:
-        resources.update(
-            _build_qr_resources(
-                qr_payloads,
-                config=qr_config,
-                kind=qr_kind,
-                render_jobs=inputs.render_jobs,
+        with span("render.qr", qr_codes=len(qr_payloads)):
+            resources.update(
+                _build_qr_resources(
+                    qr_payloads,
+                    config=qr_config,
+                    kind=qr_kind,
+                    render_jobs=inputs.render_jobs,
+                )
             )
-        )
     qr_url_for_index = functools.partial(_qr_url_for_index, kind=qr_kind)
 
     pages = build_pages(
@@ -446,6 +458,7 @@ def render_frames_to_pdf(inputs: RenderInputs) -> None:
             passphrase_lines=recovery_meta.passphrase_lines,
             quorum_value=recovery_meta.quorum_value,
             signing_pub_lines=recovery_meta.signing_pub_lines,
+            passphrase_label=recovery_meta.passphrase_label,
         )
     context = TemplateContext(
         page_size_css=_page_size_css(spec),
@@ -490,8 +503,7 @@ def render_frames_to_pdf(inputs: RenderInputs) -> None:
         layout_rest=layout_rest,
         pages=pages,
     )
-    html = render_template(inputs.template_path, context)
-    render_html_to_pdf(html, inputs.output_path, resources=resources)
+    return render_template(inputs.template_path, context), resources
 
 
 def _qr_kind(config: QrConfig) -> str:
@@ -564,54 +576,15 @@ def _resolve_qr_workers(
 ) -> int:
     """Resolve QR render worker count from config and environment overrides."""
 
-    raw = os.environ.get(_RENDER_JOBS_ENV, "").strip().lower()
-    explicit = False
-    requested: int | None = None
-    if raw and raw != "auto":
-        try:
-            parsed = int(raw)
-        except ValueError:
-            raise ValueError(f"{_RENDER_JOBS_ENV} must be a positive integer or 'auto'") from None
-        if parsed <= 0:
-            raise ValueError(f"{_RENDER_JOBS_ENV} must be a positive integer or 'auto'")
-        requested = parsed
-        explicit = True
-    elif configured is not None:
-        if configured != "auto":
-            requested = configured
-            explicit = True
-
-    cpu = _process_cpu_count()
-    if requested is None:
-        requested = min(cpu, _DEFAULT_QR_WORKERS_CAP)
-
-    workers = max(1, min(requested, cpu, task_count))
-    if not explicit:
-        workers = min(workers, max(1, task_count // _MIN_QR_TASKS_PER_WORKER))
-
-    return max(1, workers)
-
-
-def _process_cpu_count() -> int:
-    """Best-effort process-scoped CPU count across Python and OS variants."""
-
-    process_cpu_count = cast(
-        Callable[[], int | None] | None, getattr(os, "process_cpu_count", None)
+    requested = jobs_from_env(_RENDER_JOBS_ENV)
+    if requested is None and configured is not None and configured != "auto":
+        requested = configured
+    return resolve_worker_count(
+        task_count,
+        requested=requested,
+        cap=_DEFAULT_QR_WORKERS_CAP,
+        min_tasks_per_worker=_MIN_QR_TASKS_PER_WORKER,
     )
-    if callable(process_cpu_count):
-        return max(1, process_cpu_count() or 1)
-
-    sched_getaffinity = cast(
-        Callable[[int], Sequence[object]] | None,
-        getattr(os, "sched_getaffinity", None),
-    )
-    if callable(sched_getaffinity):
-        try:
-            return max(1, len(sched_getaffinity(0)))
-        except (OSError, TypeError):
-            pass
-
-    return max(1, os.cpu_count() or 1)
 
 
 def _qr_content_type(kind: str) -> str:
@@ -634,4 +607,4 @@ def _qr_kwargs(config: QrConfig) -> dict[str, Any]:
     return vars(config)
 
 
-__all__ = ["render_frames_to_pdf"]
+__all__ = ["render_frames_to_html", "render_frames_to_pdf"]
@@ -22,6 +22,7 @@ from typing import Sequence
 
 _SIGNING_PUB_GROUP_SIZE = 4
 _SIGNING_PUB_LINE_LENGTH = 40
+_AGE_IDENTITY_LINE_LENGTH = 37
 
 
 @dataclass(frozen=True)
@@ -30,6 +31,7 @@ class RecoveryMeta:
     passphrase_lines: tuple[str, ...] = ()
     quorum_value: str | None = None
     signing_pub_lines: tuple[str, ...] = ()
+    passphrase_label: str = "Passphrase"
 
 
 def wrap_passphrase(passphrase: str, *, words_per_line: int = 6) -> tuple[str, ...]:
@@ -41,6 +43,13 @@ def wrap_passphrase(passphrase: str, *, words_per_line: int = 6) -> tuple[str, .
     )
 
 
+def wrap_age_identity(
+    identity: str, *, line_length: int = _AGE_IDENTITY_LINE_LENGTH
+) -> tuple[str, ...]:
+    compact = "".join(identity.split())
+    return tuple(compact[idx : idx + line_length] for idx in range(0, len(compact), line_length))
+
+
 def split_signing_pub_tokens(lines: Sequence[str]) -> list[str]:
     tokens: list[str] = []
     hex_chars = set(string.hexdigits)
@@ -95,7 +104,10 @@ def build_recovery_meta(
     quorum_threshold: int | None,
     quorum_shares: int | None,
     signing_pub: bytes | None,
+    age_identity: str | None = None,
 ) -> RecoveryMeta:
+    if passphrase and age_identity:
+        raise ValueError("passphrase and age_identity are mutually exclusive")
     if (quorum_threshold is None) != (quorum_shares is None):
         raise ValueError("quorum_threshold and quorum_shares must be provided together")
     if quorum_threshold is not None and quorum_threshold <= 0:
@@ -109,6 +121,14 @@ def build_recovery_meta(
         else f"{quorum_threshold} of {quorum_shares}"
     )
     signing_pub_lines = normalize_signing_pub_lines((signing_pub.hex(),)) if signing_pub else ()
+    if age_identity:
+        return RecoveryMeta(
+            passphrase=age_identity,
+            passphrase_lines=wrap_age_identity(age_identity),
+            quorum_value=quorum_value,
+            signing_pub_lines=signing_pub_lines,
+            passphrase_label="Age identity",
+        )
     return RecoveryMeta(
         passphrase=passphrase,
         passphrase_lines=wrap_passphrase(passphrase) if passphrase else (),
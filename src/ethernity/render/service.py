@@ -27,6 +27,7 @@ from ethernity.core.bounds import MAX_QR_PAYLOAD_CHARS
 from ethernity.encoding.framing import Frame, encode_frame
 from ethernity.encoding.qr_payloads import (
     QR_PAYLOAD_CODEC_BASE64,
+    QR_PAYLOAD_CODEC_RAW,
     QrPayloadCodec,
     encode_qr_payload,
 )
@@ -65,7 +66,7 @@ class RenderService:
         payloads: list[bytes | str] = []
         for frame in frames:
             payload = encode_qr_payload(encode_frame(frame), codec=codec)
-            if codec == QR_PAYLOAD_CODEC_BASE64:
+            if codec != QR_PAYLOAD_CODEC_RAW:
                 if isinstance(payload, bytes):
                     try:
                         payload_text = payload.decode("ascii")
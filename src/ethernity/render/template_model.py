@@ -111,6 +111,7 @@ class RecoveryModel:
     passphrase_lines: tuple[str, ...]
     quorum_value: str | None
     signing_pub_lines: tuple[str, ...]
+    passphrase_label: str = "Passphrase"
 
 
 @dataclass(frozen=True)
@@ -166,6 +167,7 @@ class TemplateContext:
         return {
             "passphrase": recovery.passphrase,
             "passphrase_lines": list(recovery.passphrase_lines),
+            "passphrase_label": recovery.passphrase_label,
             "quorum_value": recovery.quorum_value,
             "signing_pub_lines": list(recovery.signing_pub_lines),
         }
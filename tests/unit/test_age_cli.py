@@ -16,7 +16,16 @@
 import unittest
 from unittest import mock
 
-from ethernity.crypto import AgeError, age_runtime, decrypt_bytes, encrypt_bytes_with_passphrase
+from ethernity.crypto import (
+    AGE_IDENTITY_PREFIX,
+    AgeError,
+    age_runtime,
+    decrypt_bytes,
+    encrypt_bytes_with_identity,
+    encrypt_bytes_with_passphrase,
+    generate_age_identity,
+    is_x25519_ciphertext,
+)
 
 
 class TestAgeCli(unittest.TestCase):
@@ -75,5 +84,37 @@ class TestAgeCli(unittest.TestCase):
         self.assertIn("decryption failed", str(ctx.exception))
 
 
+class TestAgeX25519(unittest.TestCase):
+    def test_generated_identity_roundtrip(self) -> None:
+        ciphertext, identity = encrypt_bytes_with_identity(b"payload")
+        self.assertTrue(identity.startswith(AGE_IDENTITY_PREFIX))
+        self.assertTrue(is_x25519_ciphertext(ciphertext))
+        self.assertEqual(decrypt_bytes(ciphertext, passphrase=identity), b"payload")
+
+    def test_passphrase_ciphertext_is_not_x25519(self) -> None:
+        ciphertext, _ = encrypt_bytes_with_passphrase(b"payload", passphrase="secret")
+        self.assertFalse(is_x25519_ciphertext(ciphertext))
+
+    def test_decrypt_accepts_wrapped_lowercase_identity(self) -> None:
+        identity = generate_age_identity()
+        ciphertext, used = encrypt_bytes_with_identity(b"payload", identity=identity.lower())
+        self.assertEqual(used, identity)
+        transcribed = f"{identity[:37].lower()}\n{identity[37:]}"
+        self.assertEqual(decrypt_bytes(ciphertext, passphrase=transcribed), b"payload")
+
+    def test_decrypt_with_other_identity_fails(self) -> None:
+        ciphertext, _ = encrypt_bytes_with_identity(b"payload")
+        for secret in (generate_age_identity(), "not an identity"):
+            with self.subTest(secret=secret[:16]):
+                with self.assertRaisesRegex(ValueError, "decryption failed"):
+                    decrypt_bytes(ciphertext, passphrase=secret)
+        with self.assertRaises(AgeError):
+            decrypt_bytes(ciphertext, passphrase=generate_age_identity(), debug=True)
+
+    def test_encrypt_rejects_passphrase_as_identity(self) -> None:
+        with self.assertRaisesRegex(ValueError, AGE_IDENTITY_PREFIX):
+            encrypt_bytes_with_identity(b"payload", identity="correct horse battery staple")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,143 @@
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from ethernity import aio
+from ethernity.cli.features.recover.execution import decrypt_manifest_and_extract
+from ethernity.cli.features.recover.planning import RecoveryPlan
+from ethernity.cli.shared.events import emit_progress
+from ethernity.cli.shared.ndjson import ndjson_session
+from ethernity.cli.shared.types import InputFile
+from ethernity.config import load_app_config
+from ethernity.config.paths import DEFAULT_CONFIG_PATH
+from ethernity.core.models import DocumentPlan
+from ethernity.crypto import encrypt_bytes_with_passphrase
+from ethernity.formats.envelope_codec import build_single_file_manifest, encode_envelope
+
+
+class _FakeRenderer:
+    def __init__(self, *, fail_on: str | None = None) -> None:
+        self.rendered: list[str] = []
+        self.fail_on = fail_on
+
+    async def render_html_to_pdf(self, html: str, output_path, *, resources=None) -> None:
+        _ = resources
+        name = Path(output_path).name
+        if self.fail_on == name:
+            raise RuntimeError("render failed")
+        await asyncio.sleep(0)
+        Path(output_path).write_bytes(b"%PDF-fake\n" + html[:32].encode("utf-8"))
+        self.rendered.append(name)
+
+
+def _input_file() -> InputFile:
+    return InputFile(
+        source_path=Path("input.txt"),
+        relative_path="input.txt",
+        data=b"async payload",
+        mtime=None,
+    )
+
+
+class TestAioBackup(unittest.TestCase):
+    def test_run_backup_async_renders_and_commits_documents(self) -> None:
+        config = load_app_config(path=DEFAULT_CONFIG_PATH)
+        renderer = _FakeRenderer()
+        buffer = io.StringIO()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir) / "out"
+            with ndjson_session(stream=buffer):
+                result = asyncio.run(
+                    aio.run_backup_async(
+                        input_files=[_input_file()],
+                        output_dir=str(output_dir),
+                        plan=DocumentPlan(version=1, sealed=False, sharding=None),
+                        passphrase="correct horse battery staple",
+                        config=config,
+                        renderer=renderer,  # type: ignore[arg-type]
+                    )
+                )
+            self.assertTrue(Path(result.qr_path).is_file())
+            self.assertTrue(Path(result.recovery_path).is_file())
+            self.assertEqual(Path(result.qr_path).parent, output_dir)
+
+        self.assertIn("qr_document.pdf", renderer.rendered)
+        self.assertIn("recovery_document.pdf", renderer.rendered)
+        events = [json.loads(line) for line in buffer.getvalue().splitlines()]
+        render_events = [
+            event for event in events if event["type"] == "progress" and event["phase"] == "render"
+        ]
+        self.assertEqual(len(render_events), len(renderer.rendered))
+        self.assertEqual(render_events[-1]["current"], render_events[-1]["total"])
+        self.assertIn("encrypt", [event.get("id") for event in events])
+
+    def test_run_backup_async_discards_staging_dir_on_render_failure(self) -> None:
+        config = load_app_config(path=DEFAULT_CONFIG_PATH)
+        renderer = _FakeRenderer(fail_on="recovery_document.pdf")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir) / "out"
+            with self.assertRaises(ExceptionGroup):
+                asyncio.run(
+                    aio.run_backup_async(
+                        input_files=[_input_file()],
+                        output_dir=str(output_dir),
+                        plan=DocumentPlan(version=1, sealed=False, sharding=None),
+                        passphrase="correct horse battery staple",
+                        config=config,
+                        renderer=renderer,  # type: ignore[arg-type]
+                    )
+                )
+            self.assertFalse(output_dir.exists())
+            self.assertEqual(list(Path(tmpdir).iterdir()), [])
+
+
+class TestAioRuntime(unittest.TestCase):
+    def test_run_blocking_keeps_active_event_sink(self) -> None:
+        buffer = io.StringIO()
+
+        async def _main() -> None:
+            await aio.run_blocking(None, emit_progress, phase="scan", current=1, total=2)
+
+        with ndjson_session(stream=buffer):
+            asyncio.run(_main())
+
+        events = [json.loads(line) for line in buffer.getvalue().splitlines()]
+        self.assertEqual(events[0]["phase"], "scan")
+        self.assertEqual(events[0]["total"], 2)
+
+    def test_decrypt_manifest_and_extract_async_matches_sync_path(self) -> None:
+        manifest = build_single_file_manifest("note.txt", b"hello", sealed=True)
+        envelope = encode_envelope(b"hello", manifest)
+        ciphertext, passphrase = encrypt_bytes_with_passphrase(envelope, passphrase="pw")
+        assert passphrase is not None
+        plan = mock.Mock(spec=RecoveryPlan, ciphertext=ciphertext, passphrase=passphrase)
+
+        async_manifest, async_extracted = asyncio.run(aio.decrypt_manifest_and_extract_async(plan))
+        sync_manifest, sync_extracted = decrypt_manifest_and_extract(plan, quiet=True)
+
+        self.assertEqual(async_manifest, sync_manifest)
+        self.assertEqual(async_extracted, sync_extracted)
+        self.assertEqual(async_extracted[0][1], b"hello")
+
+
+if __name__ == "__main__":
+    unittest.main()
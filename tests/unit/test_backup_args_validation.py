@@ -50,6 +50,18 @@ class TestBackupArgsValidation(unittest.TestCase):
             _validate_backup_args(args)
         self.assertIn("signing key shard count", str(ctx.exception).lower())
 
+    def test_x25519_key_mode_rejects_passphrase_options(self) -> None:
+        cases = (
+            (BackupArgs(key_mode="x25519", passphrase_generate=True), "age identity"),
+            (BackupArgs(key_mode="x25519", passphrase_words=24), "age identity"),
+            (BackupArgs(key_mode="x25519", passphrase="correct horse"), "AGE-SECRET-KEY-1"),
+        )
+        for args, message in cases:
+            with self.subTest(message=message):
+                with self.assertRaisesRegex(ValueError, message):
+                    _validate_backup_args(args)
+        _validate_backup_args(BackupArgs(key_mode="x25519"))
+
     def test_base_dir_existence_is_not_validated_in_preflight(self) -> None:
         args = BackupArgs(base_dir="~/definitely-missing")
         _validate_backup_args(args)
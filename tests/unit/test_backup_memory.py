@@ -0,0 +1,163 @@
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from ethernity.cli.features.backup import execution as backup_execution
+from ethernity.cli.features.backup.memory import (
+    GZIP_STATE_BYTES,
+    check_memory_limit,
+    estimate_backup_memory,
+    parse_memory_size,
+)
+from ethernity.cli.features.backup.service import prepare_backup_run
+from ethernity.cli.shared.io.inputs import _load_input_files
+from ethernity.cli.shared.types import BackupArgs, InputFile
+from ethernity.config import load_app_config
+from ethernity.config.paths import DEFAULT_CONFIG_PATH
+from ethernity.core.bounds import MAX_CIPHERTEXT_BYTES
+from ethernity.core.models import DocumentPlan
+from ethernity.formats.payload_codec import PayloadTooLargeError
+
+_MIB = 1024 * 1024
+
+
+class TestBackupMemoryEstimate(unittest.TestCase):
+    def test_parse_memory_size_accepts_binary_suffixes(self) -> None:
+        cases = {
+            "4096": 4096,
+            "64k": 64 * 1024,
+            "512M": 512 * _MIB,
+            "512MiB": 512 * _MIB,
+            "2 GB": 2 * 1024 * _MIB,
+        }
+        for raw, expected in cases.items():
+            with self.subTest(raw=raw):
+                self.assertEqual(parse_memory_size(raw), expected)
+
+    def test_parse_memory_size_rejects_invalid_values(self) -> None:
+        for raw in ("", "0", "-5M", "12X", "1.5G"):
+            with self.subTest(raw=raw):
+                with self.assertRaises(ValueError):
+                    parse_memory_size(raw)
+
+    def test_estimate_is_input_size_plus_bounded_overhead(self) -> None:
+        small = estimate_backup_memory([64 * _MIB], payload_codec="auto")
+        large = estimate_backup_memory([32 * _MIB, 32 * _MIB, 64 * _MIB], payload_codec="auto")
+        self.assertEqual(small.input_bytes, 64 * _MIB)
+        self.assertEqual(small.peak_stage, "render")
+        overhead = small.peak_bytes - small.input_bytes
+        self.assertLess(overhead, 32 * _MIB)
+        # Doubling the input adds the input once, not a multiple of it.
+        self.assertLess(large.peak_bytes - large.input_bytes - overhead, 4 * 1024)
+
+    def test_raw_codec_skips_compressor_state(self) -> None:
+        gzip_estimate = dict(estimate_backup_memory([4096], payload_codec="gzip").stages)
+        raw_estimate = dict(estimate_backup_memory([4096], payload_codec="raw").stages)
+        self.assertEqual(gzip_estimate["prepare"] - raw_estimate["prepare"], GZIP_STATE_BYTES)
+
+    def test_check_memory_limit_reports_peak_stage(self) -> None:
+        estimate = estimate_backup_memory([8 * _MIB], payload_codec="auto")
+        check_memory_limit(estimate, None)
+        check_memory_limit(estimate, estimate.peak_bytes)
+        with self.assertRaisesRegex(ValueError, "stage 'render'.*exceeds --max-memory 1.0 MiB"):
+            check_memory_limit(estimate, _MIB)
+
+
+class TestBackupMemoryAdmission(unittest.TestCase):
+    def test_load_input_files_reports_sizes_before_reading(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "a.bin").write_bytes(b"a" * 10)
+            (root / "b.bin").write_bytes(b"b" * 20)
+            seen: list[list[int]] = []
+
+            def _refuse(sizes: list[int]) -> None:
+                seen.append(sorted(sizes))
+                raise ValueError("too big")
+
+            with mock.patch.object(Path, "read_bytes") as read_mock:
+                with self.assertRaisesRegex(ValueError, "too big"):
+                    _load_input_files([], [str(root)], None, allow_stdin=False, before_read=_refuse)
+            read_mock.assert_not_called()
+            self.assertEqual(seen, [[10, 20]])
+
+    def test_prepare_backup_run_refuses_before_reading_inputs(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "large.bin"
+            path.write_bytes(b"\0" * (2 * _MIB))
+            args = BackupArgs(
+                config=str(DEFAULT_CONFIG_PATH),
+                input=[str(path)],
+                quiet=True,
+                max_memory=2 * _MIB,
+            )
+            with mock.patch.object(Path, "read_bytes") as read_mock:
+                with self.assertRaisesRegex(ValueError, "exceeds --max-memory 2.0 MiB"):
+                    prepare_backup_run(args)
+            read_mock.assert_not_called()
+
+            args.max_memory = 256 * _MIB
+            prepared = prepare_backup_run(args)
+            self.assertEqual(len(prepared.input_files), 1)
+
+
+class TestBackupEnvelopeBound(unittest.TestCase):
+    def _input(self, data: bytes) -> InputFile:
+        return InputFile(
+            source_path=Path("input.bin"), relative_path="input.bin", data=data, mtime=None
+        )
+
+    def test_prepare_envelope_rejects_payload_that_cannot_fit(self) -> None:
+        plan = DocumentPlan(version=1, sealed=True, sharding=None)
+        oversized = self._input(os.urandom(MAX_CIPHERTEXT_BYTES + 1))
+        with self.assertRaises(PayloadTooLargeError):
+            backup_execution._prepare_envelope(
+                [oversized], plan, b"", "file", [], max_envelope_bytes=MAX_CIPHERTEXT_BYTES
+            )
+
+        compressible = self._input(b"A" * (4 * MAX_CIPHERTEXT_BYTES))
+        envelope, manifest = backup_execution._prepare_envelope(
+            [compressible], plan, b"", "file", [], max_envelope_bytes=MAX_CIPHERTEXT_BYTES
+        )
+        self.assertLessEqual(len(envelope), MAX_CIPHERTEXT_BYTES)
+        self.assertEqual(manifest.payload_raw_len, 4 * MAX_CIPHERTEXT_BYTES)
+
+    def test_run_backup_rejects_oversized_payload_before_encryption(self) -> None:
+        config = load_app_config(path=DEFAULT_CONFIG_PATH)
+        plan = DocumentPlan(version=1, sealed=False, sharding=None)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with mock.patch.object(backup_execution, "encrypt_bytes_with_passphrase") as encrypt:
+                with self.assertRaisesRegex(ValueError, "MAX_CIPHERTEXT_BYTES"):
+                    backup_execution.run_backup(
+                        input_files=[self._input(os.urandom(MAX_CIPHERTEXT_BYTES + 1))],
+                        base_dir=None,
+                        output_dir=str(Path(tmpdir) / "out"),
+                        plan=plan,
+                        passphrase="pass",
+                        config=config,
+                        quiet=True,
+                    )
+            encrypt.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
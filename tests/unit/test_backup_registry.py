@@ -0,0 +1,221 @@
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+import typer
+from typer.testing import CliRunner
+
+from ethernity.cli.features.registry import command as registry_command
+from ethernity.cli.shared.types import CliContextState
+from ethernity.core import app_paths
+from ethernity.core.backup_registry import (
+    REGISTRY_SCHEMA_VERSION,
+    RegistryEntry,
+    RegistryFile,
+    RegistryOutput,
+    open_backup_registry,
+)
+
+
+def _entry(
+    doc_id: str,
+    *,
+    created_at: float,
+    files: tuple[RegistryFile, ...] = (),
+    output_dir: str = "/backups/one",
+) -> RegistryEntry:
+    return RegistryEntry(
+        doc_id=doc_id,
+        doc_hash="ab" * 32,
+        created_at=created_at,
+        sealed=False,
+        key_mode="passphrase",
+        input_origin="file",
+        output_dir=output_dir,
+        files=files,
+        outputs=(
+            RegistryOutput(kind="qr_document", path=f"{output_dir}/qr_document.pdf"),
+            RegistryOutput(kind="recovery_document", path=f"{output_dir}/recovery_document.pdf"),
+        ),
+        shard_threshold=2,
+        shard_count=3,
+        recorded_at=created_at + 1.0,
+    )
+
+
+class TestBackupRegistry(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.db_path = Path(self._tmp.name) / "state" / "registry.sqlite3"
+        self.notes = RegistryFile(path="notes/keys.txt", size=12, sha256="9f86d081" + "0" * 56)
+        self.photo = RegistryFile(path="photo.jpg", size=2048, sha256="c0ffee" + "1" * 58)
+        with open_backup_registry(self.db_path) as registry:
+            registry.record(_entry("aa01" + "0" * 28, created_at=1_000.0, files=(self.notes,)))
+            registry.record(
+                _entry(
+                    "aa02" + "0" * 28,
+                    created_at=2_000.0,
+                    files=(self.notes, self.photo),
+                    output_dir="/backups/two",
+                )
+            )
+            registry.record(_entry("bb01" + "0" * 28, created_at=3_000.0, files=(self.photo,)))
+
+    def _doc_ids(self, **filters: object) -> list[str]:
+        with open_backup_registry(self.db_path, create=False) as registry:
+            return [entry.doc_id[:4] for entry in registry.find(**filters)]
+
+    def test_round_trips_entries_newest_first(self) -> None:
+        with open_backup_registry(self.db_path) as registry:
+            self.assertEqual(len(registry), 3)
+            entries = registry.find()
+        self.assertEqual([entry.doc_id[:4] for entry in entries], ["bb01", "aa02", "aa01"])
+        second = entries[1]
+        self.assertEqual(second.files, (self.notes, self.photo))
+        self.assertEqual(second.outputs[0].path, "/backups/two/qr_document.pdf")
+        self.assertEqual((second.shard_threshold, second.shard_count), (2, 3))
+        self.assertEqual(second.recorded_at, 2_001.0)
+        self.assertEqual(second.to_dict()["files"][1]["sha256"], self.photo.sha256)
+
+    def test_filters_combine(self) -> None:
+        self.assertEqual(self._doc_ids(path="notes/keys.txt"), ["aa02", "aa01"])
+        self.assertEqual(self._doc_ids(path="/backups/two/recovery_document.pdf"), ["aa02"])
+        self.assertEqual(self._doc_ids(sha256="C0FFEE"), ["bb01", "aa02"])
+        self.assertEqual(self._doc_ids(sha256=self.notes.sha256), ["aa02", "aa01"])
+        self.assertEqual(self._doc_ids(doc_id_prefix="aa"), ["aa02", "aa01"])
+        self.assertEqual(self._doc_ids(since=2_000.0), ["bb01", "aa02"])
+        self.assertEqual(self._doc_ids(until=2_000.0), ["aa01"])
+        self.assertEqual(self._doc_ids(doc_id_prefix="aa", sha256="c0ffee"), ["aa02"])
+        self.assertEqual(self._doc_ids(limit=1), ["bb01"])
+        self.assertEqual(self._doc_ids(path="missing.txt"), [])
+
+    def test_lookups_use_indexes(self) -> None:
+        with sqlite3.connect(self.db_path) as connection:
+            plans = {
+                column: " ".join(
+                    row[-1]
+                    for row in connection.execute(
+                        f"EXPLAIN QUERY PLAN SELECT doc_id FROM {table} WHERE {column} >= ?",
+                        ("a",),
+                    )
+                )
+                for table, column in (
+                    ("backups", "created_at"),
+                    ("backup_files", "path"),
+                    ("backup_files", "sha256"),
+                )
+            }
+        for column, plan in plans.items():
+            with self.subTest(column=column):
+                self.assertIn("USING", plan)
+
+    def test_record_replaces_existing_doc_id(self) -> None:
+        doc_id = "aa01" + "0" * 28
+        with open_backup_registry(self.db_path) as registry:
+            registry.record(_entry(doc_id, created_at=1_500.0, files=(self.photo,)))
+            (entry,) = registry.find(doc_id_prefix=doc_id)
+            self.assertEqual(len(registry), 3)
+        self.assertEqual(entry.files, (self.photo,))
+        self.assertEqual(self._doc_ids(path="notes/keys.txt"), ["aa02"])
+
+    def test_rejects_non_hex_filters_and_unknown_schema(self) -> None:
+        with open_backup_registry(self.db_path) as registry:
+            with self.assertRaisesRegex(ValueError, "doc_id prefix must be hex"):
+                registry.find(doc_id_prefix="zz")
+            with self.assertRaisesRegex(ValueError, "limit must be positive"):
+                registry.find(limit=0)
+        with sqlite3.connect(self.db_path) as connection:
+            connection.execute(f"PRAGMA user_version = {REGISTRY_SCHEMA_VERSION + 1}")
+        with self.assertRaisesRegex(ValueError, "unsupported backup registry schema"):
+            with open_backup_registry(self.db_path):
+                pass
+
+    def test_missing_registry_is_not_created_for_lookups(self) -> None:
+        missing = Path(self._tmp.name) / "missing.sqlite3"
+        with self.assertRaises(FileNotFoundError):
+            with open_backup_registry(missing, create=False):
+                pass
+        self.assertFalse(missing.exists())
+
+    def test_registry_path_honors_env_override(self) -> None:
+        with mock.patch.dict("os.environ", {app_paths.BACKUP_REGISTRY_ENV: str(self.db_path)}):
+            self.assertEqual(app_paths.backup_registry_path(), self.db_path)
+        with mock.patch.dict("os.environ", {}, clear=True):
+            with mock.patch.object(app_paths, "user_state_dir_path", return_value=Path("/st")):
+                self.assertEqual(app_paths.backup_registry_path(), Path("/st/registry.sqlite3"))
+
+
+class TestRegistryCommand(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.db_path = Path(self._tmp.name) / "registry.sqlite3"
+        created = datetime(2026, 3, 14, 12, 0).timestamp()
+        with open_backup_registry(self.db_path) as registry:
+            registry.record(
+                _entry(
+                    "3fa2" + "0" * 28,
+                    created_at=created,
+                    files=(RegistryFile(path="a.txt", size=5, sha256="12" * 32),),
+                )
+            )
+        self.app = typer.Typer()
+        registry_command.register(self.app)
+
+        @self.app.callback()
+        def _root(ctx: typer.Context) -> None:
+            ctx.obj = CliContextState()
+
+    def _invoke(self, *args: str):
+        return CliRunner().invoke(self.app, ["registry", "--db", str(self.db_path), *args])
+
+    def test_json_lookup_by_date_range(self) -> None:
+        result = self._invoke("--since", "2026-03-14", "--until", "2026-03-14", "--json")
+        self.assertEqual(result.exit_code, 0, result.output)
+        payload = json.loads(result.output)
+        self.assertEqual([entry["doc_id"][:4] for entry in payload], ["3fa2"])
+        self.assertEqual(payload[0]["files"][0]["path"], "a.txt")
+
+        result = self._invoke("--since", "2026-03-15", "--json")
+        self.assertEqual(json.loads(result.output), [])
+
+    def test_table_output_and_errors(self) -> None:
+        result = self._invoke("--path", "a.txt")
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn("3fa2", result.output)
+        self.assertIn("2 of 3", result.output)
+
+        result = self._invoke("--since", "last week")
+        self.assertEqual(result.exit_code, 2)
+
+        result = CliRunner().invoke(
+            self.app, ["registry", "--db", str(Path(self._tmp.name) / "none.sqlite3")]
+        )
+        self.assertEqual(result.exit_code, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import io
+import itertools
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from PIL import Image
+
+from ethernity.cli.features.backup import orchestrator
+from ethernity.cli.features.backup.verify import (
+    VERIFY_BASE_SECONDS,
+    DocumentVerification,
+    RenderVerification,
+    VerifyTarget,
+    verify_rendered_documents,
+    verify_targets,
+)
+from ethernity.cli.shared.types import BackupResult
+from ethernity.qr.codec import qr_bytes
+from ethernity.render.types import RenderInputs
+
+try:
+    import zxingcpp  # noqa: F401
+
+    HAS_ZXING = True
+except ImportError:
+    HAS_ZXING = False
+
+
+def _render_inputs(output_path: str, payloads: list[bytes | str], *, render_qr: bool = True):
+    return RenderInputs(
+        frames=[],
+        template_path="template.html.j2",
+        output_path=output_path,
+        context={},
+        doc_type="main",
+        qr_payloads=payloads,
+        render_qr=render_qr,
+    )
+
+
+def _write_qr(path: Path, payload: bytes, *, faded: bool = False) -> None:
+    with Image.open(io.BytesIO(qr_bytes(payload, kind="png", scale=6, border=4))) as qr:
+        image = qr.convert("L")
+        if faded:
+            image = image.point(lambda level: 135 if level > 128 else 120)
+        image.save(path)
+
+
+class TestVerifyTargets(unittest.TestCase):
+    def test_keeps_qr_documents_and_maps_them_to_the_output_dir(self) -> None:
+        targets = verify_targets(
+            [
+                ("qr_document", _render_inputs("/staging/qr_document.pdf", ["AAA", b"BBB"])),
+                ("recovery_document", _render_inputs("/staging/recovery.pdf", [], render_qr=False)),
+                ("recovery_kit_index", _render_inputs("/staging/kit.pdf", ["AAA"])),
+                ("shard_document", _render_inputs("/staging/shard-1-of-2.pdf", [b"S1"])),
+            ],
+            output_dir="/out",
+        )
+        self.assertEqual(
+            targets,
+            [
+                VerifyTarget("qr_document", str(Path("/out/qr_document.pdf")), (b"AAA", b"BBB")),
+                VerifyTarget("shard_document", str(Path("/out/shard-1-of-2.pdf")), (b"S1",)),
+            ],
+        )
+
+
+@unittest.skipUnless(HAS_ZXING, "zxingcpp not available")
+class TestVerifyRenderedDocuments(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = Path(self._tmp.name)
+
+    def test_round_trip_reports_retried_codes(self) -> None:
+        _write_qr(self.root / "a.png", b"frame-a")
+        _write_qr(self.root / "b.png", b"frame-b", faded=True)
+        verification = verify_rendered_documents(
+            [
+                VerifyTarget("qr_document", str(self.root / "a.png"), (b"frame-a",)),
+                VerifyTarget("shard_document", str(self.root / "b.png"), (b"frame-b",)),
+            ]
+        )
+        self.assertTrue(verification.ok)
+        self.assertEqual(verification.frames, 2)
+        self.assertEqual(verification.budget_seconds, VERIFY_BASE_SECONDS + 2.0)
+        first, second = verification.documents
+        self.assertEqual((first.missing, first.retried), ((), ()))
+        self.assertEqual(second.retried, ((0, "autocontrast"),))
+
+    def test_missing_and_mismatched_codes_fail(self) -> None:
+        _write_qr(self.root / "a.png", b"frame-x")
+        verification = verify_rendered_documents(
+            [VerifyTarget("qr_document", str(self.root / "a.png"), (b"frame-a", b"frame-b"))]
+        )
+        self.assertFalse(verification.ok)
+        (document,) = verification.documents
+        self.assertEqual(document.missing, (0, 1))
+        self.assertEqual(document.unexpected, 1)
+
+    def test_document_without_codes_reports_every_frame_missing(self) -> None:
+        Image.new("L", (64, 64), 255).save(self.root / "blank.png")
+        verification = verify_rendered_documents(
+            [VerifyTarget("qr_document", str(self.root / "blank.png"), (b"frame-a",))]
+        )
+        self.assertEqual(verification.documents[0].missing, (0,))
+        self.assertFalse(verification.timed_out)
+
+    def test_scan_stops_when_the_budget_runs_out(self) -> None:
+        for name in ("a", "b"):
+            _write_qr(self.root / f"{name}.png", f"frame-{name}".encode())
+        ticks = itertools.count(step=100)
+        verification = verify_rendered_documents(
+            [
+                VerifyTarget("qr_document", str(self.root / "a.png"), (b"frame-a",)),
+                VerifyTarget("shard_document", str(self.root / "b.png"), (b"frame-b",)),
+            ],
+            jobs=1,
+            clock=lambda: float(next(ticks)),
+        )
+        self.assertTrue(verification.timed_out)
+        self.assertFalse(verification.ok)
+        self.assertEqual(verification.documents[1].missing, (0,))
+
+
+class TestVerificationExitCode(unittest.TestCase):
+    def _result(self, verification: RenderVerification | None) -> BackupResult:
+        return BackupResult(
+            doc_id=b"\x00" * 8,
+            qr_path="qr_document.pdf",
+            recovery_path="recovery_document.pdf",
+            shard_paths=(),
+            signing_key_shard_paths=(),
+            passphrase_used=None,
+            render_verification=verification,
+        )
+
+    def _verification(self, *, missing: tuple[int, ...]) -> RenderVerification:
+        document = DocumentVerification(
+            kind="qr_document",
+            path="qr_document.pdf",
+            expected=3,
+            missing=missing,
+            retried=((2, "tile"),),
+            unexpected=0,
+        )
+        return RenderVerification(
+            documents=(document,), budget_seconds=8.0, elapsed_seconds=0.5, timed_out=False
+        )
+
+    def test_exit_code_follows_verification(self) -> None:
+        self.assertEqual(
+            orchestrator._render_verification_exit_code(self._result(None), quiet=True), 0
+        )
+        with mock.patch.object(orchestrator, "print_render_verification") as print_mock:
+            passed = self._result(self._verification(missing=()))
+            self.assertEqual(orchestrator._render_verification_exit_code(passed, quiet=False), 0)
+            failed = self._result(self._verification(missing=(0, 1)))
+            self.assertEqual(orchestrator._render_verification_exit_code(failed, quiet=True), 1)
+        print_mock.assert_called_with(failed.render_verification, quiet=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,188 @@
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from benchmarks import (
+    STAGES,
+    Scenario,
+    ScenarioRun,
+    StageTimer,
+    compare_results,
+    default_scenarios,
+    full_scenarios,
+    main,
+    run_scenario,
+    scenario_inputs,
+    scenario_result,
+)
+from benchmarks.codecs import format_codec_results, time_zbase32
+from benchmarks.pipeline import scenario_plan
+from benchmarks.scenarios import BASE_SCENARIO
+
+from ethernity.cli.features.backup.execution import _prepare_envelope
+from ethernity.config import load_app_config
+from ethernity.config.paths import DEFAULT_CONFIG_PATH, SUPPORTED_TEMPLATE_DESIGNS
+from ethernity.core.bounds import MAX_CIPHERTEXT_BYTES
+
+
+def _run(**stages: float) -> ScenarioRun:
+    totals = dict.fromkeys(STAGES, 0.0)
+    totals.update(stages)
+    return ScenarioRun(
+        stages=totals, wall_seconds=sum(totals.values()), meta={"scan_source": "pdf"}
+    )
+
+
+def _document(**medians: float) -> dict[str, object]:
+    entry = scenario_result(BASE_SCENARIO, [_run(**medians)])
+    return {"format": 1, "scenarios": {BASE_SCENARIO.name: entry}}
+
+
+class TestScenarios(unittest.TestCase):
+    def test_default_matrix_covers_every_axis_value_once(self) -> None:
+        scenarios = default_scenarios()
+        names = [scenario.name for scenario in scenarios]
+        self.assertEqual(len(names), len(set(names)))
+        self.assertEqual({s.size for s in scenarios}, {"1k", "100k", "1m"})
+        self.assertEqual({s.file_count for s in scenarios}, {1, 2048})
+        self.assertEqual({s.payload_codec for s in scenarios}, {"gzip", "raw"})
+        self.assertEqual({s.sharding for s in scenarios}, {"none", "3of5", "10of20"})
+        self.assertEqual({s.design for s in scenarios}, set(SUPPORTED_TEMPLATE_DESIGNS))
+
+    def test_full_matrix_is_cross_product(self) -> None:
+        expected = 3 * 2 * 2 * 3 * len(SUPPORTED_TEMPLATE_DESIGNS)
+        self.assertEqual(len(full_scenarios()), expected)
+
+    def test_every_full_matrix_envelope_fits_ciphertext_bound(self) -> None:
+        sizes: dict[tuple[str, int, str], int] = {}
+        for scenario in full_scenarios():
+            key = (scenario.size, scenario.file_count, scenario.payload_codec)
+            if key not in sizes:
+                envelope, _manifest = _prepare_envelope(
+                    scenario_inputs(scenario),
+                    scenario_plan(scenario),
+                    b"\x01" * 32,
+                    "file",
+                    [],
+                    scenario.payload_codec,  # type: ignore[arg-type]
+                )
+                sizes[key] = len(envelope)
+            with self.subTest(scenario=scenario.name):
+                self.assertLessEqual(sizes[key], MAX_CIPHERTEXT_BYTES)
+
+    def test_inputs_are_deterministic_and_split_across_files(self) -> None:
+        scenario = Scenario(
+            size="1k", file_count=2048, payload_codec="raw", sharding="none", design="forge"
+        )
+        first = scenario_inputs(scenario)
+        second = scenario_inputs(scenario)
+        self.assertEqual(first, second)
+        self.assertEqual(len(first), 2048)
+        self.assertEqual(sum(len(item.data) for item in first), scenario.payload_bytes)
+        self.assertNotEqual(first, scenario_inputs(scenario, seed=1))
+
+
+class TestStageTimer(unittest.TestCase):
+    def test_nested_time_is_attributed_once(self) -> None:
+        timer = StageTimer()
+        with timer.measure("layout"):
+            with timer.measure("templating"):
+                time.sleep(0.02)
+        self.assertGreaterEqual(timer.totals["templating"], 0.02)
+        self.assertLess(timer.totals["layout"], 0.02)
+
+
+class TestCompare(unittest.TestCase):
+    def test_flags_slowdown_beyond_threshold_and_noise_floor(self) -> None:
+        baseline = _document(encryption=1.0, layout=0.001)
+        current = _document(encryption=1.5, layout=0.003)
+        comparison = compare_results(current, baseline, threshold=0.15, min_delta_seconds=0.005)
+        self.assertEqual([item.stage for item in comparison.regressions], ["encryption", "total"])
+        self.assertAlmostEqual(comparison.regressions[0].ratio, 1.5)
+
+    def test_reports_improvements_and_missing_scenarios(self) -> None:
+        baseline = _document(encryption=1.0)
+        current = _document(encryption=0.5)
+        current["scenarios"]["extra"] = current["scenarios"][BASE_SCENARIO.name]
+        comparison = compare_results(current, baseline)
+        self.assertEqual(comparison.regressions, [])
+        self.assertEqual([item.stage for item in comparison.improvements], ["encryption", "total"])
+        self.assertEqual(comparison.missing, ["extra"])
+
+    def test_changed_scan_source_is_not_compared(self) -> None:
+        baseline = _document(scan=0.1)
+        current = _document(scan=5.0)
+        current["scenarios"][BASE_SCENARIO.name]["meta"]["scan_source"] = "qr_images"
+        comparison = compare_results(current, baseline)
+        self.assertEqual(comparison.regressions, [])
+        self.assertIn(BASE_SCENARIO.name, comparison.incomparable)
+
+    def test_ciphertext_size_drift_is_still_compared(self) -> None:
+        baseline = _document(encryption=1.0)
+        current = _document(encryption=1.5)
+        baseline["scenarios"][BASE_SCENARIO.name]["meta"]["ciphertext_bytes"] = 1419
+        current["scenarios"][BASE_SCENARIO.name]["meta"]["ciphertext_bytes"] = 1423
+        comparison = compare_results(current, baseline)
+        self.assertEqual(comparison.incomparable, {})
+        self.assertEqual([item.stage for item in comparison.regressions], ["encryption", "total"])
+
+
+class TestCodecBenchmarks(unittest.TestCase):
+    def test_zbase32_timings_round_trip_each_size(self) -> None:
+        results = time_zbase32(("1k",), repeat=1)
+        self.assertEqual(results["1k"]["bytes"], 1024.0)
+        self.assertGreater(results["1k"]["decode_seconds"], 0.0)
+        self.assertIn("1k", format_codec_results(results))
+
+
+class TestRunScenario(unittest.TestCase):
+    def test_round_trip_without_pdf_times_every_stage(self) -> None:
+        scenario = Scenario(
+            size="1k", file_count=1, payload_codec="gzip", sharding="3of5", design="forge"
+        )
+        config = load_app_config(DEFAULT_CONFIG_PATH)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            run = run_scenario(scenario, config=config, work_dir=Path(tmpdir), render_pdf=False)
+        self.assertEqual(run.meta["scan_source"], "qr_images")
+        self.assertEqual(run.meta["shard_documents"], 5)
+        for stage in ("envelope", "encryption", "sharding", "qr_rasterization", "decode"):
+            self.assertGreater(run.stages[stage], 0.0, stage)
+        self.assertEqual(run.stages["pdf"], 0.0)
+
+    def test_main_writes_results_and_flags_regressions(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "results.json"
+            baseline = Path(tmpdir) / "baseline.json"
+            args = ["--scenario", "size=1k", "--repeat", "1", "--skip-pdf"]
+            code = main([*args, "--output", str(output), "--baseline", str(baseline)])
+            self.assertEqual(code, 0)
+            document = json.loads(output.read_text(encoding="utf-8"))
+            entry = document["scenarios"]["size=1k,files=1,codec=raw,shards=none,design=sentinel"]
+            self.assertEqual(entry["skipped"], {"pdf": "disabled with --skip-pdf"})
+
+            for summary in entry["stages"].values():
+                summary["median_s"] = 0.0
+            baseline.write_text(json.dumps(document), encoding="utf-8")
+            code = main([*args, "--baseline", str(baseline), "--min-delta", "0.001"])
+            self.assertEqual(code, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,12 +17,25 @@ import unittest
 
 from ethernity.core.bounds import MAX_CIPHERTEXT_BYTES, MAX_MAIN_FRAME_TOTAL
 from ethernity.encoding.chunking import (
+    ParityData,
     chunk_payload,
+    decode_parity_data,
+    encode_parity_data,
     fallback_lines_to_frame,
+    parity_frame_total,
     reassemble_payload,
 )
-from ethernity.encoding.framing import DOC_ID_LEN, Frame, FrameType, encode_frame
+from ethernity.encoding.framing import (
+    DOC_ID_LEN,
+    PARITY_VERSION,
+    Frame,
+    FrameType,
+    decode_frame,
+    encode_frame,
+)
 from ethernity.encoding.zbase32 import (
+    ZBASE32_ALPHABET,
+    ZBase32Decoder,
     decode_fallback_lines,
     decode_zbase32,
     encode_zbase32,
@@ -109,6 +122,50 @@ class TestChunking(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "non-canonical tail bits"):
             decode_zbase32("yb")
 
+    def test_decode_zbase32_checks_tail_bits_for_every_partial_group(self) -> None:
+        for length in range(1, 6):
+            encoded = encode_zbase32(b"\xff" * length)
+            with self.subTest(length=length):
+                self.assertEqual(decode_zbase32(encoded), b"\xff" * length)
+                if length % 5:
+                    # Setting the lowest (unused) bit of the final character must be rejected.
+                    bumped = ZBASE32_ALPHABET[ZBASE32_ALPHABET.index(encoded[-1]) | 1]
+                    self.assertNotEqual(bumped, encoded[-1])
+                    with self.assertRaisesRegex(ValueError, "non-canonical tail bits"):
+                        decode_zbase32(encoded[:-1] + bumped)
+
+    def test_decode_zbase32_rejects_impossible_lengths_and_foreign_characters(self) -> None:
+        for text in ("y", "yyy", "yyyyyy", "yyyyyyyyy"):
+            with self.subTest(text=text):
+                with self.assertRaisesRegex(ValueError, "non-canonical tail bits"):
+                    decode_zbase32(text)
+        for text, char in (("yb0y", "0"), ("ybVy", "V"), ("yb\u00e9y", "\u00e9"), ("yb=", "=")):
+            with self.subTest(text=text):
+                with self.assertRaisesRegex(ValueError, f"invalid z-base-32 character: '{char}'"):
+                    decode_zbase32(text)
+        self.assertEqual(decode_zbase32("\u2003yy\u00a0yy\t-"), b"\x00\x00")
+        self.assertEqual(decode_zbase32(""), b"")
+
+    def test_zbase32_decoder_matches_one_shot_decode_across_splits(self) -> None:
+        data = bytes(range(256)) * 400 + b"\x01\x02\x03"
+        encoded = encode_zbase32(data)
+        for step in (1, 7, 80, 70_001):
+            with self.subTest(step=step):
+                decoder = ZBase32Decoder()
+                for offset in range(0, len(encoded), step):
+                    decoder.feed(encoded[offset : offset + step])
+                self.assertEqual(decoder.symbol_count, len(encoded))
+                self.assertEqual(decoder.finish(), data)
+
+    def test_zbase32_decoder_rejects_foreign_text_without_consuming_it(self) -> None:
+        decoder = ZBase32Decoder()
+        self.assertEqual(decoder.feed("yb-"), 2)
+        with self.assertRaisesRegex(ValueError, "invalid z-base-32 character: '!'"):
+            decoder.feed("yy!")
+        self.assertEqual(decoder.symbol_count, 2)
+        with self.assertRaisesRegex(ValueError, "non-canonical tail bits"):
+            decoder.finish()
+
     def test_chunk_reassemble_roundtrip(self) -> None:
         payload = b"0123456789" * 50
         doc_id = b"\x22" * DOC_ID_LEN
@@ -451,6 +508,119 @@ class TestChunking(unittest.TestCase):
         rebuilt = reassemble_payload(frames)
         self.assertEqual(rebuilt, payload)
 
+    def _parity_frames(
+        self, payload: bytes, *, chunk_size: int, parity_percent: int
+    ) -> tuple[list[Frame], list[Frame]]:
+        frames = chunk_payload(
+            payload,
+            doc_id=b"\x46" * DOC_ID_LEN,
+            frame_type=FrameType.MAIN_DOCUMENT,
+            chunk_size=chunk_size,
+            parity_percent=parity_percent,
+        )
+        frames = [decode_frame(encode_frame(frame)) for frame in frames]
+        main = [frame for frame in frames if frame.frame_type == FrameType.MAIN_DOCUMENT]
+        parity = [frame for frame in frames if frame.frame_type == FrameType.PARITY]
+        return main, parity
+
+    def test_chunk_payload_appends_parity_frames(self) -> None:
+        payload = bytes(range(256)) * 4 + b"tail"
+        main, parity = self._parity_frames(payload, chunk_size=100, parity_percent=25)
+        self.assertEqual(len(main), 11)
+        self.assertEqual(len(parity), 3)
+        for index, frame in enumerate(parity):
+            self.assertEqual((frame.version, frame.index, frame.total), (PARITY_VERSION, index, 3))
+            data = decode_parity_data(frame.data)
+            self.assertEqual((data.data_total, data.payload_len), (11, len(payload)))
+            self.assertEqual(len(data.parity), max(len(frame.data) for frame in main))
+        self.assertEqual(reassemble_payload([*main, *parity]), payload)
+
+    def test_reassemble_rebuilds_any_missing_frames_covered_by_parity(self) -> None:
+        payload = bytes((idx * 31 + 7) % 256 for idx in range(997))
+        main, parity = self._parity_frames(payload, chunk_size=90, parity_percent=30)
+        self.assertEqual((len(main), len(parity)), (12, 4))
+        cases = {
+            "leading": {0, 1, 2, 3},
+            "trailing": {8, 9, 10, 11},
+            "spread": {0, 5, 11},
+            "single": {6},
+        }
+        for name, dropped in cases.items():
+            with self.subTest(case=name):
+                kept = [frame for frame in main if frame.index not in dropped]
+                self.assertEqual(reassemble_payload([*parity, *kept]), payload)
+                # Any subset of parity rows works as long as it covers the gap.
+                self.assertEqual(reassemble_payload([*kept, *parity[-len(dropped) :]]), payload)
+
+    def test_reassemble_from_parity_alone_when_it_covers_every_frame(self) -> None:
+        payload = b"parity-only"
+        main, parity = self._parity_frames(payload, chunk_size=4, parity_percent=100)
+        self.assertEqual(len(main), len(parity))
+        self.assertEqual(reassemble_payload(parity), payload)
+
+    def test_reassemble_reports_when_parity_cannot_cover_the_gap(self) -> None:
+        main, parity = self._parity_frames(bytes(300), chunk_size=30, parity_percent=20)
+        with self.assertRaisesRegex(ValueError, "missing frames: 3 MAIN frame.*only 2 PARITY"):
+            reassemble_payload([*main[3:], *parity])
+
+    def test_reassemble_rejects_inconsistent_parity_frames(self) -> None:
+        main, parity = self._parity_frames(bytes(range(200)), chunk_size=50, parity_percent=50)
+        _other_main, other_parity = self._parity_frames(
+            bytes(range(201)), chunk_size=50, parity_percent=50
+        )
+        conflicting = Frame(
+            version=PARITY_VERSION,
+            frame_type=FrameType.PARITY,
+            doc_id=parity[0].doc_id,
+            index=0,
+            total=parity[0].total,
+            data=encode_parity_data(ParityData(data_total=4, payload_len=200, parity=b"\x01" * 50)),
+        )
+        cases = (
+            ([*main[1:], parity[0], other_parity[1]], "mismatched parity frames"),
+            ([*main[1:], parity[0], conflicting], "conflicting duplicate frames"),
+            ([*main[1:], parity[0], parity[1]], None),
+        )
+        for frames, message in cases:
+            with self.subTest(message=message):
+                if message is None:
+                    self.assertEqual(reassemble_payload(frames), bytes(range(200)))
+                    continue
+                with self.assertRaisesRegex(ValueError, message):
+                    reassemble_payload(frames)
+
+    def test_parity_frame_total_rounds_up_and_enforces_limits(self) -> None:
+        self.assertEqual(parity_frame_total(10, 0), 0)
+        self.assertEqual(parity_frame_total(10, 10), 1)
+        self.assertEqual(parity_frame_total(11, 10), 2)
+        self.assertEqual(parity_frame_total(128, 100), 128)
+        with self.assertRaisesRegex(ValueError, "between 0 and 100"):
+            parity_frame_total(10, 101)
+        with self.assertRaisesRegex(ValueError, "at most 256 MAIN and PARITY frames"):
+            parity_frame_total(240, 10)
+
+    def test_chunk_payload_rejects_parity_for_single_frame_types(self) -> None:
+        with self.assertRaisesRegex(ValueError, "only defined for MAIN_DOCUMENT"):
+            chunk_payload(
+                b"auth",
+                doc_id=b"\x47" * DOC_ID_LEN,
+                frame_type=FrameType.AUTH,
+                parity_percent=10,
+            )
+
+    def test_decode_parity_data_rejects_malformed_rows(self) -> None:
+        valid = ParityData(data_total=3, payload_len=10, parity=b"\x00" * 4)
+        self.assertEqual(decode_parity_data(encode_parity_data(valid)), valid)
+        cases = (
+            (ParityData(data_total=3, payload_len=10, parity=b"\x00" * 3), "row length"),
+            (ParityData(data_total=0, payload_len=10, parity=b""), "data_total out of range"),
+            (ParityData(data_total=3, payload_len=2, parity=b"\x00"), "payload_len out of range"),
+        )
+        for data, message in cases:
+            with self.subTest(message=message):
+                with self.assertRaisesRegex(ValueError, message):
+                    decode_parity_data(encode_parity_data(data))
+
     def test_fallback_empty_lines_handling(self) -> None:
         """Test fallback encoding handles various line configurations."""
         frame = Frame(
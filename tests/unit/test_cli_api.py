@@ -560,6 +560,41 @@ class TestCliApi(unittest.TestCase):
             self.assertTrue(output_path.exists())
             self.assertEqual(events[-2]["path"], str(output_path))
 
+    def test_api_recover_timings_flag_emits_timing_events(self) -> None:
+        payloads_file = V1_FIXTURE_ROOT / "main_payloads.txt"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "recovered.bin"
+            with mock.patch("ethernity.cli.bootstrap.app.run_startup", return_value=False):
+                result = self.runner.invoke(
+                    cli.app,
+                    [
+                        "--config",
+                        str(DEFAULT_CONFIG_PATH),
+                        "api",
+                        "--timings",
+                        "recover",
+                        "--payloads-file",
+                        str(payloads_file),
+                        "--passphrase",
+                        FIXTURE_PASSPHRASE,
+                        "--output",
+                        str(output_path),
+                    ],
+                )
+
+            self.assertEqual(result.exit_code, 0, msg=result.output)
+            events = [json.loads(line) for line in result.output.splitlines() if line.strip()]
+            self._assert_valid_events(events)
+            timings = [event for event in events if event["type"] == "timing"]
+            self.assertEqual([event["span"] for event in timings], ["recover.decrypt"])
+            self.assertEqual(timings[0]["counts"]["files"], 1)
+            self.assertTrue(timings[0]["ok"])
+            untimed = [event for event in events if event["type"] != "timing"]
+            self.assertEqual(
+                [event["type"] for event in untimed],
+                _contracts()["recover_success_event_types"],
+            )
+
     def test_api_recover_result_uses_same_normalized_path_as_artifact(self) -> None:
         payloads_file = V1_FIXTURE_ROOT / "main_payloads.txt"
         with self.runner.isolated_filesystem():
@@ -937,6 +972,7 @@ class TestCliApi(unittest.TestCase):
                     sealed=False,
                     payload_codec="raw",
                     payload_raw_len=7,
+                    key_mode="passphrase",
                     files=(),
                 ),
                 extracted=(),
@@ -38,9 +38,12 @@ from ethernity.config import (
     load_app_config,
 )
 from ethernity.config.paths import DEFAULT_CONFIG_PATH
+from ethernity.core.backup_registry import open_backup_registry
 from ethernity.core.bounds import MAX_CIPHERTEXT_BYTES
-from ethernity.core.models import DocumentPlan, ShardingConfig, SigningSeedMode
-from ethernity.encoding.framing import Frame
+from ethernity.core.models import DocumentPlan, KeyMode, ShardingConfig, SigningSeedMode
+from ethernity.crypto import decrypt_bytes
+from ethernity.encoding.chunking import reassemble_payload
+from ethernity.encoding.framing import Frame, FrameType
 from ethernity.formats import envelope_codec as envelope_codec_module
 from ethernity.render.recovery_meta import RecoveryMeta
 
@@ -77,7 +80,7 @@ def _run_backup_with_plan(
             return_value=(sign_priv, sign_pub),
         ):
             with mock.patch(
-                "ethernity.formats.envelope_codec.build_manifest_and_payload",
+                "ethernity.formats.envelope_codec.build_manifest_and_payload_parts",
                 side_effect=capture_build,
             ):
                 with mock.patch("ethernity.render.render_frames_to_pdf"):
@@ -188,8 +191,9 @@ class TestCliBackup(unittest.TestCase):
             frame_type: int,
             chunk_size: int,
             version: int = 1,
+            parity_percent: int = 0,
         ) -> list[Frame]:
-            _ = payload, chunk_size
+            _ = payload, chunk_size, parity_percent
             return [
                 Frame(
                     version=version,
@@ -386,6 +390,129 @@ class TestCliBackup(unittest.TestCase):
             self.assertTrue(calls[1].recovery_meta.signing_pub_lines)
             self.assertIsNone(result.kit_index_path)
 
+    def test_run_backup_adds_parity_qr_frames_that_cover_missing_codes(self) -> None:
+        config = load_app_config(path=DEFAULT_CONFIG_PATH)
+        config = replace(config, qr_chunk_size=64, qr_parity_percent=25)
+        plan = DocumentPlan(version=1, sealed=False, sharding=None)
+        ciphertext = bytes(range(256)) * 2
+        calls: list[object] = []
+        input_file = cli.InputFile(
+            source_path=Path("input.bin"),
+            relative_path="input.bin",
+            data=b"payload",
+            mtime=None,
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with mock.patch(
+                "ethernity.cli.features.backup.execution.encrypt_bytes_with_passphrase",
+                return_value=(ciphertext, "auto-pass"),
+            ):
+                with mock.patch("ethernity.render.render_frames_to_pdf") as render_mock:
+                    render_mock.side_effect = lambda inputs: calls.append(inputs)
+                    cli.run_backup(
+                        input_files=[input_file],
+                        base_dir=None,
+                        output_dir=str(Path(tmpdir) / "out"),
+                        plan=plan,
+                        passphrase=None,
+                        config=config,
+                    )
+
+        qr_frames = calls[0].frames
+        main = [frame for frame in qr_frames if frame.frame_type == FrameType.MAIN_DOCUMENT]
+        parity = [frame for frame in qr_frames if frame.frame_type == FrameType.PARITY]
+        self.assertEqual(len(main), 8)
+        self.assertEqual(len(parity), 2)
+        self.assertEqual(calls[1].frames, main)
+        self.assertEqual(reassemble_payload([*main[2:], *parity]), ciphertext)
+
+    def test_run_backup_x25519_records_identity_and_key_mode(self) -> None:
+        config = load_app_config(path=DEFAULT_CONFIG_PATH)
+        plan = DocumentPlan(version=1, sealed=False, sharding=None, key_mode=KeyMode.X25519)
+        calls: list[object] = []
+        input_file = cli.InputFile(
+            source_path=Path("input.bin"),
+            relative_path="input.bin",
+            data=b"payload",
+            mtime=None,
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with mock.patch("ethernity.render.render_frames_to_pdf") as render_mock:
+                render_mock.side_effect = lambda inputs: calls.append(inputs)
+                result = cli.run_backup(
+                    input_files=[input_file],
+                    base_dir=None,
+                    output_dir=str(Path(tmpdir) / "out"),
+                    plan=plan,
+                    passphrase=None,
+                    config=config,
+                )
+
+        identity = result.passphrase_used
+        assert identity is not None
+        self.assertTrue(identity.startswith("AGE-SECRET-KEY-1"))
+        recovery_inputs = calls[1]
+        recovery_meta = recovery_inputs.recovery_meta
+        assert recovery_meta is not None
+        self.assertEqual(recovery_meta.passphrase_label, "Age identity")
+        self.assertEqual("".join(recovery_meta.passphrase_lines), identity)
+        self.assertEqual(recovery_inputs.key_lines[:2], ["Age identity:", identity])
+
+        main_frame = recovery_inputs.fallback_sections[1].frame
+        plaintext = decrypt_bytes(main_frame.data, passphrase=identity)
+        manifest, _payload = envelope_codec_module.decode_envelope(plaintext)
+        self.assertEqual(manifest.key_mode, KeyMode.X25519.value)
+
+    def test_run_backup_records_metadata_in_registry(self) -> None:
+        config = load_app_config(path=DEFAULT_CONFIG_PATH)
+        plan = DocumentPlan(
+            version=1,
+            sealed=False,
+            sharding=ShardingConfig(threshold=2, shares=3),
+        )
+        payload = b"payload"
+        input_file = cli.InputFile(
+            source_path=Path("input.bin"),
+            relative_path="docs/input.bin",
+            data=payload,
+            mtime=None,
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            registry_path = Path(tmpdir) / "state" / "registry.sqlite3"
+            with mock.patch("ethernity.render.render_frames_to_pdf"):
+                result = cli.run_backup(
+                    input_files=[input_file],
+                    base_dir=None,
+                    output_dir=str(Path(tmpdir) / "out"),
+                    plan=plan,
+                    passphrase="correct horse battery staple",
+                    config=config,
+                    registry_path=registry_path,
+                )
+            with open_backup_registry(registry_path, create=False) as registry:
+                (entry,) = registry.find(sha256=hashlib.sha256(payload).hexdigest())
+                by_output = registry.find(path=str(Path(result.shard_paths[0]).resolve()))
+
+        self.assertEqual(entry.doc_id, result.doc_id.hex())
+        self.assertEqual([item.path for item in entry.files], ["docs/input.bin"])
+        self.assertEqual((entry.shard_threshold, entry.shard_count), (2, 3))
+        self.assertEqual(
+            [item.kind for item in entry.outputs],
+            [
+                "qr_document",
+                "recovery_document",
+                "kit_index",
+                "shard_document",
+                "shard_document",
+                "shard_document",
+            ],
+        )
+        self.assertEqual(by_output, [entry])
+        self.assertNotIn("correct horse", repr(entry.to_dict()))
+
     def test_run_backup_renders_kit_index_when_template_exists(self) -> None:
         config = load_app_config(path=DEFAULT_CONFIG_PATH)
         plan = DocumentPlan(
@@ -755,7 +882,7 @@ class TestCliBackup(unittest.TestCase):
         sign_priv = b"\x11" * 32
         sign_pub = b"\x22" * 32
         captured: dict[str, object] = {}
-        real_build = envelope_codec_module.build_manifest_and_payload
+        real_build = envelope_codec_module.build_manifest_and_payload_parts
         capture_build = _CaptureBuild(captured, real_build)
 
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -765,7 +892,7 @@ class TestCliBackup(unittest.TestCase):
                 return_value=(sign_priv, sign_pub),
             ):
                 with mock.patch(
-                    "ethernity.formats.envelope_codec.build_manifest_and_payload",
+                    "ethernity.formats.envelope_codec.build_manifest_and_payload_parts",
                     side_effect=capture_build,
                 ):
                     with mock.patch(
@@ -798,7 +925,7 @@ class TestCliBackup(unittest.TestCase):
         )
         sign_priv = b"\x11" * 32
         sign_pub = b"\x22" * 32
-        real_build = envelope_codec_module.build_manifest_and_payload
+        real_build = envelope_codec_module.build_manifest_and_payload_parts
 
         sealed_plan = DocumentPlan(
             version=1,
@@ -835,7 +962,7 @@ class TestCliBackup(unittest.TestCase):
         passphrase_shard = SimpleNamespace(share_index=1, share_count=3, threshold=2)
         signing_shard = SimpleNamespace(share_index=2, share_count=2, threshold=1)
         captured: dict[str, object] = {}
-        real_build = envelope_codec_module.build_manifest_and_payload
+        real_build = envelope_codec_module.build_manifest_and_payload_parts
         capture_build = _CaptureBuild(captured, real_build)
 
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -845,7 +972,7 @@ class TestCliBackup(unittest.TestCase):
                 return_value=(sign_priv, sign_pub),
             ):
                 with mock.patch(
-                    "ethernity.formats.envelope_codec.build_manifest_and_payload",
+                    "ethernity.formats.envelope_codec.build_manifest_and_payload_parts",
                     side_effect=capture_build,
                 ):
                     with mock.patch(
@@ -1045,6 +1172,26 @@ class TestCliBackupUx(unittest.TestCase):
         self.assertEqual(result.exit_code, 0, result.output)
         self.assertEqual(captured.get("qr_chunk_size"), 640)
 
+    def test_backup_qr_parity_flag_reaches_command(self) -> None:
+        captured: dict[str, object] = {}
+
+        def _capture_args(args: BackupArgs) -> int:
+            captured["qr_parity"] = args.qr_parity
+            return 0
+
+        with mock.patch("ethernity.cli.bootstrap.app.run_startup", return_value=False):
+            with mock.patch(
+                "ethernity.cli.features.backup.command.run_backup_command",
+                side_effect=_capture_args,
+            ):
+                result = self.runner.invoke(
+                    cli.app,
+                    ["backup", "--input", "-", "--qr-parity", "10"],
+                    input="payload",
+                )
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(captured.get("qr_parity"), 10)
+
     def test_backup_yes_flag_reaches_command(self) -> None:
         captured: dict[str, object] = {}
 
@@ -165,6 +165,23 @@ chunk_size = 0
             with self.assertRaises(ValueError):
                 load_app_config(path=path)
 
+    def test_load_app_config_parses_and_bounds_parity_percent(self) -> None:
+        cases = (("parity_percent = 15", 15), ("parity_percent = 101", None))
+        for line, expected in cases:
+            with self.subTest(line=line):
+                with tempfile.TemporaryDirectory() as tmpdir:
+                    path = Path(tmpdir) / "config.toml"
+                    path.write_text(
+                        self._with_required_qr_payload_codec(f"[qr]\n{line}\n"),
+                        encoding="utf-8",
+                    )
+                    if expected is None:
+                        with self.assertRaisesRegex(ValueError, "qr.parity_percent"):
+                            load_app_config(path=path)
+                        continue
+                    config = load_app_config(path=path)
+                self.assertEqual(config.qr_parity_percent, expected)
+
     def test_load_app_config_ignores_payload_encoding_key(self) -> None:
         toml = """
 [qr]
@@ -15,8 +15,10 @@
 
 import gzip
 import hashlib
+import io
 import unicodedata
 import unittest
+from dataclasses import replace
 from unittest import mock
 
 import cbor2
@@ -35,8 +37,11 @@ from ethernity.formats.envelope_codec import (
     encode_envelope,
     encode_manifest,
     extract_payloads,
+    stream_extract_payloads,
 )
 from ethernity.formats.envelope_types import (
+    KEY_MODE_PASSPHRASE,
+    KEY_MODE_X25519,
     MANIFEST_VERSION,
     PATH_ENCODING_DIRECT,
     PATH_ENCODING_PREFIX_TABLE,
@@ -162,6 +167,7 @@ class TestEnvelope(unittest.TestCase):
         self.assertEqual(decoded["version"], MANIFEST_VERSION)
         self.assertEqual(decoded["payload_codec"], PAYLOAD_CODEC_RAW)
         self.assertNotIn("payload_raw_len", decoded)
+        self.assertNotIn("key_mode", decoded)
         self.assertEqual(decoded["input_origin"], "file")
         self.assertEqual(decoded["input_roots"], [])
         self.assertEqual(decoded["path_encoding"], PATH_ENCODING_DIRECT)
@@ -346,6 +352,47 @@ class TestEnvelope(unittest.TestCase):
         with self.assertRaises(ValueError):
             extract_payloads(manifest, payload)
 
+    def test_stream_extract_payloads_matches_extract_payloads(self) -> None:
+        parts = [
+            PayloadPart(path="alpha.txt", data=b"alpha" * 200, mtime=1),
+            PayloadPart(path="empty.txt", data=b"", mtime=2),
+            PayloadPart(path="gamma.txt", data=b"gamma" * 50, mtime=3),
+        ]
+        manifest, payload = build_manifest_and_payload(parts, signing_seed=TEST_SIGNING_SEED)
+        manifest = replace(manifest, payload_codec=PAYLOAD_CODEC_GZIP, payload_raw_len=len(payload))
+        compressed = gzip.compress(payload, compresslevel=9, mtime=0)
+        streamed: dict[str, io.BytesIO] = {}
+
+        def _open_entry(entry: ManifestFile) -> io.BytesIO:
+            handle = _UnclosedBytesIO()
+            streamed[entry.path] = handle
+            return handle
+
+        stream_extract_payloads(manifest, compressed, _open_entry, chunk_size=64)
+
+        self.assertEqual(
+            {path: handle.getvalue() for path, handle in streamed.items()},
+            {entry.path: data for entry, data in extract_payloads(manifest, compressed)},
+        )
+
+    def test_stream_extract_payloads_stops_at_first_hash_mismatch(self) -> None:
+        parts = [
+            PayloadPart(path="a.txt", data=b"first", mtime=None),
+            PayloadPart(path="b.txt", data=b"second", mtime=None),
+        ]
+        manifest, payload = build_manifest_and_payload(parts, signing_seed=TEST_SIGNING_SEED)
+        bad_entry = replace(manifest.files[0], sha256=b"\x00" * 32)
+        manifest = replace(manifest, files=(bad_entry, manifest.files[1]))
+        opened: list[str] = []
+
+        def _open_entry(entry: ManifestFile) -> io.BytesIO:
+            opened.append(entry.path)
+            return io.BytesIO()
+
+        with self.assertRaisesRegex(ValueError, "sha256 mismatch for a.txt"):
+            stream_extract_payloads(manifest, payload, _open_entry)
+        self.assertEqual(opened, ["a.txt"])
+
     def test_build_manifest_and_payload_multiple(self) -> None:
         parts = [
             PayloadPart(path="alpha.txt", data=b"alpha", mtime=1),
@@ -560,6 +607,21 @@ class TestEnvelope(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "payload_codec"):
             EnvelopeManifest.from_cbor(data)
 
+    def test_manifest_key_mode_roundtrip(self) -> None:
+        manifest = EnvelopeManifest.from_cbor(_make_manifest_cbor())
+        self.assertEqual(manifest.key_mode, KEY_MODE_PASSPHRASE)
+
+        x25519_manifest = replace(manifest, key_mode=KEY_MODE_X25519)
+        encoded = cbor2.loads(encode_manifest(x25519_manifest))
+        self.assertEqual(encoded["key_mode"], KEY_MODE_X25519)
+        self.assertEqual(decode_manifest(encode_manifest(x25519_manifest)), x25519_manifest)
+
+    def test_manifest_rejects_invalid_key_mode(self) -> None:
+        data = _make_manifest_cbor()
+        data["key_mode"] = "ssh-ed25519"
+        with self.assertRaisesRegex(ValueError, "key_mode"):
+            EnvelopeManifest.from_cbor(data)
+
     def test_manifest_rejects_invalid_path_encoding(self) -> None:
         data = _make_manifest_cbor(path_encoding="legacy")
         with self.assertRaisesRegex(ValueError, "path_encoding"):
@@ -1239,5 +1301,12 @@ class TestEnvelope(unittest.TestCase):
             extract_payloads(manifest, compressed[:-1])
 
 
+class _UnclosedBytesIO(io.BytesIO):
+    """BytesIO that stays readable after the extractor closes it."""
+
+    def close(self) -> None:
+        return None
+
+
 if __name__ == "__main__":
     unittest.main()
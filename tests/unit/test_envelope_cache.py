@@ -0,0 +1,119 @@
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+from ethernity.crypto import (
+    DecryptedEnvelopeCache,
+    active_envelope_cache,
+    decrypt_bytes,
+    encrypt_bytes_with_passphrase,
+    envelope_cache_session,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestDecryptedEnvelopeCache(unittest.TestCase):
+    def test_get_requires_matching_passphrase(self) -> None:
+        cache = DecryptedEnvelopeCache()
+        cache.put(b"ciphertext", passphrase="right", plaintext=b"secret")
+
+        self.assertEqual(cache.get(b"ciphertext", passphrase="right"), b"secret")
+        self.assertIsNone(cache.get(b"ciphertext", passphrase="wrong"))
+        self.assertIsNone(cache.get(b"other ciphertext", passphrase="right"))
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_expired_and_evicted_entries_are_zeroized(self) -> None:
+        clock = _Clock()
+        cache = DecryptedEnvelopeCache(ttl_seconds=10.0, max_entries=2, clock=clock)
+        cache.put(b"first", passphrase="pw", plaintext=b"first secret")
+        first_buffer = cache._entries[next(iter(cache._entries))].plaintext
+        clock.now = 5.0
+        cache.put(b"second", passphrase="pw", plaintext=b"second secret")
+        clock.now = 6.0
+        cache.put(b"third", passphrase="pw", plaintext=b"third secret")
+
+        self.assertEqual(first_buffer, bytearray(len(b"first secret")))
+        self.assertIsNone(cache.get(b"first", passphrase="pw"))
+
+        second_buffer = cache._entries[next(iter(cache._entries))].plaintext
+        clock.now = 15.0
+        self.assertIsNone(cache.get(b"second", passphrase="pw"))
+        self.assertEqual(second_buffer, bytearray(len(b"second secret")))
+        self.assertEqual(cache.get(b"third", passphrase="pw"), b"third secret")
+
+    def test_returned_plaintext_survives_clear(self) -> None:
+        cache = DecryptedEnvelopeCache()
+        cache.put(b"ciphertext", passphrase="pw", plaintext=b"secret")
+        plaintext = cache.get(b"ciphertext", passphrase="pw")
+        cache.clear()
+
+        self.assertEqual(plaintext, b"secret")
+        self.assertEqual(len(cache), 0)
+
+    def test_rejects_invalid_limits(self) -> None:
+        with self.assertRaisesRegex(ValueError, "ttl"):
+            DecryptedEnvelopeCache(ttl_seconds=0)
+        with self.assertRaisesRegex(ValueError, "max entries"):
+            DecryptedEnvelopeCache(max_entries=0)
+
+
+class TestEnvelopeCacheSession(unittest.TestCase):
+    def test_decrypt_bytes_runs_backend_once_per_document(self) -> None:
+        ciphertext, passphrase = encrypt_bytes_with_passphrase(b"payload", passphrase="pw")
+        assert passphrase is not None
+        with mock.patch(
+            "ethernity.crypto.age_runtime._decrypt_with_pyrage", return_value=b"payload"
+        ) as backend:
+            with envelope_cache_session() as cache:
+                self.assertEqual(decrypt_bytes(ciphertext, passphrase=passphrase), b"payload")
+                self.assertEqual(decrypt_bytes(ciphertext, passphrase=passphrase), b"payload")
+            self.assertEqual(decrypt_bytes(ciphertext, passphrase=passphrase), b"payload")
+
+        self.assertEqual(backend.call_count, 2)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_wrong_passphrase_is_not_served_from_cache(self) -> None:
+        ciphertext, _passphrase = encrypt_bytes_with_passphrase(b"payload", passphrase="pw")
+        with envelope_cache_session():
+            self.assertEqual(decrypt_bytes(ciphertext, passphrase="pw"), b"payload")
+            with self.assertRaisesRegex(ValueError, "decryption failed"):
+                decrypt_bytes(ciphertext, passphrase="not the passphrase")
+
+    def test_nested_sessions_share_the_outer_cache(self) -> None:
+        self.assertIsNone(active_envelope_cache())
+        with envelope_cache_session() as outer:
+            outer.put(b"ciphertext", passphrase="pw", plaintext=b"secret")
+            with envelope_cache_session() as inner:
+                self.assertIs(inner, outer)
+            self.assertEqual(outer.get(b"ciphertext", passphrase="pw"), b"secret")
+        self.assertIsNone(active_envelope_cache())
+        self.assertEqual(len(outer), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
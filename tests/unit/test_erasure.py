@@ -0,0 +1,82 @@
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+
+from __future__ import annotations
+
+import itertools
+import os
+import unittest
+
+from ethernity.encoding.erasure import (
+    MAX_ERASURE_SHARDS,
+    encode_parity,
+    parity_coefficient,
+    recover_chunks,
+)
+
+
+class TestErasure(unittest.TestCase):
+    def test_recovers_every_erasure_pattern_within_parity_budget(self) -> None:
+        data_total, parity_total, chunk_len = 5, 3, 17
+        chunks = [os.urandom(chunk_len) for _ in range(data_total)]
+        parity = encode_parity(chunks, parity_total)
+        self.assertEqual([len(row) for row in parity], [chunk_len] * parity_total)
+        for lost in range(1, parity_total + 1):
+            for missing in itertools.combinations(range(data_total), lost):
+                for rows in itertools.combinations(range(parity_total), lost):
+                    with self.subTest(missing=missing, rows=rows):
+                        recovered = recover_chunks(
+                            {i: c for i, c in enumerate(chunks) if i not in missing},
+                            {row: parity[row] for row in rows},
+                            data_total=data_total,
+                            parity_total=parity_total,
+                            chunk_len=chunk_len,
+                        )
+                        self.assertEqual(recovered, {i: chunks[i] for i in missing})
+
+    def test_nothing_missing_returns_empty(self) -> None:
+        chunks = [b"ab", b"cd"]
+        recovered = recover_chunks(
+            dict(enumerate(chunks)), {}, data_total=2, parity_total=1, chunk_len=2
+        )
+        self.assertEqual(recovered, {})
+
+    def test_parity_of_zero_chunks_is_zero(self) -> None:
+        self.assertEqual(encode_parity([bytes(8)] * 4, 2), [bytes(8), bytes(8)])
+
+    def test_cauchy_coefficients_are_nonzero(self) -> None:
+        data_total = 200
+        for row in range(MAX_ERASURE_SHARDS - data_total):
+            for index in range(data_total):
+                self.assertNotEqual(parity_coefficient(row, index, data_total), 0)
+
+    def test_rejects_invalid_shapes_and_inputs(self) -> None:
+        with self.assertRaisesRegex(ValueError, "at most 256"):
+            encode_parity([b"x"] * 250, 7)
+        with self.assertRaisesRegex(ValueError, "data_total must be positive"):
+            encode_parity([], 1)
+        with self.assertRaisesRegex(ValueError, "same length"):
+            encode_parity([b"x", b"yy"], 1)
+        with self.assertRaisesRegex(ValueError, "cannot rebuild 2 missing"):
+            recover_chunks({0: b"x"}, {0: b"y"}, data_total=3, parity_total=2, chunk_len=1)
+        with self.assertRaisesRegex(ValueError, "out of range"):
+            recover_chunks({3: b"x"}, {}, data_total=3, parity_total=1, chunk_len=1)
+        with self.assertRaisesRegex(ValueError, "same length"):
+            recover_chunks({0: b"xx"}, {}, data_total=3, parity_total=1, chunk_len=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -21,10 +21,12 @@ from ethernity.cli.shared.io.fallback_parser import (
     detect_fallback_section,
     filter_fallback_lines,
     parse_fallback_frame,
+    parse_fallback_text,
     split_fallback_sections,
 )
 from ethernity.encoding.framing import DOC_ID_LEN, VERSION, Frame, FrameType, encode_frame
 from ethernity.encoding.zbase32 import encode_zbase32
+from ethernity.render.fallback_text import format_zbase32_lines
 
 
 class TestIsValidZbase32Line(unittest.TestCase):
@@ -146,5 +148,69 @@ class TestFilterFallbackLines(unittest.TestCase):
             split_fallback_sections(["junk", "MAIN FRAME", "ybndr"])
 
 
+class TestParseFallbackText(unittest.TestCase):
+    @staticmethod
+    def _lines(frame: Frame) -> list[str]:
+        return format_zbase32_lines(
+            encode_zbase32(encode_frame(frame)), group_size=4, line_length=23, line_count=None
+        )
+
+    def _frame(self, frame_type: FrameType, data: bytes) -> Frame:
+        return Frame(
+            version=VERSION,
+            frame_type=frame_type,
+            doc_id=b"\x33" * DOC_ID_LEN,
+            index=0,
+            total=1,
+            data=data,
+        )
+
+    def test_splits_and_decodes_marked_sections_from_one_pass_over_an_iterator(self) -> None:
+        main = self._frame(FrameType.MAIN_DOCUMENT, bytes(range(256)) * 300)
+        auth = self._frame(FrameType.AUTH, b"auth")
+        lines = ["", "=== MAIN FRAME ===", *self._lines(main), "", "AUTH FRAME", *self._lines(auth)]
+        consumed: list[str] = []
+
+        def _stream():
+            for line in lines:
+                consumed.append(line)
+                yield line
+
+        parsed = parse_fallback_text(_stream(), label="fallback")
+        self.assertEqual(consumed, lines)
+        self.assertTrue(parsed.marked)
+        self.assertEqual(parsed.sections["main"].frame(), main)
+        self.assertEqual(parsed.sections["auth"].frame(), auth)
+        self.assertFalse(parsed.sections["key"].populated)
+
+    def test_unmarked_text_uses_caller_label(self) -> None:
+        frame = self._frame(FrameType.KEY_DOCUMENT, b"shard")
+        parsed = parse_fallback_text(self._lines(frame), label="shard")
+        self.assertFalse(parsed.marked)
+        self.assertEqual(list(parsed.sections), ["shard"])
+        self.assertEqual(parsed.sections["shard"].frame(), frame)
+
+    def test_bad_section_reports_first_bad_line_and_leaves_others_usable(self) -> None:
+        main = self._frame(FrameType.MAIN_DOCUMENT, b"main")
+        main_lines = self._lines(main)
+        lines = ["AUTH FRAME", "ybnd", "oops!", "also bad #", "MAIN FRAME", *main_lines]
+        parsed = parse_fallback_text(lines, label="fallback")
+        with self.assertRaisesRegex(
+            ValueError, r"outside the z-base-32 alphabet \(first at line 3\)"
+        ):
+            parsed.sections["auth"].frame()
+        self.assertEqual(parsed.sections["main"].frame(), main)
+
+    def test_limits_are_enforced_while_streaming(self) -> None:
+        with mock.patch("ethernity.cli.shared.io.fallback_parser.MAX_FALLBACK_LINES", 2):
+            parsed = parse_fallback_text(["ybnd", "", "ybnd", "ybnd", "@@"], label="fallback")
+        with self.assertRaisesRegex(ValueError, "MAX_FALLBACK_LINES \\(2\\) at line 4"):
+            parsed.sections["fallback"].frame()
+
+    def test_rejects_content_before_first_marker(self) -> None:
+        with self.assertRaisesRegex(ValueError, "before the first marked fallback section"):
+            parse_fallback_text(["ybnd", "MAIN FRAME", "ybnd"], label="fallback")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -21,9 +21,9 @@ import unittest
 from pathlib import Path
 from unittest import mock
 
+from ethernity.cli.shared import api_codes
+from ethernity.cli.shared.events import event_session
 from ethernity.cli.shared.io.frames import (
-    _all_lines_match_fallback_text,
-    _all_payload_lines_decode,
     _auth_frames_from_fallback,
     _auth_frames_from_fallback_lines,
     _auth_frames_from_payloads,
@@ -34,19 +34,31 @@ from ethernity.cli.shared.io.frames import (
     _frame_from_fallback,
     _frame_from_fallback_lines,
     _frame_from_payload_text,
+    _frame_from_scanned_payload,
     _frames_from_fallback_lines,
     _frames_from_payload_lines,
     _frames_from_scan,
     _frames_from_shard_inputs,
+    _iter_text_lines,
     _parse_fallback_section,
+    _peek_recovery_input_mode,
     _read_text_lines,
     _recovery_frames_from_scan,
     _split_main_and_auth_frames,
 )
+from ethernity.encoding.chunking import chunk_payload, reassemble_payload
 from ethernity.encoding.framing import DOC_ID_LEN, Frame, FrameType, encode_frame
-from ethernity.encoding.qr_payloads import encode_qr_payload
+from ethernity.encoding.qr_payloads import QR_PAYLOAD_CODEC_BASE45, encode_qr_payload
 from ethernity.encoding.zbase32 import encode_zbase32
-from ethernity.qr.scan import QrScanError
+from ethernity.qr import scan as qr_scan
+from ethernity.qr.scan import QrDecoder, QrScanError, ScannedPayload, scan_session
+
+
+def _scanned(*payloads: bytes | str) -> list[ScannedPayload]:
+    return [
+        ScannedPayload(Path("scan.png"), 0, payload)  # type: ignore[arg-type]
+        for payload in payloads
+    ]
 
 
 class TestFramesIo(unittest.TestCase):
@@ -107,67 +119,54 @@ class TestFramesIo(unittest.TestCase):
 
     def test_frame_from_fallback_uses_read_lines_and_parser(self) -> None:
         frame = self._frame()
-        with mock.patch("ethernity.cli.shared.io.frames._read_text_lines", return_value=["line"]):
-            with mock.patch(
-                "ethernity.cli.shared.io.frames._frame_from_fallback_lines",
-                return_value=frame,
-            ) as parse_mock:
-                parsed = _frame_from_fallback("fallback.txt")
+        encoded = encode_zbase32(encode_frame(frame))
+        lines = [encoded[:20], "", encoded[20:]]
+        with mock.patch(
+            "ethernity.cli.shared.io.frames._iter_text_lines", return_value=lines
+        ) as read_mock:
+            parsed = _frame_from_fallback("fallback.txt")
         self.assertEqual(parsed, frame)
-        parse_mock.assert_called_once_with(["line"], label="fallback", quiet=False)
+        read_mock.assert_called_once_with("fallback.txt")
 
     def test_frame_from_fallback_strips_single_marked_shard_section(self) -> None:
         frame = self._frame(frame_type=FrameType.KEY_DOCUMENT)
         with mock.patch(
-            "ethernity.cli.shared.io.frames._read_text_lines",
-            return_value=["SHARD FRAME", "line"],
+            "ethernity.cli.shared.io.frames._iter_text_lines",
+            return_value=["", "SHARD FRAME", encode_zbase32(encode_frame(frame))],
         ):
-            with mock.patch(
-                "ethernity.cli.shared.io.frames._frame_from_fallback_lines",
-                return_value=frame,
-            ) as parse_mock:
-                parsed = _frame_from_fallback("fallback.txt")
+            parsed = _frame_from_fallback("fallback.txt")
         self.assertEqual(parsed, frame)
-        parse_mock.assert_called_once_with(["line"], label="key", quiet=False)
 
     def test_frame_from_fallback_rejects_multiple_marked_sections(self) -> None:
         with mock.patch(
-            "ethernity.cli.shared.io.frames._read_text_lines",
+            "ethernity.cli.shared.io.frames._iter_text_lines",
             return_value=["MAIN FRAME", "aaa", "SHARD FRAME", "bbb"],
         ):
             with self.assertRaisesRegex(ValueError, "exactly one marked fallback section"):
                 _frame_from_fallback("fallback.txt")
 
     def test_parse_fallback_section_without_markers_passes_through_lines(self) -> None:
-        frame = self._frame()
-        with mock.patch(
-            "ethernity.cli.shared.io.frames._contains_fallback_markers", return_value=False
-        ):
-            with mock.patch(
-                "ethernity.cli.shared.io.frames._frame_from_fallback_lines",
-                return_value=frame,
-            ) as parse_mock:
-                parsed = _parse_fallback_section(
-                    ["line"],
-                    "auth",
-                    allow_invalid=False,
-                    quiet=True,
-                    missing_error="missing",
-                )
+        frame = self._frame(frame_type=FrameType.AUTH)
+        parsed = _parse_fallback_section(
+            [encode_zbase32(encode_frame(frame))],
+            "auth",
+            allow_invalid=False,
+            quiet=True,
+            missing_error="missing",
+        )
         self.assertEqual(parsed, frame)
-        parse_mock.assert_called_once_with(["line"], label="auth", quiet=True)
+        with self.assertRaisesRegex(ValueError, r"no recovery lines found \(auth\)"):
+            _parse_fallback_section(
+                ["", "  "], "auth", allow_invalid=False, quiet=True, missing_error="missing"
+            )
 
     def test_parse_fallback_section_requires_requested_marker_section(self) -> None:
-        with mock.patch(
-            "ethernity.cli.shared.io.frames._contains_fallback_markers", return_value=True
-        ):
-            with mock.patch(
-                "ethernity.cli.shared.io.frames._split_fallback_sections",
-                return_value={"auth": [], "main": ["a"]},
-            ):
+        encoded = encode_zbase32(encode_frame(self._frame()))
+        for lines in (["MAIN FRAME", encoded], ["AUTH FRAME", "MAIN FRAME", encoded]):
+            with self.subTest(lines=lines):
                 with self.assertRaisesRegex(ValueError, "missing auth section"):
                     _parse_fallback_section(
-                        ["AUTH FRAME"],
+                        lines,
                         "auth",
                         allow_invalid=False,
                         quiet=True,
@@ -175,48 +174,28 @@ class TestFramesIo(unittest.TestCase):
                     )
 
     def test_parse_fallback_section_invalid_section_can_be_ignored(self) -> None:
-        with mock.patch(
-            "ethernity.cli.shared.io.frames._contains_fallback_markers", return_value=True
-        ):
-            with mock.patch(
-                "ethernity.cli.shared.io.frames._split_fallback_sections",
-                return_value={"auth": ["bad"], "main": ["main"]},
-            ):
-                with mock.patch(
-                    "ethernity.cli.shared.io.frames._frame_from_fallback_lines",
-                    side_effect=ValueError("invalid"),
-                ):
-                    with mock.patch("ethernity.cli.shared.io.frames._warn") as warn_mock:
-                        parsed = _parse_fallback_section(
-                            ["AUTH FRAME", "bad"],
-                            "auth",
-                            allow_invalid=True,
-                            quiet=True,
-                            missing_error="missing",
-                        )
+        encoded = encode_zbase32(encode_frame(self._frame()))
+        with mock.patch("ethernity.cli.shared.io.frames._warn") as warn_mock:
+            parsed = _parse_fallback_section(
+                ["AUTH FRAME", "bad @ line", "MAIN FRAME", encoded],
+                "auth",
+                allow_invalid=True,
+                quiet=True,
+                missing_error="missing",
+            )
         self.assertIsNone(parsed)
         warn_mock.assert_called_once()
+        self.assertIn("line 2", warn_mock.call_args.args[0])
 
     def test_parse_fallback_section_invalid_section_raises_in_strict_mode(self) -> None:
-        with mock.patch(
-            "ethernity.cli.shared.io.frames._contains_fallback_markers", return_value=True
-        ):
-            with mock.patch(
-                "ethernity.cli.shared.io.frames._split_fallback_sections",
-                return_value={"auth": ["bad"], "main": ["main"]},
-            ):
-                with mock.patch(
-                    "ethernity.cli.shared.io.frames._frame_from_fallback_lines",
-                    side_effect=ValueError("invalid"),
-                ):
-                    with self.assertRaisesRegex(ValueError, "invalid"):
-                        _parse_fallback_section(
-                            ["AUTH FRAME", "bad"],
-                            "auth",
-                            allow_invalid=False,
-                            quiet=True,
-                            missing_error="missing",
-                        )
+        with self.assertRaisesRegex(ValueError, "outside the z-base-32 alphabet"):
+            _parse_fallback_section(
+                ["AUTH FRAME", "bad @ line"],
+                "auth",
+                allow_invalid=False,
+                quiet=True,
+                missing_error="missing",
+            )
 
     def test_detect_recovery_input_mode_prefers_marked_fallback(self) -> None:
         payload = encode_qr_payload(encode_frame(self._frame()))
@@ -237,26 +216,26 @@ class TestFramesIo(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "neither a valid QR payload list"):
             _detect_recovery_input_mode(["%%%", "***"])
 
-    def test_all_payload_lines_decode_returns_false_for_empty_lines(self) -> None:
-        self.assertFalse(_all_payload_lines_decode(["", "   "]))
+    def test_detect_recovery_input_mode_rejects_blank_input(self) -> None:
+        with self.assertRaisesRegex(ValueError, "neither a valid QR payload list"):
+            _detect_recovery_input_mode(["", "   "])
 
-    def test_all_lines_match_fallback_text_returns_false_for_empty_lines(self) -> None:
-        self.assertFalse(_all_lines_match_fallback_text(["", "   "]))
+    def test_peek_recovery_input_mode_reads_only_up_to_first_non_empty_line(self) -> None:
+        payload = encode_qr_payload(encode_frame(self._frame()))
+        source = iter(["", payload, "not read yet"])
+        mode, lines = _peek_recovery_input_mode(source)
+        self.assertEqual(mode, "payload")
+        self.assertEqual(next(source), "not read yet")
+        self.assertEqual(list(lines), ["", payload])
 
     def test_frames_from_fallback_lines_requires_main_section_when_marked(self) -> None:
-        with mock.patch(
-            "ethernity.cli.shared.io.frames._contains_fallback_markers", return_value=True
-        ):
-            with mock.patch(
-                "ethernity.cli.shared.io.frames._split_fallback_sections",
-                return_value={"main": [], "auth": []},
-            ):
-                with self.assertRaisesRegex(ValueError, "missing MAIN fallback section"):
-                    _frames_from_fallback_lines(
-                        ["AUTH FRAME"],
-                        allow_invalid_auth=False,
-                        quiet=True,
-                    )
+        auth = encode_zbase32(encode_frame(self._frame(frame_type=FrameType.AUTH)))
+        with self.assertRaisesRegex(ValueError, "missing MAIN fallback section"):
+            _frames_from_fallback_lines(
+                ["AUTH FRAME", auth],
+                allow_invalid_auth=False,
+                quiet=True,
+            )
 
     def test_frames_from_fallback_lines_rejects_content_before_first_marker(self) -> None:
         frame = self._frame()
@@ -295,7 +274,7 @@ class TestFramesIo(unittest.TestCase):
     def test_auth_frames_from_fallback_reads_lines_from_path(self) -> None:
         frame = self._frame(frame_type=FrameType.AUTH)
         with mock.patch(
-            "ethernity.cli.shared.io.frames._read_text_lines", return_value=["AUTH FRAME"]
+            "ethernity.cli.shared.io.frames._iter_text_lines", return_value=["AUTH FRAME"]
         ):
             with mock.patch(
                 "ethernity.cli.shared.io.frames._auth_frames_from_fallback_lines",
@@ -358,21 +337,21 @@ class TestFramesIo(unittest.TestCase):
 
     def test_frames_from_scan_reports_scan_failures(self) -> None:
         with mock.patch(
-            "ethernity.cli.shared.io.frames.scan_qr_payloads",
+            "ethernity.cli.shared.io.frames.iter_qr_payloads",
             side_effect=QrScanError("boom"),
         ):
             with self.assertRaisesRegex(ValueError, "scan failed"):
                 _frames_from_scan(["scan.png"])
 
     def test_frames_from_scan_reports_no_payloads(self) -> None:
-        with mock.patch("ethernity.cli.shared.io.frames.scan_qr_payloads", return_value=[]):
+        with mock.patch("ethernity.cli.shared.io.frames.iter_qr_payloads", return_value=[]):
             with self.assertRaisesRegex(ValueError, "no QR payloads found"):
                 _frames_from_scan(["scan.png"])
 
     def test_frames_from_scan_reports_all_invalid_payloads(self) -> None:
         with mock.patch(
-            "ethernity.cli.shared.io.frames.scan_qr_payloads",
-            return_value=["bad-1", "bad-2"],
+            "ethernity.cli.shared.io.frames.iter_qr_payloads",
+            return_value=_scanned("bad-1", "bad-2"),
         ):
             with mock.patch(
                 "ethernity.cli.shared.io.frames._frame_from_scanned_payload",
@@ -384,8 +363,8 @@ class TestFramesIo(unittest.TestCase):
     def test_frames_from_scan_accepts_raw_frame_bytes(self) -> None:
         frame = self._frame(frame_type=FrameType.AUTH, doc_id=b"\x31" * DOC_ID_LEN, data=b"auth")
         with mock.patch(
-            "ethernity.cli.shared.io.frames.scan_qr_payloads",
-            return_value=[encode_frame(frame)],
+            "ethernity.cli.shared.io.frames.iter_qr_payloads",
+            return_value=_scanned(encode_frame(frame)),
         ):
             parsed = _frames_from_scan(["scan.png"])
         self.assertEqual(len(parsed), 1)
@@ -410,6 +389,113 @@ class TestFramesIo(unittest.TestCase):
             with self.assertRaisesRegex(ValueError, "did not contain recovery QR payloads"):
                 _recovery_frames_from_scan(["backup-dir"], quiet=True)
 
+    def _scan_directory(
+        self, files: dict[str, list[Frame]], *, quiet: bool = True
+    ) -> tuple[list[Frame], list[str], mock.MagicMock]:
+        decoded: list[str] = []
+
+        def _decode_path(path: Path) -> list[bytes]:
+            decoded.append(path.name)
+            return [encode_frame(frame) for frame in files[path.name]]
+
+        decoder = QrDecoder(
+            name="fake", decode_image_path=_decode_path, decode_image_bytes=lambda _: []
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in files:
+                (Path(tmpdir) / name).write_bytes(b"")
+            with (
+                scan_session(cache=False),
+                mock.patch.object(qr_scan, "_load_decoder", return_value=decoder),
+                mock.patch("ethernity.cli.shared.io.frames._warn") as warn_mock,
+            ):
+                frames = _recovery_frames_from_scan([tmpdir], quiet=quiet)
+        return frames, decoded, warn_mock
+
+    def test_recovery_frames_from_scan_stops_once_main_and_auth_are_complete(self) -> None:
+        doc_id = b"\x42" * DOC_ID_LEN
+        main_0 = self._frame(doc_id=doc_id, index=0, total=2, data=b"zero")
+        main_1 = self._frame(doc_id=doc_id, index=1, total=2, data=b"one")
+        auth = self._frame(frame_type=FrameType.AUTH, doc_id=doc_id, data=b"auth")
+        frames, decoded, warn_mock = self._scan_directory(
+            {
+                "a.png": [main_0],
+                "b.png": [main_1, auth],
+                "c.png": [main_0, main_1],
+                "d.png": [auth],
+            }
+        )
+        self.assertEqual(decoded, ["a.png", "b.png"])
+        self.assertEqual(frames, [main_0, main_1, auth])
+        warn_mock.assert_called_once()
+        self.assertEqual(warn_mock.call_args.kwargs["code"], api_codes.RECOVERY_SCAN_INPUTS_SKIPPED)
+        skipped = warn_mock.call_args.kwargs["details"]["skipped_inputs"]
+        self.assertEqual([Path(path).name for path in skipped], ["c.png", "d.png"])
+
+    def test_recovery_frames_from_scan_reads_everything_without_auth(self) -> None:
+        doc_id = b"\x43" * DOC_ID_LEN
+        main_0 = self._frame(doc_id=doc_id, index=0, total=2, data=b"zero")
+        main_1 = self._frame(doc_id=doc_id, index=1, total=2, data=b"one")
+        frames, decoded, warn_mock = self._scan_directory(
+            {"a.png": [main_0], "b.png": [main_1], "c.png": [main_0]}
+        )
+        self.assertEqual(decoded, ["a.png", "b.png", "c.png"])
+        self.assertEqual(frames, [main_0, main_1, main_0])
+        warn_mock.assert_not_called()
+
+    def test_recovery_frames_from_scan_counts_parity_toward_completion(self) -> None:
+        doc_id = b"\x44" * DOC_ID_LEN
+        payload = bytes(range(90))
+        main_0, main_1, main_2, parity = chunk_payload(
+            payload,
+            doc_id=doc_id,
+            frame_type=FrameType.MAIN_DOCUMENT,
+            chunk_size=30,
+            parity_percent=30,
+        )
+        self.assertEqual(parity.frame_type, FrameType.PARITY)
+        auth = self._frame(frame_type=FrameType.AUTH, doc_id=doc_id, data=b"auth")
+        frames, decoded, _warn_mock = self._scan_directory(
+            {"a.png": [main_0, main_1], "b.png": [parity, auth], "c.png": [main_2]}
+        )
+        self.assertEqual(decoded, ["a.png", "b.png"])
+        main_frames, _auth_frames = _split_main_and_auth_frames(frames)
+        self.assertEqual(main_frames, [main_0, main_1, parity])
+        self.assertEqual(reassemble_payload(main_frames), payload)
+
+    def test_frames_from_scan_emits_scan_progress(self) -> None:
+        frame = self._frame(data=b"main")
+        scanned = [
+            ScannedPayload(Path("a.png"), 0, encode_frame(frame)),
+            ScannedPayload(Path("a.png"), 0, b"not-a-frame"),
+        ]
+
+        def _iter(_paths: object, *, progress: object, **_kwargs: object) -> object:
+            yield from scanned
+            progress(qr_scan.ScanProgress(1, 1, 1, 2))  # type: ignore[operator]
+
+        events: list[tuple[str, dict[str, object]]] = []
+
+        class _Sink:
+            def emit(self, event_type: str, **payload: object) -> None:
+                events.append((event_type, payload))
+
+        with (
+            mock.patch("ethernity.cli.shared.io.frames.iter_qr_payloads", side_effect=_iter),
+            event_session(_Sink()),
+        ):
+            frames = _frames_from_scan(["a.png"])
+
+        self.assertEqual(frames, [frame])
+        self.assertEqual(len(events), 1)
+        event_type, payload = events[0]
+        self.assertEqual(event_type, "progress")
+        self.assertEqual(payload["phase"], "scan")
+        self.assertEqual((payload["current"], payload["total"]), (1, 1))
+        self.assertEqual(
+            payload["details"], {"pages": 1, "payloads": 2, "decoded": 1, "rejected": 1}
+        )
+
     def test_dedupe_frames_accepts_identical_duplicates(self) -> None:
         frame = self._frame()
         deduped = _dedupe_frames([frame, frame])
@@ -457,11 +543,46 @@ class TestFramesIo(unittest.TestCase):
         self.assertEqual(parsed.frame_type, FrameType.AUTH)
         self.assertEqual(parsed.doc_id, frame.doc_id)
 
+    def test_frame_from_scanned_payload_decodes_base45_text_with_spaces(self) -> None:
+        frame = self._frame(doc_id=b"\x23" * DOC_ID_LEN, data=b"\x0c" * 24)
+        payload = encode_qr_payload(encode_frame(frame), codec=QR_PAYLOAD_CODEC_BASE45)
+        self.assertIsInstance(payload, str)
+        if not isinstance(payload, str):
+            self.fail("expected base45 payload text")
+        self.assertIn(" ", payload)
+        self.assertEqual(_frame_from_scanned_payload(payload.encode("ascii")), frame)
+        self.assertEqual(_frame_from_scanned_payload(payload), frame)
+        with self.assertRaisesRegex(ValueError, "invalid base64 QR payload"):
+            _frame_from_scanned_payload(payload[:-3].encode("ascii"))
+
     def test_read_text_lines_reads_stdin(self) -> None:
         with mock.patch("ethernity.cli.shared.io.frames.sys.stdin", new=io.StringIO("a\nb\n")):
             lines = _read_text_lines("-")
         self.assertEqual(lines, ["a", "b"])
 
+    def test_iter_text_lines_splits_lines_across_read_chunks(self) -> None:
+        text = "\u00e9" * 5 + "\r\nsecond\rthird\n\nlast"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "input.txt"
+            path.write_bytes(text.encode("utf-8"))
+            with mock.patch("ethernity.cli.shared.io.frames._TEXT_READ_CHUNK_BYTES", 3):
+                lines = list(_iter_text_lines(str(path)))
+        self.assertEqual(lines, text.splitlines())
+
+    def test_iter_text_lines_stops_at_size_limit_before_reading_the_rest(self) -> None:
+        stdin = io.BytesIO(b"a\n" * 10)
+        stdin_mock = mock.Mock(buffer=stdin)
+        with (
+            mock.patch("ethernity.cli.shared.io.frames.sys.stdin", new=stdin_mock),
+            mock.patch("ethernity.cli.shared.io.frames._TEXT_READ_CHUNK_BYTES", 4),
+            mock.patch("ethernity.cli.shared.io.frames.MAX_RECOVERY_TEXT_BYTES", 6),
+        ):
+            lines = _iter_text_lines("-")
+            self.assertEqual([next(lines), next(lines)], ["a", "a"])
+            with self.assertRaisesRegex(ValueError, "MAX_RECOVERY_TEXT_BYTES"):
+                list(lines)
+        self.assertEqual(stdin.tell(), 8)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -20,9 +20,17 @@ from ethernity.core.bounds import (
     MAX_AUTH_CBOR_BYTES,
     MAX_MAIN_FRAME_DATA_BYTES,
     MAX_MAIN_FRAME_TOTAL,
+    MAX_PARITY_FRAME_TOTAL,
     MAX_SHARD_CBOR_BYTES,
 )
-from ethernity.encoding.framing import DOC_ID_LEN, Frame, FrameType, decode_frame, encode_frame
+from ethernity.encoding.framing import (
+    DOC_ID_LEN,
+    PARITY_VERSION,
+    Frame,
+    FrameType,
+    decode_frame,
+    encode_frame,
+)
 
 
 class TestFraming(unittest.TestCase):
@@ -232,7 +240,7 @@ class TestFraming(unittest.TestCase):
         doc_id = b"\x10" * DOC_ID_LEN
         for frame_type in FrameType:
             frame = Frame(
-                version=1,
+                version=PARITY_VERSION if frame_type == FrameType.PARITY else 1,
                 frame_type=frame_type,
                 doc_id=doc_id,
                 index=0,
@@ -384,6 +392,51 @@ class TestFraming(unittest.TestCase):
             decode_frame(bytes(encoded))
         self.assertIn("version", str(ctx.exception).lower())
 
+    def test_parity_frames_are_gated_on_their_own_version(self) -> None:
+        doc_id = b"\x63" * DOC_ID_LEN
+        parity = Frame(
+            version=PARITY_VERSION,
+            frame_type=FrameType.PARITY,
+            doc_id=doc_id,
+            index=1,
+            total=2,
+            data=b"parity",
+        )
+        self.assertEqual(decode_frame(encode_frame(parity)), parity)
+        cases = (
+            (FrameType.PARITY, 1, "version for PARITY: 1"),
+            (FrameType.MAIN_DOCUMENT, PARITY_VERSION, "version for MAIN_DOCUMENT: 2"),
+            (FrameType.PARITY, 3, "unsupported frame version: 3"),
+        )
+        for frame_type, version, message in cases:
+            with self.subTest(frame_type=frame_type, version=version):
+                frame = Frame(
+                    version=version,
+                    frame_type=frame_type,
+                    doc_id=doc_id,
+                    index=0,
+                    total=1,
+                    data=b"data",
+                )
+                with self.assertRaisesRegex(ValueError, message):
+                    encode_frame(frame)
+                body = b"AP" + bytes([version, frame_type]) + doc_id + b"\x00\x01\x04data"
+                encoded = body + (zlib.crc32(body) & 0xFFFFFFFF).to_bytes(4, "big")
+                with self.assertRaisesRegex(ValueError, message):
+                    decode_frame(encoded)
+
+    def test_parity_frame_total_rejects_limit_overflow(self) -> None:
+        frame = Frame(
+            version=PARITY_VERSION,
+            frame_type=FrameType.PARITY,
+            doc_id=b"\x64" * DOC_ID_LEN,
+            index=0,
+            total=MAX_PARITY_FRAME_TOTAL + 1,
+            data=b"parity",
+        )
+        with self.assertRaisesRegex(ValueError, "MAX_PARITY_FRAME_TOTAL"):
+            encode_frame(frame)
+
     def test_decode_unsupported_type_raises(self) -> None:
         """Frame type must be one of the supported constants."""
         doc_id = b"\x63" * DOC_ID_LEN
@@ -23,12 +23,16 @@ import tempfile
 import unittest
 from pathlib import Path
 
+from ethernity.encoding.chunking import chunk_payload
+from ethernity.encoding.framing import FrameType, encode_frame
+from ethernity.encoding.qr_payloads import encode_qr_payload
 from ethernity.formats.envelope_codec import build_manifest_and_payload, encode_envelope
 from ethernity.formats.envelope_types import PayloadPart
 from tests.test_support import cli_subprocess_timeout_seconds
 
 _PROJECT_ROOT = Path(__file__).resolve().parents[2]
 _SCRIPT_PATH = _PROJECT_ROOT / "kit" / "scripts" / "run_extract_envelope.mjs"
+_RECOVER_SCRIPT_PATH = _PROJECT_ROOT / "kit" / "scripts" / "run_recover_frames.mjs"
 _KIT_HASHES_PACKAGE = _PROJECT_ROOT / "kit" / "node_modules" / "@noble" / "hashes" / "package.json"
 
 
@@ -120,5 +124,49 @@ class TestKitInterop(unittest.TestCase):
             return extracted
 
 
+class TestKitParityInterop(unittest.TestCase):
+    @unittest.skipIf(shutil.which("node") is None, "node runtime is required")
+    def test_kit_rebuilds_missing_main_frame_from_python_parity_frames(self) -> None:
+        ciphertext = bytes((idx * 37 + 11) % 256 for idx in range(4000))
+        frames = chunk_payload(
+            ciphertext,
+            doc_id=bytes(range(1, 9)),
+            frame_type=FrameType.MAIN_DOCUMENT,
+            chunk_size=512,
+            parity_percent=25,
+        )
+        main_frames = [frame for frame in frames if frame.frame_type == FrameType.MAIN_DOCUMENT]
+        parity_frames = [frame for frame in frames if frame.frame_type == FrameType.PARITY]
+        self.assertGreater(len(parity_frames), 0, msg="fixture must include PARITY frames")
+        kept = [frame for frame in frames if frame is not main_frames[3]]
+        lines = [str(encode_qr_payload(encode_frame(frame))) for frame in kept]
+
+        result = self._recover_with_kit("\n".join(lines) + "\n")
+
+        self.assertEqual(result["parity_frames"], len(parity_frames))
+        self.assertEqual(result["recovered_frames"], 1)
+        self.assertEqual(base64.b64decode(result["ciphertext_base64"]), ciphertext)
+
+    def _recover_with_kit(self, text: str) -> dict[str, object]:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            payload_path = Path(tmp_dir) / "payloads.txt"
+            payload_path.write_text(text, encoding="utf-8")
+            result = subprocess.run(
+                ["node", str(_RECOVER_SCRIPT_PATH), str(payload_path)],
+                cwd=_PROJECT_ROOT,
+                text=True,
+                capture_output=True,
+                check=False,
+                timeout=cli_subprocess_timeout_seconds(),
+            )
+            self.assertEqual(
+                result.returncode,
+                0,
+                msg=result.stderr.strip() or result.stdout.strip(),
+            )
+            payload: dict[str, object] = json.loads(result.stdout)
+            return payload
+
+
 if __name__ == "__main__":
     unittest.main()
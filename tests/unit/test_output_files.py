@@ -22,6 +22,7 @@ import stat
 import tempfile
 import types
 import unittest
+from dataclasses import replace
 from pathlib import Path
 from unittest import mock
 
@@ -29,9 +30,12 @@ from ethernity.cli.shared.io.outputs import (
     _ensure_output_dir,
     _prepare_output_dir,
     _safe_join,
+    _stream_recovered_directory_outputs,
     _write_output,
     _write_recovered_outputs,
 )
+from ethernity.formats.envelope_codec import build_manifest_and_payload
+from ethernity.formats.envelope_types import PayloadPart
 
 
 def _home_env(home: Path) -> dict[str, str]:
@@ -225,6 +229,82 @@ class TestOutputFiles(unittest.TestCase):
                 with self.assertRaisesRegex(ValueError, "collide on this filesystem"):
                     _write_recovered_outputs(str(out_dir), entries)
 
+    def test_write_recovered_outputs_writes_many_entries_without_case_probe(self) -> None:
+        entries = [
+            (types.SimpleNamespace(path=f"dir{index % 7}/file-{index:04d}.bin"), bytes([index]))
+            for index in range(256)
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out_dir = Path(tmpdir) / "recovered"
+            with mock.patch(
+                "ethernity.cli.shared.io.outputs._is_directory_case_sensitive"
+            ) as probe:
+                written = _write_recovered_outputs(str(out_dir), entries)
+
+            probe.assert_not_called()
+            self.assertEqual(written, [str(out_dir / entry.path) for entry, _data in entries])
+            for entry, data in entries:
+                self.assertEqual((out_dir / entry.path).read_bytes(), data)
+            self.assertEqual(sorted(path.name for path in Path(tmpdir).iterdir()), ["recovered"])
+
+    def test_write_recovered_outputs_rejects_duplicate_paths(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out_dir = Path(tmpdir) / "recovered"
+            entries = [
+                (types.SimpleNamespace(path="same.txt"), b"A"),
+                (types.SimpleNamespace(path="same.txt"), b"B"),
+            ]
+            with self.assertRaisesRegex(ValueError, "duplicate output path"):
+                _write_recovered_outputs(str(out_dir), entries)
+            self.assertEqual(list(Path(tmpdir).iterdir()), [])
+
+    def test_stream_recovered_directory_outputs_replaces_existing_directory(self) -> None:
+        manifest, payload = build_manifest_and_payload(
+            [
+                PayloadPart(path="kept.txt", data=b"new", mtime=None),
+                PayloadPart(path="nested/fresh.txt", data=b"fresh", mtime=None),
+            ],
+            signing_seed=b"\x11" * 32,
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out_dir = Path(tmpdir) / "recovered"
+            out_dir.mkdir()
+            (out_dir / "stale.txt").write_text("stale", encoding="utf-8")
+
+            written = _stream_recovered_directory_outputs(str(out_dir), manifest, payload)
+
+            self.assertEqual(
+                written, [str(out_dir / "kept.txt"), str(out_dir / "nested" / "fresh.txt")]
+            )
+            self.assertFalse((out_dir / "stale.txt").exists())
+            self.assertEqual((out_dir / "kept.txt").read_bytes(), b"new")
+            self.assertEqual((out_dir / "nested" / "fresh.txt").read_bytes(), b"fresh")
+            self.assertEqual(sorted(path.name for path in Path(tmpdir).iterdir()), ["recovered"])
+
+    def test_stream_recovered_directory_outputs_leaves_destination_on_hash_mismatch(
+        self,
+    ) -> None:
+        manifest, payload = build_manifest_and_payload(
+            [
+                PayloadPart(path="a.txt", data=b"first", mtime=None),
+                PayloadPart(path="b.txt", data=b"second", mtime=None),
+            ],
+            signing_seed=b"\x11" * 32,
+        )
+        bad_entry = replace(manifest.files[1], sha256=b"\x00" * 32)
+        manifest = replace(manifest, files=(manifest.files[0], bad_entry))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out_dir = Path(tmpdir) / "recovered"
+            out_dir.mkdir()
+            (out_dir / "a.txt").write_text("old", encoding="utf-8")
+
+            with self.assertRaisesRegex(ValueError, "sha256 mismatch for b.txt"):
+                _stream_recovered_directory_outputs(str(out_dir), manifest, payload)
+
+            self.assertEqual(sorted(path.name for path in out_dir.iterdir()), ["a.txt"])
+            self.assertEqual((out_dir / "a.txt").read_text(encoding="utf-8"), "old")
+            self.assertEqual(sorted(path.name for path in Path(tmpdir).iterdir()), ["recovered"])
+
     def test_write_recovered_outputs_stdout_invokes_callback(self) -> None:
         fake_stdout = types.SimpleNamespace(buffer=io.BytesIO())
         calls: list[tuple[str, str, int, int]] = []
@@ -33,6 +33,8 @@ from ethernity.formats.payload_codec import (
     PAYLOAD_ENCODING_AUTO,
     decode_payload_from_manifest,
     encode_payload_for_manifest,
+    encode_payload_parts_for_manifest,
+    iter_decoded_payload,
 )
 
 
@@ -94,6 +96,45 @@ class TestPayloadCodec(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "unsupported payload encoding mode"):
             encode_payload_for_manifest(b"payload", mode="brotli")  # type: ignore[arg-type]
 
+    def test_encode_payload_parts_matches_one_shot_encoding(self) -> None:
+        parts = (b"alpha" * 300, os.urandom(700), b"", b"omega" * 900)
+        payload = b"".join(parts)
+        for mode in (PAYLOAD_ENCODING_AUTO, PAYLOAD_CODEC_RAW, PAYLOAD_CODEC_GZIP):
+            with self.subTest(mode=mode):
+                self.assertEqual(
+                    encode_payload_parts_for_manifest(parts, mode=mode),
+                    encode_payload_for_manifest(payload, mode=mode),
+                )
+        encoded, _codec, _raw_len = encode_payload_parts_for_manifest(
+            parts, mode=PAYLOAD_CODEC_GZIP
+        )
+        self.assertEqual(encoded, gzip.compress(payload, compresslevel=9, mtime=0))
+
+    def test_encode_payload_parts_enforces_max_encoded_bytes(self) -> None:
+        compressible = (b"A" * 8192,)
+        encoded, codec, _raw_len = encode_payload_parts_for_manifest(
+            compressible, max_encoded_bytes=1024
+        )
+        self.assertEqual(codec, PAYLOAD_CODEC_GZIP)
+        self.assertLessEqual(len(encoded), 1024)
+
+        incompressible = (os.urandom(8192),)
+        for mode in (PAYLOAD_ENCODING_AUTO, PAYLOAD_CODEC_RAW, PAYLOAD_CODEC_GZIP):
+            with self.subTest(mode=mode):
+                with self.assertRaisesRegex(ValueError, "encoded payload exceeds 1024 bytes"):
+                    encode_payload_parts_for_manifest(
+                        incompressible, mode=mode, max_encoded_bytes=1024
+                    )
+
+    def test_encode_payload_parts_auto_falls_back_to_raw_within_limit(self) -> None:
+        raw = os.urandom(512)
+        encoded, codec, raw_len = encode_payload_parts_for_manifest(
+            (raw[:100], raw[100:]), max_encoded_bytes=len(raw)
+        )
+        self.assertEqual(codec, PAYLOAD_CODEC_RAW)
+        self.assertIsNone(raw_len)
+        self.assertEqual(encoded, raw)
+
     def test_decode_payload_from_manifest_roundtrip_gzip(self) -> None:
         raw = b"hello world\n" * 300
         compressed = gzip.compress(raw, compresslevel=9, mtime=0)
@@ -135,6 +176,42 @@ class TestPayloadCodec(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "MAX_DECOMPRESSED_PAYLOAD_BYTES"):
             decode_payload_from_manifest(manifest, compressed)
 
+    def test_iter_decoded_payload_matches_one_shot_decode(self) -> None:
+        raw = b"hello world\n" * 300 + os.urandom(333)
+        compressed = gzip.compress(raw, compresslevel=9, mtime=0)
+        cases = (
+            (self._manifest_for(raw, codec=PAYLOAD_CODEC_GZIP, raw_len=len(raw)), compressed),
+            (self._manifest_for(raw, codec=PAYLOAD_CODEC_RAW, raw_len=None), raw),
+        )
+        for manifest, payload in cases:
+            with self.subTest(codec=manifest.payload_codec):
+                chunks = list(iter_decoded_payload(manifest, payload, chunk_size=97))
+                self.assertEqual(b"".join(chunks), raw)
+                self.assertTrue(all(0 < len(chunk) <= 97 for chunk in chunks))
+
+    def test_iter_decoded_payload_rejects_corrupt_streams(self) -> None:
+        raw = b"hello world\n" * 300
+        compressed = gzip.compress(raw, compresslevel=9, mtime=0)
+        manifest = self._manifest_for(raw, codec=PAYLOAD_CODEC_GZIP, raw_len=len(raw))
+        cases = (
+            (compressed[:-12], "invalid gzip payload"),
+            (compressed + b"junk", "trailing data"),
+        )
+        for payload, message in cases:
+            with self.subTest(message=message):
+                with self.assertRaisesRegex(ValueError, message):
+                    list(iter_decoded_payload(manifest, payload, chunk_size=64))
+
+    def test_iter_decoded_payload_stops_once_output_exceeds_raw_len(self) -> None:
+        raw = b"A" * 4096
+        compressed = gzip.compress(raw + raw, compresslevel=9, mtime=0)
+        manifest = self._manifest_for(raw, codec=PAYLOAD_CODEC_GZIP, raw_len=len(raw))
+        decoded: list[bytes] = []
+        with self.assertRaisesRegex(ValueError, "exceeds manifest payload_raw_len"):
+            for chunk in iter_decoded_payload(manifest, compressed, chunk_size=1024):
+                decoded.append(chunk)
+        self.assertEqual(b"".join(decoded), raw)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -487,7 +487,7 @@ class TestPdfRender(unittest.TestCase):
 
     @mock.patch.dict("os.environ", {}, clear=True)
     @mock.patch(
-        "ethernity.render.pdf_render.os.process_cpu_count",
+        "ethernity.core.concurrency.os.process_cpu_count",
         create=True,
         return_value=8,
     )
@@ -500,7 +500,7 @@ class TestPdfRender(unittest.TestCase):
 
     @mock.patch.dict("os.environ", {"ETHERNITY_RENDER_JOBS": "5"}, clear=True)
     @mock.patch(
-        "ethernity.render.pdf_render.os.process_cpu_count",
+        "ethernity.core.concurrency.os.process_cpu_count",
         create=True,
         return_value=8,
     )
@@ -513,7 +513,7 @@ class TestPdfRender(unittest.TestCase):
 
     @mock.patch.dict("os.environ", {"ETHERNITY_RENDER_JOBS": "invalid"}, clear=True)
     @mock.patch(
-        "ethernity.render.pdf_render.os.process_cpu_count",
+        "ethernity.core.concurrency.os.process_cpu_count",
         create=True,
         return_value=8,
     )
@@ -526,7 +526,7 @@ class TestPdfRender(unittest.TestCase):
 
     @mock.patch.dict("os.environ", {}, clear=True)
     @mock.patch(
-        "ethernity.render.pdf_render.os.process_cpu_count",
+        "ethernity.core.concurrency.os.process_cpu_count",
         create=True,
         return_value=8,
     )
@@ -538,9 +538,9 @@ class TestPdfRender(unittest.TestCase):
         self.assertEqual(workers, 8)
 
     @mock.patch.dict("os.environ", {}, clear=True)
-    @mock.patch("ethernity.render.pdf_render.os.process_cpu_count", new=None, create=True)
+    @mock.patch("ethernity.core.concurrency.os.process_cpu_count", new=None, create=True)
     @mock.patch(
-        "ethernity.render.pdf_render.os.sched_getaffinity",
+        "ethernity.core.concurrency.os.sched_getaffinity",
         create=True,
         return_value={0, 1, 2},
     )
@@ -552,13 +552,13 @@ class TestPdfRender(unittest.TestCase):
         self.assertEqual(workers, 3)
 
     @mock.patch.dict("os.environ", {}, clear=True)
-    @mock.patch("ethernity.render.pdf_render.os.process_cpu_count", new=None, create=True)
+    @mock.patch("ethernity.core.concurrency.os.process_cpu_count", new=None, create=True)
     @mock.patch(
-        "ethernity.render.pdf_render.os.sched_getaffinity",
+        "ethernity.core.concurrency.os.sched_getaffinity",
         create=True,
         side_effect=OSError("not supported"),
     )
-    @mock.patch("ethernity.render.pdf_render.os.cpu_count", return_value=6)
+    @mock.patch("ethernity.core.concurrency.os.cpu_count", return_value=6)
     def test_resolve_qr_workers_falls_back_to_os_cpu_count_when_affinity_unavailable(
         self,
         _cpu_count: mock.MagicMock,
@@ -0,0 +1,134 @@
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import pstats
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from typer.testing import CliRunner
+
+from ethernity import cli
+from ethernity.cli.shared.profiling import ProfileSession, collapsed_stacks, redact_argv
+from ethernity.config.install import DEFAULT_CONFIG_PATH
+
+
+def _busy(depth: int) -> int:
+    if depth == 0:
+        return sum(range(20_000))
+    return _busy(depth - 1) + len([str(item) for item in range(2_000)])
+
+
+class TestRedactArgv(unittest.TestCase):
+    def test_masks_passphrase_values_in_both_forms(self) -> None:
+        redacted = redact_argv(
+            ["ethernity", "recover", "--passphrase", "hunter2", "--passphrase=swordfish", "-"]
+        )
+        joined = " ".join(redacted)
+        self.assertNotIn("hunter2", joined)
+        self.assertNotIn("swordfish", joined)
+        self.assertEqual(redacted[2], "--passphrase")
+        self.assertTrue(redacted[3].startswith("<masked chars=7"))
+        self.assertTrue(redacted[4].startswith("--passphrase=<masked chars=9"))
+        self.assertEqual(redacted[-1], "-")
+
+    def test_leaves_other_passphrase_options_alone(self) -> None:
+        argv = ["ethernity", "backup", "--passphrase-words", "24", "--generate-passphrase"]
+        self.assertEqual(redact_argv(argv), argv)
+
+
+class TestCollapsedStacks(unittest.TestCase):
+    def test_own_time_is_split_across_callers(self) -> None:
+        root = ("app.py", 1, "main")
+        left = ("app.py", 10, "left")
+        right = ("app.py", 20, "right")
+        leaf = ("lib.py", 5, "work")
+        stats = {
+            root: (1, 1, 0.001, 1.001, {}),
+            left: (1, 1, 0.0, 0.25, {root: (1, 1, 0.0, 0.25)}),
+            right: (1, 1, 0.0, 0.75, {root: (1, 1, 0.0, 0.75)}),
+            leaf: (2, 2, 1.0, 1.0, {left: (1, 1, 0.25, 0.25), right: (1, 1, 0.75, 0.75)}),
+        }
+        lines = dict(line.rsplit(" ", 1) for line in collapsed_stacks(stats))
+        self.assertEqual(
+            lines,
+            {
+                "main (app.py:1)": "1000",
+                "main (app.py:1);left (app.py:10);work (lib.py:5)": "250000",
+                "main (app.py:1);right (app.py:20);work (lib.py:5)": "750000",
+            },
+        )
+
+    def test_recursive_cycles_terminate(self) -> None:
+        func = ("app.py", 1, "recurse")
+        stats = {func: (3, 1, 0.5, 0.5, {func: (2, 2, 0.2, 0.2)})}
+        self.assertEqual(collapsed_stacks(stats), ["recurse (app.py:1) 500000"])
+
+
+class TestProfileSession(unittest.TestCase):
+    def test_writes_pstats_collapsed_allocation_and_summary_files(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir) / "profile"
+            session = ProfileSession(
+                output_dir,
+                command="backup",
+                argv=["ethernity", "--passphrase", "secret words"],
+                top_n=5,
+            )
+            session.start()
+            _busy(3)
+            artifacts = session.stop()
+
+            stats = pstats.Stats(str(artifacts.pstats_path))
+            self.assertTrue(any(key[2] == "_busy" for key in stats.stats))  # type: ignore[attr-defined]
+            collapsed = artifacts.collapsed_path.read_text(encoding="utf-8")
+            self.assertIn("_busy (test_profiling.py:", collapsed)
+            allocations = artifacts.allocations_path.read_text(encoding="utf-8")
+            self.assertIn("Top 5 live allocations by line:", allocations)
+            summary = json.loads(artifacts.summary_path.read_text(encoding="utf-8"))
+            self.assertEqual(summary["command"], "backup")
+            self.assertNotIn("secret words", json.dumps(summary))
+            self.assertTrue(artifacts.pstats_path.name.startswith("ethernity-backup-"))
+
+
+class TestProfileOption(unittest.TestCase):
+    def test_global_profile_option_wraps_dispatched_command(self) -> None:
+        runner = CliRunner()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            argv = [
+                "--profile",
+                tmpdir,
+                "api",
+                "config",
+                "get",
+                "--config",
+                str(DEFAULT_CONFIG_PATH),
+            ]
+            with (
+                mock.patch("ethernity.cli.bootstrap.app.run_startup", return_value=False),
+                mock.patch("sys.argv", ["ethernity", *argv]),
+            ):
+                result = runner.invoke(cli.app, argv)
+
+            self.assertEqual(result.exit_code, 0, msg=result.output)
+            names = sorted(path.name for path in Path(tmpdir).iterdir())
+            self.assertEqual(len(names), 4)
+            self.assertTrue(all(name.startswith("ethernity-api-config-get-") for name in names))
+
+
+if __name__ == "__main__":
+    unittest.main()
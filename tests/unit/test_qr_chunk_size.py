@@ -15,9 +15,11 @@
 
 import unittest
 
+from ethernity.core.bounds import MAX_QR_PAYLOAD_CHARS
 from ethernity.encoding.chunking import DEFAULT_CHUNK_SIZE, chunk_payload
 from ethernity.encoding.framing import DOC_ID_LEN, FrameType, encode_frame
 from ethernity.encoding.qr_payloads import (
+    QR_PAYLOAD_CODEC_BASE45,
     QR_PAYLOAD_CODEC_BASE64,
     QR_PAYLOAD_CODEC_RAW,
     encode_qr_payload,
@@ -134,6 +136,53 @@ class TestQrChunkSize(unittest.TestCase):
         )
         self.assertGreaterEqual(raw_chunk_size, base64_chunk_size)
 
+    def test_choose_frame_chunk_size_base45_codec_uses_alphanumeric_capacity(self) -> None:
+        doc_id = b"\x44" * DOC_ID_LEN
+        qr_config = QrConfig(error="M", version=25, micro=False, boost_error=False)
+        sizes = {
+            codec: choose_frame_chunk_size(
+                20_000,
+                preferred_chunk_size=4096,
+                doc_id=doc_id,
+                frame_type=FrameType.MAIN_DOCUMENT,
+                qr_config=qr_config,
+                payload_codec=codec,
+            )
+            for codec in (QR_PAYLOAD_CODEC_RAW, QR_PAYLOAD_CODEC_BASE64, QR_PAYLOAD_CODEC_BASE45)
+        }
+        self.assertGreater(sizes[QR_PAYLOAD_CODEC_BASE45], sizes[QR_PAYLOAD_CODEC_BASE64] * 5 // 4)
+        self.assertLessEqual(sizes[QR_PAYLOAD_CODEC_BASE45], sizes[QR_PAYLOAD_CODEC_RAW])
+
+        frames = chunk_payload(
+            b"\xff" * 20_000,
+            doc_id=doc_id,
+            frame_type=FrameType.MAIN_DOCUMENT,
+            chunk_size=sizes[QR_PAYLOAD_CODEC_BASE45],
+        )
+        payload = encode_qr_payload(encode_frame(frames[0]), codec=QR_PAYLOAD_CODEC_BASE45)
+        self.assertEqual(make_qr(payload, error="M", version=25).mode, "alphanumeric")
+
+    def test_choose_frame_chunk_size_keeps_text_codecs_within_payload_char_bound(self) -> None:
+        doc_id = b"\x44" * DOC_ID_LEN
+        qr_config = QrConfig(error="L", version=40, micro=False, boost_error=False)
+        chunk_size = choose_frame_chunk_size(
+            20_000,
+            preferred_chunk_size=4096,
+            doc_id=doc_id,
+            frame_type=FrameType.MAIN_DOCUMENT,
+            qr_config=qr_config,
+            payload_codec=QR_PAYLOAD_CODEC_BASE45,
+        )
+        frames = chunk_payload(
+            b"\xff" * 20_000,
+            doc_id=doc_id,
+            frame_type=FrameType.MAIN_DOCUMENT,
+            chunk_size=chunk_size,
+        )
+        for frame in frames:
+            payload = encode_qr_payload(encode_frame(frame), codec=QR_PAYLOAD_CODEC_BASE45)
+            self.assertLessEqual(len(payload), MAX_QR_PAYLOAD_CHARS)
+
 
 if __name__ == "__main__":
     unittest.main()
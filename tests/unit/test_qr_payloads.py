@@ -20,8 +20,12 @@ from unittest import mock
 from ethernity.core.bounds import MAX_QR_PAYLOAD_CHARS
 from ethernity.encoding.framing import DOC_ID_LEN, VERSION, Frame, FrameType, encode_frame
 from ethernity.encoding.qr_payloads import (
+    BASE45_ALPHABET,
+    QR_PAYLOAD_CODEC_BASE45,
     QR_PAYLOAD_CODEC_RAW,
+    decode_base45,
     decode_qr_payload,
+    encode_base45,
     encode_qr_payload,
 )
 from ethernity.render.service import RenderService
@@ -46,6 +50,38 @@ class TestQrPayloads(unittest.TestCase):
         decoded = decode_qr_payload(encoded, codec=QR_PAYLOAD_CODEC_RAW)
         self.assertEqual(decoded, data)
 
+    def test_base45_matches_rfc_9285_vectors(self) -> None:
+        vectors = (
+            (b"AB", "BB8"),
+            (b"Hello!!", "%69 VD92EX0"),
+            (b"base-45", "UJCLQE7W581"),
+            (b"ietf!", "QED8WEX0"),
+            (b"", ""),
+        )
+        for data, text in vectors:
+            with self.subTest(text=text):
+                self.assertEqual(encode_base45(data), text)
+                self.assertEqual(decode_base45(text), data)
+
+    def test_roundtrip_base45(self) -> None:
+        data = bytes(range(256)) + b"\x00"
+        encoded = encode_qr_payload(data, codec=QR_PAYLOAD_CODEC_BASE45)
+        self.assertIsInstance(encoded, str)
+        if not isinstance(encoded, str):
+            self.fail("expected base45 payload text")
+        self.assertTrue(set(encoded) <= set(BASE45_ALPHABET))
+        self.assertEqual(len(encoded), 3 * (len(data) // 2) + 2)
+        self.assertEqual(decode_qr_payload(encoded, codec=QR_PAYLOAD_CODEC_BASE45), data)
+        self.assertEqual(
+            decode_qr_payload(encoded.encode("ascii"), codec=QR_PAYLOAD_CODEC_BASE45), data
+        )
+
+    def test_decode_rejects_invalid_base45(self) -> None:
+        for text in ("A", "GGW", "V5", "bb8", "BB8=", "B B8"):
+            with self.subTest(text=text):
+                with self.assertRaisesRegex(ValueError, "invalid base45 QR payload"):
+                    decode_qr_payload(text, codec=QR_PAYLOAD_CODEC_BASE45)
+
     def test_decode_raw_rejects_text(self) -> None:
         with self.assertRaisesRegex(ValueError, "invalid raw QR payload"):
             decode_qr_payload("not-bytes", codec=QR_PAYLOAD_CODEC_RAW)
@@ -96,6 +132,23 @@ class TestQrPayloads(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "MAX_QR_PAYLOAD_CHARS"):
             service.build_qr_payloads([overflow_frame])  # type: ignore[list-item]
 
+    def test_render_service_enforces_text_bound_for_base45(self) -> None:
+        config = SimpleNamespace()
+        service = RenderService(config=config)  # type: ignore[arg-type]
+        frame = Frame(
+            version=VERSION,
+            frame_type=FrameType.MAIN_DOCUMENT,
+            doc_id=b"\x01" * DOC_ID_LEN,
+            index=0,
+            total=1,
+            data=b"x" * 64,
+        )
+        payload = service.build_qr_payloads([frame], codec=QR_PAYLOAD_CODEC_BASE45)[0]
+        self.assertIsInstance(payload, str)
+        with mock.patch("ethernity.render.service.MAX_QR_PAYLOAD_CHARS", 4):
+            with self.assertRaisesRegex(ValueError, "MAX_QR_PAYLOAD_CHARS"):
+                service.build_qr_payloads([frame], codec=QR_PAYLOAD_CODEC_BASE45)
+
     def test_render_service_raw_codec_skips_text_bound(self) -> None:
         config = SimpleNamespace()
         service = RenderService(config=config)  # type: ignore[arg-type]
@@ -0,0 +1,128 @@
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import io
+import unittest
+from unittest import mock
+
+from PIL import Image
+
+from ethernity.qr import scan as qr_scan
+from ethernity.qr.codec import qr_bytes
+from ethernity.qr.preprocess import (
+    PREPROCESS_TRANSFORMS,
+    TransformRanking,
+    otsu_threshold,
+    retry_with_transforms,
+)
+
+try:
+    import zxingcpp
+
+    HAS_ZXING = True
+except ImportError:
+    HAS_ZXING = False
+
+
+def _low_contrast_qr(payload: bytes) -> Image.Image:
+    with Image.open(io.BytesIO(qr_bytes(payload, kind="png", scale=6, border=4))) as qr:
+        return qr.convert("L").point(lambda level: 135 if level > 128 else 120)
+
+
+class TestTransformRanking(unittest.TestCase):
+    def test_order_prefers_transforms_that_recovered_codes(self) -> None:
+        ranking = TransformRanking()
+        self.assertEqual(ranking.order(), list(PREPROCESS_TRANSFORMS))
+        ranking.record("invert")
+        ranking.record("otsu")
+        ranking.record("invert")
+        self.assertEqual(ranking.order()[:2], ["invert", "otsu"])
+        self.assertEqual(ranking.wins(), {"invert": 2, "otsu": 1})
+
+    def test_otsu_threshold_splits_bimodal_histogram(self) -> None:
+        histogram = [0] * 256
+        histogram[40] = 500
+        histogram[200] = 300
+        threshold = otsu_threshold(histogram)
+        self.assertGreaterEqual(threshold, 40)
+        self.assertLess(threshold, 200)
+
+
+class TestRetryWithTransforms(unittest.TestCase):
+    def test_retry_stops_at_expected_count_and_records_wins(self) -> None:
+        image = Image.linear_gradient("L").resize((20, 20))
+        calls: list[int] = []
+
+        def _decode(_candidate: Image.Image) -> list[bytes]:
+            calls.append(len(calls))
+            return [b"known", b"new"] if len(calls) == 2 else []
+
+        ranking = TransformRanking()
+        recovered = retry_with_transforms(
+            image, decode=_decode, found=[b"known"], expected=2, ranking=ranking
+        )
+        self.assertEqual(recovered, [b"new"])
+        # Grayscale is skipped for an image that is already grayscale.
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(ranking.wins(), {"otsu": 1})
+        self.assertEqual(ranking.order()[0], "otsu")
+
+
+@unittest.skipUnless(HAS_ZXING, "zxingcpp not available")
+class TestPreprocessedDecode(unittest.TestCase):
+    def test_low_contrast_image_decodes_after_transform(self) -> None:
+        image = _low_contrast_qr(b"faded-scan")
+        self.assertEqual(qr_scan._decode_image(image, zxing_module=zxingcpp), [])
+
+        ranking = TransformRanking()
+        payloads = qr_scan._decode_image(image, zxing_module=zxingcpp, ranking=ranking)
+        self.assertEqual(payloads, [b"faded-scan"])
+        self.assertEqual(ranking.order()[0], "autocontrast")
+
+    def test_retry_log_records_transform_that_recovered_payload(self) -> None:
+        retries = qr_scan.ScanRetryLog()
+        payloads = qr_scan._decode_image(
+            _low_contrast_qr(b"faded-scan"),
+            zxing_module=zxingcpp,
+            ranking=TransformRanking(),
+            retries=retries,
+        )
+        self.assertEqual(payloads, [b"faded-scan"])
+        self.assertEqual(retries.retried(), {b"faded-scan": "autocontrast"})
+
+    def test_images_that_decode_skip_preprocessing(self) -> None:
+        with Image.open(io.BytesIO(qr_bytes(b"clean", kind="png", scale=6))) as qr:
+            image = qr.convert("L")
+        real_read = qr_scan._read_qr_results
+        with mock.patch.object(qr_scan, "_read_qr_results", side_effect=real_read) as read_mock:
+            payloads = qr_scan._decode_image(
+                image, zxing_module=zxingcpp, ranking=TransformRanking()
+            )
+        self.assertEqual(payloads, [b"clean"])
+        read_mock.assert_called_once()
+
+    def test_scan_session_shares_one_ranking(self) -> None:
+        with qr_scan.scan_session():
+            first = qr_scan._load_decoder().decode_image_bytes
+            second = qr_scan._load_decoder().decode_image_bytes
+        outside = qr_scan._load_decoder().decode_image_bytes
+        self.assertIs(first.keywords["ranking"], second.keywords["ranking"])  # type: ignore[attr-defined]
+        self.assertIsNot(first.keywords["ranking"], outside.keywords["ranking"])  # type: ignore[attr-defined]
+
+
+if __name__ == "__main__":
+    unittest.main()
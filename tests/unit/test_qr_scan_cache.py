@@ -0,0 +1,185 @@
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from ethernity.cli.shared.io import frames as frames_io
+from ethernity.encoding.framing import DOC_ID_LEN, Frame, FrameType, encode_frame
+from ethernity.qr import scan as qr_scan, scan_cache
+from ethernity.qr.scan import QrDecoder, scan_session
+from ethernity.qr.scan_cache import ScanCache
+
+
+def _frame(frame_type: FrameType, index: int = 0) -> Frame:
+    return Frame(
+        version=1,
+        frame_type=frame_type,
+        doc_id=b"\x21" * DOC_ID_LEN,
+        index=index,
+        total=1,
+        data=b"ciphertext",
+    )
+
+
+class TestScanCache(unittest.TestCase):
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.tmp = Path(tmpdir.name)
+        self.root = self.tmp / "cache"
+        self.scan_path = self.tmp / "page.png"
+        self.scan_path.write_bytes(b"image-bytes")
+
+    def _cache(self, **kwargs: object) -> ScanCache:
+        options: dict[str, object] = {"fingerprint": "v1", "accept": lambda _payloads: True}
+        options.update(kwargs)
+        return ScanCache(self.root, **options)  # type: ignore[arg-type]
+
+    def _store(self, pages: list[tuple[int, bytes]], **kwargs: object) -> None:
+        cache = self._cache(**kwargs)
+        self.assertIsNone(cache.get(self.scan_path))
+        cache.put(self.scan_path, pages)
+
+    def test_put_after_miss_is_returned_by_later_get(self) -> None:
+        self._store([(0, b"one"), (1, b"two")])
+        cache = self._cache()
+        self.assertEqual(cache.get(self.scan_path), [(0, b"one"), (1, b"two")])
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+    def test_put_without_prior_miss_is_ignored(self) -> None:
+        self._cache().put(self.scan_path, [(0, b"one")])
+        self.assertIsNone(self._cache().get(self.scan_path))
+
+    def test_unchanged_file_skips_hashing(self) -> None:
+        self._store([(0, b"one")])
+        with mock.patch.object(scan_cache, "_sha256_file") as sha_mock:
+            self.assertEqual(self._cache().get(self.scan_path), [(0, b"one")])
+        sha_mock.assert_not_called()
+
+    def test_changed_content_or_fingerprint_misses(self) -> None:
+        self._store([(0, b"one")])
+        self.assertIsNone(self._cache(fingerprint="v2").get(self.scan_path))
+        self.scan_path.write_bytes(b"other-image-bytes")
+        self.assertIsNone(self._cache().get(self.scan_path))
+
+    def test_identical_content_at_another_path_hits(self) -> None:
+        self._store([(0, b"one")])
+        copy_path = self.tmp / "copy.png"
+        copy_path.write_bytes(self.scan_path.read_bytes())
+        self.assertEqual(self._cache().get(copy_path), [(0, b"one")])
+
+    def test_rejected_payloads_are_not_stored(self) -> None:
+        self._store([(0, b"secret")], accept=lambda _payloads: False)
+        self.assertIsNone(self._cache().get(self.scan_path))
+
+    def test_corrupt_entry_is_removed(self) -> None:
+        self._store([(0, b"one")])
+        entries = list((self.root / "entries").iterdir())
+        self.assertEqual(len(entries), 1)
+        entries[0].write_bytes(b"\xff not cbor")
+        self.assertIsNone(self._cache().get(self.scan_path))
+        self.assertFalse(entries[0].exists())
+
+    def test_oldest_files_are_evicted_over_max_bytes(self) -> None:
+        old_path = self.tmp / "old.png"
+        old_path.write_bytes(b"old")
+        cache = self._cache()
+        self.assertIsNone(cache.get(old_path))
+        cache.put(old_path, [(0, b"o" * 64)])
+        for entry in (self.root / "entries").iterdir():
+            os.utime(entry, (1, 1))
+        for entry in (self.root / "stat").iterdir():
+            os.utime(entry, (1, 1))
+        self._store([(0, b"n" * 64)], max_bytes=200)
+        cache = self._cache()
+        self.assertIsNone(cache.get(old_path))
+        self.assertEqual(cache.get(self.scan_path), [(0, b"n" * 64)])
+
+    def test_unreadable_input_is_a_miss(self) -> None:
+        cache = self._cache()
+        self.assertIsNone(cache.get(self.tmp / "missing.png"))
+        self.assertEqual(cache.misses, 1)
+
+
+class TestScanQrPayloadsCache(unittest.TestCase):
+    def _decoder(self, calls: list[str]) -> QrDecoder:
+        def _decode_path(path: Path) -> list[bytes]:
+            calls.append(path.name)
+            return [path.name.encode("ascii")]
+
+        return QrDecoder(
+            name="fake", decode_image_path=_decode_path, decode_image_bytes=lambda _data: []
+        )
+
+    def test_cached_inputs_are_not_decoded_again(self) -> None:
+        for jobs in (1, 2):
+            with self.subTest(jobs=jobs), tempfile.TemporaryDirectory() as tmpdir:
+                root = Path(tmpdir)
+                paths = []
+                for name in ("a.png", "b.png", "c.png"):
+                    path = root / name
+                    path.write_bytes(name.encode("ascii"))
+                    paths.append(path)
+                calls: list[str] = []
+                with mock.patch.object(qr_scan, "_load_decoder", return_value=self._decoder(calls)):
+                    for _ in range(2):
+                        cache = ScanCache(
+                            root / "cache", fingerprint="v1", accept=lambda _payloads: True
+                        )
+                        payloads = qr_scan.scan_qr_payloads(
+                            paths, jobs=jobs, executor="thread", cache=cache
+                        )
+                        self.assertEqual(payloads, [b"a.png", b"b.png", b"c.png"])
+                self.assertEqual(calls, ["a.png", "b.png", "c.png"])
+                self.assertEqual(cache.hits, 3)
+
+    def test_decoder_fingerprint_tracks_grid_and_dpi(self) -> None:
+        base = qr_scan.decoder_fingerprint()
+        grid = qr_scan.ScanGrid(
+            page_w=210, page_h=297, x=10, y=10, qr_size=50, gap_x=5, gap_y=5, cols=3, rows=4
+        )
+        self.assertNotEqual(qr_scan.decoder_fingerprint(grid), base)
+        with mock.patch.dict(os.environ, {"ETHERNITY_SCAN_DPI": "300"}):
+            self.assertNotEqual(qr_scan.decoder_fingerprint(), base)
+
+
+class TestRecoveryScanCache(unittest.TestCase):
+    def test_only_main_and_auth_payload_sets_are_cacheable(self) -> None:
+        main = encode_frame(_frame(FrameType.MAIN_DOCUMENT))
+        auth = encode_frame(_frame(FrameType.AUTH))
+        shard = encode_frame(_frame(FrameType.KEY_DOCUMENT))
+        self.assertTrue(frames_io._is_recovery_payload_set([main, auth]))
+        self.assertFalse(frames_io._is_recovery_payload_set([main, shard]))
+        self.assertFalse(frames_io._is_recovery_payload_set([main, b"garbage"]))
+
+    def test_scan_session_can_disable_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with mock.patch.object(frames_io, "scan_cache_dir_path", return_value=Path(tmpdir)):
+                cache = frames_io._recovery_scan_cache()
+                self.assertIsInstance(cache, ScanCache)
+                assert cache is not None
+                self.assertEqual(cache.root, Path(tmpdir))
+                with scan_session(cache=False):
+                    self.assertIsNone(frames_io._recovery_scan_cache())
+
+
+if __name__ == "__main__":
+    unittest.main()
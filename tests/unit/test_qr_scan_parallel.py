@@ -0,0 +1,235 @@
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from ethernity.core.concurrency import jobs_from_env, resolve_worker_count
+from ethernity.qr import scan as qr_scan
+from ethernity.qr.scan import QrDecoder, QrScanError, ScannedPayload, ScanProgress, scan_session
+
+
+class _FakeImage:
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+
+
+class _FakePage:
+    def __init__(self, images: list[_FakeImage]) -> None:
+        self.images = images
+
+
+class _FakeReader:
+    def __init__(self, _path: str) -> None:
+        self.pages = [
+            _FakePage([_FakeImage(b"p1"), _FakeImage(b"bad")]),
+            _FakePage([_FakeImage(b"p2")]),
+        ]
+
+
+def _slow_decode_path(path: Path) -> list[bytes]:
+    # Earlier files sleep longer so completion order is the reverse of submission order.
+    index = int(path.stem)
+    time.sleep(0.002 * (10 - index))
+    return [path.stem.encode("ascii")]
+
+
+def _decode_bytes(data: bytes) -> list[bytes]:
+    if data == b"bad":
+        raise OSError("corrupt image")
+    return [data]
+
+
+def _failing_decode_path(_path: Path) -> list[bytes]:
+    raise OSError("unreadable")
+
+
+class TestScanWorkerResolution(unittest.TestCase):
+    def test_jobs_from_env_parses_auto_and_integers(self) -> None:
+        with mock.patch.dict(os.environ, {"ETHERNITY_SCAN_JOBS": "3"}):
+            self.assertEqual(jobs_from_env("ETHERNITY_SCAN_JOBS"), 3)
+        with mock.patch.dict(os.environ, {"ETHERNITY_SCAN_JOBS": "auto"}):
+            self.assertIsNone(jobs_from_env("ETHERNITY_SCAN_JOBS"))
+        with mock.patch.dict(os.environ, {"ETHERNITY_SCAN_JOBS": "0"}):
+            with self.assertRaisesRegex(ValueError, "ETHERNITY_SCAN_JOBS must be a positive"):
+                jobs_from_env("ETHERNITY_SCAN_JOBS")
+
+    def test_resolve_worker_count_caps_by_tasks_and_cpus(self) -> None:
+        with mock.patch("ethernity.core.concurrency.process_cpu_count", return_value=16):
+            self.assertEqual(
+                resolve_worker_count(10, requested=None, cap=8, min_tasks_per_worker=2), 5
+            )
+            self.assertEqual(
+                resolve_worker_count(40, requested=None, cap=8, min_tasks_per_worker=2), 8
+            )
+            self.assertEqual(
+                resolve_worker_count(3, requested=12, cap=8, min_tasks_per_worker=2), 3
+            )
+        with mock.patch("ethernity.core.concurrency.process_cpu_count", return_value=2):
+            self.assertEqual(
+                resolve_worker_count(40, requested=12, cap=8, min_tasks_per_worker=2), 2
+            )
+
+    def test_scan_workers_prefer_argument_then_context_then_env(self) -> None:
+        files = [Path(f"{index}.png") for index in range(20)]
+        with (
+            mock.patch("ethernity.core.concurrency.process_cpu_count", return_value=16),
+            mock.patch.dict(os.environ, {"ETHERNITY_SCAN_JOBS": "2"}),
+        ):
+            self.assertEqual(qr_scan._resolve_scan_workers(files, jobs=None), 2)
+            with scan_session(jobs=4):
+                self.assertEqual(qr_scan._resolve_scan_workers(files, jobs=None), 4)
+                self.assertEqual(qr_scan._resolve_scan_workers(files, jobs=6), 6)
+            self.assertEqual(qr_scan._resolve_scan_workers(files, jobs=None), 2)
+
+    def test_scan_jobs_rejects_non_positive_values(self) -> None:
+        with self.assertRaisesRegex(ValueError, "positive integer"):
+            with scan_session(jobs=0):
+                pass
+        with self.assertRaisesRegex(ValueError, "positive integer"):
+            qr_scan._resolve_scan_workers([Path("a.png")], jobs=-1)
+
+    def test_resolve_scan_executor_validates_env(self) -> None:
+        with mock.patch.dict(os.environ, {"ETHERNITY_SCAN_EXECUTOR": "Process"}):
+            self.assertEqual(qr_scan._resolve_scan_executor(None), "process")
+        with mock.patch.dict(os.environ, {"ETHERNITY_SCAN_EXECUTOR": "auto"}):
+            self.assertEqual(qr_scan._resolve_scan_executor(None), "thread")
+        with mock.patch.dict(os.environ, {"ETHERNITY_SCAN_EXECUTOR": "gpu"}):
+            with self.assertRaisesRegex(ValueError, "ETHERNITY_SCAN_EXECUTOR"):
+                qr_scan._resolve_scan_executor(None)
+
+
+class TestParallelScan(unittest.TestCase):
+    def _scan(self, paths: list[Path], decoder: QrDecoder, *, jobs: int) -> list[bytes]:
+        pypdf = types.ModuleType("pypdf")
+        pypdf.PdfReader = _FakeReader
+        with (
+            mock.patch.object(qr_scan, "_load_decoder", return_value=decoder),
+            mock.patch.object(qr_scan, "pypdf", pypdf),
+            mock.patch.dict("sys.modules", {"pypdf": pypdf}),
+            mock.patch("ethernity.core.concurrency.process_cpu_count", return_value=8),
+        ):
+            return qr_scan.scan_qr_payloads(paths, jobs=jobs, executor="thread")
+
+    def test_parallel_scan_keeps_input_order(self) -> None:
+        decoder = QrDecoder(
+            name="fake", decode_image_path=_slow_decode_path, decode_image_bytes=_decode_bytes
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            for index in range(10):
+                (root / f"{index}.png").write_bytes(b"")
+            (root / "9.pdf").write_bytes(b"")
+            sequential = self._scan([root], decoder, jobs=1)
+            parallel = self._scan([root], decoder, jobs=4)
+
+        expected = [str(index).encode("ascii") for index in range(9)]
+        expected += [b"p1", b"p2", b"9"]
+        self.assertEqual(sequential, expected)
+        self.assertEqual(parallel, expected)
+
+    def test_stop_when_ends_scan_after_matching_file(self) -> None:
+        decoder = QrDecoder(
+            name="fake", decode_image_path=_slow_decode_path, decode_image_bytes=_decode_bytes
+        )
+        seen: list[str] = []
+
+        def _stop_after_second(path: Path, payloads: list[bytes]) -> bool:
+            seen.append(path.name)
+            return path.stem == "1"
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            for index in range(8):
+                (root / f"{index}.png").write_bytes(b"")
+            pypdf = types.ModuleType("pypdf")
+            with (
+                mock.patch.object(qr_scan, "_load_decoder", return_value=decoder),
+                mock.patch.dict("sys.modules", {"pypdf": pypdf}),
+                mock.patch("ethernity.core.concurrency.process_cpu_count", return_value=8),
+            ):
+                payloads = qr_scan.scan_qr_payloads(
+                    [root], jobs=3, executor="thread", stop_when=_stop_after_second
+                )
+
+        self.assertEqual(payloads, [b"0", b"1"])
+        self.assertEqual(seen, ["0.png", "1.png"])
+
+    def test_parallel_scan_raises_for_unreadable_image_file(self) -> None:
+        decoder = QrDecoder(
+            name="fake", decode_image_path=_failing_decode_path, decode_image_bytes=_decode_bytes
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = [Path(tmpdir) / f"{index}.png" for index in range(4)]
+            for path in paths:
+                path.write_bytes(b"")
+            with self.assertRaisesRegex(QrScanError, "failed to read image"):
+                self._scan(paths, decoder, jobs=2)
+
+
+class TestStreamingScan(unittest.TestCase):
+    def test_iter_qr_payloads_yields_sources_pages_and_progress(self) -> None:
+        decoder = QrDecoder(
+            name="fake", decode_image_path=_slow_decode_path, decode_image_bytes=_decode_bytes
+        )
+        pypdf = types.ModuleType("pypdf")
+        pypdf.PdfReader = _FakeReader
+        for jobs in (1, 3):
+            with self.subTest(jobs=jobs), tempfile.TemporaryDirectory() as tmpdir:
+                root = Path(tmpdir)
+                image = root / "0.png"
+                image.write_bytes(b"")
+                document = root / "1.pdf"
+                document.write_bytes(b"")
+                events: list[tuple[str, ScanProgress]] = []
+                with (
+                    mock.patch.object(qr_scan, "_load_decoder", return_value=decoder),
+                    mock.patch.dict("sys.modules", {"pypdf": pypdf}),
+                    mock.patch("ethernity.core.concurrency.process_cpu_count", return_value=8),
+                ):
+                    stream = qr_scan.iter_qr_payloads(
+                        [root],
+                        jobs=jobs,
+                        executor="thread",
+                        progress=lambda state: events.append(("progress", state)),
+                    )
+                    for item in stream:
+                        events.append(("payload", item))  # type: ignore[arg-type]
+
+                self.assertEqual(
+                    events,
+                    [
+                        ("payload", ScannedPayload(image, 0, b"0")),
+                        ("progress", ScanProgress(0, 2, 1, 1)),
+                        ("progress", ScanProgress(1, 2, 1, 1)),
+                        ("payload", ScannedPayload(document, 0, b"p1")),
+                        ("progress", ScanProgress(1, 2, 2, 2)),
+                        ("progress", ScanProgress(1, 2, 2, 2)),
+                        ("payload", ScannedPayload(document, 1, b"p2")),
+                        ("progress", ScanProgress(1, 2, 3, 3)),
+                        ("progress", ScanProgress(2, 2, 3, 3)),
+                    ],
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,228 @@
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import io
+import os
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from PIL import Image
+
+from ethernity.qr import scan as qr_scan
+from ethernity.qr.codec import make_qr, qr_bytes
+
+try:
+    import zxingcpp  # noqa: F401
+
+    HAS_ZXING = True
+except ImportError:
+    HAS_ZXING = False
+
+try:
+    import pypdfium2  # noqa: F401
+
+    HAS_PDFIUM = True
+except ImportError:
+    HAS_PDFIUM = False
+
+
+class _FakeImage:
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+
+
+class _FakePage:
+    def __init__(self, images: list[_FakeImage]) -> None:
+        self.images = images
+
+
+def _fake_pypdf(pages: list[_FakePage]) -> types.ModuleType:
+    module = types.ModuleType("pypdf")
+    module.PdfReader = lambda _path: types.SimpleNamespace(pages=pages)
+    return module
+
+
+class _FakeBitmap:
+    def __init__(self, image: Image.Image) -> None:
+        self._image = image
+
+    def to_pil(self) -> Image.Image:
+        return self._image
+
+
+class _FakePdfiumPage:
+    def __init__(self, image: Image.Image, renders: list[dict[str, object]]) -> None:
+        self._image = image
+        self._renders = renders
+        self.closed = False
+
+    def render(self, **kwargs: object) -> _FakeBitmap:
+        self._renders.append(kwargs)
+        return _FakeBitmap(self._image)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _FakePdfiumDocument:
+    def __init__(self, image: Image.Image, renders: list[dict[str, object]]) -> None:
+        self._image = image
+        self._renders = renders
+        self.closed = False
+
+    def __getitem__(self, _index: int) -> _FakePdfiumPage:
+        return _FakePdfiumPage(self._image, self._renders)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _write_vector_qr_pdf(path: Path, payload: bytes) -> None:
+    from fpdf import FPDF
+
+    pdf = FPDF(unit="mm", format="A4")
+    pdf.add_page()
+    pdf.set_fill_color(0, 0, 0)
+    module = 2.0
+    for row, cells in enumerate(make_qr(payload, error="M").matrix):
+        for col, dark in enumerate(cells):
+            if dark:
+                pdf.rect(20 + col * module, 20 + row * module, module, module, style="F")
+    pdf.output(str(path))
+
+
+def _qr_image(payload: bytes, *, scale: int) -> Image.Image:
+    with Image.open(io.BytesIO(qr_bytes(payload, kind="png", scale=scale))) as image:
+        return image.convert("L")
+
+
+class TestDecodeDownscale(unittest.TestCase):
+    @unittest.skipUnless(HAS_ZXING, "zxingcpp not available")
+    def test_huge_image_decodes_from_reduced_copy(self) -> None:
+        image = _qr_image(b"huge-scan", scale=150)
+        self.assertGreater(max(image.size), qr_scan._MAX_DECODE_EDGE)
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG")
+
+        original_reduce = Image.Image.reduce
+        with mock.patch.object(
+            Image.Image, "reduce", autospec=True, side_effect=original_reduce
+        ) as reduce_mock:
+            payloads = qr_scan._load_decoder().decode_image_bytes(buffer.getvalue())
+
+        self.assertEqual(payloads, [b"huge-scan"])
+        reduce_mock.assert_called_once()
+
+    def test_reduced_miss_falls_back_to_full_resolution(self) -> None:
+        image = mock.Mock(size=(9000, 10), mode="P")
+        converted = image.convert.return_value
+        with mock.patch.object(
+            qr_scan, "_read_qr_results", side_effect=[[], [(b"full", None)]]
+        ) as read_mock:
+            payloads = qr_scan._decode_image(image, zxing_module=object())
+
+        self.assertEqual(payloads, [b"full"])
+        image.convert.assert_called_once_with("L")
+        converted.reduce.assert_called_once_with(3)
+        self.assertIs(read_mock.call_args_list[0].args[0], converted.reduce.return_value)
+        self.assertIs(read_mock.call_args_list[1].args[0], image)
+
+    def test_small_images_are_decoded_directly(self) -> None:
+        image = mock.Mock(size=(800, 600), mode="L")
+        with mock.patch.object(
+            qr_scan, "_read_qr_results", return_value=[(b"x", None)]
+        ) as read_mock:
+            self.assertEqual(qr_scan._decode_image(image, zxing_module=object()), [b"x"])
+        image.reduce.assert_not_called()
+        read_mock.assert_called_once()
+
+
+class TestPdfRasterFallback(unittest.TestCase):
+    def _scan(self, pages: list[_FakePage], pdfium: types.ModuleType | None) -> list[bytes]:
+        decoder = qr_scan.QrDecoder(
+            name="fake",
+            decode_image_path=lambda _path: [],
+            decode_image_bytes=lambda data: [data[:2]],
+        )
+        with (
+            mock.patch.dict("sys.modules", {"pypdf": _fake_pypdf(pages)}),
+            mock.patch.object(qr_scan, "pypdfium2", pdfium),
+            mock.patch.dict("sys.modules", {"pypdfium2": pdfium}),
+        ):
+            return qr_scan._scan_pdf(Path("vector.pdf"), decoder)
+
+    def test_vector_pages_are_rasterized_at_configured_dpi(self) -> None:
+        renders: list[dict[str, object]] = []
+        document = _FakePdfiumDocument(Image.new("L", (8, 8), 255), renders)
+        pdfium = types.ModuleType("pypdfium2")
+        pdfium.PdfDocument = lambda _path: document
+        pdfium.PdfiumError = RuntimeError
+        pages = [_FakePage([]), _FakePage([_FakeImage(b"e1")]), _FakePage([])]
+
+        with mock.patch.dict(os.environ, {"ETHERNITY_SCAN_DPI": "144"}):
+            payloads = self._scan(pages, pdfium)
+
+        # Rasterized pages are encoded as PGM ("P5"), embedded images pass through untouched.
+        self.assertEqual(payloads, [b"P5", b"e1", b"P5"])
+        self.assertEqual(renders, [{"scale": 2.0, "grayscale": True}] * 2)
+        self.assertTrue(document.closed)
+
+    def test_vector_pages_are_skipped_without_pypdfium2(self) -> None:
+        pages = [_FakePage([]), _FakePage([_FakeImage(b"e1")])]
+        self.assertEqual(self._scan(pages, None), [b"e1"])
+
+    def test_vector_only_pdf_without_pypdfium2_raises_clear_error(self) -> None:
+        with self.assertRaisesRegex(
+            qr_scan.PdfRasterizerUnavailableError, "pypdfium2 is not installed"
+        ):
+            self._scan([_FakePage([]), _FakePage([])], None)
+
+    @unittest.skipUnless(HAS_ZXING and HAS_PDFIUM, "zxingcpp or pypdfium2 not available")
+    def test_real_vector_pdf_is_rasterized_and_decoded(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "vector.pdf"
+            _write_vector_qr_pdf(path, b"vector-path-qr")
+            payloads = qr_scan._scan_pdf(path, qr_scan._load_decoder())
+        self.assertEqual(payloads, [b"vector-path-qr"])
+
+    @unittest.skipUnless(HAS_ZXING, "zxingcpp not available")
+    def test_rasterized_page_is_decoded(self) -> None:
+        renders: list[dict[str, object]] = []
+        document = _FakePdfiumDocument(_qr_image(b"vector-qr", scale=8), renders)
+        pdfium = types.ModuleType("pypdfium2")
+        pdfium.PdfDocument = lambda _path: document
+        pdfium.PdfiumError = RuntimeError
+        with (
+            mock.patch.dict("sys.modules", {"pypdf": _fake_pypdf([_FakePage([])])}),
+            mock.patch.dict("sys.modules", {"pypdfium2": pdfium}),
+        ):
+            payloads = qr_scan._scan_pdf(Path("vector.pdf"), qr_scan._load_decoder())
+        self.assertEqual(payloads, [b"vector-qr"])
+
+    def test_scan_dpi_env_must_be_positive(self) -> None:
+        for value in ("0", "abc"):
+            with self.subTest(value=value):
+                with mock.patch.dict(os.environ, {"ETHERNITY_SCAN_DPI": value}):
+                    with self.assertRaisesRegex(ValueError, "ETHERNITY_SCAN_DPI"):
+                        qr_scan._resolve_raster_dpi()
+
+
+if __name__ == "__main__":
+    unittest.main()
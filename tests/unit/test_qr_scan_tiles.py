@@ -0,0 +1,168 @@
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import io
+import unittest
+from unittest import mock
+
+from PIL import Image
+
+from ethernity.qr import scan as qr_scan
+from ethernity.qr.codec import qr_bytes
+from ethernity.qr.scan import ScanGrid
+from ethernity.render.layout import scan_grid_for_layout
+from ethernity.render.types import Layout
+
+try:
+    import zxingcpp
+
+    HAS_ZXING = True
+except ImportError:
+    HAS_ZXING = False
+
+_PX_PER_MM = 10
+_GRID = ScanGrid(
+    page_w=100.0,
+    page_h=140.0,
+    x=10.0,
+    y=20.0,
+    qr_size=30.0,
+    gap_x=10.0,
+    gap_y=10.0,
+    cols=2,
+    rows=2,
+)
+_PAYLOADS = [b"cell-0", b"cell-1", b"cell-2", b"cell-3"]
+
+
+def _page_image() -> Image.Image:
+    page = Image.new(
+        "L", (int(_GRID.page_w * _PX_PER_MM), int(_GRID.page_h * _PX_PER_MM)), color=255
+    )
+    size = int(_GRID.qr_size * _PX_PER_MM)
+    for payload, (left, top, _right, _bottom) in zip(_PAYLOADS, _GRID.cell_boxes()):
+        with Image.open(io.BytesIO(qr_bytes(payload, kind="png", scale=10, border=1))) as qr:
+            tile = qr.convert("L").resize((size, size), Image.Resampling.NEAREST)
+        page.paste(tile, (int(left * _PX_PER_MM), int(top * _PX_PER_MM)))
+    return page
+
+
+class TestScanGrid(unittest.TestCase):
+    def test_cell_boxes_follow_grid_geometry(self) -> None:
+        self.assertEqual(_GRID.expected_count, 4)
+        self.assertEqual(
+            _GRID.cell_boxes(),
+            [
+                (10.0, 20.0, 40.0, 50.0),
+                (50.0, 20.0, 80.0, 50.0),
+                (10.0, 60.0, 40.0, 90.0),
+                (50.0, 60.0, 80.0, 90.0),
+            ],
+        )
+
+    def test_scan_grid_for_layout_uses_gap_y_override(self) -> None:
+        layout = Layout(
+            page_w=210.0,
+            page_h=297.0,
+            margin=12.0,
+            header_height=20.0,
+            instructions_y=32.0,
+            content_start_y=60.0,
+            usable_w=186.0,
+            usable_h=225.0,
+            usable_h_grid=225.0,
+            qr_size=40.0,
+            gap=4.0,
+            cols=4,
+            rows=5,
+            per_page=20,
+            gap_y_override=6.5,
+            fallback_width=186.0,
+            line_length=80,
+            line_height=4.0,
+            fallback_lines_per_page=0,
+            fallback_font="Courier",
+            fallback_size=8.0,
+            text_gap=2.0,
+            min_lines=1,
+            key_lines=(),
+            total_pages=1,
+        )
+        grid = scan_grid_for_layout(layout)
+        self.assertEqual((grid.x, grid.y, grid.cols, grid.rows), (12.0, 60.0, 4, 5))
+        self.assertEqual((grid.gap_x, grid.gap_y, grid.qr_size), (4.0, 6.5, 40.0))
+        self.assertEqual((grid.page_w, grid.page_h), (210.0, 297.0))
+
+    def test_scan_session_grid_reaches_decoder(self) -> None:
+        with (
+            qr_scan.scan_session(grid=_GRID),
+            mock.patch.object(qr_scan, "_load_decoder") as load_mock,
+            mock.patch.object(qr_scan, "expand_scan_paths", return_value=[]),
+        ):
+            with self.assertRaises(qr_scan.QrScanError):
+                qr_scan.scan_qr_payloads([])
+        load_mock.assert_called_once_with(grid=_GRID)
+
+
+@unittest.skipUnless(HAS_ZXING, "zxingcpp not available")
+class TestTiledRetries(unittest.TestCase):
+    def _decode(self, image: Image.Image, *, grid: ScanGrid | None, full_pass_keep: int):
+        real_read = qr_scan._read_qr_results
+        calls: list[tuple[int, int]] = []
+
+        def _read(target, *, zxing_module):
+            calls.append(target.size)
+            results = real_read(target, zxing_module=zxing_module)
+            if target.size == image.size:
+                # Simulate a dense page where the whole-page pass misses most codes.
+                return results[:full_pass_keep]
+            return results
+
+        with mock.patch.object(qr_scan, "_read_qr_results", side_effect=_read):
+            payloads = qr_scan._decode_image(image, zxing_module=zxingcpp, grid=grid)
+        return payloads, calls
+
+    def test_unresolved_cells_are_retried_as_tiles(self) -> None:
+        image = _page_image()
+        payloads, calls = self._decode(image, grid=_GRID, full_pass_keep=1)
+
+        self.assertEqual(sorted(payloads), _PAYLOADS)
+        self.assertEqual(len(payloads), 4)
+        # One full-page pass, then one tile per cell that had no decoded code.
+        self.assertEqual(len(calls), 4)
+        self.assertTrue(all(size != image.size for size in calls[1:]))
+
+    def test_complete_pages_and_missing_grid_skip_tiling(self) -> None:
+        image = _page_image()
+        payloads, calls = self._decode(image, grid=_GRID, full_pass_keep=4)
+        self.assertEqual(sorted(payloads), _PAYLOADS)
+        self.assertEqual(len(calls), 1)
+
+        payloads, calls = self._decode(image, grid=None, full_pass_keep=1)
+        self.assertEqual(len(payloads), 1)
+        self.assertEqual(len(calls), 1)
+
+    def test_non_page_images_skip_tiling(self) -> None:
+        with Image.open(io.BytesIO(qr_bytes(b"single", kind="png", scale=8))) as qr:
+            image = qr.convert("L")
+        payloads, calls = self._decode(image, grid=_GRID, full_pass_keep=1)
+        self.assertEqual(payloads, [b"single"])
+        self.assertEqual(len(calls), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
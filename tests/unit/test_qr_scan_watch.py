@@ -0,0 +1,180 @@
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from ethernity.cli.features.recover.planning import validate_recover_args
+from ethernity.cli.shared.events import event_session
+from ethernity.cli.shared.io.frames import _format_index_ranges, _recovery_frames_from_watch
+from ethernity.cli.shared.types import RecoverArgs
+from ethernity.encoding.framing import DOC_ID_LEN, Frame, FrameType, encode_frame
+from ethernity.qr import scan as qr_scan
+from ethernity.qr.scan import QrDecoder, QrScanError, scan_session
+from ethernity.qr.scan_watch import ScanWatcher
+
+
+def _frame(frame_type: FrameType, index: int = 0, total: int = 1) -> Frame:
+    return Frame(
+        version=1,
+        frame_type=frame_type,
+        doc_id=b"\x52" * DOC_ID_LEN,
+        index=index,
+        total=total,
+        data=f"data-{index}".encode("ascii"),
+    )
+
+
+class TestScanWatcher(unittest.TestCase):
+    def test_files_are_reported_once_they_stop_changing(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            watcher = ScanWatcher(root)
+            photo = root / "IMG_0001.jpg"
+            photo.write_bytes(b"partial")
+            (root / "notes.txt").write_text("ignored", encoding="utf-8")
+            self.assertEqual(watcher.poll(), [])
+            photo.write_bytes(b"partial-and-done")
+            self.assertEqual(watcher.poll(), [])
+            self.assertEqual(watcher.poll(), [photo])
+            self.assertEqual(watcher.poll(), [])
+
+            os.utime(photo, ns=(1, 1))
+            self.assertEqual(watcher.poll(), [])
+            self.assertEqual(watcher.poll(), [photo])
+
+    def test_missing_directory_is_rejected(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with self.assertRaisesRegex(QrScanError, "scan watch directory not found"):
+                ScanWatcher(Path(tmpdir) / "missing")
+
+
+class TestRecoveryFramesFromWatch(unittest.TestCase):
+    def _watch(
+        self,
+        batches: list[dict[str, list[Frame]]],
+        *,
+        allow_unsigned: bool = False,
+        idle_timeout: float = 600.0,
+        interrupt: bool = False,
+    ) -> tuple[list[Frame], list[str], list[str]]:
+        contents: dict[str, list[Frame]] = {}
+        decoded: list[str] = []
+        labels: list[str] = []
+
+        def _decode_path(path: Path) -> list[bytes]:
+            decoded.append(path.name)
+            return [encode_frame(frame) for frame in contents[path.name]]
+
+        decoder = QrDecoder(
+            name="fake", decode_image_path=_decode_path, decode_image_bytes=lambda _data: []
+        )
+
+        class _Sink:
+            def emit(self, event_type: str, **payload: object) -> None:
+                if event_type == "progress":
+                    labels.append(str(payload["label"]))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            pending = list(batches)
+            now = [0.0]
+
+            def _sleep(seconds: float) -> None:
+                now[0] += seconds
+                if not pending:
+                    if interrupt:
+                        raise KeyboardInterrupt
+                    raise AssertionError("watch did not finish")
+                for name, frames in pending.pop(0).items():
+                    contents[name] = frames
+                    (root / name).write_bytes(name.encode("ascii"))
+
+            with (
+                scan_session(cache=False),
+                event_session(_Sink()),
+                mock.patch.object(qr_scan, "_load_decoder", return_value=decoder),
+            ):
+                frames = _recovery_frames_from_watch(
+                    str(root),
+                    allow_unsigned=allow_unsigned,
+                    idle_timeout=idle_timeout,
+                    sleep=_sleep,
+                    clock=lambda: now[0],
+                )
+        return frames, decoded, labels
+
+    def test_watch_decodes_new_files_until_document_is_complete(self) -> None:
+        main = [_frame(FrameType.MAIN_DOCUMENT, index, 4) for index in range(4)]
+        auth = _frame(FrameType.AUTH)
+        frames, decoded, labels = self._watch(
+            [
+                {"a.png": [main[0]], "b.png": []},
+                {},
+                {"c.png": [main[2], main[3]]},
+                {},
+                {"d.png": [main[1], auth]},
+                {},
+            ]
+        )
+        self.assertEqual(frames, [main[0], main[2], main[3], main[1], auth])
+        self.assertEqual(decoded, ["a.png", "b.png", "c.png", "d.png"])
+        self.assertIn("a.png: 1/4 frames found, missing 1-3, waiting for the AUTH frame", labels)
+        self.assertIn(
+            "b.png: no QR codes; 1/4 frames found, missing 1-3, waiting for the AUTH frame", labels
+        )
+        self.assertIn("c.png: 3/4 frames found, missing 1, waiting for the AUTH frame", labels)
+        self.assertEqual(labels[-1], "d.png: all 4 frames found")
+
+    def test_rescue_mode_does_not_wait_for_auth(self) -> None:
+        main = _frame(FrameType.MAIN_DOCUMENT)
+        frames, _decoded, _labels = self._watch([{"a.png": [main]}, {}], allow_unsigned=True)
+        self.assertEqual(frames, [main])
+
+    def test_watch_stops_after_idle_timeout_with_missing_frames(self) -> None:
+        main = [_frame(FrameType.MAIN_DOCUMENT, index, 3) for index in range(3)]
+        with self.assertRaisesRegex(
+            ValueError, r"no new scans in .* for 3s; 1/3 frames found, missing 1-2"
+        ):
+            self._watch([{"a.png": [main[0]]}, {}, {}, {}, {}], idle_timeout=3.0)
+
+    def test_interrupted_watch_reports_partial_progress(self) -> None:
+        main = [_frame(FrameType.MAIN_DOCUMENT, index, 2) for index in range(2)]
+        with self.assertRaisesRegex(
+            ValueError,
+            "scan watch interrupted; 1/2 frames found, missing 1, waiting for the AUTH frame",
+        ):
+            self._watch([{"a.png": [main[0]]}, {}], interrupt=True)
+
+    def test_format_index_ranges(self) -> None:
+        self.assertEqual(_format_index_ranges([3]), "3")
+        self.assertEqual(_format_index_ranges([0, 1, 2, 5, 7, 8]), "0-2, 5, 7-8")
+
+    def test_scan_watch_conflicts_with_other_main_inputs(self) -> None:
+        with self.assertRaisesRegex(ValueError, "--scan-watch"):
+            validate_recover_args(RecoverArgs(scan=["a.png"], scan_watch="inbox"))
+
+    def test_scan_watch_idle_requires_scan_watch(self) -> None:
+        with self.assertRaisesRegex(ValueError, "--scan-watch-idle requires --scan-watch"):
+            validate_recover_args(RecoverArgs(scan=["a.png"], scan_watch_idle=30.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
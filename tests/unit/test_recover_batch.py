@@ -0,0 +1,201 @@
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from ethernity.cli.features.backup.execution import _create_auth_frame
+from ethernity.cli.features.recover import batch as batch_module
+from ethernity.cli.features.recover.batch import (
+    BATCH_REPORT_NAME,
+    BatchPassphrases,
+    load_passphrase_file,
+    partition_frames_by_doc_id,
+    partition_shard_frames_by_doc_hash,
+    run_batch_recovery,
+)
+from ethernity.cli.features.recover.planning import validate_recover_args
+from ethernity.cli.shared.crypto import _doc_id_and_hash_from_ciphertext
+from ethernity.cli.shared.types import RecoverArgs
+from ethernity.crypto import encrypt_bytes_with_passphrase
+from ethernity.crypto.sharding import encode_shard_payload, split_passphrase
+from ethernity.crypto.signing import generate_signing_keypair
+from ethernity.encoding.chunking import chunk_payload
+from ethernity.encoding.framing import VERSION, Frame, FrameType
+from ethernity.formats.envelope_codec import build_manifest_and_payload, encode_envelope
+from ethernity.formats.envelope_types import PayloadPart
+
+
+class _Backup:
+    """One encrypted backup and the frames its QR and shard documents would carry."""
+
+    def __init__(self, name: str, *, shards: bool = False) -> None:
+        sign_priv, sign_pub = generate_signing_keypair()
+        manifest, payload = build_manifest_and_payload(
+            [PayloadPart(path=f"{name}.txt", data=name.encode() * 50, mtime=None)],
+            sealed=False,
+            created_at=0.0,
+            signing_seed=sign_priv,
+        )
+        ciphertext, self.passphrase = encrypt_bytes_with_passphrase(
+            encode_envelope(payload, manifest), passphrase=None
+        )
+        self.doc_id, self.doc_hash = _doc_id_and_hash_from_ciphertext(ciphertext)
+        self.frames = [
+            *chunk_payload(
+                ciphertext,
+                doc_id=self.doc_id,
+                frame_type=FrameType.MAIN_DOCUMENT,
+                chunk_size=256,
+            ),
+            _create_auth_frame(self.doc_id, self.doc_hash, sign_priv, sign_pub),
+        ]
+        self.shard_frames: list[Frame] = []
+        if shards:
+            self.shard_frames = [
+                Frame(
+                    version=VERSION,
+                    frame_type=FrameType.KEY_DOCUMENT,
+                    doc_id=self.doc_id,
+                    index=0,
+                    total=1,
+                    data=encode_shard_payload(shard),
+                )
+                for shard in split_passphrase(
+                    self.passphrase,
+                    threshold=2,
+                    shares=3,
+                    doc_hash=self.doc_hash,
+                    sign_priv=sign_priv,
+                    sign_pub=sign_pub,
+                )
+            ]
+
+
+class TestBatchPartitioning(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.first = _Backup("first", shards=True)
+        cls.second = _Backup("second")
+
+    def test_frames_are_grouped_by_doc_id_and_shards_by_doc_hash(self) -> None:
+        mixed = [
+            *self.first.frames[:1],
+            *self.second.frames,
+            *self.first.frames[1:],
+            *self.first.shard_frames,
+        ]
+        groups = partition_frames_by_doc_id(mixed)
+        self.assertEqual(list(groups), [self.first.doc_id, self.second.doc_id])
+        self.assertEqual(len(groups[self.first.doc_id]), len(self.first.frames))
+        shard_sets = partition_shard_frames_by_doc_hash(mixed)
+        self.assertEqual(list(shard_sets), [self.first.doc_hash])
+        self.assertEqual(len(shard_sets[self.first.doc_hash]), 3)
+
+    def test_passphrase_sources_in_order(self) -> None:
+        key = self.second.doc_id.hex()
+        passphrases = BatchPassphrases(by_doc_id={}, env_prefix="BATCH_PW_", default="shared")
+        with mock.patch.dict(os.environ, {f"BATCH_PW_{key.upper()}": "from env"}):
+            self.assertEqual(passphrases.resolve(self.second.doc_id), ("from env", "env"))
+        self.assertEqual(passphrases.resolve(self.second.doc_id), ("shared", "passphrase"))
+        from_file = BatchPassphrases(by_doc_id={key: "from file"})
+        self.assertEqual(from_file.resolve(self.second.doc_id), ("from file", "file"))
+        self.assertIsNone(from_file.resolve(self.first.doc_id))
+
+    def test_load_passphrase_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "passphrases.txt"
+            path.write_text("# archive\n\n0011AABBCCDDEEFF word one two\n", encoding="utf-8")
+            self.assertEqual(load_passphrase_file(str(path)), {"0011aabbccddeeff": "word one two"})
+            path.write_text("not-hex secret\n", encoding="utf-8")
+            with self.assertRaisesRegex(ValueError, "passphrases.txt:1"):
+                load_passphrase_file(str(path))
+
+
+class TestRunBatchRecovery(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.sharded = _Backup("sharded", shards=True)
+        cls.keyed = _Backup("keyed")
+        cls.locked = _Backup("locked")
+
+    def _run(self, output: str, *, passphrase_file: str | None = None) -> int:
+        scanned = [
+            *self.sharded.frames,
+            *self.sharded.shard_frames[:2],
+            *self.keyed.frames,
+            *self.locked.frames[1:],
+        ]
+        args = RecoverArgs(
+            scan=["archive"],
+            output=output,
+            batch=True,
+            passphrase_file=passphrase_file,
+            quiet=True,
+        )
+        with mock.patch.object(batch_module, "_frames_from_scan", return_value=scanned):
+            return run_batch_recovery(args)
+
+    def test_recovers_each_document_into_its_own_directory(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            passphrase_file = Path(tmpdir) / "passphrases.txt"
+            passphrase_file.write_text(
+                f"{self.keyed.doc_id.hex()} {self.keyed.passphrase}\n", encoding="utf-8"
+            )
+            output = Path(tmpdir) / "recovered"
+            exit_code = self._run(str(output), passphrase_file=str(passphrase_file))
+
+            self.assertEqual(exit_code, 1)
+            self.assertEqual(
+                (output / self.sharded.doc_id.hex() / "sharded.txt").read_bytes(),
+                b"sharded" * 50,
+            )
+            self.assertEqual(
+                (output / self.keyed.doc_id.hex() / "keyed.txt").read_bytes(), b"keyed" * 50
+            )
+            report = json.loads((output / BATCH_REPORT_NAME).read_text(encoding="utf-8"))
+
+        documents = {entry["doc_id"]: entry for entry in report["documents"]}
+        self.assertEqual((report["recovered"], report["failed"]), (2, 1))
+        self.assertEqual(documents[self.sharded.doc_id.hex()]["passphrase_source"], "shards")
+        self.assertEqual(documents[self.keyed.doc_id.hex()]["passphrase_source"], "file")
+        self.assertEqual(documents[self.keyed.doc_id.hex()]["auth_status"], "verified")
+        failed = documents[self.locked.doc_id.hex()]
+        self.assertEqual(failed["status"], "failed")
+        self.assertIn("missing", failed["error"])
+
+
+class TestBatchValidation(unittest.TestCase):
+    def test_batch_argument_combinations(self) -> None:
+        cases = (
+            (RecoverArgs(batch=True, output="out"), "requires --scan"),
+            (RecoverArgs(batch=True, scan=["a"]), "requires --output"),
+            (RecoverArgs(batch=True, scan=["a"], output="o", auth_payloads_file="x"), "AUTH"),
+            (RecoverArgs(scan=["a"], passphrase_env="PW_"), "require --batch"),
+        )
+        for args, message in cases:
+            with self.subTest(message=message):
+                with self.assertRaisesRegex(ValueError, message):
+                    validate_recover_args(args)
+
+
+if __name__ == "__main__":
+    unittest.main()
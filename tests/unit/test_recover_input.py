@@ -38,11 +38,19 @@ from ethernity.cli.shared.io.frames import (
 from ethernity.core.bounds import MAX_QR_PAYLOAD_CHARS
 from ethernity.encoding.framing import DOC_ID_LEN, VERSION, Frame, FrameType, encode_frame
 from ethernity.encoding.zbase32 import encode_zbase32
+from ethernity.qr.scan import ScannedPayload
 
 _PROJECT_ROOT = Path(__file__).resolve().parents[2]
 _FIXTURE_PATH = _PROJECT_ROOT / "tests" / "fixtures" / "recovery_parse_vectors.json"
 
 
+def _scanned(*payloads: bytes | str) -> list[ScannedPayload]:
+    return [
+        ScannedPayload(Path("scan.png"), 0, payload)  # type: ignore[arg-type]
+        for payload in payloads
+    ]
+
+
 def _base64_payload_for_main_data(size: int) -> str:
     frame = Frame(
         version=VERSION,
@@ -255,8 +263,8 @@ class TestRecoverInput(unittest.TestCase):
     def test_frames_from_scan_rejects_qr_payload_char_limit_overflow(self) -> None:
         oversized_payload = "A" * (MAX_QR_PAYLOAD_CHARS + 1)
         with mock.patch(
-            "ethernity.cli.shared.io.frames.scan_qr_payloads",
-            return_value=[oversized_payload],
+            "ethernity.cli.shared.io.frames.iter_qr_payloads",
+            return_value=_scanned(oversized_payload),
         ):
             with self.assertRaisesRegex(ValueError, "MAX_QR_PAYLOAD_CHARS"):
                 _frames_from_scan(["scan.png"])
@@ -645,7 +653,7 @@ class TestRecoverInput(unittest.TestCase):
                 side_effect=["recovery.txt", "scan.png"],
             ):
                 with mock.patch(
-                    "ethernity.cli.features.recover.input_collection._read_text_lines",
+                    "ethernity.cli.features.recover.input_collection._iter_text_lines",
                     side_effect=[ValueError("bad"), ["line"]],
                 ):
                     with mock.patch(
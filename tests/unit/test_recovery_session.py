@@ -0,0 +1,189 @@
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import stat
+import tempfile
+import unittest
+from dataclasses import replace
+from pathlib import Path
+
+from ethernity.cli.features.recover.planning import plan_from_args, validate_recover_args
+from ethernity.cli.shared.events import event_session
+from ethernity.cli.shared.types import RecoverArgs
+from ethernity.encoding.chunking import parity_frames
+from ethernity.encoding.framing import PARITY_VERSION, FrameType, encode_frame
+from ethernity.encoding.qr_payloads import encode_qr_payload
+from ethernity.formats.recovery_session import (
+    RecoverySession,
+    decode_recovery_session,
+    encode_recovery_session,
+)
+from tests.unit.test_recover_batch import _Backup
+
+
+class _Events:
+    def __init__(self) -> None:
+        self.progress: list[dict[str, object]] = []
+
+    def emit(self, event_type: str, **payload: object) -> None:
+        if event_type == "progress":
+            self.progress.append(payload)
+
+
+class TestRecoverySessionFormat(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.backup = _Backup("session")
+
+    def test_roundtrip_keeps_gaps_and_auth(self) -> None:
+        main_frames, auth_frame = self.backup.frames[:-1], self.backup.frames[-1]
+        session = RecoverySession()
+        self.assertEqual(
+            session.add_frames([*main_frames[::2], auth_frame]), 1 + len(main_frames[::2])
+        )
+
+        encoded = encode_recovery_session(session)
+        decoded = decode_recovery_session(encoded)
+
+        document = decoded.documents[self.backup.doc_id]
+        self.assertEqual(document.total, len(main_frames))
+        self.assertEqual(document.missing_indices, list(range(1, len(main_frames), 2)))
+        self.assertEqual(document.frames(), [*main_frames[::2], auth_frame])
+        chunk_bytes = sum(len(frame.data) for frame in [*main_frames[::2], auth_frame])
+        self.assertLess(len(encoded) - chunk_bytes, 64)
+
+    def test_duplicate_frames_are_counted_once_and_conflicts_raise(self) -> None:
+        session = RecoverySession()
+        first = self.backup.frames[0]
+        self.assertEqual(session.add_frames([first, first]), 1)
+        conflicting = replace(first, data=first.data[::-1])
+        with self.assertRaisesRegex(ValueError, "conflicting duplicate frames"):
+            session.add_frames([conflicting])
+        other_total = replace(first, total=first.total + 1)
+        with self.assertRaisesRegex(ValueError, "does not match"):
+            session.add_frames([other_total])
+
+    def test_roundtrip_keeps_parity_frames(self) -> None:
+        main_frames, auth_frame = self.backup.frames[:-1], self.backup.frames[-1]
+        parity = parity_frames(main_frames, parity_total=2)
+        session = RecoverySession()
+        self.assertEqual(session.add_frames([*main_frames[1:], parity[1], auth_frame]), 4)
+
+        decoded = decode_recovery_session(encode_recovery_session(session))
+
+        document = decoded.documents[self.backup.doc_id]
+        self.assertEqual(document.parity_total, 2)
+        self.assertTrue(document.main_recoverable)
+        self.assertEqual(document.frames(), [*main_frames[1:], parity[1], auth_frame])
+        self.assertEqual(document.frames()[-2].version, PARITY_VERSION)
+        self.assertEqual(document.frames()[-2].frame_type, FrameType.PARITY)
+        with self.assertRaisesRegex(ValueError, "mismatched parity frames"):
+            session.add_frames([replace(parity[0], total=3)])
+
+    def test_decode_rejects_corruption(self) -> None:
+        session = RecoverySession()
+        session.add_frames(self.backup.frames)
+        encoded = bytearray(encode_recovery_session(session))
+        encoded[len(encoded) // 2] ^= 0x01
+        with self.assertRaisesRegex(ValueError, "crc mismatch"):
+            decode_recovery_session(bytes(encoded))
+        with self.assertRaisesRegex(ValueError, "bad magic"):
+            decode_recovery_session(b"XX" + bytes(encoded[2:]))
+
+
+class TestRecoverWithSession(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.backup = _Backup("resume")
+
+    def _payloads_file(self, directory: Path, name: str, frames: list) -> str:
+        path = directory / name
+        path.write_text(
+            "".join(f"{encode_qr_payload(encode_frame(frame))}\n" for frame in frames),
+            encoding="ascii",
+        )
+        return str(path)
+
+    def test_runs_accumulate_frames_until_the_document_is_complete(self) -> None:
+        frames = self.backup.frames
+        with tempfile.TemporaryDirectory() as tmpdir:
+            directory = Path(tmpdir)
+            session_path = directory / "recovery.session"
+            first = self._payloads_file(directory, "first.txt", frames[:2])
+            rest = self._payloads_file(directory, "rest.txt", frames[2:])
+            args = RecoverArgs(
+                payloads_file=first,
+                session=str(session_path),
+                passphrase=self.backup.passphrase,
+                quiet=True,
+            )
+            events = _Events()
+            with event_session(events), self.assertRaisesRegex(ValueError, "incomplete"):
+                plan_from_args(args)
+            self.assertTrue(session_path.exists())
+            self.assertEqual(stat.S_IMODE(session_path.stat().st_mode), 0o600)
+            self.assertEqual(events.progress[-1]["current"], 2)
+            self.assertEqual(
+                events.progress[-1]["details"]["missing_indices"],
+                list(range(2, len(frames) - 1)),
+            )
+
+            args.payloads_file = rest
+            plan = plan_from_args(args)
+            self.assertEqual(len(plan.main_frames), len(frames) - 1)
+            self.assertEqual(plan.auth_status, "verified")
+
+            args.payloads_file = None
+            self.assertEqual(plan_from_args(args).ciphertext, plan.ciphertext)
+
+    def test_parity_frames_complete_a_resumed_session(self) -> None:
+        main_frames, auth_frame = self.backup.frames[:-1], self.backup.frames[-1]
+        parity = parity_frames(main_frames, parity_total=1)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            directory = Path(tmpdir)
+            session_path = directory / "recovery.session"
+            first = self._payloads_file(directory, "first.txt", main_frames[1:])
+            rest = self._payloads_file(directory, "rest.txt", [*parity, auth_frame])
+            args = RecoverArgs(
+                payloads_file=first,
+                session=str(session_path),
+                passphrase=self.backup.passphrase,
+                quiet=True,
+            )
+            with self.assertRaisesRegex(ValueError, "missing 0"):
+                plan_from_args(args)
+
+            args.payloads_file = rest
+            events = _Events()
+            with event_session(events):
+                plan = plan_from_args(args)
+            self.assertEqual(events.progress[-1]["details"]["parity_frames"], 1)
+            self.assertEqual(events.progress[-1]["details"]["missing_indices"], [0])
+            self.assertEqual(plan.auth_status, "verified")
+
+            args.payloads_file = None
+            self.assertEqual(plan_from_args(args).ciphertext, plan.ciphertext)
+
+    def test_session_rejects_batch_and_scan_watch(self) -> None:
+        for extra in ({"batch": True, "scan": ["scans"], "output": "out"}, {"scan_watch": "dir"}):
+            with self.subTest(extra=extra):
+                with self.assertRaisesRegex(ValueError, "--session cannot be combined"):
+                    validate_recover_args(RecoverArgs(session="recovery.session", **extra))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+# Copyright (C) 2026 Alex Stoyanov
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+import io
+import json
+import unittest
+
+from ethernity.cli.shared.events import timing_events
+from ethernity.cli.shared.ndjson import ndjson_session
+from ethernity.core.timing import SpanRecord, span, timing_enabled, timing_listener
+
+
+class TestTimingSpans(unittest.TestCase):
+    def test_disabled_span_is_shared_no_op(self) -> None:
+        self.assertFalse(timing_enabled())
+        first = span("backup", input_files=1)
+        self.assertIs(first, span("render"))
+        with first as active:
+            active.count("frames", 3)
+            active.add("files")
+
+    def test_nested_spans_report_parent_counts_and_failures(self) -> None:
+        records: list[SpanRecord] = []
+        with timing_listener(records.append):
+            self.assertTrue(timing_enabled())
+            with span("backup", input_files=2) as outer:
+                with span("backup.encrypt"):
+                    pass
+                outer.count("documents", 3)
+                outer.add("documents")
+            with self.assertRaises(ValueError):
+                with span("scan"):
+                    raise ValueError("boom")
+        self.assertFalse(timing_enabled())
+
+        self.assertEqual([record.name for record in records], ["backup.encrypt", "backup", "scan"])
+        inner, outer_record, failed = records
+        self.assertEqual(inner.parent, "backup")
+        self.assertIsNone(outer_record.parent)
+        self.assertEqual(outer_record.counts, {"input_files": 2, "documents": 4})
+        self.assertGreaterEqual(outer_record.wall_seconds, inner.wall_seconds)
+        self.assertTrue(outer_record.ok)
+        self.assertFalse(failed.ok)
+
+    def test_timing_events_write_ndjson_records(self) -> None:
+        stream = io.StringIO()
+        with ndjson_session(stream=stream), timing_events(True):
+            with span("render", frames=4):
+                pass
+        with ndjson_session(stream=stream), timing_events(False):
+            with span("render", frames=4):
+                pass
+
+        events = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(len(events), 1)
+        event = events[0]
+        self.assertEqual(event["type"], "timing")
+        self.assertEqual(event["span"], "render")
+        self.assertIsNone(event["parent"])
+        self.assertEqual(event["counts"], {"frames": 4})
+        self.assertGreaterEqual(event["wall_s"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
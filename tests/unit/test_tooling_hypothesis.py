@@ -27,12 +27,31 @@ from ethernity.encoding.framing import (
     encode_frame,
 )
 from ethernity.encoding.qr_payloads import decode_qr_payload, encode_qr_payload
+from ethernity.encoding.zbase32 import decode_zbase32, encode_zbase32
 
 PROPERTY_SETTINGS = settings(deadline=None, max_examples=50)
 ZBASE32_CHARS = "ybndrfg8ejkmcpqxot1uwisza345h769"
 VALID_FALLBACK_CHARS = ZBASE32_CHARS + ZBASE32_CHARS.upper() + " \t"
 
 
+def _reference_encode_zbase32(data: bytes) -> str:
+    # Bit-at-a-time definition of z-base-32 that the bulk codec must match exactly.
+    bits = "".join(f"{byte:08b}" for byte in data)
+    bits += "0" * (-len(bits) % 5)
+    return "".join(ZBASE32_CHARS[int(bits[i : i + 5], 2)] for i in range(0, len(bits), 5))
+
+
+def _reference_decode_zbase32(text: str) -> bytes | None:
+    symbols = [ch.lower() for ch in text if not ch.isspace() and ch != "-"]
+    if any(ch not in ZBASE32_CHARS for ch in symbols):
+        return None
+    bits = "".join(f"{ZBASE32_CHARS.index(ch):05b}" for ch in symbols)
+    data = bytes(int(bits[i : i + 8], 2) for i in range(0, len(bits) - 7, 8))
+    if _reference_encode_zbase32(data) != "".join(symbols):
+        return None
+    return data
+
+
 def _canonical_cbor_values() -> st.SearchStrategy[object]:
     scalar = st.none() | st.booleans() | st.integers(min_value=-1024, max_value=1024)
     binary = st.binary(max_size=32)
@@ -116,3 +135,25 @@ def test_filter_fallback_lines_rejects_invalid_non_empty_lines(
         assert "outside the z-base-32 alphabet" in str(exc)
     else:
         raise AssertionError("expected invalid non-empty fallback line to be rejected")
+
+
+@PROPERTY_SETTINGS
+@given(st.binary(max_size=96))
+def test_zbase32_bulk_codec_matches_bitwise_reference(data: bytes) -> None:
+    encoded = encode_zbase32(data)
+    assert encoded == _reference_encode_zbase32(data)
+    assert decode_zbase32(encoded) == data
+    decorated = "-".join(encoded[i : i + 4].upper() for i in range(0, len(encoded), 4))
+    assert decode_zbase32(f" {decorated}\n") == data
+
+
+@PROPERTY_SETTINGS
+@given(st.text(alphabet=ZBASE32_CHARS + ZBASE32_CHARS.upper() + " -\n0lv2=", max_size=40))
+def test_zbase32_decode_accepts_exactly_what_reference_accepts(text: str) -> None:
+    expected = _reference_decode_zbase32(text)
+    try:
+        decoded = decode_zbase32(text)
+    except ValueError:
+        assert expected is None
+    else:
+        assert decoded == expected